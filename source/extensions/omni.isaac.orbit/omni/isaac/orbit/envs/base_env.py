@@ -225,6 +225,11 @@ class BaseEnv:
         # -- event manager
         self.event_manager = EventManager(self.cfg.events, self)
         print("[INFO] Event Manager: ", self.event_manager)
+        # compile the per-step computations of the managers
+        # note: the event terms write into the simulation and are not compiled
+        if self.cfg.compile_managers:
+            self.action_manager.compile_terms()
+            self.observation_manager.compile_terms()
 
     """
     Operations - MDP.
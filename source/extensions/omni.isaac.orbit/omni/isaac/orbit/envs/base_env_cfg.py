@@ -105,6 +105,15 @@ class BaseEnvCfg:
     This means that the control action is updated every 10 simulation steps.
     """
 
+    compile_managers: bool = False
+    """Whether to compile the per-step computations of the managers with :func:`torch.compile`. Defaults to False.
+
+    If True, the action processing of the action terms and the function-based terms of the observation,
+    termination and reward managers are compiled on their first call. Terms that cannot be compiled fall
+    back to eager mode. The compilation status of the terms is available through the
+    :attr:`~omni.isaac.orbit.managers.ManagerBase.compile_report` property of each manager.
+    """
+
     # environment settings
     scene: InteractiveSceneCfg = MISSING
     """Scene settings.
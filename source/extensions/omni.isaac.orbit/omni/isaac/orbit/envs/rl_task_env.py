@@ -16,6 +16,7 @@ from typing import Any, ClassVar
 from omni.isaac.version import get_version
 
 from omni.isaac.orbit.managers import CommandManager, CurriculumManager, RewardManager, TerminationManager
+from omni.isaac.orbit.utils.profiler import Profiler
 
 from .base_env import BaseEnv, VecEnvObs
 from .rl_task_env_cfg import RLTaskEnvCfg
@@ -122,6 +123,8 @@ class RLTaskEnv(BaseEnv, gym.Env):
     def load_managers(self):
         # note: this order is important since observation manager needs to know the command and action managers
         # and the reward manager needs to know the termination manager
+        # -- profiler (used to time the phases of the step and the terms of the managers)
+        self.profiler = Profiler(self.cfg.profiler, device=self.device)
         # -- command manager
         self.command_manager: CommandManager = CommandManager(self.cfg.commands, self)
         print("[INFO] Command Manager: ", self.command_manager)
@@ -137,6 +140,18 @@ class RLTaskEnv(BaseEnv, gym.Env):
         # -- curriculum manager
         self.curriculum_manager = CurriculumManager(self.cfg.curriculum, self)
         print("[INFO] Curriculum Manager: ", self.curriculum_manager)
+        # compile the per-step computations of the managers
+        if self.cfg.compile_managers:
+            self.termination_manager.compile_terms()
+            self.reward_manager.compile_terms()
+        # time the terms of the managers
+        # note: the costs of the terms are then available through the term statistics of each manager
+        if self.profiler.enabled and self.cfg.profiler.time_terms:
+            self.observation_manager.profile_terms(self.profiler, prefix="observation_manager")
+            self.termination_manager.profile_terms(self.profiler, prefix="termination_manager")
+            self.reward_manager.profile_terms(self.profiler, prefix="reward_manager")
+            self.curriculum_manager.profile_terms(self.profiler, prefix="curriculum_manager")
+            self.event_manager.profile_terms(self.profiler, prefix="event_manager")
 
     """
     Operations - MDP
@@ -155,51 +170,73 @@ class RLTaskEnv(BaseEnv, gym.Env):
         6. Compute the observations.
         7. Return the observations, rewards, resets and extras.
 
+        If the profiler is enabled (see :attr:`RLTaskEnvCfg.profiler`), the time spent in each of these
+        phases is recorded by :attr:`profiler`.
+
         Args:
             action: The actions to apply on the environment. Shape is (num_envs, action_dim).
 
         Returns:
             A tuple containing the observations, rewards, resets (terminated and truncated) and extras.
         """
-        # process actions
-        self.action_manager.process_action(action)
-        # perform physics stepping
-        for _ in range(self.cfg.decimation):
-            # set actions into buffers
-            self.action_manager.apply_action()
-            # set actions into simulator
-            self.scene.write_data_to_sim()
-            # simulate
-            self.sim.step(render=False)
-            # update buffers at sim dt
-            self.scene.update(dt=self.physics_dt)
-        # perform rendering if gui is enabled
-        if self.sim.has_gui() or self.sim.has_rtx_sensors():
-            self.sim.render()
-
-        # post-step:
-        # -- update env counters (used for curriculum generation)
-        self.episode_length_buf += 1  # step in current episode (per env)
-        self.common_step_counter += 1  # total step (common for all envs)
-        # -- check terminations
-        self.reset_buf = self.termination_manager.compute()
-        self.reset_terminated = self.termination_manager.terminated
-        self.reset_time_outs = self.termination_manager.time_outs
-        # -- reward computation
-        self.reward_buf = self.reward_manager.compute(dt=self.step_dt)
-
-        # -- reset envs that terminated/timed-out and log the episode information
-        reset_env_ids = self.reset_buf.nonzero(as_tuple=False).squeeze(-1)
-        if len(reset_env_ids) > 0:
-            self._reset_idx(reset_env_ids)
-        # -- update command
-        self.command_manager.compute(dt=self.step_dt)
-        # -- step interval events
-        if "interval" in self.event_manager.available_modes:
-            self.event_manager.apply(mode="interval", dt=self.step_dt)
-        # -- compute observations
-        # note: done after reset to get the correct observations for reset envs
-        self.obs_buf = self.observation_manager.compute()
+        with self.profiler.scope("step"):
+            # process actions
+            with self.profiler.scope("step/action_manager"):
+                self.action_manager.process_action(action)
+            # perform physics stepping
+            for _ in range(self.cfg.decimation):
+                with self.profiler.scope("step/substep"):
+                    # set actions into buffers
+                    with self.profiler.scope("step/substep/apply_action"):
+                        self.action_manager.apply_action()
+                    # set actions into simulator
+                    with self.profiler.scope("step/substep/write_data_to_sim"):
+                        self.scene.write_data_to_sim()
+                    # simulate
+                    with self.profiler.scope("step/substep/sim_step"):
+                        self.sim.step(render=False)
+                    # update buffers at sim dt
+                    with self.profiler.scope("step/substep/scene_update"):
+                        self.scene.update(dt=self.physics_dt)
+            # perform rendering if gui is enabled
+            if self.sim.has_gui() or self.sim.has_rtx_sensors():
+                with self.profiler.scope("step/render"):
+                    self.sim.render()
+
+            # post-step:
+            # -- update env counters (used for curriculum generation)
+            self.episode_length_buf += 1  # step in current episode (per env)
+            self.common_step_counter += 1  # total step (common for all envs)
+            # -- check terminations
+            with self.profiler.scope("step/termination_manager"):
+                self.reset_buf = self.termination_manager.compute()
+            self.reset_terminated = self.termination_manager.terminated
+            self.reset_time_outs = self.termination_manager.time_outs
+            # -- reward computation
+            with self.profiler.scope("step/reward_manager"):
+                self.reward_buf = self.reward_manager.compute(dt=self.step_dt)
+
+            # -- reset envs that terminated/timed-out and log the episode information
+            reset_env_ids = self.reset_buf.nonzero(as_tuple=False).squeeze(-1)
+            if len(reset_env_ids) > 0:
+                with self.profiler.scope("step/reset_idx"):
+                    self._reset_idx(reset_env_ids)
+            # -- update command
+            with self.profiler.scope("step/command_manager"):
+                self.command_manager.compute(dt=self.step_dt)
+            # -- step interval events
+            if "interval" in self.event_manager.available_modes:
+                with self.profiler.scope("step/event_manager"):
+                    self.event_manager.apply(mode="interval", dt=self.step_dt)
+            # -- compute observations
+            # note: done after reset to get the correct observations for reset envs
+            with self.profiler.scope("step/observation_manager"):
+                self.obs_buf = self.observation_manager.compute()
+
+        # -- log the statistics of the profiler
+        if self.profiler.enabled and self.cfg.profiler.log_interval > 0:
+            if self.common_step_counter % self.cfg.profiler.log_interval == 0:
+                self.extras.setdefault("log", dict()).update(self.profiler.get_log_info())
 
         # return observations, rewards, resets and extras
         return self.obs_buf, self.reward_buf, self.reset_terminated, self.reset_time_outs, self.extras
@@ -269,6 +306,8 @@ class RLTaskEnv(BaseEnv, gym.Env):
 
     def close(self):
         if not self._is_closed:
+            # save the recorded timings (if requested)
+            self.profiler.save()
             # destructor is order-sensitive
             del self.command_manager
             del self.reward_manager
@@ -287,6 +326,7 @@ class RLTaskEnv(BaseEnv, gym.Env):
         self.single_observation_space = gym.spaces.Dict()
         for group_name, group_term_names in self.observation_manager.active_terms.items():
             # extract quantities about the group
+            # note: the dimensions of the terms include their stacked history (if any)
             has_concatenated_obs = self.observation_manager.group_obs_concatenate[group_name]
             group_dim = self.observation_manager.group_obs_dim[group_name]
             group_term_dim = self.observation_manager.group_obs_term_dim[group_name]
@@ -314,12 +354,15 @@ class RLTaskEnv(BaseEnv, gym.Env):
             env_ids: List of environment ids which must be reset
         """
         # update the curriculum for environments that need a reset
-        self.curriculum_manager.compute(env_ids=env_ids)
+        with self.profiler.scope("reset_idx/curriculum_manager"):
+            self.curriculum_manager.compute(env_ids=env_ids)
         # reset the internal buffers of the scene elements
-        self.scene.reset(env_ids)
+        with self.profiler.scope("reset_idx/scene"):
+            self.scene.reset(env_ids)
         # apply events such as randomizations for environments that need a reset
         if "reset" in self.event_manager.available_modes:
-            self.event_manager.apply(env_ids=env_ids, mode="reset")
+            with self.profiler.scope("reset_idx/event_manager"):
+                self.event_manager.apply(env_ids=env_ids, mode="reset")
 
         # iterate over all managers and reset them
         # this returns a dictionary of information which is stored in the extras
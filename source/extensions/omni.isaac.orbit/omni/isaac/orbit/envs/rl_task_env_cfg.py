@@ -6,6 +6,7 @@
 from dataclasses import MISSING
 
 from omni.isaac.orbit.utils import configclass
+from omni.isaac.orbit.utils.profiler import ProfilerCfg
 
 from .base_env_cfg import BaseEnvCfg
 from .ui import RLTaskEnvWindow
@@ -78,3 +79,12 @@ class RLTaskEnvCfg(BaseEnvCfg):
 
     Please refer to the :class:`omni.isaac.orbit.managers.CommandManager` class for more details.
     """
+
+    # profiling settings
+    profiler: ProfilerCfg = ProfilerCfg()
+    """Profiler settings. Defaults to a disabled profiler.
+
+    If enabled, the environment records the time spent in the phases of :meth:`RLTaskEnv.step` and
+    :meth:`RLTaskEnv._reset_idx`, and in the terms of the managers. Please refer to the
+    :class:`omni.isaac.orbit.utils.profiler.Profiler` class for more details.
+    """
@@ -229,6 +229,26 @@ class ActionManager(ManagerBase):
         for term in self._terms.values():
             term.apply_actions()
 
+    def compile_terms(self, **compile_kwargs):
+        """Compiles the processing of the actions of each term with :func:`torch.compile`.
+
+        The :meth:`ActionTerm.process_actions` method of each term is wrapped so that it is compiled on its
+        first call. The application of the actions is not compiled since it writes into the simulation buffers.
+        Terms that cannot be traced into a single graph fall back to eager mode.
+
+        The status of each term can be inspected through :attr:`compile_report`.
+
+        Args:
+            **compile_kwargs: The keyword arguments passed to :func:`torch.compile`. By default, the terms
+                are compiled with static shapes into a single graph (``dynamic=False`` and ``fullgraph=True``).
+        """
+        for name, term in self._terms.items():
+            # skip terms that are already compiled
+            if name in self._compiled_terms:
+                continue
+            # wrap the bound method of the term
+            term.process_actions = self._compile_callable(name, term.process_actions, **compile_kwargs)
+
     def get_term(self, name: str) -> ActionTerm:
         """Returns the action term with the specified name.
 
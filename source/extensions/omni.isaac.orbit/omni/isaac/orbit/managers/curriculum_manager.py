@@ -57,12 +57,12 @@ class CurriculumManager(ManagerBase):
         # create table for term information
         table = PrettyTable()
         table.title = "Active Curriculum Terms"
-        table.field_names = ["Index", "Name"]
+        table.field_names = ["Index", "Name"] + self._get_term_stats_field_names()
         # set alignment of table columns
         table.align["Name"] = "l"
         # add info on each term
         for index, name in enumerate(self._term_names):
-            table.add_row([index, name])
+            table.add_row([index, name] + self._get_term_stats_row(name))
         # convert table to string
         msg += table.get_string()
         msg += "\n"
@@ -131,6 +131,10 @@ class CurriculumManager(ManagerBase):
             state = term_cfg.func(self._env, env_ids, **term_cfg.params)
             self._curriculum_state[name] = state
 
+    def _get_term_cfgs(self) -> dict[str, CurriculumTermCfg]:
+        """Returns the configurations of the terms handled by the manager."""
+        return dict(zip(self._term_names, self._term_cfgs))
+
     """
     Helper functions.
     """
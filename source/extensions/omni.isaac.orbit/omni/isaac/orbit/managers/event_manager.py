@@ -76,15 +76,15 @@ class EventManager(ManagerBase):
             table.title = f"Active Event Terms in Mode: '{mode}'"
             # add table headers based on mode
             if mode == "interval":
-                table.field_names = ["Index", "Name", "Interval time range (s)"]
+                table.field_names = ["Index", "Name", "Interval time range (s)"] + self._get_term_stats_field_names()
                 table.align["Name"] = "l"
                 for index, (name, cfg) in enumerate(zip(self._mode_term_names[mode], self._mode_term_cfgs[mode])):
-                    table.add_row([index, name, cfg.interval_range_s])
+                    table.add_row([index, name, cfg.interval_range_s] + self._get_term_stats_row(name))
             else:
-                table.field_names = ["Index", "Name"]
+                table.field_names = ["Index", "Name"] + self._get_term_stats_field_names()
                 table.align["Name"] = "l"
                 for index, name in enumerate(self._mode_term_names[mode]):
-                    table.add_row([index, name])
+                    table.add_row([index, name] + self._get_term_stats_row(name))
             # convert table to string
             msg += table.get_string()
             msg += "\n"
@@ -208,6 +208,13 @@ class EventManager(ManagerBase):
                 return self._mode_term_cfgs[mode][terms.index(term_name)]
         raise ValueError(f"Event term '{term_name}' not found.")
 
+    def _get_term_cfgs(self) -> dict[str, EventTermCfg]:
+        """Returns the configurations of the terms handled by the manager."""
+        term_cfgs = dict()
+        for mode in self._mode_term_names:
+            term_cfgs.update(zip(self._mode_term_names[mode], self._mode_term_cfgs[mode]))
+        return term_cfgs
+
     """
     Helper functions.
     """
@@ -6,9 +6,11 @@
 from __future__ import annotations
 
 import copy
+import functools
 import inspect
+import torch
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any
 
 import carb
@@ -21,6 +23,7 @@ from .scene_entity_cfg import SceneEntityCfg
 
 if TYPE_CHECKING:
     from omni.isaac.orbit.envs import BaseEnv
+    from omni.isaac.orbit.utils.profiler import Profiler
 
 
 class ManagerTermBase(ABC):
@@ -113,6 +116,61 @@ class ManagerTermBase(ABC):
         raise NotImplementedError
 
 
+class _CompiledCallable:
+    """Wrapper that calls the :func:`torch.compile` version of a function and falls back to the eager version.
+
+    The function is compiled lazily on the first call. If the compilation fails (for instance, because the
+    function is not traceable into a single graph), the wrapper logs a warning and calls the eager function
+    from then on. Only the errors raised by the compiler (:class:`torch._dynamo.exc.TorchDynamoException`) trigger
+    the fallback. The other errors are raised as is.
+    """
+
+    def __init__(self, func: Callable, **compile_kwargs):
+        """Initialize the wrapper.
+
+        Args:
+            func: The function to compile.
+            **compile_kwargs: The keyword arguments passed to :func:`torch.compile`.
+        """
+        self.func = func
+        self._compiled_func = torch.compile(func, **compile_kwargs)
+        # status of the compilation: None (not called yet), True (compiled) or False (fallback to eager)
+        self._is_compiled: bool | None = None
+        self._error_msg = ""
+        # copy the signature and names of the function
+        functools.update_wrapper(self, func)
+
+    @property
+    def status(self) -> str:
+        """The status of the compilation: "pending", "compiled" or "eager (<reason>)"."""
+        if self._is_compiled is None:
+            return "pending"
+        elif self._is_compiled:
+            return "compiled"
+        else:
+            return f"eager ({self._error_msg})"
+
+    def __call__(self, *args, **kwargs) -> Any:
+        # call the eager function if the compilation failed before
+        if self._is_compiled is False:
+            return self.func(*args, **kwargs)
+        # call the compiled function
+        try:
+            output = self._compiled_func(*args, **kwargs)
+        except torch._dynamo.exc.TorchDynamoException as e:
+            # note: the compiler traces the function symbolically and raises its errors before running the graph,
+            #   so the function has not been executed yet. If the error also happens in eager mode (for instance,
+            #   a shape mismatch found while tracing), the eager call raises it before the fallback is recorded.
+            output = self.func(*args, **kwargs)
+            # fallback to the eager function
+            self._is_compiled = False
+            self._error_msg = f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}"
+            carb.log_warn(f"Failed to compile '{self.func.__qualname__}'. Using eager mode. {self._error_msg}")
+            return output
+        self._is_compiled = True
+        return output
+
+
 class ManagerBase(ABC):
     """Base class for all managers."""
 
@@ -126,6 +184,14 @@ class ManagerBase(ABC):
         # store the inputs
         self.cfg = copy.deepcopy(cfg)
         self._env = env
+        # compilation status of the terms (filled by :meth:`compile_terms`)
+        self._compiled_terms: dict[str, _CompiledCallable | str] = dict()
+        # settings of the wrappers of the terms (see :meth:`_wrap_terms`)
+        self._term_compile_kwargs: dict[str, Any] | None = None
+        self._term_profiler: Profiler | None = None
+        self._term_profiler_prefix = ""
+        # the unwrapped and wrapped callables of the terms
+        self._term_funcs: dict[str, tuple[Callable, Callable]] = dict()
         # parse config to create terms information
         self._prepare_terms()
 
@@ -149,6 +215,50 @@ class ManagerBase(ABC):
         """Name of active terms."""
         raise NotImplementedError
 
+    @property
+    def compile_report(self) -> dict[str, str]:
+        """The compilation status of the terms handled by the manager.
+
+        The keys are the names of the terms and the values are one of:
+
+        * ``"pending"``: The term is wrapped but has not been called yet.
+        * ``"compiled"``: The term runs as a compiled graph.
+        * ``"eager (<reason>)"``: The term runs in eager mode, for instance, because it is not traceable.
+
+        The dictionary is empty if :meth:`compile_terms` has not been called.
+        """
+        return {name: term if isinstance(term, str) else term.status for name, term in self._compiled_terms.items()}
+
+    @property
+    def term_stats(self) -> dict[str, dict[str, float]]:
+        """The costs of the terms handled by the manager recorded by the profiler of :meth:`profile_terms`.
+
+        The keys are the names of the terms and the values are dictionaries with the following entries:
+
+        * ``"calls"``: The number of calls of the term.
+        * ``"total_time"``: The total time spent in the term (in ms).
+        * ``"mean_time"``: The mean time per call (in ms).
+        * ``"mean_bytes"``: The mean number of bytes allocated per call. This is only available if the
+          profiler records the memory (see :attr:`~omni.isaac.orbit.utils.profiler.ProfilerCfg.record_memory`).
+
+        The dictionary is empty if :meth:`profile_terms` has not been called.
+        """
+        if self._term_profiler is None:
+            return {}
+        summary = self._term_profiler.summary()
+        term_stats = dict()
+        for term_name in self._get_term_cfgs():
+            stats = summary.get(f"{self._term_profiler_prefix}/{term_name}", {"count": 0, "total": 0.0})
+            num_calls = max(stats["count"], 1)
+            term_stats[term_name] = {
+                "calls": stats["count"],
+                "total_time": stats["total"],
+                "mean_time": stats["total"] / num_calls,
+            }
+            if self._term_profiler.cfg.record_memory:
+                term_stats[term_name]["mean_bytes"] = stats.get("mean_bytes", 0.0)
+        return term_stats
+
     """
     Operations.
     """
@@ -165,6 +275,47 @@ class ManagerBase(ABC):
         """
         return {}
 
+    def compile_terms(self, **compile_kwargs):
+        """Compiles the function-based terms of the manager with :func:`torch.compile`.
+
+        Each term's function is wrapped so that it is compiled on its first call. Since most terms
+        only launch a few small kernels on tensors of fixed shapes, compiling them reduces the number of
+        kernel launches and the Python overhead per step. Terms that cannot be traced into a single graph
+        fall back to eager mode. Class-based terms are stateful and are always run in eager mode.
+
+        The loops of the managers over their terms are not compiled. The terms read the data of the scene
+        through lazily updated buffers and the managers keep Python state (such as the delay and history
+        buffers of the observations), which would break the graph at every term.
+
+        The status of each term can be inspected through :attr:`compile_report`.
+
+        Args:
+            **compile_kwargs: The keyword arguments passed to :func:`torch.compile`. By default, the terms
+                are compiled with static shapes into a single graph (``dynamic=False`` and ``fullgraph=True``).
+        """
+        self._term_compile_kwargs = compile_kwargs
+        self._wrap_terms()
+
+    def profile_terms(self, profiler: Profiler, prefix: str):
+        """Times each call of the terms of the manager with the given profiler.
+
+        The calls of each term are recorded as the phase ``"<prefix>/<term_name>"``. The recorded costs of
+        the terms are also available through :attr:`term_stats` and are printed in the string representation
+        of the manager. If the profiler is disabled, the terms are not wrapped.
+
+        The terms can be compiled with :meth:`compile_terms` before or after this call. The timing is always
+        applied around the compiled term.
+
+        Args:
+            profiler: The profiler that records the timings.
+            prefix: The prefix of the phase names, typically the name of the manager.
+        """
+        if not profiler.enabled:
+            return
+        self._term_profiler = profiler
+        self._term_profiler_prefix = prefix
+        self._wrap_terms()
+
     def find_terms(self, name_keys: str | Sequence[str]) -> list[str]:
         """Find terms in the manager based on the names.
 
@@ -201,10 +352,101 @@ class ManagerBase(ABC):
         """Prepare terms information from the configuration object."""
         raise NotImplementedError
 
+    def _get_term_cfgs(self) -> dict[str, ManagerTermBaseCfg]:
+        """Returns the configurations of the function-based terms handled by the manager.
+
+        This is used by the operations that act on all the terms, such as :meth:`compile_terms` and
+        :meth:`profile_terms`.
+        Managers with function-based terms should override this method. By default, it returns an empty
+        dictionary.
+
+        Returns:
+            A dictionary with the term names as keys and the term configurations as values.
+        """
+        return dict()
+
     """
     Helper functions.
     """
 
+    def _get_term_stats_field_names(self) -> list[str]:
+        """Returns the names of the table columns for the recorded costs of the terms.
+
+        The list is empty if :meth:`profile_terms` has not been called.
+        """
+        if self._term_profiler is None:
+            return []
+        field_names = ["Calls", "Mean time (ms)", "Total time (ms)"]
+        if self._term_profiler.cfg.record_memory:
+            field_names.append("Mean alloc (KB)")
+        return field_names
+
+    def _get_term_stats_row(self, term_name: str) -> list:
+        """Returns the table entries for the recorded costs of a term.
+
+        The list is empty if :meth:`profile_terms` has not been called.
+
+        Args:
+            term_name: The name of the term.
+        """
+        if self._term_profiler is None:
+            return []
+        stats = self.term_stats[term_name]
+        row = [stats["calls"], f"{stats['mean_time']:.4f}", f"{stats['total_time']:.2f}"]
+        if "mean_bytes" in stats:
+            row.append(f"{stats['mean_bytes'] / 1024:.2f}")
+        return row
+
+    def _compile_callable(self, name: str, func: Callable, **compile_kwargs) -> Callable:
+        """Wraps a callable with its compiled version and registers it for the :attr:`compile_report`.
+
+        Args:
+            name: The name under which the callable is reported.
+            func: The callable to compile.
+            **compile_kwargs: The keyword arguments passed to :func:`torch.compile`. These override the
+                default settings ``dynamic=False`` and ``fullgraph=True``.
+
+        Returns:
+            The wrapped callable.
+        """
+        compile_kwargs = {"dynamic": False, "fullgraph": True, **compile_kwargs}
+        compiled_func = _CompiledCallable(func, **compile_kwargs)
+        self._compiled_terms[name] = compiled_func
+        return compiled_func
+
+    def _wrap_terms(self):
+        """Wraps the callables of the terms according to the settings of :meth:`compile_terms` and
+        :meth:`profile_terms`.
+
+        The wrappers are always rebuilt from the unwrapped callables of the terms, so that they are applied in
+        the same order independently of the order of the calls: the compilation is applied first and the
+        timing of the profiler is applied around it.
+        """
+        for term_name, term_cfg in self._get_term_cfgs().items():
+            # resolve the unwrapped callable of the term
+            # note: if the callable was replaced since the last call (for instance, through the term settings),
+            #   the new callable is wrapped instead
+            func, wrapped_func = self._term_funcs.get(term_name, (None, None))
+            if term_cfg.func is not wrapped_func:
+                func = term_cfg.func
+            wrapped_func = func
+            # compile the term
+            if self._term_compile_kwargs is not None:
+                if isinstance(func, ManagerTermBase):
+                    # class-based terms store their own state and are run in eager mode
+                    self._compiled_terms[term_name] = "eager (class-based term)"
+                else:
+                    compiled_func = self._compiled_terms.get(term_name)
+                    if not isinstance(compiled_func, _CompiledCallable) or compiled_func.func is not func:
+                        compiled_func = self._compile_callable(term_name, func, **self._term_compile_kwargs)
+                    wrapped_func = compiled_func
+            # time the term
+            if self._term_profiler is not None:
+                wrapped_func = self._term_profiler.wrap(f"{self._term_profiler_prefix}/{term_name}", wrapped_func)
+            # store the callables
+            term_cfg.func = wrapped_func
+            self._term_funcs[term_name] = (func, wrapped_func)
+
     def _resolve_common_term_cfg(self, term_name: str, term_cfg: ManagerTermBaseCfg, min_argc: int = 1):
         """Resolve common term configuration.
 
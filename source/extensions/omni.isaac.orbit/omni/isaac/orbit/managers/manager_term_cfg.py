@@ -142,6 +142,45 @@ class ObservationTermCfg(ManagerTermBaseCfg):
     """The scale to apply to the observation after clipping. Defaults to None,
     in which case no scaling is applied (same as setting scale to :obj:`1`)."""
 
+    delay_range: tuple[int, int] | None = None
+    """The range of the delay of the observation in number of environment steps. Defaults to None,
+    in which case no delay is applied.
+
+    The delay is sampled uniformly (inclusive of both ends) for each environment when the environment is reset.
+    The manager stores the last ``delay_range[1] + 1`` outputs of the term in a
+    :class:`~omni.isaac.orbit.utils.buffers.CircularBuffer` and reads the delayed output for all the environments
+    with a single gather. The delay is applied before adding noise, clipping and scaling.
+    """
+
+    history_length: int = 0
+    """The number of past observations to stack for the term. Defaults to 0, in which case no history is stored.
+
+    If greater than zero, the manager stores the processed (corrupted, clipped and scaled) observations of the
+    term in a :class:`~omni.isaac.orbit.utils.buffers.CircularBuffer`. The term's observation is then the history
+    ordered from the oldest to the newest entry, with shape (num_envs, history_length, obs_term_dim).
+    """
+
+    flatten_history_dim: bool = True
+    """Whether to flatten the history of the term into a single dimension. Defaults to True.
+
+    If true, the observation with history has the shape (num_envs, history_length * obs_term_dim).
+
+    Note:
+        This is only used if :attr:`history_length` is greater than zero.
+    """
+
+    clone_output: bool = True
+    """Whether to clone the tensor returned by the term before post-processing it. Defaults to True.
+
+    The noise, clipping and scaling operations are applied in-place on the term's output. Cloning it
+    ensures that the tensors owned by the term (for instance, the asset data buffers) are not modified.
+    If the term already returns a freshly allocated tensor, this can be set to False to skip the copy.
+
+    Note:
+        For groups with :attr:`ObservationGroupCfg.preallocate_buffer` enabled, the term's output is
+        always copied into the group buffer. Thus, this setting has no effect for them.
+    """
+
 
 @configclass
 class ObservationGroupCfg:
@@ -161,6 +200,19 @@ class ObservationGroupCfg:
     Otherwise, no corruption is applied.
     """
 
+    preallocate_buffer: bool = False
+    """Whether to write the observation terms into a persistent buffer for the group. Defaults to False.
+
+    If true, the group owns a single tensor of shape (num_envs, group_obs_dim) that is allocated once
+    by the manager. Each term writes its output directly into its slice of the buffer, where the clipping
+    and scaling are applied in-place. This avoids the per-step allocation of a new tensor for the
+    concatenation of the terms.
+
+    Note:
+        This is only used if :attr:`concatenate_terms` is True. Since the same tensor is returned on every
+        call, the consumers must copy the observations if they want to keep them across steps.
+    """
+
 
 ##
 # Event manager
@@ -7,11 +7,14 @@
 
 from __future__ import annotations
 
+import math
 import torch
 from collections.abc import Sequence
 from prettytable import PrettyTable
 from typing import TYPE_CHECKING
 
+from omni.isaac.orbit.utils.buffers import CircularBuffer
+
 from .manager_base import ManagerBase, ManagerTermBase
 from .manager_term_cfg import ObservationGroupCfg, ObservationTermCfg
 
@@ -40,10 +43,12 @@ class ObservationManager(ManagerBase):
         """
         super().__init__(cfg, env)
         # compute combined vector for obs group
+        # note: the terms are concatenated along the last dimension
         self._group_obs_dim: dict[str, tuple[int, ...]] = dict()
         for group_name, group_term_dims in self._group_obs_term_dim.items():
-            term_dims = [torch.tensor(dims, device="cpu") for dims in group_term_dims]
-            self._group_obs_dim[group_name] = tuple(torch.sum(torch.stack(term_dims, dim=0), dim=0).tolist())
+            self._group_obs_dim[group_name] = group_term_dims[0][:-1] + (sum(dims[-1] for dims in group_term_dims),)
+        # create persistent buffers for the groups that write into them
+        self._prepare_group_buffers()
 
     def __str__(self) -> str:
         """Returns: A string representation for the observation manager."""
@@ -54,7 +59,7 @@ class ObservationManager(ManagerBase):
             # create table for term information
             table = PrettyTable()
             table.title = f"Active Observation Terms in Group: '{group_name}' (shape: {group_dim})"
-            table.field_names = ["Index", "Name", "Shape"]
+            table.field_names = ["Index", "Name", "Shape"] + self._get_term_stats_field_names()
             # set alignment of table columns
             table.align["Name"] = "l"
             # add info for each term
@@ -66,7 +71,7 @@ class ObservationManager(ManagerBase):
                 # resolve inputs to simplify prints
                 tab_dims = tuple(dims)
                 # add row
-                table.add_row([index, name, tab_dims])
+                table.add_row([index, name, tab_dims] + self._get_term_stats_row(f"{group_name}/{name}"))
             # convert table to string
             msg += table.get_string()
             msg += "\n"
@@ -106,6 +111,15 @@ class ObservationManager(ManagerBase):
         for group_cfg in self._group_obs_class_term_cfgs.values():
             for term_cfg in group_cfg:
                 term_cfg.func.reset(env_ids=env_ids)
+        # reset the history of the terms
+        for group_history_buffers in self._group_obs_term_history_buffer.values():
+            for history_buffer in group_history_buffers.values():
+                history_buffer.reset(batch_ids=env_ids)
+        # reset the delay buffers and resample the delays of the terms
+        for group_name, group_delay_buffers in self._group_obs_term_delay_buffer.items():
+            for term_name, delay_buffer in group_delay_buffers.items():
+                delay_buffer.reset(batch_ids=env_ids)
+                self._resample_term_delay(group_name, term_name, env_ids)
         # nothing to log here
         return {}
 
@@ -138,8 +152,14 @@ class ObservationManager(ManagerBase):
         shape as the observation. The observations are clipped and scaled as per the configuration
         settings.
 
-        The operations are performed in the order: compute, add corruption/noise, clip, scale.
-        By default, no scaling or clipping is applied.
+        The operations are performed in the order: compute, delay, add corruption/noise, clip, scale.
+        By default, no delay, scaling or clipping is applied. If the term has a history (see
+        :attr:`ObservationTermCfg.history_length`), the processed observation is appended to the term's
+        history buffer and the term's observation is the stacked history from the oldest to the newest entry.
+
+        If the group is configured with :attr:`ObservationGroupCfg.preallocate_buffer`, the terms are written
+        into their slice of the group's persistent buffer, and the clipping and scaling are applied in-place
+        on it. The same buffer is returned on every call.
 
         Args:
             group_name: The name of the group for which to compute the observations. Defaults to None,
@@ -163,29 +183,72 @@ class ObservationManager(ManagerBase):
         group_term_names = self._group_obs_term_names[group_name]
         # buffer to store obs per group
         group_obs = dict.fromkeys(group_term_names, None)
+        # read the persistent buffer of the group (if any)
+        group_buffer = self._group_obs_buffer.get(group_name)
+        group_buffer_views = self._group_obs_term_buffer_views.get(group_name)
+        group_history_buffers = self._group_obs_term_history_buffer[group_name]
+        group_delay_buffers = self._group_obs_term_delay_buffer[group_name]
+        group_delays = self._group_obs_term_delay[group_name]
         # read attributes for each term
         obs_terms = zip(group_term_names, self._group_obs_term_cfgs[group_name])
-        # evaluate terms: compute, add noise, clip, scale.
-        for name, term_cfg in obs_terms:
+        # evaluate terms: compute, add noise, clip, scale, add to history.
+        for index, (name, term_cfg) in enumerate(obs_terms):
             # compute term's value
-            obs: torch.Tensor = term_cfg.func(self._env, **term_cfg.params).clone()
+            obs: torch.Tensor = term_cfg.func(self._env, **term_cfg.params)
+            # obtain the history buffer of the term (if any)
+            history_buffer = group_history_buffers.get(name)
+            # resolve the tensor on which the post-processing happens in-place
+            # note: terms without history write directly into the group buffer
+            obs_view = group_buffer_views[index] if group_buffer is not None and history_buffer is None else None
+            # apply the delay
+            # note: the gathered tensor is a copy, so it does not need to be cloned
+            delay_buffer = group_delay_buffers.get(name)
+            if delay_buffer is not None:
+                delay_buffer.append(obs)
+                obs = delay_buffer[group_delays[name]]
+            elif obs_view is None and term_cfg.clone_output:
+                obs = obs.clone()
             # apply post-processing
             if term_cfg.noise:
                 obs = term_cfg.noise.func(obs, term_cfg.noise)
+            if obs_view is not None:
+                obs = obs_view.copy_(obs)
             if term_cfg.clip:
                 obs = obs.clip_(min=term_cfg.clip[0], max=term_cfg.clip[1])
             if term_cfg.scale:
                 obs = obs.mul_(term_cfg.scale)
-            # TODO: Introduce delay and filtering models.
+            # TODO: Introduce filtering models.
             # Ref: https://robosuite.ai/docs/modules/sensors.html#observables
+            # add the observation to the history and read the stacked history
+            if history_buffer is not None:
+                history_buffer.append(obs)
+                obs = history_buffer.buffer
+                if term_cfg.flatten_history_dim:
+                    obs = obs.reshape(self.num_envs, -1)
+                if group_buffer is not None:
+                    group_buffer_views[index].copy_(obs)
             # add value to list
             group_obs[name] = obs
+        # return the persistent buffer if the group has one
+        if group_buffer is not None:
+            return group_buffer
         # concatenate all observations in the group together
         if self._group_obs_concatenate[group_name]:
             return torch.cat(list(group_obs.values()), dim=-1)
         else:
             return group_obs
 
+    def _get_term_cfgs(self) -> dict[str, ObservationTermCfg]:
+        """Returns the configurations of the terms handled by the manager.
+
+        The terms are named as ``"<group_name>/<term_name>"``.
+        """
+        term_cfgs = dict()
+        for group_name, group_term_names in self._group_obs_term_names.items():
+            for term_name, term_cfg in zip(group_term_names, self._group_obs_term_cfgs[group_name]):
+                term_cfgs[f"{group_name}/{term_name}"] = term_cfg
+        return term_cfgs
+
     """
     Helper functions.
     """
@@ -195,10 +258,14 @@ class ObservationManager(ManagerBase):
         # create buffers to store information for each observation group
         # TODO: Make this more convenient by using data structures.
         self._group_obs_term_names: dict[str, list[str]] = dict()
-        self._group_obs_term_dim: dict[str, list[int]] = dict()
+        self._group_obs_term_dim: dict[str, list[tuple[int, ...]]] = dict()
         self._group_obs_term_cfgs: dict[str, list[ObservationTermCfg]] = dict()
         self._group_obs_class_term_cfgs: dict[str, list[ObservationTermCfg]] = dict()
         self._group_obs_concatenate: dict[str, bool] = dict()
+        self._group_obs_preallocate: dict[str, bool] = dict()
+        self._group_obs_term_history_buffer: dict[str, dict[str, CircularBuffer]] = dict()
+        self._group_obs_term_delay_buffer: dict[str, dict[str, CircularBuffer]] = dict()
+        self._group_obs_term_delay: dict[str, dict[str, torch.Tensor]] = dict()
 
         # check if config is dict already
         if isinstance(self.cfg, dict):
@@ -221,8 +288,12 @@ class ObservationManager(ManagerBase):
             self._group_obs_term_dim[group_name] = list()
             self._group_obs_term_cfgs[group_name] = list()
             self._group_obs_class_term_cfgs[group_name] = list()
+            self._group_obs_term_history_buffer[group_name] = dict()
+            self._group_obs_term_delay_buffer[group_name] = dict()
+            self._group_obs_term_delay[group_name] = dict()
             # read common config for the group
             self._group_obs_concatenate[group_name] = group_cfg.concatenate_terms
+            self._group_obs_preallocate[group_name] = group_cfg.concatenate_terms and group_cfg.preallocate_buffer
 
             # check if config is dict already
             if isinstance(group_cfg, dict):
@@ -232,7 +303,7 @@ class ObservationManager(ManagerBase):
             # iterate over all the terms in each group
             for term_name, term_cfg in group_cfg.__dict__.items():
                 # skip non-obs settings
-                if term_name in ["enable_corruption", "concatenate_terms"]:
+                if term_name in ["enable_corruption", "concatenate_terms", "preallocate_buffer"]:
                     continue
                 # check for non config
                 if term_cfg is None:
@@ -252,9 +323,86 @@ class ObservationManager(ManagerBase):
                 self._group_obs_term_cfgs[group_name].append(term_cfg)
                 # call function the first time to fill up dimensions
                 obs_dims = tuple(term_cfg.func(self._env, **term_cfg.params).shape[1:])
+                # create delay buffer and sample the delays
+                if term_cfg.delay_range is not None:
+                    min_delay, max_delay = term_cfg.delay_range
+                    if min_delay < 0 or min_delay > max_delay:
+                        raise ValueError(
+                            f"Invalid delay range for the term '{group_name}/{term_name}'. Expected non-negative"
+                            f" values with min <= max. Received: {term_cfg.delay_range}."
+                        )
+                    self._group_obs_term_delay_buffer[group_name][term_name] = CircularBuffer(
+                        max_len=max_delay + 1, batch_size=self.num_envs, device=self.device
+                    )
+                    self._group_obs_term_delay[group_name][term_name] = torch.zeros(
+                        self.num_envs, dtype=torch.long, device=self.device
+                    )
+                    self._resample_term_delay(group_name, term_name)
+                # create history buffer and update the dimensions with the history
+                if term_cfg.history_length > 0:
+                    self._group_obs_term_history_buffer[group_name][term_name] = CircularBuffer(
+                        max_len=term_cfg.history_length, batch_size=self.num_envs, device=self.device
+                    )
+                    if term_cfg.flatten_history_dim:
+                        obs_dims = (term_cfg.history_length * math.prod(obs_dims),)
+                    else:
+                        obs_dims = (term_cfg.history_length, *obs_dims)
                 self._group_obs_term_dim[group_name].append(obs_dims)
                 # add term in a separate list if term is a class
                 if isinstance(term_cfg.func, ManagerTermBase):
                     self._group_obs_class_term_cfgs[group_name].append(term_cfg)
                     # call reset (in-case above call to get obs dims changed the state)
                     term_cfg.func.reset()
+
+    def _resample_term_delay(self, group_name: str, term_name: str, env_ids: Sequence[int] | None = None):
+        """Samples the delays of the term for the specified environments.
+
+        Args:
+            group_name: The name of the observation group.
+            term_name: The name of the observation term.
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+        """
+        # resolve environment ids
+        if env_ids is None:
+            env_ids = slice(None)
+        # obtain the delays
+        delays = self._group_obs_term_delay[group_name][term_name]
+        min_delay, max_delay = self._group_obs_term_cfgs[group_name][
+            self._group_obs_term_names[group_name].index(term_name)
+        ].delay_range
+        # sample the delays uniformly
+        delays[env_ids] = torch.randint_like(delays[env_ids], min_delay, max_delay + 1)
+
+    def _prepare_group_buffers(self):
+        """Prepares the persistent buffers for the groups that write the terms into them.
+
+        Each buffer has the shape (num_envs, group_obs_dim). For every term, a view into the buffer is stored
+        that corresponds to the term's slice along the last dimension.
+
+        Raises:
+            ValueError: If the term dimensions (except the last one) do not match within the group.
+        """
+        self._group_obs_buffer: dict[str, torch.Tensor] = dict()
+        self._group_obs_term_buffer_views: dict[str, list[torch.Tensor]] = dict()
+        # iterate over all the groups
+        for group_name, preallocate in self._group_obs_preallocate.items():
+            if not preallocate:
+                continue
+            # check that the terms can be concatenated along the last dimension
+            term_dims = self._group_obs_term_dim[group_name]
+            if any(dims[:-1] != term_dims[0][:-1] for dims in term_dims):
+                raise ValueError(
+                    f"Unable to preallocate the buffer for the observation group '{group_name}'. The term"
+                    f" dimensions must match except for the last one. Received: {term_dims}."
+                )
+            # create buffer for the group
+            group_buffer = torch.zeros((self.num_envs, *self._group_obs_dim[group_name]), device=self.device)
+            # create views for the terms
+            term_views = list()
+            start_idx = 0
+            for dims in term_dims:
+                term_views.append(group_buffer[..., start_idx : start_idx + dims[-1]])
+                start_idx += dims[-1]
+            # store the buffer and views
+            self._group_obs_buffer[group_name] = group_buffer
+            self._group_obs_term_buffer_views[group_name] = term_views
@@ -35,6 +35,9 @@ class RewardManager(ManagerBase):
         of the environment. This is done to ensure that the computed reward terms are balanced with
         respect to the chosen time-step interval in the environment.
 
+    The values of the reward terms are written into the columns of a single tensor of shape (num_envs, num_terms).
+    The net reward is then computed with one matrix-vector product against the vector of weights, and the
+    episodic sums of all the terms are accumulated in a single tensor of the same shape.
     """
 
     _env: RLTaskEnv
@@ -48,12 +51,19 @@ class RewardManager(ManagerBase):
             env: The environment instance.
         """
         super().__init__(cfg, env)
+        # create buffer for storing the value of each reward term
+        self._term_values = torch.zeros(self.num_envs, len(self._term_names), dtype=torch.float, device=self.device)
         # prepare extra info to store individual reward term information
-        self._episode_sums = dict()
-        for term_name in self._term_names:
-            self._episode_sums[term_name] = torch.zeros(self.num_envs, dtype=torch.float, device=self.device)
+        self._episode_sums = torch.zeros_like(self._term_values)
         # create buffer for managing reward per environment
         self._reward_buf = torch.zeros(self.num_envs, dtype=torch.float, device=self.device)
+        # create buffer for the weights of the reward terms
+        # note: the weights are scaled by the time-step interval when computing the reward
+        # note: the weights are read from the configuration of the terms at every call to compute, since
+        #   they can be modified in place (for example, by the curriculum terms)
+        self._term_weights: list[float] = list()
+        self._scaled_term_weights = torch.zeros(len(self._term_names), dtype=torch.float, device=self.device)
+        self._scaled_term_weights_dt: float | None = None
 
     def __str__(self) -> str:
         """Returns: A string representation for reward manager."""
@@ -62,13 +72,13 @@ class RewardManager(ManagerBase):
         # create table for term information
         table = PrettyTable()
         table.title = "Active Reward Terms"
-        table.field_names = ["Index", "Name", "Weight"]
+        table.field_names = ["Index", "Name", "Weight"] + self._get_term_stats_field_names()
         # set alignment of table columns
         table.align["Name"] = "l"
         table.align["Weight"] = "r"
         # add info on each term
         for index, (name, term_cfg) in enumerate(zip(self._term_names, self._term_cfgs)):
-            table.add_row([index, name, term_cfg.weight])
+            table.add_row([index, name, term_cfg.weight] + self._get_term_stats_row(name))
         # convert table to string
         msg += table.get_string()
         msg += "\n"
@@ -84,6 +94,27 @@ class RewardManager(ManagerBase):
         """Name of active reward terms."""
         return self._term_names
 
+    @property
+    def term_values(self) -> torch.Tensor:
+        """The unweighted values of the reward terms computed in the last call to :meth:`compute`.
+
+        Shape is (num_envs, num_terms), where the columns follow the order of :attr:`active_terms`.
+        The columns of terms with zero weight are not computed and remain zero.
+
+        Note:
+            The returned tensor is the internal buffer of the manager. It is overwritten on every call to
+            :meth:`compute` and should not be modified.
+        """
+        return self._term_values
+
+    @property
+    def episode_sums(self) -> torch.Tensor:
+        """The episodic sums of the weighted reward terms. Shape is (num_envs, num_terms).
+
+        The columns follow the order of :attr:`active_terms`.
+        """
+        return self._episode_sums
+
     """
     Operations.
     """
@@ -101,15 +132,15 @@ class RewardManager(ManagerBase):
         # resolve environment ids
         if env_ids is None:
             env_ids = slice(None)
+        # compute the average episodic sum of all the terms at once
+        # r_1 + r_2 + ... + r_n
+        episodic_sum_avg = torch.mean(self._episode_sums[env_ids], dim=0) / self._env.max_episode_length_s
         # store information
         extras = {}
-        for key in self._episode_sums.keys():
-            # store information
-            # r_1 + r_2 + ... + r_n
-            episodic_sum_avg = torch.mean(self._episode_sums[key][env_ids])
-            extras["Episode Reward/" + key] = episodic_sum_avg / self._env.max_episode_length_s
-            # reset episodic sum
-            self._episode_sums[key][env_ids] = 0.0
+        for index, key in enumerate(self._term_names):
+            extras["Episode Reward/" + key] = episodic_sum_avg[index]
+        # reset episodic sum
+        self._episode_sums[env_ids] = 0.0
         # reset all the reward terms
         for term_cfg in self._class_term_cfgs:
             term_cfg.func.reset(env_ids=env_ids)
@@ -119,8 +150,10 @@ class RewardManager(ManagerBase):
     def compute(self, dt: float) -> torch.Tensor:
         """Computes the reward signal as a weighted sum of individual terms.
 
-        This function calls each reward term managed by the class and adds them to compute the net
-        reward signal. It also updates the episodic sums corresponding to individual reward terms.
+        This function calls each reward term managed by the class and writes its value into the
+        corresponding column of :attr:`term_values`. The net reward signal is then computed as a
+        single matrix-vector product with the weights of the terms. It also updates the episodic sums
+        corresponding to individual reward terms.
 
         Args:
             dt: The time-step interval of the environment.
@@ -128,19 +161,21 @@ class RewardManager(ManagerBase):
         Returns:
             The net reward signal of shape (num_envs,).
         """
-        # reset computation
-        self._reward_buf[:] = 0.0
+        # update the scaled weights if the weights or the time-step changed
+        weights = [term_cfg.weight for term_cfg in self._term_cfgs]
+        if weights != self._term_weights or dt != self._scaled_term_weights_dt:
+            self._update_term_weights(weights, dt)
         # iterate over all the reward terms
-        for name, term_cfg in zip(self._term_names, self._term_cfgs):
+        for index, term_cfg in enumerate(self._term_cfgs):
             # skip if weight is zero (kind of a micro-optimization)
-            if term_cfg.weight == 0.0:
+            if weights[index] == 0.0:
                 continue
             # compute term's value
-            value = term_cfg.func(self._env, **term_cfg.params) * term_cfg.weight * dt
-            # update total reward
-            self._reward_buf += value
-            # update episodic sum
-            self._episode_sums[name] += value
+            self._term_values[:, index] = term_cfg.func(self._env, **term_cfg.params)
+        # compute the total reward
+        torch.mv(self._term_values, self._scaled_term_weights, out=self._reward_buf)
+        # update episodic sum
+        self._episode_sums.addcmul_(self._term_values, self._scaled_term_weights)
 
         return self._reward_buf
 
@@ -161,6 +196,7 @@ class RewardManager(ManagerBase):
         if term_name not in self._term_names:
             raise ValueError(f"Reward term '{term_name}' not found.")
         # set the configuration
+        # note: the weights of the terms are updated in the next call to compute
         self._term_cfgs[self._term_names.index(term_name)] = cfg
 
     def get_term_cfg(self, term_name: str) -> RewardTermCfg:
@@ -180,10 +216,31 @@ class RewardManager(ManagerBase):
         # return the configuration
         return self._term_cfgs[self._term_names.index(term_name)]
 
+    def _get_term_cfgs(self) -> dict[str, RewardTermCfg]:
+        """Returns the configurations of the terms handled by the manager."""
+        return dict(zip(self._term_names, self._term_cfgs))
+
     """
     Helper functions.
     """
 
+    def _update_term_weights(self, weights: list[float], dt: float):
+        """Updates the buffer of scaled weights.
+
+        Args:
+            weights: The weights of the terms.
+            dt: The time-step interval of the environment.
+        """
+        self._scaled_term_weights[:] = torch.tensor(weights, dtype=torch.float, device=self.device) * dt
+        # clear the values of the terms that are not computed
+        # note: this avoids propagating stale values (such as NaNs) through the weighted sum
+        for index, weight in enumerate(weights):
+            if weight == 0.0:
+                self._term_values[:, index] = 0.0
+        # store the weights used for the buffer
+        self._term_weights = weights
+        self._scaled_term_weights_dt = dt
+
     def _prepare_terms(self):
         """Prepares a list of reward functions."""
         # parse remaining reward terms and decimate their information
@@ -69,12 +69,12 @@ class TerminationManager(ManagerBase):
         # create table for term information
         table = PrettyTable()
         table.title = "Active Termination Terms"
-        table.field_names = ["Index", "Name", "Time Out"]
+        table.field_names = ["Index", "Name", "Time Out"] + self._get_term_stats_field_names()
         # set alignment of table columns
         table.align["Name"] = "l"
         # add info on each term
         for index, (name, term_cfg) in enumerate(zip(self._term_names, self._term_cfgs)):
-            table.add_row([index, name, term_cfg.time_out])
+            table.add_row([index, name, term_cfg.time_out] + self._get_term_stats_row(name))
         # convert table to string
         msg += table.get_string()
         msg += "\n"
@@ -214,6 +214,10 @@ class TerminationManager(ManagerBase):
         # return the configuration
         return self._term_cfgs[self._term_names.index(term_name)]
 
+    def _get_term_cfgs(self) -> dict[str, TerminationTermCfg]:
+        """Returns the configurations of the terms handled by the manager."""
+        return dict(zip(self._term_names, self._term_cfgs))
+
     """
     Helper functions.
     """
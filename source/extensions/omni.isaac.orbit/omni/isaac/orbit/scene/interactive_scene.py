@@ -16,7 +16,7 @@ from pxr import PhysxSchema
 
 import omni.isaac.orbit.sim as sim_utils
 from omni.isaac.orbit.assets import Articulation, ArticulationCfg, AssetBaseCfg, RigidObject, RigidObjectCfg
-from omni.isaac.orbit.sensors import FrameTransformerCfg, SensorBase, SensorBaseCfg
+from omni.isaac.orbit.sensors import FrameTransformerCfg, RayCasterCfg, SensorBase, SensorBaseCfg
 from omni.isaac.orbit.terrains import TerrainImporter, TerrainImporterCfg
 
 from .interactive_scene_cfg import InteractiveSceneCfg
@@ -348,6 +348,12 @@ class InteractiveScene:
                         target_frame.prim_path = target_frame.prim_path.format(ENV_REGEX_NS=self.env_regex_ns)
                         updated_target_frames.append(target_frame)
                     asset_cfg.target_frames = updated_target_frames
+                # Update dynamic mesh path(s)' regex name space for RayCaster
+                if isinstance(asset_cfg, RayCasterCfg):
+                    asset_cfg.dynamic_mesh_prim_paths = [
+                        prim_path.format(ENV_REGEX_NS=self.env_regex_ns)
+                        for prim_path in asset_cfg.dynamic_mesh_prim_paths
+                    ]
 
                 self._sensors[asset_name] = asset_cfg.class_type(asset_cfg)
             elif isinstance(asset_cfg, AssetBaseCfg):
@@ -5,7 +5,6 @@
 
 from __future__ import annotations
 
-import math
 import numpy as np
 import re
 import torch
@@ -198,6 +197,9 @@ class Camera(SensorBase):
     ):
         """Set parameters of the USD camera from its intrinsic matrix.
 
+        The intrinsic matrices in :attr:`CameraData.intrinsic_matrices` are cached and are only computed from the
+        parameters of the USD cameras at initialization and when they are set with this method.
+
         The intrinsic matrix and focal length are used to set the following parameters to the USD camera:
 
         - ``focal_length``: The focal length of the camera.
@@ -256,6 +258,8 @@ class Camera(SensorBase):
                 #   layer (default cameras are on session layer), and this is the simplest
                 #   way to set the property on the right layer.
                 omni.usd.set_prop_val(param_attr(), param_value)
+        # update the cached intrinsic matrices from the new parameters
+        self._update_intrinsic_matrices(env_ids)
 
     """
     Operations - Set pose.
@@ -345,7 +349,6 @@ class Camera(SensorBase):
         # reset the data
         # note: this recomputation is useful if one performs events such as randomizations on the camera poses.
         self._update_poses(env_ids)
-        self._update_intrinsic_matrices(env_ids)
         # Reset the frame count
         self._frame[env_ids] = 0
 
@@ -451,9 +454,8 @@ class Camera(SensorBase):
     def _update_buffers_impl(self, env_ids: Sequence[int]):
         # Increment frame count
         self._frame[env_ids] += 1
-        # -- intrinsic matrix
-        self._update_intrinsic_matrices(env_ids)
         # -- pose
+        # note: the intrinsic matrices are cached and only updated when they are set
         self._update_poses(env_ids)
         # -- read the data from annotator registry
         # check if buffer is called for the first time. If so then, allocate the memory
@@ -464,15 +466,19 @@ class Camera(SensorBase):
         else:
             # iterate over all the data types
             for name, annotators in self._rep_registry.items():
-                # iterate over all the annotators
-                for index in env_ids:
-                    # get the output
-                    output = annotators[index].get_data()
-                    # process the output
-                    data, info = self._process_annotator_output(name, output)
-                    # add data to output
-                    self._data.output[name][index] = data
-                    # add info to output
+                # get the outputs of the annotators
+                # note: replicator requires one annotator per render product
+                outputs = [annotators[index].get_data() for index in env_ids]
+                # process the outputs of all the cameras at once
+                data, infos = self._process_annotator_outputs(name, outputs)
+                # add data to output with a single copy into the buffer
+                buffer = self._data.output[name]
+                if len(env_ids) == self._view.count:
+                    buffer.copy_(data)
+                else:
+                    buffer[env_ids] = data
+                # add info to output
+                for index, info in zip(env_ids, infos):
                     self._data.info[index][name] = info
 
     """
@@ -507,6 +513,7 @@ class Camera(SensorBase):
         self._data.quat_w_world = torch.zeros((self._view.count, 4), device=self._device)
         # -- intrinsic matrix
         self._data.intrinsic_matrices = torch.zeros((self._view.count, 3, 3), device=self._device)
+        self._update_intrinsic_matrices(self._ALL_INDICES)
         self._data.image_shape = self.image_shape
         # -- output data
         # lazy allocation of data dictionary
@@ -520,29 +527,32 @@ class Camera(SensorBase):
 
         Also called calibration matrix. This matrix works for linear depth images. We assume square pixels.
 
+        The matrices are computed from the parameters of the USD cameras and cached. This function is only called
+        at initialization and when the intrinsic matrices are set with :meth:`set_intrinsic_matrices`.
+
         Note:
             The calibration matrix projects points in the 3D scene onto an imaginary screen of the camera.
             The coordinates of points on the image plane are in the homogeneous representation.
         """
-        # iterate over all cameras
-        for i in env_ids:
-            # Get corresponding sensor prim
-            sensor_prim = self._sensor_prims[i]
-            # get camera parameters
-            focal_length = sensor_prim.GetFocalLengthAttr().Get()
-            horiz_aperture = sensor_prim.GetHorizontalApertureAttr().Get()
-            # get viewport parameters
-            height, width = self.image_shape
-            # calculate the field of view
-            fov = 2 * math.atan(horiz_aperture / (2 * focal_length))
-            # calculate the focal length in pixels
-            focal_px = width * 0.5 / math.tan(fov / 2)
-            # create intrinsic matrix for depth linear
-            self._data.intrinsic_matrices[i, 0, 0] = focal_px
-            self._data.intrinsic_matrices[i, 0, 2] = width * 0.5
-            self._data.intrinsic_matrices[i, 1, 1] = focal_px
-            self._data.intrinsic_matrices[i, 1, 2] = height * 0.5
-            self._data.intrinsic_matrices[i, 2, 2] = 1
+        # get camera parameters
+        focal_lengths = [self._sensor_prims[i].GetFocalLengthAttr().Get() for i in env_ids]
+        horiz_apertures = [self._sensor_prims[i].GetHorizontalApertureAttr().Get() for i in env_ids]
+        focal_lengths = torch.tensor(focal_lengths, dtype=torch.float64)
+        horiz_apertures = torch.tensor(horiz_apertures, dtype=torch.float64)
+        # get viewport parameters
+        height, width = self.image_shape
+        # calculate the field of view
+        fov = 2 * torch.atan(horiz_apertures / (2 * focal_lengths))
+        # calculate the focal length in pixels
+        focal_px = width * 0.5 / torch.tan(fov / 2)
+        # create intrinsic matrix for depth linear
+        intrinsic_matrices = torch.zeros((len(focal_px), 3, 3))
+        intrinsic_matrices[:, 0, 0] = focal_px
+        intrinsic_matrices[:, 0, 2] = width * 0.5
+        intrinsic_matrices[:, 1, 1] = focal_px
+        intrinsic_matrices[:, 1, 2] = height * 0.5
+        intrinsic_matrices[:, 2, 2] = 1
+        self._data.intrinsic_matrices[env_ids] = intrinsic_matrices.to(self._device)
 
     def _update_poses(self, env_ids: Sequence[int]):
         """Computes the pose of the camera in the world frame with ROS convention.
@@ -566,64 +576,69 @@ class Camera(SensorBase):
         """Create the buffers to store the annotator data.
 
         We create a buffer for each annotator and store the data in a dictionary. Since the data
-        shape is not known beforehand, we create a list of buffers and concatenate them later.
+        shape is not known beforehand, the buffers are allocated from the first outputs of the annotators.
+        The buffers are then reused to store the data of the following updates.
 
         This is an expensive operation and should be called only once.
         """
         # add data from the annotators
         for name, annotators in self._rep_registry.items():
-            # create a list to store the data for each annotator
-            data_all_cameras = list()
-            # iterate over all the annotators
-            for index in self._ALL_INDICES:
-                # get the output
-                output = annotators[index].get_data()
-                # process the output
-                data, info = self._process_annotator_output(name, output)
-                # append the data
-                data_all_cameras.append(data)
-                # store the info
+            # get the outputs of all the annotators
+            outputs = [annotators[index].get_data() for index in self._ALL_INDICES]
+            # process the outputs of all the cameras at once
+            data, infos = self._process_annotator_outputs(name, outputs)
+            # store the info
+            for index, info in enumerate(infos):
                 self._data.info[index][name] = info
-            # concatenate the data along the batch dimension
-            self._data.output[name] = torch.stack(data_all_cameras, dim=0)
+            # store the data batched along the first dimension
+            self._data.output[name] = data
+
+    def _process_annotator_outputs(self, name: str, outputs: list[Any]) -> tuple[torch.Tensor, list[dict | None]]:
+        """Process the annotator outputs of a data type for a batch of cameras.
 
-    def _process_annotator_output(self, name: str, output: Any) -> tuple[torch.tensor, dict | None]:
-        """Process the annotator output.
+        The data of the cameras are stacked before they are converted to a torch tensor. Thus, the data of
+        annotators on the CPU are transferred to the device with a single copy.
 
-        This function is called after the data has been collected from all the cameras.
+        Args:
+            name: The name of the data type.
+            outputs: The outputs of the annotators of the cameras.
+
+        Returns:
+            A tuple containing the data stacked along the first dimension, and the info of each camera.
         """
-        # extract info and data from the output
-        if isinstance(output, dict):
-            data = output["data"]
-            info = output["info"]
+        # extract info and data from the outputs
+        if isinstance(outputs[0], dict):
+            data = [output["data"] for output in outputs]
+            infos = [output["info"] for output in outputs]
         else:
-            data = output
-            info = None
-        # convert data into torch tensor
-        data = convert_to_torch(data, device=self.device)
+            data = outputs
+            infos = [None] * len(outputs)
+        # stack the data and convert it into a torch tensor
+        if isinstance(data[0], np.ndarray):
+            data = convert_to_torch(np.stack(data), device=self.device)
+        else:
+            data = torch.stack([convert_to_torch(array, device=self.device) for array in data])
 
         # process data for different segmentation types
         # Note: Replicator returns raw buffers of dtype int32 for segmentation types
         #   so we need to convert them to uint8 4 channel images for colorized types
         height, width = self.image_shape
         if name == "semantic_segmentation":
-            if self.cfg.colorize_semantic_segmentation:
-                data = data.view(torch.uint8).reshape(height, width, -1)
-            else:
-                data = data.view(height, width)
+            colorize = self.cfg.colorize_semantic_segmentation
         elif name == "instance_segmentation_fast":
-            if self.cfg.colorize_instance_segmentation:
-                data = data.view(torch.uint8).reshape(height, width, -1)
-            else:
-                data = data.view(height, width)
+            colorize = self.cfg.colorize_instance_segmentation
         elif name == "instance_id_segmentation_fast":
-            if self.cfg.colorize_instance_id_segmentation:
-                data = data.view(torch.uint8).reshape(height, width, -1)
+            colorize = self.cfg.colorize_instance_id_segmentation
+        else:
+            colorize = None
+        if colorize is not None:
+            if colorize:
+                data = data.view(torch.uint8).reshape(len(outputs), height, width, -1)
             else:
-                data = data.view(height, width)
+                data = data.view(len(outputs), height, width)
 
         # return the data and info
-        return data, info
+        return data, infos
 
     """
     Internal simulation callbacks.
@@ -13,7 +13,7 @@ import numpy as np
 import torch
 import torch.nn.functional as F
 from collections.abc import Sequence
-from typing import Literal
+from typing import Any, Literal
 
 import omni.isaac.core.utils.stage as stage_utils
 import warp as wp
@@ -262,6 +262,182 @@ def create_pointcloud_from_rgbd(
         return points_xyz, points_rgb
 
 
+def create_pointclouds_from_depth(
+    intrinsic_matrices: torch.Tensor | np.ndarray | wp.array,
+    depth: torch.Tensor | np.ndarray | wp.array,
+    positions: torch.Tensor | None = None,
+    orientations: torch.Tensor | None = None,
+    voxel_size: float | None = None,
+    output_format: Literal["padded", "packed"] = "padded",
+    device: torch.device | str | None = None,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    r"""Creates the pointclouds of a batch of cameras from their depth images and intrinsic matrices.
+
+    This function provides the same functionality as :meth:`create_pointcloud_from_depth` for a batch of
+    cameras at once. The depth images of all the cameras are unprojected with a single batched operation
+    and transformed to the target frame with a single call to :meth:`omni.isaac.orbit.utils.math.transform_points`.
+    The rays through the pixels of the cameras are cached for the last intrinsic matrices, such that they are not
+    recomputed as long as the intrinsic matrices are not modified.
+
+    Since the number of valid points differs between the cameras, the pointclouds are returned in one of the
+    following formats:
+
+    - ``"padded"``: A tensor of shape (N, P, 3) and a validity mask of shape (N, P). The invalid points are zero.
+      The valid points of a camera are in the same order as the points returned by
+      :meth:`create_pointcloud_from_depth`.
+    - ``"packed"``: A tensor of shape (M, 3) with the valid points of all the cameras, and the offsets of the
+      points of each camera of shape (N + 1,). The points of the camera ``i`` are ``points[offsets[i]:offsets[i + 1]]``.
+
+    If :obj:`voxel_size` is provided, the pointclouds are downsampled with :meth:`voxel_downsample_pointclouds`.
+
+    Args:
+        intrinsic_matrices: The calibration matrices of the cameras. Shape is (N, 3, 3) or (3, 3).
+        depth: The depth images of the cameras. Shape is (N, H, W) or (N, H, W, 1).
+        positions: The positions of the cameras in a target frame. Shape is (N, 3). Defaults to None.
+        orientations: The orientations (w, x, y, z) of the cameras in a target frame. Shape is (N, 4).
+            Defaults to None.
+        voxel_size: The size of the voxels (in m) to downsample the pointclouds. Defaults to None, in which case
+            the pointclouds are not downsampled.
+        output_format: The format of the returned pointclouds. Defaults to "padded".
+        device: The device for torch where the computation should be executed.
+            Defaults to None, i.e. takes the device that matches the depth images.
+
+    Returns:
+        A tuple containing the points and either the validity mask or the offsets, depending on the output format.
+
+    Raises:
+        ValueError: When the output format is not "padded" or "packed".
+    """
+    points, _, mask = _create_pointclouds(intrinsic_matrices, depth, None, positions, orientations, device)
+    # downsample the pointclouds
+    if voxel_size is not None:
+        points, _, mask = voxel_downsample_pointclouds(points, mask, voxel_size)
+    points, _, mask_or_offsets = _format_pointclouds(points, None, mask, output_format)
+    return points, mask_or_offsets
+
+
+def create_pointclouds_from_rgbd(
+    intrinsic_matrices: torch.Tensor | np.ndarray | wp.array,
+    depth: torch.Tensor | np.ndarray | wp.array,
+    rgb: torch.Tensor | np.ndarray | wp.array | tuple[float, float, float] | None = None,
+    normalize_rgb: bool = False,
+    positions: torch.Tensor | None = None,
+    orientations: torch.Tensor | None = None,
+    num_channels: int = 3,
+    voxel_size: float | None = None,
+    output_format: Literal["padded", "packed"] = "padded",
+    device: torch.device | str | None = None,
+) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Creates the colored pointclouds of a batch of cameras from their depth and RGB images.
+
+    This function provides the same functionality as :meth:`create_pointclouds_from_depth` but also returns
+    the color of each point, as in :meth:`create_pointcloud_from_rgbd`. The colors are returned in the same
+    format as the points. If the pointclouds are downsampled, the color of a voxel is the mean color of its points.
+
+    Args:
+        intrinsic_matrices: The calibration matrices of the cameras. Shape is (N, 3, 3) or (3, 3).
+        depth: The depth images of the cameras. Shape is (N, H, W) or (N, H, W, 1).
+        rgb: The color of the pointclouds. If an array/tensor of shape (N, H, W, 3) or (N, H, W, 4), the channels
+            encode the RGB values of the pixels. If a tuple, all the points have the color (r, g, b).
+            Defaults to None, in which case the color is (0, 0, 0).
+        normalize_rgb: Whether to normalize the RGB values to [0, 1]. Defaults to False.
+        positions: The positions of the cameras in a target frame. Shape is (N, 3). Defaults to None.
+        orientations: The orientations (w, x, y, z) of the cameras in a target frame. Shape is (N, 4).
+            Defaults to None.
+        num_channels: Number of channels of the colors. Defaults to 3.
+        voxel_size: The size of the voxels (in m) to downsample the pointclouds. Defaults to None, in which case
+            the pointclouds are not downsampled.
+        output_format: The format of the returned pointclouds. Defaults to "padded".
+        device: The device for torch where the computation should be executed.
+            Defaults to None, i.e. takes the device that matches the depth images.
+
+    Returns:
+        A tuple containing the points, their colors and either the validity mask or the offsets, depending on the
+        output format.
+
+    Raises:
+        ValueError: When the rgb images are not of shape (N, H, W, 3) or (N, H, W, 4).
+        ValueError: When the number of channels is not 3 or 4.
+        ValueError: When the output format is not "padded" or "packed".
+    """
+    # check valid inputs
+    if rgb is not None and not isinstance(rgb, tuple):
+        if len(rgb.shape) != 4 or rgb.shape[3] not in [3, 4]:
+            raise ValueError(f"Input rgb images of invalid shape: {rgb.shape} != (N, H, W, 3) or (N, H, W, 4).")
+    if num_channels not in [3, 4]:
+        raise ValueError(f"Invalid number of channels: {num_channels} != 3 or 4.")
+
+    # default color is black
+    if rgb is None:
+        rgb = (0.0, 0.0, 0.0)
+    points, colors, mask = _create_pointclouds(intrinsic_matrices, depth, rgb, positions, orientations, device)
+    # normalize color values
+    if normalize_rgb:
+        colors = colors / 255
+    # downsample the pointclouds
+    if voxel_size is not None:
+        points, colors, mask = voxel_downsample_pointclouds(points, mask, voxel_size, colors)
+    # add additional channels if required
+    if num_channels == 4:
+        colors = torch.nn.functional.pad(colors, (0, 1), mode="constant", value=1.0)
+    return _format_pointclouds(points, colors, mask, output_format)
+
+
+def voxel_downsample_pointclouds(
+    points: torch.Tensor, mask: torch.Tensor, voxel_size: float, colors: torch.Tensor | None = None
+) -> tuple[torch.Tensor, torch.Tensor | None, torch.Tensor]:
+    """Downsamples a batch of padded pointclouds on a voxel grid.
+
+    The valid points of each pointcloud are grouped by the voxel of a regular grid in which they lie, and each
+    voxel is replaced by the mean of its points. The voxels of all the pointclouds are computed at once with
+    torch operations, so that the downsampling runs on the device of the points.
+
+    Args:
+        points: The padded pointclouds. Shape is (N, P, 3).
+        mask: The validity mask of the points. Shape is (N, P).
+        voxel_size: The size of the voxels (in m).
+        colors: The colors of the points. Shape is (N, P, C). Defaults to None.
+
+    Returns:
+        A tuple containing the downsampled padded pointclouds of shape (N, V, 3), their mean colors of shape
+        (N, V, C) (None if no colors are provided) and their validity mask of shape (N, V), where V is the
+        largest number of voxels of a pointcloud.
+    """
+    num_clouds = points.shape[0]
+    # find the voxels of the valid points
+    # note: the voxels are sorted by pointcloud since the pointcloud index is the first key
+    cloud_ids = torch.nonzero(mask)[:, 0]
+    valid_points = points[mask]
+    voxel_keys = torch.cat([cloud_ids.unsqueeze(1), torch.floor(valid_points / voxel_size).long()], dim=1)
+    voxel_keys, voxel_ids, voxel_counts = torch.unique(voxel_keys, dim=0, return_inverse=True, return_counts=True)
+    # compute the mean of the points in each voxel
+    voxel_counts = voxel_counts.unsqueeze(1).to(points.dtype)
+    voxel_points = torch.zeros((len(voxel_keys), 3), dtype=points.dtype, device=points.device)
+    voxel_points = voxel_points.index_add_(0, voxel_ids, valid_points) / voxel_counts
+    if colors is not None:
+        colors = colors.to(points.dtype)
+        voxel_colors = torch.zeros((len(voxel_keys), colors.shape[-1]), dtype=colors.dtype, device=colors.device)
+        voxel_colors = voxel_colors.index_add_(0, voxel_ids, colors[mask]) / voxel_counts
+    # scatter the voxels into padded pointclouds
+    voxel_cloud_ids = voxel_keys[:, 0]
+    num_voxels = torch.bincount(voxel_cloud_ids, minlength=num_clouds)
+    offsets = torch.cumsum(num_voxels, dim=0) - num_voxels
+    voxel_indices = torch.arange(len(voxel_keys), device=points.device) - offsets[voxel_cloud_ids]
+    max_num_voxels = int(num_voxels.max()) if num_clouds > 0 else 0
+    downsampled_mask = torch.zeros((num_clouds, max_num_voxels), dtype=torch.bool, device=points.device)
+    downsampled_mask[voxel_cloud_ids, voxel_indices] = True
+    downsampled_points = torch.zeros((num_clouds, max_num_voxels, 3), dtype=points.dtype, device=points.device)
+    downsampled_points[voxel_cloud_ids, voxel_indices] = voxel_points
+    if colors is not None:
+        downsampled_colors = torch.zeros(
+            (num_clouds, max_num_voxels, colors.shape[-1]), dtype=colors.dtype, device=colors.device
+        )
+        downsampled_colors[voxel_cloud_ids, voxel_indices] = voxel_colors
+    else:
+        downsampled_colors = None
+    return downsampled_points, downsampled_colors, downsampled_mask
+
+
 def convert_orientation_convention(
     orientation: torch.Tensor,
     origin: Literal["opengl", "ros", "world"] = "opengl",
@@ -397,3 +573,135 @@ def create_rotation_matrix_from_view(
         x_axis = torch.where(is_close, replacement, x_axis)
     R = torch.cat((x_axis[:, None, :], y_axis[:, None, :], z_axis[:, None, :]), dim=1)
     return R.transpose(1, 2)
+
+
+"""
+Helper functions.
+"""
+
+# the rays through the pixels of the last intrinsic matrices used to create batched pointclouds
+_PIXEL_RAYS_CACHE: dict[str, Any] = {"intrinsic_matrices": None, "image_shape": None, "rays": None}
+
+
+def _get_pixel_rays(intrinsic_matrices: torch.Tensor, height: int, width: int) -> torch.Tensor:
+    """Gets the rays through the pixels of a batch of cameras with unit depth.
+
+    The rays are cached for the last intrinsic matrices and image size. They are only recomputed when
+    the values of the intrinsic matrices or the image size change.
+
+    Args:
+        intrinsic_matrices: The calibration matrices of the cameras. Shape is (N, 3, 3) or (3, 3).
+        height: The height of the images.
+        width: The width of the images.
+
+    Returns:
+        The rays through the pixels in the frame of the cameras. Shape is (N, H x W, 3) or (1, H x W, 3).
+    """
+    cached_matrices, rays = _PIXEL_RAYS_CACHE["intrinsic_matrices"], _PIXEL_RAYS_CACHE["rays"]
+    # check if the cached rays match the inputs
+    # note: comparing the matrices is much cheaper than computing the rays
+    is_cached = (
+        cached_matrices is not None
+        and cached_matrices.shape == intrinsic_matrices.shape
+        and cached_matrices.device == intrinsic_matrices.device
+        and _PIXEL_RAYS_CACHE["image_shape"] == (height, width)
+        and torch.equal(cached_matrices, intrinsic_matrices)
+    )
+    if not is_cached:
+        # unproject an image of unit depth
+        depth = torch.ones((1, height, width), dtype=torch.float32, device=intrinsic_matrices.device)
+        rays = math_utils.unproject_depth(depth, intrinsic_matrices)
+        _PIXEL_RAYS_CACHE.update(intrinsic_matrices=intrinsic_matrices.clone(), image_shape=(height, width), rays=rays)
+    return rays
+
+
+def _create_pointclouds(
+    intrinsic_matrices: torch.Tensor | np.ndarray | wp.array,
+    depth: torch.Tensor | np.ndarray | wp.array,
+    rgb: torch.Tensor | np.ndarray | wp.array | tuple[float, float, float] | None,
+    positions: torch.Tensor | None,
+    orientations: torch.Tensor | None,
+    device: torch.device | str | None,
+) -> tuple[torch.Tensor, torch.Tensor | None, torch.Tensor]:
+    """Creates the padded pointclouds of a batch of cameras.
+
+    Please check :meth:`create_pointclouds_from_rgbd` for the description of the arguments.
+
+    Returns:
+        A tuple containing the points of shape (N, H x W, 3), their colors of shape (N, H x W, 3) (None if
+        :obj:`rgb` is None) and their validity mask of shape (N, H x W).
+    """
+    # decide device
+    if device is None and isinstance(depth, np.ndarray):
+        device = torch.device("cpu")
+    # convert inputs to torch tensors
+    depth = convert_to_torch(depth, dtype=torch.float32, device=device)
+    # update the device with the device of the depth images
+    # note: this is needed since warp does not provide the device directly
+    device = depth.device
+    intrinsic_matrices = convert_to_torch(intrinsic_matrices, dtype=torch.float32, device=device)
+    if positions is not None:
+        positions = convert_to_torch(positions, dtype=torch.float32, device=device)
+    if orientations is not None:
+        orientations = convert_to_torch(orientations, dtype=torch.float32, device=device)
+    # make the depth images of shape (N, H, W)
+    if depth.dim() == 4:
+        depth = depth.squeeze(dim=3)
+    if depth.dim() != 3:
+        raise ValueError(f"Expected depth images of shape (N, H, W) or (N, H, W, 1): got shape {depth.shape}.")
+    num_cameras, height, width = depth.shape
+
+    # unproject the depth images along the rays of the pixels
+    # note: the pixels are ordered along the height first, as in :meth:`math_utils.unproject_depth`
+    rays = _get_pixel_rays(intrinsic_matrices, height, width)
+    points = rays * depth.transpose(1, 2).reshape(num_cameras, -1, 1)
+    # convert 3D points to the target frame
+    points = math_utils.transform_points(points, positions, orientations)
+    # find the valid points
+    mask = torch.isfinite(points).all(dim=2)
+    points[~mask] = 0.0
+
+    # extract color values
+    if rgb is None:
+        colors = None
+    elif isinstance(rgb, tuple):
+        # same color for all points
+        colors = torch.tensor(rgb, dtype=torch.float32, device=device).expand(num_cameras, height * width, 3)
+    else:
+        # convert the images to (N, W, H, 3) from (N, H, W, 3) since the pixels are ordered along the height first
+        rgb = convert_to_torch(rgb, dtype=torch.float32, device=device)
+        colors = rgb[..., :3].transpose(1, 2).reshape(num_cameras, -1, 3)
+    return points, colors, mask
+
+
+def _format_pointclouds(
+    points: torch.Tensor,
+    colors: torch.Tensor | None,
+    mask: torch.Tensor,
+    output_format: Literal["padded", "packed"],
+) -> tuple[torch.Tensor, torch.Tensor | None, torch.Tensor]:
+    """Formats padded pointclouds into the output format.
+
+    Args:
+        points: The padded pointclouds. Shape is (N, P, 3).
+        colors: The colors of the points. Shape is (N, P, C).
+        mask: The validity mask of the points. Shape is (N, P).
+        output_format: The format of the returned pointclouds, i.e. "padded" or "packed".
+
+    Returns:
+        A tuple containing the points, their colors and either the validity mask or the offsets.
+
+    Raises:
+        ValueError: When the output format is not "padded" or "packed".
+    """
+    if output_format == "padded":
+        # set the color of the invalid points to zero
+        if colors is not None:
+            colors = torch.where(mask.unsqueeze(-1), colors, 0.0)
+        return points, colors, mask
+    elif output_format == "packed":
+        offsets = torch.zeros(mask.shape[0] + 1, dtype=torch.long, device=mask.device)
+        torch.cumsum(mask.sum(dim=1), dim=0, out=offsets[1:])
+        return points[mask], colors[mask] if colors is not None else None, offsets
+    else:
+        raise ValueError(f"Invalid output format: '{output_format}'. Expected 'padded' or 'packed'.")
@@ -81,6 +81,9 @@ class ContactSensor(SensorBase):
     def data(self) -> ContactSensorData:
         # update sensors if needed
         self._update_outdated_buffers()
+        # order the history of the contact forces if it changed since the last read
+        if self.cfg.history_length > 0 and self._is_history_outdated:
+            self._order_net_forces_w_history()
         # return the data
         return self._data
 
@@ -125,8 +128,8 @@ class ContactSensor(SensorBase):
             env_ids = slice(None)
         # reset accumulative data buffers
         self._data.net_forces_w[env_ids] = 0.0
-        self._data.net_forces_w_history[env_ids] = 0.0
         if self.cfg.history_length > 0:
+            self._net_forces_w_history_buffer[env_ids] = 0.0
             self._data.net_forces_w_history[env_ids] = 0.0
         # reset force matrix
         if len(self.cfg.filter_prim_paths_expr) != 0:
@@ -269,9 +272,19 @@ class ContactSensor(SensorBase):
         # optional buffers
         # -- history of net forces
         if self.cfg.history_length > 0:
-            self._data.net_forces_w_history = torch.zeros(
+            # the history is written into a circular buffer and only ordered when the data is read
+            self._net_forces_w_history_buffer = torch.zeros(
                 self._num_envs, self.cfg.history_length, self._num_bodies, 3, device=self._device
             )
+            self._data.net_forces_w_history = torch.zeros_like(self._net_forces_w_history_buffer)
+            # index of the most recent entry in the circular buffer for each sensor
+            self._history_head = torch.zeros(self._num_envs, dtype=torch.long, device=self._device)
+            # offsets of the entries from the most recent to the oldest
+            self._history_offsets = torch.arange(self.cfg.history_length, device=self._device)
+            # indices of the first entry of each sensor in the flattened circular buffer
+            self._history_start_ids = torch.arange(self._num_envs, device=self._device) * self.cfg.history_length
+            # flag for whether the ordered history needs to be updated
+            self._is_history_outdated = False
         else:
             self._data.net_forces_w_history = self._data.net_forces_w.unsqueeze(1)
         # -- pose of sensor origins
@@ -303,9 +316,23 @@ class ContactSensor(SensorBase):
         net_forces_w = self.contact_physx_view.get_net_contact_forces(dt=self._sim_physics_dt)
         self._data.net_forces_w[env_ids, :, :] = net_forces_w.view(-1, self._num_bodies, 3)[env_ids]
         # update contact force history
+        # note: the forces are written at the next position of the circular buffer. This avoids shifting
+        #   the whole history, which would scale with the history length.
         if self.cfg.history_length > 0:
-            self._data.net_forces_w_history[env_ids, 1:] = self._data.net_forces_w_history[env_ids, :-1].clone()
-            self._data.net_forces_w_history[env_ids, 0] = self._data.net_forces_w[env_ids]
+            # move the head of the updated sensors
+            if isinstance(env_ids, slice):
+                self._history_head.add_(1).remainder_(self.cfg.history_length)
+                history_ids = self._history_start_ids + self._history_head
+            else:
+                history_head = (self._history_head[env_ids] + 1) % self.cfg.history_length
+                self._history_head[env_ids] = history_head
+                history_ids = self._history_start_ids[env_ids] + history_head
+            # write the forces at the head
+            self._net_forces_w_history_buffer.view(-1, self._num_bodies, 3).index_copy_(
+                0, history_ids, self._data.net_forces_w[env_ids]
+            )
+            # mark the ordered history as outdated
+            self._is_history_outdated = True
 
         # obtain the contact force matrix
         if len(self.cfg.filter_prim_paths_expr) != 0:
@@ -350,6 +377,24 @@ class ContactSensor(SensorBase):
                 is_contact, self._data.current_contact_time[env_ids] + elapsed_time.unsqueeze(-1), 0.0
             )
 
+    def _order_net_forces_w_history(self):
+        """Orders the history of the contact forces from the most recent to the oldest entry.
+
+        The ordered history is gathered from the circular buffer into :attr:`ContactSensorData.net_forces_w_history`.
+        """
+        # indices of the entries from the most recent to the oldest: (N, T)
+        indices = torch.remainder(self._history_head.unsqueeze(1) - self._history_offsets, self.cfg.history_length)
+        # convert to indices in the flattened circular buffer: (N * T,)
+        indices = (indices + self._history_start_ids.unsqueeze(1)).view(-1)
+        # gather the entries into the data buffer
+        torch.index_select(
+            self._net_forces_w_history_buffer.view(-1, self._num_bodies * 3),
+            dim=0,
+            index=indices,
+            out=self._data.net_forces_w_history.view(-1, self._num_bodies * 3),
+        )
+        self._is_history_outdated = False
+
     def _set_debug_vis_impl(self, debug_vis: bool):
         # set visibility of markers
         # note: parent only deals with callbacks. not their visibility
@@ -45,6 +45,10 @@ class ContactSensorData:
     and B is the number of bodies in each sensor.
 
     In the history dimension, the first index is the most recent and the last index is the oldest.
+
+    Note:
+        Internally, the sensor stores the history in a circular buffer. The ordered history is only
+        gathered into this buffer when the sensor data is read after an update.
     """
 
     force_matrix_w: torch.Tensor | None = None
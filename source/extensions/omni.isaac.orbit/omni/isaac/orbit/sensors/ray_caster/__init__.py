@@ -6,6 +6,8 @@
 """Sub-module for Warp-based ray-cast sensor."""
 
 from . import patterns
+from .height_field_scanner import HeightFieldScanner
+from .height_field_scanner_cfg import HeightFieldScannerCfg
 from .ray_caster import RayCaster
 from .ray_caster_camera import RayCasterCamera
 from .ray_caster_camera_cfg import RayCasterCameraCfg
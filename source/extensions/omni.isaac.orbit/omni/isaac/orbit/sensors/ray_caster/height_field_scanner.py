@@ -0,0 +1,149 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import carb
+
+from omni.isaac.orbit.terrains.utils import create_height_map, sample_height_map
+
+from .ray_caster import RayCaster
+
+if TYPE_CHECKING:
+    from .height_field_scanner_cfg import HeightFieldScannerCfg
+
+
+class HeightFieldScanner(RayCaster):
+    """A height scanner that looks up the heights in a height map instead of ray-casting the meshes.
+
+    At initialization, the static meshes are converted to warp meshes as for the :class:`RayCaster` class and
+    are rasterized into a dense height map by ray-casting downwards on a regular grid. At every update, the
+    height below each ray start is then interpolated bilinearly from the height map with a single gather
+    operation, which is much faster than ray-casting the meshes.
+
+    The sensor data is the same as for the :class:`RayCaster` class. Thus, the sensor can be used with the
+    observation terms that consume height scans, such as :func:`omni.isaac.orbit.envs.mdp.observations.height_scan`.
+    Since the height map does not store which mesh is the highest one, the mesh ids of the hits are zero.
+
+    The height map only describes the highest surface at each position. Thus, the sensor only supports rays
+    pointing downwards in the world frame, which is the case for grid patterns with :obj:`cfg.attach_yaw_only`
+    set to True. The rays that start below the surface or outside the height map are considered as missed.
+
+    .. note::
+        Moving meshes are not supported since the height map is only computed again when the static meshes
+        are refreshed (see :meth:`RayCaster.refresh_meshes`).
+    """
+
+    cfg: HeightFieldScannerCfg
+    """The configuration parameters."""
+
+    def __init__(self, cfg: HeightFieldScannerCfg):
+        """Initializes the height-field scanner object.
+
+        Args:
+            cfg: The configuration parameters.
+
+        Raises:
+            ValueError: If the rays do not only track the yaw orientation or moving meshes are specified.
+        """
+        # check the configuration
+        if not cfg.attach_yaw_only:
+            raise ValueError("The height-field scanner only supports rays that track the yaw orientation only.")
+        if len(cfg.dynamic_mesh_prim_paths) > 0:
+            raise ValueError(
+                "The height-field scanner does not support moving meshes. Received dynamic mesh prim paths:"
+                f" {cfg.dynamic_mesh_prim_paths}."
+            )
+        # initialize base class
+        super().__init__(cfg)
+
+    def __str__(self) -> str:
+        """Returns: A string containing information about the instance."""
+        return (
+            super().__str__()
+            + f"\n\theight map shape     : {tuple(self._height_map.shape)}\n"
+            + f"\theight map resolution: {self.cfg.resolution}"
+        )
+
+    """
+    Implementation.
+    """
+
+    def refresh_meshes(self):
+        # refresh the warp meshes
+        super().refresh_meshes()
+        # rasterize the static meshes into a height map
+        self._height_map, self._height_map_origin = create_height_map(
+            [RayCaster.meshes[mesh_prim_path] for mesh_prim_path in self._static_mesh_prim_paths],
+            self.cfg.resolution,
+            x_range=self.cfg.map_x_range,
+            y_range=self.cfg.map_y_range,
+        )
+        # print info
+        carb.log_info(
+            f"Created height map of shape {tuple(self._height_map.shape)} for: {self._static_mesh_prim_paths}."
+        )
+
+    def _initialize_rays_impl(self):
+        # initialize the rays
+        super()._initialize_rays_impl()
+        # check that the rays point downwards
+        down = torch.tensor([0.0, 0.0, -1.0], device=self._device)
+        if not torch.allclose(self.ray_directions, down.expand_as(self.ray_directions), atol=1e-6):
+            raise ValueError(
+                "The height-field scanner only supports rays pointing downwards. Please check the ray pattern and"
+                " the offset rotation of the sensor."
+            )
+
+    def _raycast(
+        self,
+        env_ids: Sequence[int],
+        ray_starts_w: torch.Tensor,
+        ray_directions_w: torch.Tensor,
+        max_dist: float = 1e6,
+        return_distance: bool = False,
+        return_normal: bool = False,
+        return_face_id: bool = False,
+        return_mesh_id: bool = False,
+    ) -> tuple[torch.Tensor, torch.Tensor | None, torch.Tensor | None, torch.Tensor | None, torch.Tensor | None]:
+        """Looks up the heights below the ray starts in the height map.
+
+        Args:
+            env_ids: The sensor ids of the rays.
+            ray_starts_w: The starting positions of the rays in the world frame. Shape is (len(env_ids), B, 3).
+            ray_directions_w: The directions of the rays in the world frame. Shape is (len(env_ids), B, 3).
+                These are assumed to point downwards.
+            max_dist: The maximum distance to ray-cast. Defaults to 1e6.
+            return_distance: Whether to return the distance of the ray until it hits the surface. Defaults to False.
+            return_normal: Not supported. The normals are always None.
+            return_face_id: Not supported. The face ids are always None.
+            return_mesh_id: Whether to return the mesh ids, which are zero for the hits. Defaults to False.
+
+        Returns:
+            The same outputs as :meth:`omni.isaac.orbit.utils.warp.raycast_meshes`, with None for the normals
+            and the face ids.
+        """
+        # interpolate the heights below the ray starts
+        heights = sample_height_map(
+            self._height_map, self._height_map_origin, self.cfg.resolution, ray_starts_w[..., :2]
+        )
+        # compute the distances and find the missed rays
+        # note: the distances of the rays outside the height map are negative infinity
+        ray_distances = ray_starts_w[..., 2] - heights
+        is_hit = (ray_distances >= 0.0) & (ray_distances <= max_dist)
+        # compute the hits
+        ray_hits_w = torch.cat([ray_starts_w[..., :2], heights.unsqueeze(-1)], dim=-1)
+        ray_hits_w[~is_hit] = float("inf")
+        # compute the optional outputs
+        if return_distance:
+            ray_distances[~is_hit] = float("inf")
+        else:
+            ray_distances = None
+        ray_mesh_ids = torch.where(is_hit, 0, -1).int() if return_mesh_id else None
+        return ray_hits_w, ray_distances, None, None, ray_mesh_ids
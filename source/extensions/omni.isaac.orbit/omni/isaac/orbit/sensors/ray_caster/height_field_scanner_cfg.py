@@ -0,0 +1,45 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Configuration for the height-field scanner sensor."""
+
+from omni.isaac.orbit.utils import configclass
+
+from .height_field_scanner import HeightFieldScanner
+from .ray_caster_cfg import RayCasterCfg
+
+
+@configclass
+class HeightFieldScannerCfg(RayCasterCfg):
+    """Configuration for the height-field scanner sensor."""
+
+    class_type: type = HeightFieldScanner
+
+    attach_yaw_only: bool = True
+    """Whether the rays' starting positions and directions only track the yaw orientation. Defaults to True.
+
+    The height-field scanner only supports rays that point downwards in the world frame. Thus, this must be True.
+    """
+
+    resolution: float = 0.1
+    """The distance between two cells of the height map (in m). Defaults to 0.1.
+
+    The heights are interpolated bilinearly between the cells. For height-field terrains, the scanned heights
+    match the surface of the terrain if its horizontal scale is a multiple of the resolution.
+    """
+
+    map_x_range: tuple[float, float] | None = None
+    """The range of x coordinates (in m) covered by the height map. Defaults to None.
+
+    If None, the range of x coordinates of the vertices of the meshes is used. This must be specified for
+    infinite ground planes.
+    """
+
+    map_y_range: tuple[float, float] | None = None
+    """The range of y coordinates (in m) covered by the height map. Defaults to None.
+
+    If None, the range of y coordinates of the vertices of the meshes is used. This must be specified for
+    infinite ground planes.
+    """
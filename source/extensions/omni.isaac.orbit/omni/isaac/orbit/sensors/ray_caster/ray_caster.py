@@ -15,13 +15,13 @@ import carb
 import omni.physics.tensors.impl.api as physx
 import warp as wp
 from omni.isaac.core.prims import XFormPrimView
-from pxr import UsdGeom, UsdPhysics
+from pxr import Usd, UsdGeom, UsdPhysics
 
 import omni.isaac.orbit.sim as sim_utils
 from omni.isaac.orbit.markers import VisualizationMarkers
 from omni.isaac.orbit.terrains.trimesh.utils import make_plane
 from omni.isaac.orbit.utils.math import convert_quat, quat_apply, quat_apply_yaw
-from omni.isaac.orbit.utils.warp import convert_to_warp_mesh, raycast_mesh
+from omni.isaac.orbit.utils.warp import convert_to_warp_mesh, raycast_dynamic_meshes, raycast_meshes
 
 from ..sensor_base import SensorBase
 from .ray_caster_data import RayCasterData
@@ -38,12 +38,21 @@ class RayCaster(SensorBase):
     a set of meshes with a given ray pattern.
 
     The meshes are parsed from the list of primitive paths provided in the configuration. These are then
-    converted to warp meshes and stored in the `warp_meshes` list. The ray-caster then ray-casts against
-    these warp meshes using the ray pattern provided in the configuration.
-
-    .. note::
-        Currently, only static meshes are supported. Extending the warp mesh to support dynamic meshes
-        is a work in progress.
+    converted to warp meshes and stored in the :attr:`meshes` dictionary. The ray-caster then ray-casts against
+    all these warp meshes in a single kernel launch using the ray pattern provided in the configuration, and
+    keeps the closest hit of each ray. The index of the hit mesh is stored in :attr:`RayCasterData.ray_mesh_ids`.
+
+    Moving meshes, such as doors or other robots, can be specified with the dynamic mesh prim paths in the
+    configuration. Each of these meshes has one instance per sensor, whose pose is read at every update. For
+    rigid bodies, the poses of all the instances are read from the physics engine in a single call. The rays
+    are transformed into the local frame of each instance, so that the warp mesh is built once and never
+    rebuilt when the instances move.
+
+    Meshes that are created after the initialization of the sensors, such as the tiles of a
+    :class:`omni.isaac.orbit.terrains.TiledTerrainGenerator`, can be shared with :meth:`register_meshes` and
+    removed with :meth:`unregister_meshes`. The registered meshes below a mesh prim path of the configuration are
+    ray-casted against along with the mesh at this path. The sensors refresh their meshes with
+    :meth:`refresh_meshes` at their next update after the registered meshes change.
     """
 
     cfg: RayCasterCfg
@@ -56,6 +65,10 @@ class RayCaster(SensorBase):
     Note:
            We store a global dictionary of all warp meshes to prevent re-loading the mesh for different ray-cast sensor instances.
     """
+    _registered_mesh_prim_paths: ClassVar[set[str]] = set()
+    """The prim paths of the meshes registered with :meth:`register_meshes`."""
+    _meshes_version: ClassVar[int] = 0
+    """The number of changes of the registered meshes."""
 
     def __init__(self, cfg: RayCasterCfg):
         """Initializes the ray-caster object.
@@ -85,6 +98,7 @@ class RayCaster(SensorBase):
             f"\tview type            : {self._view.__class__}\n"
             f"\tupdate period (s)    : {self.cfg.update_period}\n"
             f"\tnumber of meshes     : {len(RayCaster.meshes)}\n"
+            f"\tnumber of dyn. meshes: {len(self.cfg.dynamic_mesh_prim_paths)}\n"
             f"\tnumber of sensors    : {self._view.count}\n"
             f"\tnumber of rays/sensor: {self.num_rays}\n"
             f"\ttotal number of rays : {self.num_rays * self._view.count}"
@@ -118,6 +132,69 @@ class RayCaster(SensorBase):
         # resample the drift
         self.drift[env_ids].uniform_(*self.cfg.drift_range)
 
+    def refresh_meshes(self):
+        """Refreshes the static meshes to ray-cast against.
+
+        The static meshes are the meshes at the mesh prim paths of the configuration and the meshes registered
+        with :meth:`register_meshes` below these paths. This is called automatically at the next update after
+        the registered meshes change. The indices of the static meshes follow the order of the mesh prim paths
+        and, for each path, the order of registration. The indices of the moving meshes follow the static meshes.
+
+        Raises:
+            RuntimeError: If no meshes are found for the mesh prim paths.
+        """
+        # collect the static meshes
+        mesh_prim_paths = list()
+        for mesh_prim_path in self.cfg.mesh_prim_paths:
+            if mesh_prim_path in RayCaster.meshes:
+                mesh_prim_paths.append(mesh_prim_path)
+            mesh_prim_paths += self._find_registered_mesh_prim_paths(mesh_prim_path)
+        # throw an error if no meshes are found
+        if len(mesh_prim_paths) == 0:
+            raise RuntimeError(
+                f"No meshes found for ray-casting! Please check the mesh prim paths: {self.cfg.mesh_prim_paths}"
+            )
+        # store the ids of the warp meshes to ray-cast against them in a single kernel launch
+        # note: the meshes registered below several mesh prim paths are only ray-casted once
+        self._static_mesh_prim_paths = list(dict.fromkeys(mesh_prim_paths))
+        self._mesh_ids_wp = wp.array(
+            [RayCaster.meshes[mesh_prim_path].id for mesh_prim_path in self._static_mesh_prim_paths],
+            dtype=wp.uint64,
+            device=self.device,
+        )
+        self._mesh_ids_version = RayCaster._meshes_version
+
+    @classmethod
+    def register_meshes(cls, meshes: dict[str, wp.Mesh]):
+        """Registers static warp meshes that are shared by all the sensors.
+
+        The sensors ray-cast against the registered meshes whose prim paths are below their mesh prim paths,
+        starting from their next update.
+
+        Args:
+            meshes: The prim paths and the warp meshes to register. The warp meshes must be on the device of
+                the sensors.
+        """
+        # note: the shared state is written on the base class, so that calls through subclasses update it too
+        RayCaster.meshes.update(meshes)
+        RayCaster._registered_mesh_prim_paths.update(meshes.keys())
+        RayCaster._meshes_version += 1
+
+    @classmethod
+    def unregister_meshes(cls, prim_paths: Sequence[str]):
+        """Removes registered warp meshes.
+
+        The sensors stop ray-casting against the meshes starting from their next update.
+
+        Args:
+            prim_paths: The prim paths of the meshes to remove.
+        """
+        # note: the shared state is written on the base class, so that calls through subclasses update it too
+        for prim_path in prim_paths:
+            RayCaster.meshes.pop(prim_path, None)
+            RayCaster._registered_mesh_prim_paths.discard(prim_path)
+        RayCaster._meshes_version += 1
+
     """
     Implementation.
     """
@@ -155,16 +232,10 @@ class RayCaster(SensorBase):
         self._initialize_rays_impl()
 
     def _initialize_warp_meshes(self):
-        # check number of mesh prims provided
-        if len(self.cfg.mesh_prim_paths) != 1:
-            raise NotImplementedError(
-                f"RayCaster currently only supports one mesh prim. Received: {len(self.cfg.mesh_prim_paths)}"
-            )
-
         # read prims to ray-cast
         for mesh_prim_path in self.cfg.mesh_prim_paths:
-            # check if mesh already casted into warp mesh
-            if mesh_prim_path in RayCaster.meshes:
+            # check if mesh already casted into warp mesh or if meshes are registered below the path
+            if mesh_prim_path in RayCaster.meshes or len(self._find_registered_mesh_prim_paths(mesh_prim_path)) > 0:
                 continue
 
             # check if the prim is a plane - handle PhysX plane as a special case
@@ -199,11 +270,59 @@ class RayCaster(SensorBase):
             # add the warp mesh to the list
             RayCaster.meshes[mesh_prim_path] = wp_mesh
 
-        # throw an error if no meshes are found
-        if all([mesh_prim_path not in RayCaster.meshes for mesh_prim_path in self.cfg.mesh_prim_paths]):
-            raise RuntimeError(
-                f"No meshes found for ray-casting! Please check the mesh prim paths: {self.cfg.mesh_prim_paths}"
-            )
+        # store the ids of the static warp meshes
+        self.refresh_meshes()
+
+        # read the moving meshes
+        self._dynamic_mesh_views: list[XFormPrimView | physx.RigidBodyView] = list()
+        for mesh_prim_path in self.cfg.dynamic_mesh_prim_paths:
+            # check that there is one instance of the mesh per sensor
+            num_instances = len(sim_utils.find_matching_prim_paths(mesh_prim_path))
+            if num_instances != self._view.count:
+                raise RuntimeError(
+                    f"Invalid number of prims for the dynamic mesh prim path: {mesh_prim_path}. Expected one prim"
+                    f" per sensor ({self._view.count}), but found {num_instances}."
+                )
+            # obtain the prim of the first instance
+            instance_prim = sim_utils.find_first_matching_prim(mesh_prim_path)
+            # check if mesh already casted into warp mesh
+            if mesh_prim_path not in RayCaster.meshes:
+                # obtain the mesh prim of the first instance
+                mesh_prim = sim_utils.get_first_matching_child_prim(
+                    instance_prim.GetPath(), lambda prim: prim.GetTypeName() == "Mesh"
+                )
+                # check if valid
+                if mesh_prim is None or not mesh_prim.IsValid():
+                    raise RuntimeError(f"Invalid dynamic mesh prim path: {mesh_prim_path}")
+                # cast into UsdGeomMesh
+                mesh_prim = UsdGeom.Mesh(mesh_prim)
+                # read the vertices in the frame of the instance prim and the faces
+                points = self._read_points_in_prim_frame(mesh_prim, instance_prim)
+                indices = np.asarray(mesh_prim.GetFaceVertexIndicesAttr().Get())
+                RayCaster.meshes[mesh_prim_path] = convert_to_warp_mesh(points, indices, device=self.device)
+                # print info
+                carb.log_info(
+                    f"Read dynamic mesh prim: {mesh_prim.GetPath()} with {len(points)} vertices and"
+                    f" {len(indices)} faces."
+                )
+            # create view to read the poses of the instances
+            # note: the physics view reads the poses of all the instances in a single call, while the xform view
+            #   reads the pose of each instance from the stage
+            if instance_prim.HasAPI(UsdPhysics.RigidBodyAPI):
+                view = self._physics_sim_view.create_rigid_body_view(mesh_prim_path.replace(".*", "*"))
+            else:
+                view = XFormPrimView(mesh_prim_path, reset_xform_properties=False)
+                carb.log_warn(
+                    f"The dynamic mesh prim at path {instance_prim.GetPath().pathString} is not a physics prim!"
+                    " Using XFormPrimView, which is slower."
+                )
+            self._dynamic_mesh_views.append(view)
+        # store the ids of the moving warp meshes
+        self._dynamic_mesh_ids_wp = wp.array(
+            [RayCaster.meshes[mesh_prim_path].id for mesh_prim_path in self.cfg.dynamic_mesh_prim_paths],
+            dtype=wp.uint64,
+            device=self.device,
+        )
 
     def _initialize_rays_impl(self):
         # compute ray stars and directions
@@ -223,9 +342,19 @@ class RayCaster(SensorBase):
         self._data.pos_w = torch.zeros(self._view.count, 3, device=self._device)
         self._data.quat_w = torch.zeros(self._view.count, 4, device=self._device)
         self._data.ray_hits_w = torch.zeros(self._view.count, self.num_rays, 3, device=self._device)
+        self._data.ray_mesh_ids = torch.full((self._view.count, self.num_rays), -1, device=self._device)
+        # create the output buffers of the ray-casting
+        # note: the ray-casting writes into these buffers instead of allocating new tensors at every update
+        self._ray_hits_buffer = torch.empty(self._view.count, self.num_rays, 3, device=self._device)
+        self._ray_distance_buffer = torch.empty(self._view.count, self.num_rays, device=self._device)
+        self._ray_mesh_ids_buffer = torch.empty(
+            (self._view.count, self.num_rays), dtype=torch.int32, device=self._device
+        )
 
     def _update_buffers_impl(self, env_ids: Sequence[int]):
         """Fills the buffers of the sensor data."""
+        # refresh the static meshes if the registered meshes changed
+        self._update_meshes()
         # obtain the poses of the sensors
         if isinstance(self._view, XFormPrimView):
             pos_w, quat_w = self._view.get_world_poses(env_ids)
@@ -257,14 +386,121 @@ class RayCaster(SensorBase):
             ray_starts_w = quat_apply(quat_w.repeat(1, self.num_rays), self.ray_starts[env_ids])
             ray_starts_w += pos_w.unsqueeze(1)
             ray_directions_w = quat_apply(quat_w.repeat(1, self.num_rays), self.ray_directions[env_ids])
-        # ray cast and store the hits
-        # TODO: Make this work for multiple meshes?
-        self._data.ray_hits_w[env_ids] = raycast_mesh(
+        # ray cast against all the meshes and store the closest hits
+        ray_hits_w, _, _, _, ray_mesh_ids = self._raycast(
+            env_ids, ray_starts_w, ray_directions_w, max_dist=self.cfg.max_distance, return_mesh_id=True
+        )
+        self._data.ray_hits_w[env_ids] = ray_hits_w
+        self._data.ray_mesh_ids[env_ids] = ray_mesh_ids.long()
+
+    def _update_meshes(self):
+        """Refreshes the static meshes if the registered meshes changed since the last refresh.
+
+        This must be called before ray-casting, so that the sensor never ray-casts against unregistered meshes.
+        """
+        if self._mesh_ids_version != RayCaster._meshes_version:
+            self.refresh_meshes()
+
+    def _raycast(
+        self, env_ids: Sequence[int], ray_starts_w: torch.Tensor, ray_directions_w: torch.Tensor, **kwargs
+    ) -> tuple[torch.Tensor, torch.Tensor | None, torch.Tensor | None, torch.Tensor | None, torch.Tensor | None]:
+        """Ray-casts against the static and moving meshes in a single kernel launch.
+
+        Args:
+            env_ids: The sensor ids of the rays.
+            ray_starts_w: The starting positions of the rays in the world frame. Shape is (len(env_ids), B, 3).
+            ray_directions_w: The directions of the rays in the world frame. Shape is (len(env_ids), B, 3).
+            **kwargs: The keyword arguments passed to the ray-casting operation.
+
+        Returns:
+            The outputs of :meth:`omni.isaac.orbit.utils.warp.raycast_meshes`. The mesh ids index the static meshes
+            first, followed by the moving meshes. The hits, distances and mesh ids are views of the output buffers
+            of the sensor, which are overwritten by the next call.
+        """
+        # write the outputs into the buffers of the rays
+        # note: the first rows of the buffers are contiguous, so that they are written in-place
+        num_sensors = ray_starts_w.shape[0]
+        kwargs.setdefault("ray_hits", self._ray_hits_buffer[:num_sensors])
+        kwargs.setdefault("ray_distance", self._ray_distance_buffer[:num_sensors])
+        kwargs.setdefault("ray_mesh_id", self._ray_mesh_ids_buffer[:num_sensors])
+        # static meshes only
+        if len(self._dynamic_mesh_views) == 0:
+            return raycast_meshes(ray_starts_w, ray_directions_w, meshes=self._mesh_ids_wp, **kwargs)
+        # ray cast against all the meshes
+        return raycast_dynamic_meshes(
             ray_starts_w,
             ray_directions_w,
-            max_dist=self.cfg.max_distance,
-            mesh=RayCaster.meshes[self.cfg.mesh_prim_paths[0]],
-        )[0]
+            meshes=self._mesh_ids_wp,
+            instance_meshes=self._dynamic_mesh_ids_wp,
+            instance_poses=self._compute_instance_poses(env_ids),
+            **kwargs,
+        )
+
+    def _find_registered_mesh_prim_paths(self, mesh_prim_path: str) -> list[str]:
+        """Finds the prim paths of the registered meshes below a mesh prim path.
+
+        Args:
+            mesh_prim_path: The mesh prim path.
+
+        Returns:
+            The prim paths of the registered meshes below the mesh prim path, in the order of registration.
+        """
+        return [
+            prim_path
+            for prim_path in RayCaster.meshes
+            if prim_path in RayCaster._registered_mesh_prim_paths and prim_path.startswith(mesh_prim_path + "/")
+        ]
+
+    def _compute_instance_poses(self, env_ids: Sequence[int]) -> torch.Tensor | None:
+        """Reads the poses of the instances of the moving meshes from the stage.
+
+        Args:
+            env_ids: The sensor ids of the instances.
+
+        Returns:
+            The position and the quaternion orientation in (w, x, y, z) of the instances in the world frame.
+            Shape is (len(env_ids), I, 7), where I is the number of moving meshes. None if there are no
+            moving meshes.
+        """
+        if len(self._dynamic_mesh_views) == 0:
+            return None
+        # read the poses of the moving meshes
+        instance_poses = list()
+        for view in self._dynamic_mesh_views:
+            if isinstance(view, XFormPrimView):
+                pos_w, quat_w = view.get_world_poses(env_ids)
+                instance_poses.append(torch.cat([pos_w, quat_w], dim=-1))
+            else:
+                # note: the physics view returns the orientation in (x, y, z, w)
+                transforms = view.get_transforms()[env_ids]
+                instance_poses.append(
+                    torch.cat([transforms[:, :3], convert_quat(transforms[:, 3:], to="wxyz")], dim=-1)
+                )
+        return torch.stack(instance_poses, dim=1)
+
+    @staticmethod
+    def _read_points_in_prim_frame(mesh_prim: UsdGeom.Mesh, prim: Usd.Prim) -> np.ndarray:
+        """Reads the vertices of a mesh and expresses them in the frame of one of its ancestor prims.
+
+        The transforms between the prim and the mesh (for instance, the pose of a visual mesh under a rigid body)
+        are baked into the vertices. The scale of the prim itself is also baked, since the poses of the prims do
+        not contain it.
+
+        Args:
+            mesh_prim: The mesh prim.
+            prim: The ancestor prim of the mesh.
+
+        Returns:
+            The vertices of the mesh in the frame of the prim. Shape is (N, 3).
+        """
+        points = np.asarray(mesh_prim.GetPointsAttr().Get(), dtype=np.float64)
+        # compute the transform from the mesh frame to the (unscaled) prim frame
+        # note: USD uses row vectors, i.e. the points are transformed as p * M
+        time_code = Usd.TimeCode.Default()
+        mesh_tf = UsdGeom.Xformable(mesh_prim.GetPrim()).ComputeLocalToWorldTransform(time_code)
+        prim_tf = UsdGeom.Xformable(prim).ComputeLocalToWorldTransform(time_code).RemoveScaleShear()
+        transform = np.array(mesh_tf * prim_tf.GetInverse())
+        return points @ transform[:3, :3] + transform[3, :3]
 
     def _set_debug_vis_impl(self, debug_vis: bool):
         # set visibility of markers
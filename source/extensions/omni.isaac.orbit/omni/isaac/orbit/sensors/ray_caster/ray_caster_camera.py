@@ -16,7 +16,7 @@ from omni.isaac.core.prims import XFormPrimView
 import omni.isaac.orbit.utils.math as math_utils
 from omni.isaac.orbit.sensors.camera import CameraData
 from omni.isaac.orbit.sensors.camera.utils import convert_orientation_convention, create_rotation_matrix_from_view
-from omni.isaac.orbit.utils.warp import raycast_mesh
+from omni.isaac.orbit.utils.warp import raycast_camera_meshes
 
 from .ray_caster import RayCaster
 
@@ -32,7 +32,8 @@ class RayCasterCamera(RayCaster):
     :class:`omni.isaac.orbit.sensors.Camera` that implements the camera class through USD camera prims.
     However, this class provides a faster image generation. The sensor converts meshes from the list of
     primitive paths provided in the configuration to Warp meshes. The camera then ray-casts against these
-    Warp meshes only.
+    Warp meshes only. The rays are cast in a single kernel launch that transforms the rays from the camera
+    frame with the poses of the cameras and writes the outputs directly into the image buffers of the sensor.
 
     Currently, only the following annotators are supported:
 
@@ -251,6 +252,8 @@ class RayCasterCamera(RayCaster):
 
     def _update_buffers_impl(self, env_ids: Sequence[int]):
         """Fills the buffers of the sensor data."""
+        # refresh the static meshes if the registered meshes changed
+        self._update_meshes()
         # increment frame count
         self._frame[env_ids] += 1
 
@@ -260,37 +263,22 @@ class RayCasterCamera(RayCaster):
         self._data.pos_w[env_ids] = pos_w
         self._data.quat_w_world[env_ids] = quat_w
 
-        # note: full orientation is considered
-        ray_starts_w = math_utils.quat_apply(quat_w.repeat(1, self.num_rays), self.ray_starts[env_ids])
-        ray_starts_w += pos_w.unsqueeze(1)
-        ray_directions_w = math_utils.quat_apply(quat_w.repeat(1, self.num_rays), self.ray_directions[env_ids])
-        # ray cast and store the hits
-        # TODO: Make ray-casting work for multiple meshes?
-        # necessary for regular dictionaries.
-        self.ray_hits_w, ray_depth, ray_normal, _ = raycast_mesh(
-            ray_starts_w,
-            ray_directions_w,
-            mesh=RayCasterCamera.meshes[self.cfg.mesh_prim_paths[0]],
+        # ray cast against all the meshes and write the closest hits into the image buffers
+        # note: the rays are transformed into the world frame with the full orientation inside the kernel
+        raycast_camera_meshes(
+            self.ray_starts,
+            self.ray_directions,
+            camera_poses=torch.cat([pos_w, quat_w], dim=-1),
+            meshes=self._mesh_ids_wp,
+            ray_hits=self.ray_hits_w,
+            ray_distance=self._data.output.get("distance_to_camera", None),
+            ray_depth=self._data.output.get("distance_to_image_plane", None),
+            ray_normal=self._data.output.get("normals", None),
+            env_ids=env_ids,
+            instance_meshes=self._dynamic_mesh_ids_wp,
+            instance_poses=self._compute_instance_poses(env_ids),
             max_dist=self.cfg.max_distance,
-            return_distance=any(
-                [name in self.cfg.data_types for name in ["distance_to_image_plane", "distance_to_camera"]]
-            ),
-            return_normal="normals" in self.cfg.data_types,
         )
-        # update output buffers
-        if "distance_to_image_plane" in self.cfg.data_types:
-            # note: data is in camera frame so we only take the first component (z-axis of camera frame)
-            distance_to_image_plane = (
-                math_utils.quat_apply(
-                    math_utils.quat_inv(quat_w).repeat(1, self.num_rays),
-                    (ray_depth[:, :, None] * ray_directions_w),
-                )
-            )[:, :, 0]
-            self._data.output["distance_to_image_plane"][env_ids] = distance_to_image_plane.view(-1, *self.image_shape)
-        if "distance_to_camera" in self.cfg.data_types:
-            self._data.output["distance_to_camera"][env_ids] = ray_depth.view(-1, *self.image_shape)
-        if "normals" in self.cfg.data_types:
-            self._data.output["normals"][env_ids] = ray_normal.view(-1, *self.image_shape, 3)
 
     def _debug_vis_callback(self, event):
         # in case it crashes be safe
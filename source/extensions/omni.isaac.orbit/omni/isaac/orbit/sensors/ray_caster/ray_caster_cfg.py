@@ -35,9 +35,23 @@ class RayCasterCfg(SensorBaseCfg):
     mesh_prim_paths: list[str] = MISSING
     """The list of mesh primitive paths to ray cast against.
 
+    The rays are cast against all the meshes and the closest hit is kept for each ray. The meshes registered
+    below these paths with :meth:`RayCaster.register_meshes`, such as the tiles of a tiled terrain, are also
+    ray-casted against.
+
     Note:
-        Currently, only a single static mesh is supported. We are working on supporting multiple
-        static meshes and dynamic meshes.
+        These meshes are assumed to be static. For moving meshes, please use :attr:`dynamic_mesh_prim_paths`.
+    """
+
+    dynamic_mesh_prim_paths: list[str] = list()
+    """The list of primitive path expressions of moving meshes to ray cast against. Defaults to an empty list.
+
+    Each expression must match one prim per sensor, for instance ``"{ENV_REGEX_NS}/Door"``. The mesh is read
+    once from the first child mesh of the first matching prim and its vertices are expressed in the frame of
+    this prim, including the transforms between the prim and its child mesh. At every update, the world poses
+    of the matching prims are read and the rays of each sensor are cast against the mesh placed at the pose of
+    its prim. If the prims are rigid bodies, the poses are read from the physics engine. Changes of the scale of
+    the prims after the mesh is read are not supported.
     """
 
     offset: OffsetCfg = OffsetCfg()
@@ -27,3 +27,12 @@ class RayCasterData:
     Shape is (N, B, 3), where N is the number of sensors, B is the number of rays
     in the scan pattern per sensor.
     """
+    ray_mesh_ids: torch.Tensor = None
+    """The indices of the meshes hit by the rays.
+
+    Shape is (N, B), where N is the number of sensors, B is the number of rays in the scan pattern per sensor.
+    The indices correspond to the order of the mesh prim paths in the sensor's configuration
+    (:attr:`RayCasterCfg.mesh_prim_paths`), each followed by the meshes registered below it (see
+    :meth:`RayCaster.register_meshes`), and then to the dynamic mesh prim paths
+    (:attr:`RayCasterCfg.dynamic_mesh_prim_paths`). The index is -1 for rays that did not hit any mesh.
+    """
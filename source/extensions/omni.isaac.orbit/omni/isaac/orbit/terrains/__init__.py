@@ -5,11 +5,17 @@
 
 """Sub-package with utilities for creating terrains procedurally.
 
-There are two main components in this package:
+The main components in this package are:
 
 * :class:`TerrainGenerator`: This class procedurally generates terrains based on the passed
   sub-terrain configuration. It creates a ``trimesh`` mesh object and contains the origins of
   each generated sub-terrain.
+* :class:`TiledTerrainGenerator`: This class generates the sub-terrains on demand instead of combining
+  all of them into a single mesh. This is useful for large grids of sub-terrains.
+* :class:`TerrainSharedMemory`: This class hands the arrays of a generated terrain over to the other
+  processes of a machine, such that the terrain is generated only once in multi-GPU training.
+* :class:`TerrainCurriculum`: This class keeps the statistics of the episodes on each sub-terrain and
+  samples the sub-terrains of the environments from them.
 * :class:`TerrainImporter`: This class mainly deals with importing terrains from different
   possible sources and adding them to the simulator as a prim object. It also stores the
   terrain mesh into a dictionary called :obj:`TerrainImporter.warp_meshes` that later can be used
@@ -22,9 +28,19 @@ There are two main components in this package:
 """
 
 from .height_field import *  # noqa: F401, F403
+from .terrain_cache import TerrainCache
+from .terrain_curriculum import TerrainCurriculum
+from .terrain_curriculum_cfg import TerrainCurriculumCfg
 from .terrain_generator import TerrainGenerator
-from .terrain_generator_cfg import FlatPatchSamplingCfg, SubTerrainBaseCfg, TerrainGeneratorCfg
+from .terrain_generator_cfg import (
+    FlatPatchSamplingCfg,
+    SubTerrainBaseCfg,
+    TerrainGeneratorCfg,
+    TiledTerrainGeneratorCfg,
+)
 from .terrain_importer import TerrainImporter
 from .terrain_importer_cfg import TerrainImporterCfg
+from .terrain_shared_memory import TerrainSharedMemory
+from .tiled_terrain_generator import TiledTerrainGenerator
 from .trimesh import *  # noqa: F401, F403
 from .utils import color_meshes_by_height, create_prim_from_mesh
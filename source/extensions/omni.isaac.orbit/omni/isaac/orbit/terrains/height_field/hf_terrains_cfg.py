@@ -28,6 +28,13 @@ class HfTerrainBaseCfg(SubTerrainBaseCfg):
     slope_threshold: float | None = None
     """The slope threshold above which surfaces are made vertical. Defaults to None,
     in which case no correction is applied."""
+    simplify_mesh: bool = False
+    """Whether to merge the flat regions of the height field into larger polygons. Defaults to False.
+
+    This reduces the number of triangles of terrains with large flat regions, such as stairs and pyramids.
+    Please check the function :func:`~omni.isaac.orbit.terrains.height_field.utils.simplify_flat_regions`
+    for more details.
+    """
 
 
 """
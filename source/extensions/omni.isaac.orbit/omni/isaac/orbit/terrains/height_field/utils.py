@@ -60,7 +60,7 @@ def height_field_to_mesh(func: Callable) -> Callable:
 
         # convert to trimesh
         vertices, triangles = convert_height_field_to_mesh(
-            heights, cfg.horizontal_scale, cfg.vertical_scale, cfg.slope_threshold
+            heights, cfg.horizontal_scale, cfg.vertical_scale, cfg.slope_threshold, simplify=cfg.simplify_mesh
         )
         mesh = trimesh.Trimesh(vertices=vertices, faces=triangles)
         # compute origin
@@ -77,7 +77,11 @@ def height_field_to_mesh(func: Callable) -> Callable:
 
 
 def convert_height_field_to_mesh(
-    height_field: np.ndarray, horizontal_scale: float, vertical_scale: float, slope_threshold: float | None = None
+    height_field: np.ndarray,
+    horizontal_scale: float,
+    vertical_scale: float,
+    slope_threshold: float | None = None,
+    simplify: bool = False,
 ) -> tuple[np.ndarray, np.ndarray]:
     """Convert a height-field array to a triangle mesh represented by vertices and triangles.
 
@@ -102,12 +106,17 @@ def convert_height_field_to_mesh(
                   /  |
         (x_1,y_1)A---A'(x_1',y_1)
 
+    If :obj:`simplify` is True, the flat regions of the height field are merged into larger polygons to
+    reduce the number of triangles. Please check the function :func:`simplify_flat_regions` for more details.
+
     Args:
         height_field: The input height-field array.
         horizontal_scale: The discretization of the terrain along the x and y axis.
         vertical_scale: The discretization of the terrain along the z axis.
         slope_threshold: The slope threshold above which surfaces are made vertical.
             Defaults to None, in which case no correction is applied.
+        simplify: Whether to merge the flat regions of the height field into larger polygons.
+            Defaults to False.
 
     Returns:
         The vertices and triangles of the mesh:
@@ -148,6 +157,10 @@ def convert_height_field_to_mesh(
         )
         xx += (move_x + move_corners * (move_x == 0)) * horizontal_scale
         yy += (move_y + move_corners * (move_y == 0)) * horizontal_scale
+        # vertices that are moved by the correction
+        is_moved = (move_x != 0) | (move_y != 0) | (move_corners != 0)
+    else:
+        is_moved = np.zeros((num_rows, num_cols), dtype=bool)
 
     # create vertices for the mesh
     vertices = np.zeros((num_rows * num_cols, 3), dtype=np.float32)
@@ -155,19 +168,135 @@ def convert_height_field_to_mesh(
     vertices[:, 1] = yy.flatten()
     vertices[:, 2] = hf.flatten() * vertical_scale
     # create triangles for the mesh
-    triangles = -np.ones((2 * (num_rows - 1) * (num_cols - 1), 3), dtype=np.uint32)
-    for i in range(num_rows - 1):
-        ind0 = np.arange(0, num_cols - 1) + i * num_cols
-        ind1 = ind0 + 1
-        ind2 = ind0 + num_cols
-        ind3 = ind2 + 1
-        start = 2 * i * (num_cols - 1)
-        stop = start + 2 * (num_cols - 1)
-        triangles[start:stop:2, 0] = ind0
-        triangles[start:stop:2, 1] = ind3
-        triangles[start:stop:2, 2] = ind1
-        triangles[start + 1 : stop : 2, 0] = ind0
-        triangles[start + 1 : stop : 2, 1] = ind2
-        triangles[start + 1 : stop : 2, 2] = ind3
+    # note: each cell of the grid is split into two triangles. The vertex indices of the cells are computed
+    #   for all the cells at once. The vertices (0, 1, 2, 3) of a cell are its lower-left, lower-right,
+    #   upper-left and upper-right corners, with rows along x and columns along y.
+    ind0 = np.arange(num_rows - 1, dtype=np.uint32)[:, None] * num_cols + np.arange(num_cols - 1, dtype=np.uint32)
+    ind0 = ind0.reshape(-1)
+    ind1 = ind0 + 1
+    ind2 = ind0 + num_cols
+    ind3 = ind2 + 1
+    triangles = np.empty((ind0.shape[0], 2, 3), dtype=np.uint32)
+    triangles[:, 0] = np.stack([ind0, ind3, ind1], axis=1)
+    triangles[:, 1] = np.stack([ind0, ind2, ind3], axis=1)
+    triangles = triangles.reshape(-1, 3)
+
+    # merge the flat regions
+    if simplify:
+        vertices, triangles = simplify_flat_regions(vertices, triangles, hf, is_moved)
+
+    return vertices, triangles
+
+
+def simplify_flat_regions(
+    vertices: np.ndarray, triangles: np.ndarray, height_field: np.ndarray, is_moved: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Merge the flat regions of a height-field mesh into larger polygons.
+
+    The mesh must be created by :func:`convert_height_field_to_mesh` without simplification. A cell of the
+    height field is flat if its four corners have the same height and are not moved by the slope correction.
+    The flat cells are merged into rectangles of the same height: first into runs of cells along each row,
+    and then the identical runs of consecutive rows are merged together.
+
+    To avoid T-junctions with the neighboring triangles, each rectangle is triangulated as a fan around a new
+    vertex at its center, which connects to all the vertices on the boundary of the rectangle. Thus, a rectangle
+    of :math:`m \\times n` cells has :math:`2 (m + n)` triangles instead of :math:`2 m n`. Only the rectangles
+    for which this reduces the number of triangles are merged. The vertices inside the merged rectangles are
+    removed from the mesh.
+
+    Args:
+        vertices: The vertices of the mesh. Shape is (num_rows * num_cols, 3).
+        triangles: The triangles of the mesh. Shape is (2 * (num_rows - 1) * (num_cols - 1), 3).
+        height_field: The height field used to create the mesh. Shape is (num_rows, num_cols).
+        is_moved: Whether each vertex is moved by the slope correction. Shape is (num_rows, num_cols).
+
+    Returns:
+        The vertices and triangles of the simplified mesh.
+    """
+    num_rows, num_cols = height_field.shape
+    # find the flat cells
+    # note: a cell is flat if all its corners have the same height and are on the regular grid
+    hf = height_field
+    is_flat = (hf[:-1, :-1] == hf[1:, :-1]) & (hf[:-1, :-1] == hf[:-1, 1:]) & (hf[:-1, :-1] == hf[1:, 1:])
+    is_flat &= ~(is_moved[:-1, :-1] | is_moved[1:, :-1] | is_moved[:-1, 1:] | is_moved[1:, 1:])
+    cell_heights = hf[:-1, :-1]
+
+    # find the runs of flat cells with the same height along each row: (row, col_start, col_end, height)
+    # a run starts at a flat cell whose previous cell is not flat or has a different height
+    is_start = is_flat.copy()
+    is_start[:, 1:] &= ~(is_flat[:, :-1] & (cell_heights[:, :-1] == cell_heights[:, 1:]))
+    is_end = is_flat.copy()
+    is_end[:, :-1] &= ~(is_flat[:, 1:] & (cell_heights[:, 1:] == cell_heights[:, :-1]))
+    run_rows, run_starts = np.nonzero(is_start)
+    _, run_ends = np.nonzero(is_end)
+    run_ends += 1
+    run_heights = cell_heights[run_rows, run_starts]
+    # merge identical runs of consecutive rows into rectangles
+    # note: the runs are sorted such that identical runs are contiguous and ordered by their row
+    order = np.lexsort((run_rows, run_heights, run_ends, run_starts))
+    run_rows, run_starts, run_ends, run_heights = (
+        run_rows[order],
+        run_starts[order],
+        run_ends[order],
+        run_heights[order],
+    )
+    is_new_rect = np.ones(len(run_rows), dtype=bool)
+    is_new_rect[1:] = ~(
+        (run_starts[1:] == run_starts[:-1])
+        & (run_ends[1:] == run_ends[:-1])
+        & (run_heights[1:] == run_heights[:-1])
+        & (run_rows[1:] == run_rows[:-1] + 1)
+    )
+    rect_ids = np.cumsum(is_new_rect) - 1
+    rect_row_starts = run_rows[is_new_rect]
+    rect_row_ends = np.zeros_like(rect_row_starts)
+    np.maximum.at(rect_row_ends, rect_ids, run_rows + 1)
+    rect_col_starts = run_starts[is_new_rect]
+    rect_col_ends = run_ends[is_new_rect]
+    # keep the rectangles for which the fan has fewer triangles
+    rect_num_rows = rect_row_ends - rect_row_starts
+    rect_num_cols = rect_col_ends - rect_col_starts
+    is_merged = rect_num_rows * rect_num_cols > rect_num_rows + rect_num_cols
+    if not np.any(is_merged):
+        return vertices, triangles
+
+    # remove the triangles of the merged cells
+    is_cell_merged = np.zeros((num_rows - 1, num_cols - 1), dtype=bool)
+    new_vertices = list()
+    new_triangles = list()
+    center_index = len(vertices)
+    for row_start, row_end, col_start, col_end in zip(
+        rect_row_starts[is_merged], rect_row_ends[is_merged], rect_col_starts[is_merged], rect_col_ends[is_merged]
+    ):
+        is_cell_merged[row_start:row_end, col_start:col_end] = True
+        # vertices on the boundary of the rectangle in clockwise order (rows along x and columns along y)
+        boundary = np.concatenate([
+            row_start * num_cols + np.arange(col_start, col_end),
+            np.arange(row_start, row_end) * num_cols + col_end,
+            row_end * num_cols + np.arange(col_end, col_start, -1),
+            np.arange(row_end, row_start, -1) * num_cols + col_start,
+        ])
+        # vertex at the center of the rectangle
+        corners = vertices[[row_start * num_cols + col_start, row_end * num_cols + col_end]]
+        new_vertices.append(corners.mean(axis=0))
+        # fan of triangles around the center
+        fan = np.empty((len(boundary), 3), dtype=np.uint32)
+        fan[:, 0] = center_index
+        fan[:, 1] = np.roll(boundary, -1)
+        fan[:, 2] = boundary
+        new_triangles.append(fan)
+        center_index += 1
+    # combine the remaining triangles with the new ones
+    # note: the triangles of a cell are stored consecutively
+    triangles = triangles.reshape(-1, 2, 3)[~is_cell_merged.reshape(-1)].reshape(-1, 3)
+    triangles = np.concatenate([triangles] + new_triangles)
+    vertices = np.concatenate([vertices, np.asarray(new_vertices, dtype=vertices.dtype)])
+
+    # remove the unused vertices
+    is_used = np.zeros(len(vertices), dtype=bool)
+    is_used[triangles] = True
+    new_indices = np.cumsum(is_used, dtype=np.int64) - 1
+    vertices = vertices[is_used]
+    triangles = new_indices[triangles].astype(np.uint32)
 
     return vertices, triangles
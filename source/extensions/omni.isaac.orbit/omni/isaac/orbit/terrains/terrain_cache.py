@@ -0,0 +1,160 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import numpy as np
+import os
+import shutil
+import tempfile
+
+from omni.isaac.orbit.utils.io import dump_yaml
+
+
+class TerrainCache:
+    """Binary cache for the arrays of generated terrains.
+
+    Each entry of the cache is a directory named after its key, which is typically the MD5 hash of the
+    configuration that generated the data. The arrays of an entry are stored as raw ``.npy`` files, which are
+    memory-mapped when the entry is loaded. Thus, loading an entry does not parse the data and only reads the
+    parts of the arrays that are accessed. The configuration is stored alongside the arrays for inspection.
+
+    The entries are written to a temporary directory that is renamed once complete. This prevents readers,
+    such as other processes sharing the same cache directory, from loading partially written entries.
+
+    If a maximum size is specified, the least recently used entries are removed by :meth:`evict` until the
+    cache fits within the maximum size. The last use of an entry is tracked with the modification time of its
+    directory, which is updated on every load.
+    """
+
+    def __init__(self, cache_dir: str, max_size_mb: float | None = None):
+        """Initialize the terrain cache.
+
+        Args:
+            cache_dir: The directory where the entries are stored.
+            max_size_mb: The maximum size of the cache (in MB). Defaults to None, in which case the size of the
+                cache is not limited.
+        """
+        self.cache_dir = cache_dir
+        self.max_size_mb = max_size_mb
+
+    """
+    Properties.
+    """
+
+    @property
+    def size(self) -> int:
+        """The total size of the entries in the cache (in bytes)."""
+        return sum(self._get_entry_size(path) for path in self._get_entry_paths())
+
+    """
+    Operations.
+    """
+
+    def contains(self, key: str) -> bool:
+        """Checks whether the cache contains an entry.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            True if the entry exists in the cache.
+        """
+        return os.path.isdir(os.path.join(self.cache_dir, key))
+
+    def load(self, key: str) -> dict[str, np.ndarray] | None:
+        """Loads the arrays of an entry.
+
+        The arrays are memory-mapped in copy-on-write mode. They can be modified in memory without changing
+        the data in the cache.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            A dictionary with the names and the arrays of the entry. None if the entry is not in the cache.
+        """
+        entry_dir = os.path.join(self.cache_dir, key)
+        # check if the entry exists
+        if not os.path.isdir(entry_dir):
+            return None
+        # load the arrays
+        data = dict()
+        for file_name in os.listdir(entry_dir):
+            if file_name.endswith(".npy"):
+                data[file_name[:-4]] = np.load(os.path.join(entry_dir, file_name), mmap_mode="c")
+        # mark the entry as recently used
+        os.utime(entry_dir)
+        return data
+
+    def save(self, key: str, data: dict[str, np.ndarray], cfg: object | None = None):
+        """Saves the arrays of an entry.
+
+        If the entry already exists in the cache, it is not overwritten.
+
+        Args:
+            key: The key of the entry.
+            data: A dictionary with the names and the arrays to save. The names must be valid file names.
+            cfg: The configuration that generated the data. Defaults to None, in which case no configuration
+                is stored.
+        """
+        entry_dir = os.path.join(self.cache_dir, key)
+        # check if the entry exists
+        if os.path.isdir(entry_dir):
+            return
+        # write the entry to a temporary directory
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=f".{key}-", dir=self.cache_dir)
+        for name, array in data.items():
+            np.save(os.path.join(tmp_dir, f"{name}.npy"), np.ascontiguousarray(array))
+        if cfg is not None:
+            dump_yaml(os.path.join(tmp_dir, "cfg.yaml"), cfg)
+        # move the complete entry to its final location
+        try:
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            # the entry was saved concurrently by another process
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def evict(self, keep: str | None = None):
+        """Removes the least recently used entries until the cache fits within the maximum size.
+
+        This is a no-op if the maximum size of the cache is not specified.
+
+        Args:
+            keep: The key of an entry that is never removed, such as the entry in use. Defaults to None.
+        """
+        # check if the size is limited
+        if self.max_size_mb is None:
+            return
+        # sort the entries from the most to the least recently used
+        # note: the entry to keep is counted first, so that it is never removed
+        entries = list()
+        for path in self._get_entry_paths():
+            last_used = np.inf if os.path.basename(path) == keep else os.path.getmtime(path)
+            entries.append((last_used, self._get_entry_size(path), path))
+        entries.sort(reverse=True)
+        # keep the most recently used entries that fit within the maximum size
+        max_size = self.max_size_mb * 1024**2
+        total_size = 0
+        for _, entry_size, path in entries:
+            total_size += entry_size
+            if total_size > max_size and os.path.basename(path) != keep:
+                shutil.rmtree(path, ignore_errors=True)
+
+    """
+    Internal helpers.
+    """
+
+    def _get_entry_paths(self) -> list[str]:
+        """Returns the paths of the complete entries in the cache."""
+        if not os.path.isdir(self.cache_dir):
+            return list()
+        return [entry.path for entry in os.scandir(self.cache_dir) if entry.is_dir() and not entry.name.startswith(".")]
+
+    @staticmethod
+    def _get_entry_size(path: str) -> int:
+        """Returns the size of the files in an entry (in bytes)."""
+        return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
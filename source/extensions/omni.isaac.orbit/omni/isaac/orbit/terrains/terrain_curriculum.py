@@ -0,0 +1,184 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import torch
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .terrain_curriculum_cfg import TerrainCurriculumCfg
+
+
+class TerrainCurriculum:
+    r"""Curriculum that samples the sub-terrains (tiles) from their statistics.
+
+    The curriculum keeps the statistics of the episodes played on each tile of the terrain, i.e. on each pair
+    of terrain level (row) and terrain type (column). These are the number of episodes (visit counts), an
+    exponential moving average of the success of the episodes (success rates) and the last update in which
+    each tile was visited. The statistics are stored in tensors of shape (num_levels, num_types) and are
+    updated for a batch of episodes at once.
+
+    The tiles are sampled with prioritized level replay [1]. The priority of a tile mixes two distributions:
+
+    * The score distribution, which favors the tiles with the highest learning potential. The score of a tile
+      is :math:`p (1 - p)`, where :math:`p` is its success rate, such that the tiles that are neither solved nor
+      failed get the highest scores. The probabilities are proportional to :math:`(1 / rank)^{1 / \beta}`,
+      where :math:`rank` is the rank of the score and :math:`\beta` is the temperature. Tiles with equal scores
+      are ranked from the lowest to the highest level.
+    * The staleness distribution, which favors the tiles that were not visited for a long time. The
+      probabilities are proportional to the number of updates since the last visit.
+
+    The new tiles of a batch of environments are sampled with a single multinomial draw. Either the terrain
+    type of each environment is kept and only its level is sampled, or both are sampled.
+
+    Reference:
+        [1] Jiang, M., Grefenstette, E., & Rocktäschel, T. (2021). Prioritized level replay. ICML.
+    """
+
+    cfg: TerrainCurriculumCfg
+    """The configuration of the curriculum."""
+    success_rates: torch.Tensor
+    """The moving average of the success of the episodes on each tile. Shape is (num_levels, num_types)."""
+    visit_counts: torch.Tensor
+    """The number of episodes on each tile. Shape is (num_levels, num_types)."""
+    last_visits: torch.Tensor
+    """The number of the last update in which each tile was visited. Shape is (num_levels, num_types).
+
+    The updates are numbered from one. Zero means that the tile was never visited.
+    """
+
+    def __init__(self, cfg: TerrainCurriculumCfg, num_levels: int, num_types: int, device: str = "cpu"):
+        """Initialize the terrain curriculum.
+
+        Args:
+            cfg: The configuration of the curriculum.
+            num_levels: The number of terrain levels (rows of sub-terrains).
+            num_types: The number of terrain types (columns of sub-terrains).
+            device: The device of the statistics tensors.
+        """
+        # store inputs
+        self.cfg = cfg
+        self.device = device
+        # create the statistics buffers
+        self.success_rates = torch.full((num_levels, num_types), cfg.initial_success_rate, device=device)
+        self.visit_counts = torch.zeros(num_levels, num_types, dtype=torch.long, device=device)
+        self.last_visits = torch.zeros(num_levels, num_types, dtype=torch.long, device=device)
+        # number of updates of the statistics
+        self._num_updates = 0
+
+    def __str__(self) -> str:
+        """Returns: A string containing information about the curriculum."""
+        return (
+            f"Terrain curriculum with {self.num_levels} levels and {self.num_types} types:\n"
+            f"\tnumber of updates : {self._num_updates}\n"
+            f"\tnumber of episodes: {int(self.visit_counts.sum())}\n"
+            f"\tmean success rate : {float(self.success_rates.mean()):.3f}"
+        )
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_levels(self) -> int:
+        """The number of terrain levels."""
+        return self.success_rates.shape[0]
+
+    @property
+    def num_types(self) -> int:
+        """The number of terrain types."""
+        return self.success_rates.shape[1]
+
+    @property
+    def num_updates(self) -> int:
+        """The number of updates of the statistics."""
+        return self._num_updates
+
+    """
+    Operations.
+    """
+
+    def update(self, levels: torch.Tensor, types: torch.Tensor, success: torch.Tensor):
+        r"""Update the statistics of the tiles with the outcomes of a batch of episodes.
+
+        The success rate :math:`p` of a tile with :math:`n` episodes in the batch and a mean success :math:`s` is
+        updated as :math:`p \leftarrow p + (1 - \alpha^n) (s - p)`, where :math:`\alpha` is the decay of the
+        moving average. This is the same as updating the success rate with the episodes one by one if they have
+        the same success.
+
+        Args:
+            levels: The terrain levels of the episodes. Shape is (N,).
+            types: The terrain types of the episodes. Shape is (N,).
+            success: The success of the episodes, either as booleans or as values between 0 and 1. Shape is (N,).
+        """
+        self._num_updates += 1
+        # accumulate the episodes of each tile
+        tile_ids = levels.to(self.device, dtype=torch.long) * self.num_types + types.to(self.device, dtype=torch.long)
+        success = success.to(self.device, dtype=torch.float)
+        counts = torch.zeros(self.success_rates.numel(), device=self.device).index_add_(
+            0, tile_ids, torch.ones_like(success)
+        )
+        sums = torch.zeros_like(counts).index_add_(0, tile_ids, success)
+        counts = counts.view_as(self.success_rates)
+        sums = sums.view_as(self.success_rates)
+        # update the statistics
+        # note: the weight of the tiles without episodes is zero
+        mean_success = sums / counts.clamp(min=1.0)
+        self.success_rates += (1.0 - self.cfg.success_rate_decay**counts) * (mean_success - self.success_rates)
+        self.visit_counts += counts.long()
+        self.last_visits[:] = torch.where(counts > 0, self._num_updates, self.last_visits)
+
+    def get_sampling_probs(self) -> torch.Tensor:
+        """Compute the probabilities of sampling each tile.
+
+        If :obj:`cfg.keep_terrain_type` is True, the probabilities are normalized over the levels of each
+        terrain type. Otherwise, they are normalized over all the tiles.
+
+        Returns:
+            The probabilities of the tiles. Shape is (num_levels, num_types).
+        """
+        # flatten the tiles if the terrain types are sampled
+        # note: the tiles are ordered by level such that ties are broken from the lowest level
+        if self.cfg.keep_terrain_type:
+            scores = self.success_rates * (1.0 - self.success_rates)
+            staleness = (self._num_updates - self.last_visits).float()
+        else:
+            scores = (self.success_rates * (1.0 - self.success_rates)).view(-1, 1)
+            staleness = (self._num_updates - self.last_visits).float().view(-1, 1)
+        # compute the score distribution from the ranks of the scores
+        order = torch.argsort(scores, dim=0, descending=True, stable=True)
+        ranks = torch.empty_like(order).scatter_(
+            0, order, torch.arange(1, len(scores) + 1, device=self.device).unsqueeze(1).expand_as(order)
+        )
+        score_probs = (1.0 / ranks.float()) ** (1.0 / self.cfg.temperature)
+        score_probs /= score_probs.sum(dim=0, keepdim=True)
+        # compute the staleness distribution
+        # note: the distribution is uniform if all the tiles were visited in the last update
+        staleness_sum = staleness.sum(dim=0, keepdim=True)
+        staleness_probs = torch.where(staleness_sum > 0, staleness / staleness_sum.clamp(min=1.0), 1.0 / len(scores))
+        # mix the distributions
+        probs = (1.0 - self.cfg.staleness_coeff) * score_probs + self.cfg.staleness_coeff * staleness_probs
+        return probs.view_as(self.success_rates)
+
+    def sample(self, types: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Sample new tiles for a batch of environments.
+
+        Args:
+            types: The current terrain types of the environments. Shape is (N,).
+
+        Returns:
+            A tuple containing the terrain levels and the terrain types of the sampled tiles. Shape is (N,).
+        """
+        types = types.to(self.device, dtype=torch.long)
+        probs = self.get_sampling_probs()
+        if self.cfg.keep_terrain_type:
+            # sample the level of each environment from the distribution of its terrain type
+            levels = torch.multinomial(probs[:, types].T, 1).squeeze(-1)
+            return levels, types
+        else:
+            # sample the tiles from the distribution of all the tiles
+            tile_ids = torch.multinomial(probs.view(-1), len(types), replacement=True)
+            return torch.div(tile_ids, self.num_types, rounding_mode="floor"), tile_ids % self.num_types
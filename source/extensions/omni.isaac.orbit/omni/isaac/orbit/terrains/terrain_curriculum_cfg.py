@@ -0,0 +1,53 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+from omni.isaac.orbit.utils import configclass
+
+from .terrain_curriculum import TerrainCurriculum
+
+
+@configclass
+class TerrainCurriculumCfg:
+    """Configuration for the terrain curriculum based on prioritized level replay."""
+
+    class_type: type = TerrainCurriculum
+    """The class to use for the terrain curriculum.
+
+    Defaults to :class:`omni.isaac.orbit.terrains.terrain_curriculum.TerrainCurriculum`.
+    """
+
+    keep_terrain_type: bool = True
+    """Whether the environments keep their terrain type when sampling new tiles. Defaults to True.
+
+    If True, only the terrain level of each environment is sampled. Otherwise, both the terrain level and the
+    terrain type are sampled.
+    """
+
+    initial_success_rate: float = 0.5
+    """The success rate of the tiles before their first episode. Defaults to 0.5.
+
+    The default value gives the highest score to the tiles that were never visited. Since the ties are broken
+    from the lowest level, the curriculum starts with the easiest tiles.
+    """
+
+    success_rate_decay: float = 0.9
+    """The decay of the moving average of the success of the episodes on each tile. Defaults to 0.9.
+
+    A value close to one averages the success over many episodes.
+    """
+
+    temperature: float = 0.3
+    """The temperature of the score distribution. Defaults to 0.3.
+
+    Lower values concentrate the samples on the tiles with the highest scores.
+    """
+
+    staleness_coeff: float = 0.1
+    """The weight of the staleness distribution in the sampling distribution. Defaults to 0.1.
+
+    It must be between 0 and 1. Higher values favor the tiles that were not visited for a long time.
+    """
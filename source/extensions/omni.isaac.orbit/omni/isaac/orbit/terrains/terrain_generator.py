@@ -3,22 +3,27 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+from __future__ import annotations
+
+import multiprocessing
 import numpy as np
 import os
 import torch
 import trimesh
+from concurrent.futures import ProcessPoolExecutor
 
 import carb
 
 from omni.isaac.orbit.utils.dict import dict_to_md5_hash
-from omni.isaac.orbit.utils.io import dump_yaml
 from omni.isaac.orbit.utils.timer import Timer
 from omni.isaac.orbit.utils.warp import convert_to_warp_mesh
 
 from .height_field import HfTerrainBaseCfg
+from .terrain_cache import TerrainCache
 from .terrain_generator_cfg import FlatPatchSamplingCfg, SubTerrainBaseCfg, TerrainGeneratorCfg
-from .trimesh.utils import make_border
-from .utils import color_meshes_by_height, find_flat_patches
+from .terrain_shared_memory import TerrainSharedMemory
+from .trimesh.utils import make_flat_border
+from .utils import color_meshes_by_height, create_height_map, find_flat_patches_batched
 
 
 class TerrainGenerator:
@@ -45,18 +50,37 @@ class TerrainGenerator:
     If the :obj:`cfg.flat_patch_sampling` is specified for a sub-terrain, flat patches are sampled
     on the terrain. These can be used for spawning robots, targets, etc. The sampled patches are stored
     in the :obj:`flat_patches` dictionary. The key specifies the intention of the flat patches and the
-    value is a tensor containing the flat patches for each sub-terrain.
+    value is a tensor containing the flat patches for each sub-terrain. The patches of all the sub-terrains
+    are sampled at once on the combined terrain mesh.
 
     If the flag :obj:`cfg.use_cache` is set to True, the terrains are cached based on their
     sub-terrain configurations. This means that if the same sub-terrain configuration is used
     multiple times, the terrain is only generated once and then reused. This is useful when
-    generating complex sub-terrains that take a long time to generate.
+    generating complex sub-terrains that take a long time to generate. Additionally, the complete
+    terrain (mesh, origins and flat patches) is cached based on the entire configuration. If it exists
+    in the cache, the generation, coloring and border construction of the terrain are skipped. Since the
+    complete terrain is only determined by its configuration if :obj:`cfg.seed` is specified, it is not
+    cached otherwise. The cache is handled by the :class:`TerrainCache` class.
+
+    If the flag :obj:`cfg.use_shared_memory` is set to True, the terrain is shared between the processes of
+    a machine, for instance in multi-GPU training. Only the process with the local rank 0 generates (or loads)
+    the terrain and publishes it. The other processes wait for the terrain and attach to it without copying it.
+    If the flag :obj:`cfg.shared_memory_reuse` is set to True and :obj:`cfg.seed` is specified, the published
+    terrain is kept for later runs. The handoff is handled by the :class:`TerrainSharedMemory` class.
+
+    If :obj:`cfg.num_workers` is greater than zero, the sub-terrain meshes are generated in a pool of worker
+    processes. Each sub-terrain is generated with a seed derived from :obj:`cfg.seed` and its row and column
+    index, so that the generated terrain is the same for any number of workers. The flat patches are sampled
+    and the sub-terrains are assembled in the main process.
     """
 
     terrain_mesh: trimesh.Trimesh
     """A single trimesh.Trimesh object for all the generated sub-terrains."""
     terrain_meshes: list[trimesh.Trimesh]
-    """List of trimesh.Trimesh objects for all the generated sub-terrains."""
+    """List of trimesh.Trimesh objects for all the generated sub-terrains.
+
+    This list is empty if the complete terrain is loaded from the cache or from the shared memory.
+    """
     terrain_origins: np.ndarray
     """The origin of each sub-terrain. Shape is (num_rows, num_cols, 3)."""
     flat_patches: dict[str, torch.Tensor]
@@ -85,15 +109,10 @@ class TerrainGenerator:
         self.device = device
         # -- valid patches
         self.flat_patches = {}
+        # -- the flat patches to sample: (name, row, col, patch configuration, bounds of the sub-terrain)
+        self._flat_patch_queries: list[tuple[str, int, int, FlatPatchSamplingCfg, np.ndarray]] = list()
         # set common values to all sub-terrains config
-        for sub_cfg in self.cfg.sub_terrains.values():
-            # size of all terrains
-            sub_cfg.size = self.cfg.size
-            # params for height field terrains
-            if isinstance(sub_cfg, HfTerrainBaseCfg):
-                sub_cfg.horizontal_scale = self.cfg.horizontal_scale
-                sub_cfg.vertical_scale = self.cfg.vertical_scale
-                sub_cfg.slope_threshold = self.cfg.slope_threshold
+        self._configure_sub_terrains()
 
         # set the seed for reproducibility
         if self.cfg.seed is not None:
@@ -103,6 +122,45 @@ class TerrainGenerator:
         self.terrain_meshes = list()
         self.terrain_origins = np.zeros((self.cfg.num_rows, self.cfg.num_cols, 3))
 
+        # create the cache of the terrains
+        self._cache = TerrainCache(self.cfg.cache_dir, self.cfg.cache_max_size_mb)
+        terrain_key = f"terrain_{self._get_terrain_hash()}"
+        # check if the terrain is published by another process - if true, attach to it and skip the generation
+        # note: the publisher does not wait and only attaches to the terrain if a previous run published it and
+        #   the reuse is enabled. Without a seed, the terrain of a previous run differs from the terrain of this run.
+        #   If the terrain is not reused, it is scoped to this run so that no process attaches to a stale terrain.
+        self._shared_memory = None
+        if self.cfg.use_shared_memory:
+            reuse = self.cfg.shared_memory_reuse and self.cfg.seed is not None
+            self._shared_memory = TerrainSharedMemory(
+                self.cfg.shared_memory_dir,
+                timeout=self.cfg.shared_memory_timeout,
+                max_size_mb=self.cfg.shared_memory_max_size_mb,
+                persistent=reuse,
+            )
+            if self._shared_memory.is_publisher and not reuse:
+                self._shared_memory.unlink(terrain_key)
+            data = self._shared_memory.attach(terrain_key, wait=not self._shared_memory.is_publisher)
+            if data is not None:
+                self._load_terrain(data)
+                shared_path = self._shared_memory.get_path(terrain_key)
+                if self._shared_memory.is_publisher:
+                    carb.log_warn(
+                        f"Attached to the shared terrain published by a previous run: {shared_path}. Set"
+                        " 'shared_memory_reuse' to False to generate the terrain again."
+                    )
+                else:
+                    carb.log_info(f"Attached to the shared terrain: {shared_path}")
+                return
+        # check if the complete terrain is cached - if true, load it and skip the generation
+        # note: without a seed, the random sampling of the terrain differs between runs and it is not cached
+        use_terrain_cache = self.cfg.use_cache and self.cfg.seed is not None
+        if use_terrain_cache and self._load_terrain_from_cache(terrain_key):
+            carb.log_info(f"Loaded the terrain from the cache: {os.path.join(self.cfg.cache_dir, terrain_key)}")
+            if self._shared_memory is not None:
+                self._shared_memory.publish(terrain_key, self._get_terrain_data())
+            return
+
         # parse configuration and add sub-terrains
         # create terrains based on curriculum or randomly
         if self.cfg.curriculum:
@@ -115,18 +173,13 @@ class TerrainGenerator:
         self._add_terrain_border()
         # combine all the sub-terrains into a single mesh
         self.terrain_mesh = trimesh.util.concatenate(self.terrain_meshes)
+        # sample the flat patches of all the sub-terrains
+        if len(self._flat_patch_queries) > 0:
+            with Timer("[INFO] Sampling flat patches took"):
+                self._sample_flat_patches(self.terrain_mesh)
 
         # color the terrain mesh
-        if self.cfg.color_scheme == "height":
-            self.terrain_mesh = color_meshes_by_height(self.terrain_mesh)
-        elif self.cfg.color_scheme == "random":
-            self.terrain_mesh.visual.vertex_colors = np.random.choice(
-                range(256), size=(len(self.terrain_mesh.vertices), 4)
-            )
-        elif self.cfg.color_scheme == "none":
-            pass
-        else:
-            raise ValueError(f"Invalid color scheme: {self.cfg.color_scheme}.")
+        self.terrain_mesh = self._color_mesh(self.terrain_mesh)
 
         # offset the entire terrain and origins so that it is centered
         # -- terrain mesh
@@ -140,12 +193,98 @@ class TerrainGenerator:
         for name, value in self.flat_patches.items():
             self.flat_patches[name] = value + terrain_origins_torch
 
+        # save the complete terrain to the cache and remove the least recently used entries
+        if use_terrain_cache:
+            self._save_terrain_to_cache(terrain_key)
+        if self.cfg.use_cache:
+            self._cache.evict()
+        # publish the complete terrain to the other processes
+        if self._shared_memory is not None:
+            self._shared_memory.publish(terrain_key, self._get_terrain_data())
+
+    """
+    Operations.
+    """
+
+    def get_height_map(self, resolution: float | None = None) -> tuple[torch.Tensor, torch.Tensor]:
+        """Computes a dense height map of the terrain mesh.
+
+        The height map covers the terrain mesh, including its border, and is expressed in the terrain frame.
+        It can be queried with :func:`omni.isaac.orbit.terrains.utils.sample_height_map`, which is a faster
+        alternative to ray-casting the terrain mesh for height scans.
+
+        Args:
+            resolution: The distance between two cells of the height map (in m). Defaults to None, in which case
+                the horizontal scale of the height-field sub-terrains (:obj:`cfg.horizontal_scale`) is used.
+
+        Returns:
+            A tuple containing the height map and the (x, y) position of its first cell. The shape of the height
+            map is (num_x, num_y) and the shape of the origin is (2,). The cells without terrain contain
+            :obj:`float('inf')`.
+        """
+        # resolve the resolution
+        if resolution is None:
+            resolution = self.cfg.horizontal_scale
+        # compute the height map of the terrain mesh
+        wp_mesh = convert_to_warp_mesh(self.terrain_mesh.vertices, self.terrain_mesh.faces, device=self.device)
+        return create_height_map([wp_mesh], resolution)
+
     """
     Terrain generator functions.
     """
 
     def _generate_random_terrains(self):
         """Add terrains based on randomly sampled difficulty parameter."""
+        self._generate_sub_terrains(self._get_random_sub_terrains())
+
+    def _generate_curriculum_terrains(self):
+        """Add terrains based on the difficulty parameter."""
+        self._generate_sub_terrains(self._get_curriculum_sub_terrains())
+
+    """
+    Internal helper functions.
+    """
+
+    def _configure_sub_terrains(self):
+        """Set the parameters common to all the sub-terrain configurations."""
+        for sub_cfg in self.cfg.sub_terrains.values():
+            # size of all terrains
+            sub_cfg.size = self.cfg.size
+            # params for height field terrains
+            if isinstance(sub_cfg, HfTerrainBaseCfg):
+                sub_cfg.horizontal_scale = self.cfg.horizontal_scale
+                sub_cfg.vertical_scale = self.cfg.vertical_scale
+                sub_cfg.slope_threshold = self.cfg.slope_threshold
+
+    def _color_mesh(self, mesh: trimesh.Trimesh) -> trimesh.Trimesh:
+        """Color a mesh based on the color scheme of the configuration.
+
+        Args:
+            mesh: The mesh to color.
+
+        Returns:
+            The colored mesh.
+
+        Raises:
+            ValueError: If the color scheme is not supported.
+        """
+        if self.cfg.color_scheme == "height":
+            mesh = color_meshes_by_height(mesh)
+        elif self.cfg.color_scheme == "random":
+            # note: the colors are the same as with np.random.choice(range(256), ...) but stored as uint8
+            mesh.visual.vertex_colors = np.random.randint(0, 256, size=(len(mesh.vertices), 4)).astype(np.uint8)
+        elif self.cfg.color_scheme == "none":
+            pass
+        else:
+            raise ValueError(f"Invalid color scheme: {self.cfg.color_scheme}.")
+        return mesh
+
+    def _get_random_sub_terrains(self) -> list[tuple[int, int, float, SubTerrainBaseCfg]]:
+        """Sample the configuration and the difficulty parameter of the sub-terrains randomly.
+
+        Returns:
+            The row index, column index, difficulty and configuration of each sub-terrain.
+        """
         # normalize the proportions of the sub-terrains
         proportions = np.array([sub_cfg.proportion for sub_cfg in self.cfg.sub_terrains.values()])
         proportions /= np.sum(proportions)
@@ -153,6 +292,7 @@ class TerrainGenerator:
         sub_terrains_cfgs = list(self.cfg.sub_terrains.values())
 
         # randomly sample sub-terrains
+        sub_terrains = list()
         for index in range(self.cfg.num_rows * self.cfg.num_cols):
             # coordinate index of the sub-terrain
             (sub_row, sub_col) = np.unravel_index(index, (self.cfg.num_rows, self.cfg.num_cols))
@@ -160,13 +300,16 @@ class TerrainGenerator:
             sub_index = np.random.choice(len(proportions), p=proportions)
             # randomly sample difficulty parameter
             difficulty = np.random.uniform(*self.cfg.difficulty_range)
-            # generate terrain
-            mesh, origin = self._get_terrain_mesh(difficulty, sub_terrains_cfgs[sub_index])
-            # add to sub-terrains
-            self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_terrains_cfgs[sub_index])
+            # store the sub-terrain to generate
+            sub_terrains.append((int(sub_row), int(sub_col), difficulty, sub_terrains_cfgs[sub_index]))
+        return sub_terrains
 
-    def _generate_curriculum_terrains(self):
-        """Add terrains based on the difficulty parameter."""
+    def _get_curriculum_sub_terrains(self) -> list[tuple[int, int, float, SubTerrainBaseCfg]]:
+        """Assign the configuration of the sub-terrains by column and their difficulty parameter by row.
+
+        Returns:
+            The row index, column index, difficulty and configuration of each sub-terrain.
+        """
         # normalize the proportions of the sub-terrains
         proportions = np.array([sub_cfg.proportion for sub_cfg in self.cfg.sub_terrains.values()])
         proportions /= np.sum(proportions)
@@ -182,20 +325,174 @@ class TerrainGenerator:
         sub_terrains_cfgs = list(self.cfg.sub_terrains.values())
 
         # curriculum-based sub-terrains
+        sub_terrains = list()
         for sub_col in range(self.cfg.num_cols):
             for sub_row in range(self.cfg.num_rows):
                 # vary the difficulty parameter linearly over the number of rows
                 lower, upper = self.cfg.difficulty_range
                 difficulty = (sub_row + np.random.uniform()) / self.cfg.num_rows
                 difficulty = lower + (upper - lower) * difficulty
-                # generate terrain
-                mesh, origin = self._get_terrain_mesh(difficulty, sub_terrains_cfgs[sub_indices[sub_col]])
-                # add to sub-terrains
-                self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_terrains_cfgs[sub_indices[sub_col]])
+                # store the sub-terrain to generate
+                sub_terrains.append((sub_row, sub_col, difficulty, sub_terrains_cfgs[sub_indices[sub_col]]))
+        return sub_terrains
 
-    """
-    Internal helper functions.
-    """
+    def _generate_sub_terrains(
+        self, sub_terrains: list[tuple[int, int, float, SubTerrainBaseCfg]], base_seed: int | None = None
+    ):
+        """Generate the sub-terrains and add them to the list of sub-terrains.
+
+        The meshes of the sub-terrains are generated in the main process or in a pool of worker processes,
+        depending on :obj:`cfg.num_workers`. The sub-terrains are added in the order of the input list.
+
+        Args:
+            sub_terrains: The row index, column index, difficulty and configuration of each sub-terrain.
+            base_seed: The seed from which the seeds of the sub-terrains are derived. Defaults to None,
+                in which case :obj:`cfg.seed` is used if specified, otherwise it is sampled.
+        """
+        # resolve the seed of each sub-terrain
+        # note: if no seed is specified, the base seed is sampled so that the sub-terrains are still different
+        if base_seed is None:
+            base_seed = self.cfg.seed if self.cfg.seed is not None else np.random.randint(0, 2**31 - 1)
+        seeds = [self._get_sub_terrain_seed(base_seed, row, col) for row, col, _, _ in sub_terrains]
+        difficulties = [difficulty for _, _, difficulty, _ in sub_terrains]
+        sub_terrain_cfgs = [sub_cfg for _, _, _, sub_cfg in sub_terrains]
+        # the sub-terrains are only identified by their seed in the cache if the terrain is seeded
+        cache = self._cache if self.cfg.use_cache else None
+        cache_seeds = seeds if self.cfg.seed is not None else [None] * len(seeds)
+
+        # check if the sub-terrains can be generated in worker processes
+        # note: the workers are forked. This is safe since they only run the module-level function
+        #   :func:`_generate_sub_terrain_mesh`, which relies on numpy, trimesh and the CPU random number generator
+        #   of torch, and does not use CUDA, carb or the simulator. Spawning them instead is not possible, since
+        #   it re-executes the main script (which launches the simulator) and carb is only importable in the app.
+        num_workers = self.cfg.num_workers
+        if num_workers > 0 and "fork" not in multiprocessing.get_all_start_methods():
+            carb.log_warn("Forking processes is not supported on this platform. Generating sub-terrains serially.")
+            num_workers = 0
+
+        if num_workers > 0:
+            # generate the sub-terrains in worker processes
+            # note: only the arguments of the sub-terrains are sent to the workers and not the terrain generator,
+            #   whose list of meshes grows with every generated sub-terrain.
+            # note: the results are returned in the order of the inputs as soon as they are available. This allows
+            #   sampling the flat patches in the main process while the next sub-terrains are generated.
+            chunk_size = max(1, len(sub_terrains) // (4 * num_workers))
+            with ProcessPoolExecutor(num_workers, mp_context=multiprocessing.get_context("fork")) as executor:
+                results = executor.map(
+                    _generate_sub_terrain_mesh,
+                    difficulties,
+                    sub_terrain_cfgs,
+                    seeds,
+                    [cache] * len(sub_terrains),
+                    cache_seeds,
+                    chunksize=chunk_size,
+                )
+                for (row, col, _, sub_cfg), (mesh, origin) in zip(sub_terrains, results):
+                    self._add_sub_terrain(mesh, origin, row, col, sub_cfg)
+        else:
+            # generate the sub-terrains in the main process
+            for (row, col, difficulty, sub_cfg), seed, cache_seed in zip(sub_terrains, seeds, cache_seeds):
+                mesh, origin = _generate_sub_terrain_mesh(difficulty, sub_cfg, seed, cache, cache_seed)
+                self._add_sub_terrain(mesh, origin, row, col, sub_cfg)
+
+    @staticmethod
+    def _get_sub_terrain_seed(base_seed: int, row: int, col: int) -> int:
+        """Derive the seed of a sub-terrain from the base seed and its row and column index.
+
+        Args:
+            base_seed: The base seed of the terrain generator.
+            row: The row index of the sub-terrain.
+            col: The column index of the sub-terrain.
+
+        Returns:
+            The seed of the sub-terrain.
+        """
+        return int(np.random.SeedSequence(base_seed, spawn_key=(row, col)).generate_state(1)[0])
+
+    def _get_terrain_hash(self) -> str:
+        """Generate the hash of the configuration that determines the generated terrain.
+
+        The parameters that do not change the generated terrain, such as the number of workers, the
+        cache settings and the shared memory settings, are not included in the hash.
+
+        Returns:
+            The MD5 hash of the configuration.
+        """
+        cfg_dict = self.cfg.to_dict()
+        # remove the parameters that do not affect the terrain
+        for key in [
+            "num_workers",
+            "use_cache",
+            "cache_dir",
+            "cache_max_size_mb",
+            "use_shared_memory",
+            "shared_memory_dir",
+            "shared_memory_timeout",
+            "shared_memory_max_size_mb",
+            "shared_memory_reuse",
+        ]:
+            cfg_dict.pop(key)
+        return dict_to_md5_hash(cfg_dict)
+
+    def _load_terrain_from_cache(self, key: str) -> bool:
+        """Load the complete terrain from the cache.
+
+        Args:
+            key: The key of the terrain in the cache.
+
+        Returns:
+            True if the terrain was found in the cache.
+        """
+        data = self._cache.load(key)
+        if data is None:
+            return False
+        self._load_terrain(data)
+        return True
+
+    def _save_terrain_to_cache(self, key: str):
+        """Save the complete terrain to the cache.
+
+        Args:
+            key: The key of the terrain in the cache.
+        """
+        self._cache.save(key, self._get_terrain_data(), self.cfg)
+
+    def _load_terrain(self, data: dict[str, np.ndarray]):
+        """Load the complete terrain from its arrays.
+
+        The vertices and the faces of the terrain mesh refer to the arrays without copying them.
+
+        Args:
+            data: A dictionary with the names and the arrays of the terrain (see :meth:`_get_terrain_data`).
+        """
+        # terrain mesh
+        self.terrain_mesh = trimesh.Trimesh(
+            vertices=data["vertices"], faces=data["faces"], vertex_colors=data.get("vertex_colors"), process=False
+        )
+        # terrain origins
+        self.terrain_origins = np.array(data["origins"])
+        # flat patches
+        for name, value in data.items():
+            if name.startswith("flat_patches."):
+                self.flat_patches[name[len("flat_patches.") :]] = torch.tensor(value, device=self.device)
+
+    def _get_terrain_data(self) -> dict[str, np.ndarray]:
+        """Get the arrays of the complete terrain.
+
+        Returns:
+            A dictionary with the vertices, the faces and the vertex colors (if the terrain is colored) of the
+            terrain mesh, the origins of the sub-terrains, and the flat patches with the prefix "flat_patches.".
+        """
+        data = {
+            "vertices": self.terrain_mesh.vertices,
+            "faces": self.terrain_mesh.faces,
+            "origins": self.terrain_origins,
+        }
+        if self.cfg.color_scheme != "none":
+            data["vertex_colors"] = self.terrain_mesh.visual.vertex_colors
+        for name, value in self.flat_patches.items():
+            data[f"flat_patches.{name}"] = value.cpu().numpy()
+        return data
 
     def _add_terrain_border(self):
         """Add a surrounding border over all the sub-terrains into the terrain meshes."""
@@ -205,23 +502,48 @@ class TerrainGenerator:
             self.cfg.num_cols * self.cfg.size[1] + 2 * self.cfg.border_width,
         )
         inner_size = (self.cfg.num_rows * self.cfg.size[0], self.cfg.num_cols * self.cfg.size[1])
-        border_center = (self.cfg.num_rows * self.cfg.size[0] / 2, self.cfg.num_cols * self.cfg.size[1] / 2, -0.5)
-        # border mesh
-        border_meshes = make_border(border_size, inner_size, height=1.0, position=border_center)
-        border = trimesh.util.concatenate(border_meshes)
-        # update the faces to have minimal triangles
-        selector = ~(np.asarray(border.triangles)[:, :, 2] < -0.1).any(1)
-        border.update_faces(selector)
+        border_center = (self.cfg.num_rows * self.cfg.size[0] / 2, self.cfg.num_cols * self.cfg.size[1] / 2, 0.0)
+        # border mesh: only the top surface, since the sides and the bottom are never visible
+        border = make_flat_border(border_size, inner_size, position=border_center)
         # add the border to the list of meshes
         self.terrain_meshes.append(border)
 
+    def _sample_flat_patches(self, mesh: trimesh.Trimesh):
+        """Sample the flat patches of the added sub-terrains on their combined mesh.
+
+        The patches of all the sub-terrains and patch configurations are sampled at once with a single
+        warp mesh. Each patch only lies within the bounds of its sub-terrain. The patches are stored
+        relative to the origins of the sub-terrains.
+
+        Args:
+            mesh: The combined mesh of the sub-terrains.
+        """
+        carb.log_info(f"Sampling flat patches for {len(self._flat_patch_queries)} sub-terrain configurations.")
+        # convert the combined mesh to warp mesh
+        wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
+        # sample the flat patches
+        names, rows, cols, patch_cfgs, bounds = zip(*self._flat_patch_queries)
+        flat_patches = find_flat_patches_batched(
+            wp_mesh, list(patch_cfgs), origins=self.terrain_origins[rows, cols], bounds=np.stack(bounds)
+        )
+        # add the flat patches to the tensors
+        for name, row, col, patch_cfg, patches in zip(names, rows, cols, patch_cfgs, flat_patches):
+            # create the flat patches tensor (if not already created)
+            if name not in self.flat_patches:
+                self.flat_patches[name] = torch.zeros(
+                    (self.cfg.num_rows, self.cfg.num_cols, patch_cfg.num_patches, 3), device=self.device
+                )
+            self.flat_patches[name][row, col] = patches
+        # clear the queries
+        self._flat_patch_queries.clear()
+
     def _add_sub_terrain(
         self, mesh: trimesh.Trimesh, origin: np.ndarray, row: int, col: int, sub_terrain_cfg: SubTerrainBaseCfg
     ):
         """Add input sub-terrain to the list of sub-terrains.
 
         This function adds the input sub-terrain mesh to the list of sub-terrains and updates the origin
-        of the sub-terrain in the list of origins. It also samples flat patches if specified.
+        of the sub-terrain in the list of origins. It also stores the flat patches to sample if specified.
 
         Args:
             mesh: The mesh of the sub-terrain.
@@ -229,31 +551,6 @@ class TerrainGenerator:
             row: The row index of the sub-terrain.
             col: The column index of the sub-terrain.
         """
-        # sample flat patches if specified
-        if sub_terrain_cfg.flat_patch_sampling is not None:
-            carb.log_info(f"Sampling flat patches for sub-terrain at (row, col):  ({row}, {col})")
-            # convert the mesh to warp mesh
-            wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
-            # sample flat patches based on each patch configuration for that sub-terrain
-            for name, patch_cfg in sub_terrain_cfg.flat_patch_sampling.items():
-                patch_cfg: FlatPatchSamplingCfg
-                # create the flat patches tensor (if not already created)
-                if name not in self.flat_patches:
-                    self.flat_patches[name] = torch.zeros(
-                        (self.cfg.num_rows, self.cfg.num_cols, patch_cfg.num_patches, 3), device=self.device
-                    )
-                # add the flat patches to the tensor
-                self.flat_patches[name][row, col] = find_flat_patches(
-                    wp_mesh=wp_mesh,
-                    origin=origin,
-                    num_patches=patch_cfg.num_patches,
-                    patch_radius=patch_cfg.patch_radius,
-                    x_range=patch_cfg.x_range,
-                    y_range=patch_cfg.y_range,
-                    z_range=patch_cfg.z_range,
-                    max_height_diff=patch_cfg.max_height_diff,
-                )
-
         # transform the mesh to the correct position
         transform = np.eye(4)
         transform[0:2, -1] = (row + 0.5) * self.cfg.size[0], (col + 0.5) * self.cfg.size[1]
@@ -263,59 +560,111 @@ class TerrainGenerator:
         # add origin to the list
         self.terrain_origins[row, col] = origin + transform[:3, -1]
 
-    def _get_terrain_mesh(self, difficulty: float, cfg: SubTerrainBaseCfg) -> tuple[trimesh.Trimesh, np.ndarray]:
-        """Generate a sub-terrain mesh based on the input difficulty parameter.
+        # store the flat patches to sample if specified
+        # note: the patches of all the sub-terrains are sampled at once on the combined terrain mesh
+        if sub_terrain_cfg.flat_patch_sampling is not None:
+            for name, patch_cfg in sub_terrain_cfg.flat_patch_sampling.items():
+                self._flat_patch_queries.append((name, row, col, patch_cfg, mesh.bounds[:, :2]))
 
-        If caching is enabled, the sub-terrain is cached and loaded from the cache if it exists.
-        The cache is stored in the cache directory specified in the configuration.
 
-        .. Note:
-            This function centers the 2D center of the mesh and its specified origin such that the
-            2D center becomes :math:`(0, 0)` instead of :math:`(size[0] / 2, size[1] / 2).
+"""
+Sub-terrain generation.
 
-        Args:
-            difficulty: The difficulty parameter.
-            cfg: The configuration of the sub-terrain.
+These functions are defined at the module level so that the worker processes of the terrain generator only
+receive the arguments of the sub-terrains, and not the terrain generator itself.
+"""
 
-        Returns:
-            The sub-terrain mesh and origin.
-        """
-        # add other parameters to the sub-terrain configuration
-        cfg.difficulty = float(difficulty)
-        cfg.seed = self.cfg.seed
-        # generate hash for the sub-terrain
-        sub_terrain_hash = dict_to_md5_hash(cfg.to_dict())
-        # generate the file name
-        sub_terrain_cache_dir = os.path.join(self.cfg.cache_dir, sub_terrain_hash)
-        sub_terrain_stl_filename = os.path.join(sub_terrain_cache_dir, "mesh.stl")
-        sub_terrain_csv_filename = os.path.join(sub_terrain_cache_dir, "origin.csv")
-        sub_terrain_meta_filename = os.path.join(sub_terrain_cache_dir, "cfg.yaml")
-
-        # check if hash exists - if true, load the mesh and origin and return
-        if self.cfg.use_cache and os.path.exists(sub_terrain_stl_filename):
+
+def _generate_sub_terrain_mesh(
+    difficulty: float,
+    cfg: SubTerrainBaseCfg,
+    seed: int,
+    cache: TerrainCache | None = None,
+    cache_seed: int | None = None,
+) -> tuple[trimesh.Trimesh, np.ndarray]:
+    """Generate a sub-terrain mesh with its own seed.
+
+    The seed is used for the global random number generators of numpy and torch (on the CPU). Their states
+    are restored after the generation, so that the sub-terrains do not affect the random numbers sampled
+    in the calling process.
+
+    Args:
+        difficulty: The difficulty parameter.
+        cfg: The configuration of the sub-terrain.
+        seed: The seed of the sub-terrain.
+        cache: The cache of the sub-terrains. Defaults to None, in which case the sub-terrain is not cached.
+        cache_seed: The seed that identifies the sub-terrain in the cache. Defaults to None.
+
+    Returns:
+        The sub-terrain mesh and origin.
+    """
+    # store the state of the random number generators
+    np_rng_state = np.random.get_state()
+    torch_rng_state = torch.get_rng_state()
+    # seed the random number generators for the sub-terrain
+    np.random.seed(seed)
+    torch.random.default_generator.manual_seed(seed)
+    try:
+        return _create_sub_terrain_mesh(difficulty, cfg, cache, cache_seed)
+    finally:
+        np.random.set_state(np_rng_state)
+        torch.set_rng_state(torch_rng_state)
+
+
+def _create_sub_terrain_mesh(
+    difficulty: float, cfg: SubTerrainBaseCfg, cache: TerrainCache | None = None, cache_seed: int | None = None
+) -> tuple[trimesh.Trimesh, np.ndarray]:
+    """Create a sub-terrain mesh based on the input difficulty parameter.
+
+    If a cache is given, the sub-terrain is loaded from the cache if it exists and saved to it otherwise.
+    The vertices, faces and origin of the sub-terrain are stored as binary arrays, so that the loaded mesh
+    is identical to the generated one.
+
+    .. Note:
+        This function centers the 2D center of the mesh and its specified origin such that the
+        2D center becomes :math:`(0, 0)` instead of :math:`(size[0] / 2, size[1] / 2).
+
+    Args:
+        difficulty: The difficulty parameter.
+        cfg: The configuration of the sub-terrain.
+        cache: The cache of the sub-terrains. Defaults to None, in which case the sub-terrain is not cached.
+        cache_seed: The seed that identifies the sub-terrain in the cache. Defaults to None, in which case
+            the sub-terrains with the same configuration and difficulty share their entry.
+
+    Returns:
+        The sub-terrain mesh and origin.
+    """
+    # add other parameters to the sub-terrain configuration
+    # note: the configuration is copied since it is shared between sub-terrains and some terrain functions
+    #   modify it. This keeps the hash of the terrain generator configuration unchanged.
+    cfg = cfg.copy()
+    cfg.difficulty = float(difficulty)
+    cfg.seed = cache_seed
+    # generate hash for the sub-terrain
+    sub_terrain_key = f"sub_terrain_{dict_to_md5_hash(cfg.to_dict())}"
+
+    # check if hash exists - if true, load the mesh and origin and return
+    if cache is not None:
+        data = cache.load(sub_terrain_key)
+        if data is not None:
             # load existing mesh
-            mesh = trimesh.load_mesh(sub_terrain_stl_filename)
-            origin = np.loadtxt(sub_terrain_csv_filename, delimiter=",")
+            mesh = trimesh.Trimesh(vertices=data["vertices"], faces=data["faces"], process=False)
+            origin = np.array(data["origin"])
             # return the generated mesh
             return mesh, origin
 
-        # generate the terrain
-        meshes, origin = cfg.function(difficulty, cfg)
-        mesh = trimesh.util.concatenate(meshes)
-        # offset mesh such that they are in their center
-        transform = np.eye(4)
-        transform[0:2, -1] = -cfg.size[0] * 0.5, -cfg.size[1] * 0.5
-        mesh.apply_transform(transform)
-        # change origin to be in the center of the sub-terrain
-        origin += transform[0:3, -1]
-
-        # if caching is enabled, save the mesh and origin
-        if self.cfg.use_cache:
-            # create the cache directory
-            os.makedirs(sub_terrain_cache_dir, exist_ok=True)
-            # save the data
-            mesh.export(sub_terrain_stl_filename)
-            np.savetxt(sub_terrain_csv_filename, origin, delimiter=",", header="x,y,z")
-            dump_yaml(sub_terrain_meta_filename, cfg)
-        # return the generated mesh
-        return mesh, origin
+    # generate the terrain
+    meshes, origin = cfg.function(difficulty, cfg)
+    mesh = trimesh.util.concatenate(meshes)
+    # offset mesh such that they are in their center
+    transform = np.eye(4)
+    transform[0:2, -1] = -cfg.size[0] * 0.5, -cfg.size[1] * 0.5
+    mesh.apply_transform(transform)
+    # change origin to be in the center of the sub-terrain
+    origin += transform[0:3, -1]
+
+    # if caching is enabled, save the mesh and origin
+    if cache is not None:
+        cache.save(sub_terrain_key, {"vertices": mesh.vertices, "faces": mesh.faces, "origin": origin}, cfg)
+    # return the generated mesh
+    return mesh, origin
@@ -175,8 +175,89 @@ class TerrainGeneratorCfg:
     of difficulty. Otherwise, the terrains will be generated based on this range in a random order.
     """
 
+    num_workers: int = 0
+    """The number of worker processes used to generate the sub-terrains. Defaults to 0, in which case
+    the sub-terrains are generated in the main process.
+
+    Each sub-terrain is generated with its own seed, which is derived from :attr:`seed` and the row and
+    column of the sub-terrain. Thus, the generated terrain does not depend on the number of workers.
+    The flat patches are always sampled in the main process.
+
+    Note:
+        The worker processes are created by forking the main process. On platforms that do not support
+        forking, the sub-terrains are generated in the main process.
+    """
+
     use_cache: bool = False
-    """Whether to load the terrain from cache if it exists. Defaults to True."""
+    """Whether to load the terrain from cache if it exists. Defaults to True.
+
+    The complete terrain is only cached if :attr:`seed` is specified. Otherwise, only the sub-terrains are cached.
+    """
 
     cache_dir: str = "/tmp/orbit/terrains"
     """The directory where the terrain cache is stored. Defaults to "/tmp/orbit/terrains"."""
+
+    cache_max_size_mb: float | None = None
+    """The maximum size of the terrain cache (in MB). Defaults to None, in which case the size is not limited.
+
+    If the cache exceeds this size after a terrain is generated, the least recently used entries are removed.
+    This is useful when the cache directory is shared, for instance on the disk of a cluster.
+    """
+
+    use_shared_memory: bool = False
+    """Whether to share the generated terrain between the processes of a machine. Defaults to False.
+
+    If True, only the process with the local rank 0 generates the terrain, and publishes its mesh, origins and
+    flat patches in :attr:`shared_memory_dir`. The other processes attach to the published terrain without
+    copying it instead of generating it. The local rank is read from the ``LOCAL_RANK`` environment variable.
+    Please check the class :class:`omni.isaac.orbit.terrains.TerrainSharedMemory` for more details.
+
+    Note:
+        This is not supported by the :class:`omni.isaac.orbit.terrains.TiledTerrainGenerator` class.
+    """
+
+    shared_memory_dir: str = "/dev/shm/orbit/terrains"
+    """The directory where the shared terrains are published. Defaults to "/dev/shm/orbit/terrains".
+
+    The directory should be on a memory-backed file system, such as ``/dev/shm`` on Linux.
+    """
+
+    shared_memory_timeout: float = 600.0
+    """The maximum time (in seconds) to wait for the terrain to be published. Defaults to 600.0."""
+
+    shared_memory_max_size_mb: float | None = 1024.0
+    """The maximum size of the shared terrains (in MB). Defaults to 1024.0.
+
+    If the shared terrains exceed this size after a terrain is published, the least recently used terrains are
+    removed. If None, the size is not limited and the terrains are only removed manually.
+    """
+
+    shared_memory_reuse: bool = True
+    """Whether to attach to a terrain published by a previous run. Defaults to True.
+
+    If True, the published terrains are kept after the processes exit and the process with the local rank 0
+    attaches to the terrain published by a previous run with the same configuration instead of generating it.
+    If False, or if :attr:`seed` is not specified, the terrain is generated again and published for the
+    current run only (see :meth:`TerrainSharedMemory.get_run_id`), so that no process attaches to the terrain
+    of a previous run. The published terrain is then removed when the process exits.
+    """
+
+
+@configclass
+class TiledTerrainGeneratorCfg(TerrainGeneratorCfg):
+    """Configuration for the tiled terrain generator.
+
+    The sub-terrains (tiles) are generated on demand instead of all at once. Please check the class
+    :class:`omni.isaac.orbit.terrains.TiledTerrainGenerator` for more details.
+    """
+
+    max_num_tiles: int = 256
+    """The maximum number of tile meshes kept in memory. Defaults to 256.
+
+    When more tiles are generated, the meshes of the least recently used tiles are released. Their origins
+    and flat patches are kept, and their meshes are generated again when they are queried.
+
+    The :class:`TerrainImporter` also removes the prims of the least recently used tiles from the stage when
+    more tiles are imported. The tiles used by the environments are never removed, so that more tiles are
+    imported if the environments use more tiles.
+    """
@@ -8,8 +8,10 @@ from __future__ import annotations
 import numpy as np
 import torch
 import trimesh
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
+import omni.isaac.core.utils.prims as prim_utils
 import warp
 from pxr import UsdGeom
 
@@ -18,7 +20,10 @@ from omni.isaac.orbit.markers import VisualizationMarkers
 from omni.isaac.orbit.markers.config import FRAME_MARKER_CFG
 from omni.isaac.orbit.utils.warp import convert_to_warp_mesh
 
+from .terrain_curriculum import TerrainCurriculum
 from .terrain_generator import TerrainGenerator
+from .terrain_generator_cfg import TiledTerrainGeneratorCfg
+from .tiled_terrain_generator import TiledTerrainGenerator
 from .trimesh.utils import make_plane
 from .utils import create_prim_from_mesh
 
@@ -41,6 +46,19 @@ class TerrainImporter:
     If a curriculum is used, it is possible to update the environment origins to terrain origins that correspond
     to a harder difficulty. This is done by calling :func:`update_terrain_levels`. The idea comes from game-based
     curriculum. For example, in a game, the player starts with easy levels and progresses to harder levels.
+
+    Alternatively, if a terrain curriculum is configured, the terrain levels and types of the environments can be
+    sampled from the statistics of the episodes on each sub-terrain. This is done by calling
+    :meth:`resample_env_origins`. Please check the :class:`TerrainCurriculum` class for more details.
+
+    If the terrain generator configuration is a :class:`TiledTerrainGeneratorCfg`, the sub-terrains (tiles)
+    are generated with the :class:`TiledTerrainGenerator` class. A tile is only generated and imported as a
+    separate prim ``cfg.prim_path/tile_{row}_{col}`` when it is used by an environment, i.e. when it is
+    referenced by :attr:`terrain_levels` and :attr:`terrain_types`. The combined terrain mesh is never created.
+    The warp meshes of the tiles and the border are registered with
+    :meth:`omni.isaac.orbit.sensors.RayCaster.register_meshes`, so that the ray-casters with the mesh prim path
+    ``cfg.prim_path`` ray-cast against them. If more than :obj:`max_num_tiles` tiles are imported, the least
+    recently used tiles that are not used by any environment are removed from the stage and unregistered.
     """
 
     meshes: dict[str, trimesh.Trimesh]
@@ -54,6 +72,11 @@ class TerrainImporter:
     """
     env_origins: torch.Tensor
     """The origins of the environments. Shape is (num_envs, 3)."""
+    curriculum: TerrainCurriculum | None
+    """The terrain curriculum to sample the sub-terrains of the environments.
+
+    If None, then no terrain curriculum is configured or no sub-terrains exist.
+    """
 
     def __init__(self, cfg: TerrainImporterCfg):
         """Initialize the terrain importer.
@@ -76,8 +99,10 @@ class TerrainImporter:
         self.warp_meshes = dict()
         self.env_origins = None
         self.terrain_origins = None
+        self.curriculum = None
         # private variables
         self._terrain_flat_patches = dict()
+        self._tiled_terrain_generator: TiledTerrainGenerator | None = None
 
         # auto-import the terrain based on the config
         if self.cfg.terrain_type == "generator":
@@ -85,8 +110,18 @@ class TerrainImporter:
             if self.cfg.terrain_generator is None:
                 raise ValueError("Input terrain type is 'generator' but no value provided for 'terrain_generator'.")
             # generate the terrain
-            terrain_generator = TerrainGenerator(cfg=self.cfg.terrain_generator, device=self.device)
-            self.import_mesh("terrain", terrain_generator.terrain_mesh)
+            if isinstance(self.cfg.terrain_generator, TiledTerrainGeneratorCfg):
+                # note: the tiles are generated and imported when they are used by the environments
+                terrain_generator = TiledTerrainGenerator(cfg=self.cfg.terrain_generator, device=self.device)
+                self._tiled_terrain_generator = terrain_generator
+                # the imported tiles from the least to the most recently used
+                self._imported_tiles: OrderedDict[tuple[int, int], None] = OrderedDict()
+                if terrain_generator.border_mesh is not None:
+                    self.import_mesh("border", terrain_generator.border_mesh)
+                    self._register_ray_caster_meshes(["border"])
+            else:
+                terrain_generator = TerrainGenerator(cfg=self.cfg.terrain_generator, device=self.device)
+                self.import_mesh("terrain", terrain_generator.terrain_mesh)
             # configure the terrain origins based on the terrain generator
             self.configure_env_origins(terrain_generator.terrain_origins)
             # refer to the flat patches
@@ -199,7 +234,7 @@ class TerrainImporter:
         ground_plane_cfg = sim_utils.GroundPlaneCfg(physics_material=self.cfg.physics_material, size=size)
         ground_plane_cfg.func(self.cfg.prim_path, ground_plane_cfg)
 
-    def import_mesh(self, key: str, mesh: trimesh.Trimesh):
+    def import_mesh(self, key: str, mesh: trimesh.Trimesh, warp_mesh: warp.Mesh | None = None):
         """Import a mesh into the simulator.
 
         The mesh is imported into the simulator under the prim path ``cfg.prim_path/{key}``. The created path
@@ -208,6 +243,7 @@ class TerrainImporter:
         Args:
             key: The key to store the mesh.
             mesh: The mesh to import.
+            warp_mesh: The warp mesh of the mesh. Defaults to None, in which case it is created from the mesh.
 
         Raises:
             ValueError: If a terrain with the same key already exists.
@@ -218,8 +254,10 @@ class TerrainImporter:
         # store the mesh
         self.meshes[key] = mesh
         # create a warp mesh
-        device = "cuda" if "cuda" in self.device else "cpu"
-        self.warp_meshes[key] = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=device)
+        if warp_mesh is None:
+            device = "cuda" if "cuda" in self.device else "cpu"
+            warp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=device)
+        self.warp_meshes[key] = warp_mesh
 
         # get the mesh
         mesh = self.meshes[key]
@@ -316,9 +354,42 @@ class TerrainImporter:
             torch.randint_like(self.terrain_levels[env_ids], self.max_terrain_level),
             torch.clip(self.terrain_levels[env_ids], 0),
         )
+        # import the used tiles that are not imported (if tiled terrain)
+        self._import_tiles(self.terrain_levels[env_ids], self.terrain_types[env_ids])
         # update the env origins
         self.env_origins[env_ids] = self.terrain_origins[self.terrain_levels[env_ids], self.terrain_types[env_ids]]
 
+    def resample_env_origins(self, env_ids: torch.Tensor, success: torch.Tensor):
+        """Update the terrain curriculum and sample new environment origins from it.
+
+        The outcomes of the episodes of the environments are recorded for their current sub-terrains. Then, new
+        terrain levels and types are sampled for the environments from the terrain curriculum.
+
+        Args:
+            env_ids: The ids of the environments to update.
+            success: The success of the episodes of the environments, either as booleans or as values between
+                0 and 1. Shape is (len(env_ids),).
+
+        Raises:
+            RuntimeError: If no terrain curriculum is configured.
+        """
+        # check if grid-like spawning
+        if self.terrain_origins is None:
+            return
+        # check if the curriculum is configured
+        if self.curriculum is None:
+            raise RuntimeError("No terrain curriculum is configured. Please set the 'curriculum' configuration.")
+        # record the episodes on the current sub-terrains
+        self.curriculum.update(self.terrain_levels[env_ids], self.terrain_types[env_ids], success)
+        # sample the new sub-terrains
+        terrain_levels, terrain_types = self.curriculum.sample(self.terrain_types[env_ids])
+        self.terrain_levels[env_ids] = terrain_levels
+        self.terrain_types[env_ids] = terrain_types
+        # import the used tiles that are not imported (if tiled terrain)
+        self._import_tiles(terrain_levels, terrain_types)
+        # update the env origins
+        self.env_origins[env_ids] = self.terrain_origins[terrain_levels, terrain_types]
+
     """
     Internal helpers.
     """
@@ -341,11 +412,112 @@ class TerrainImporter:
             (num_envs / num_cols),
             rounding_mode="floor",
         ).to(torch.long)
+        # create the terrain curriculum
+        if self.cfg.curriculum is not None:
+            self.curriculum = self.cfg.curriculum.class_type(self.cfg.curriculum, num_rows, num_cols, self.device)
+        # import the tiles used by the environments (if tiled terrain)
+        # note: this updates the origins of the imported tiles in-place
+        self._import_tiles(self.terrain_levels, self.terrain_types)
         # create tensor based on number of environments
         env_origins = torch.zeros(num_envs, 3, device=self.device)
         env_origins[:] = origins[self.terrain_levels, self.terrain_types]
         return env_origins
 
+    def _import_tiles(self, terrain_levels: torch.Tensor, terrain_types: torch.Tensor):
+        """Import the tiles of a tiled terrain that are used by environments.
+
+        The tiles that are not imported yet are generated, imported into the simulator and their warp meshes are
+        registered for the ray-casters. Their origins are stored in :attr:`terrain_origins`. Afterwards, the least
+        recently used tiles that are not used by any environment are released until at most
+        :obj:`max_num_tiles` tiles are imported. This is a no-op if the terrain is not tiled.
+
+        Args:
+            terrain_levels: The terrain levels (rows) of the used tiles.
+            terrain_types: The terrain types (columns) of the used tiles.
+        """
+        # check if tiled terrain
+        if self._tiled_terrain_generator is None:
+            return
+        # mark the imported tiles as the most recently used ones and find the other tiles
+        tiles = torch.unique(torch.stack([terrain_levels, terrain_types], dim=1), dim=0).tolist()
+        missing_tiles = list()
+        for row, col in tiles:
+            if (row, col) in self._imported_tiles:
+                self._imported_tiles.move_to_end((row, col))
+            else:
+                missing_tiles.append((row, col))
+        if len(missing_tiles) == 0:
+            return
+        rows, cols = np.array(missing_tiles).T
+        # generate the tiles and import them
+        self._tiled_terrain_generator.generate_tiles(rows, cols)
+        keys = list()
+        for row, col in missing_tiles:
+            key = f"tile_{row}_{col}"
+            self.import_mesh(
+                key,
+                self._tiled_terrain_generator.get_tile_mesh(row, col),
+                warp_mesh=self._tiled_terrain_generator.get_tile_warp_mesh(row, col),
+            )
+            self._imported_tiles[(row, col)] = None
+            keys.append(key)
+        self._register_ray_caster_meshes(keys)
+        # store the origins of the tiles
+        origins = torch.tensor(self._tiled_terrain_generator.terrain_origins[rows, cols], dtype=torch.float)
+        self.terrain_origins[torch.from_numpy(rows), torch.from_numpy(cols)] = origins.to(self.device)
+        # release the least recently used tiles
+        self._release_tiles()
+
+    def _release_tiles(self):
+        """Remove the least recently used tiles that are not used by any environment from the simulator.
+
+        The tiles are removed until at most :obj:`max_num_tiles` tiles are imported. The tiles used by the
+        environments are kept, even if more tiles are used. The origins and the flat patches of the removed
+        tiles are kept, and the tiles are imported again when they are used.
+        """
+        max_num_tiles = self._tiled_terrain_generator.cfg.max_num_tiles
+        if len(self._imported_tiles) <= max_num_tiles:
+            return
+        # find the tiles used by the environments
+        used_tiles = torch.unique(torch.stack([self.terrain_levels, self.terrain_types], dim=1), dim=0).tolist()
+        used_tiles = {(row, col) for row, col in used_tiles}
+        # remove the least recently used tiles
+        keys = list()
+        for tile in list(self._imported_tiles):
+            if len(self._imported_tiles) <= max_num_tiles:
+                break
+            if tile in used_tiles:
+                continue
+            key = f"tile_{tile[0]}_{tile[1]}"
+            prim_utils.delete_prim(self.cfg.prim_path + f"/{key}")
+            self.meshes.pop(key)
+            self.warp_meshes.pop(key)
+            self._imported_tiles.pop(tile)
+            keys.append(key)
+        self._unregister_ray_caster_meshes(keys)
+
+    def _register_ray_caster_meshes(self, keys: list[str]):
+        """Register the warp meshes of the imported meshes for the ray-casters.
+
+        Args:
+            keys: The keys of the meshes.
+        """
+        # note: the sensors are imported here since they depend on the terrains module
+        from omni.isaac.orbit.sensors.ray_caster import RayCaster
+
+        RayCaster.register_meshes({self.cfg.prim_path + f"/{key}": self.warp_meshes[key] for key in keys})
+
+    def _unregister_ray_caster_meshes(self, keys: list[str]):
+        """Unregister the warp meshes of the removed meshes for the ray-casters.
+
+        Args:
+            keys: The keys of the meshes.
+        """
+        # note: the sensors are imported here since they depend on the terrains module
+        from omni.isaac.orbit.sensors.ray_caster import RayCaster
+
+        RayCaster.unregister_meshes([self.cfg.prim_path + f"/{key}" for key in keys])
+
     def _compute_env_origins_grid(self, num_envs: int, env_spacing: float) -> torch.Tensor:
         """Compute the origins of the environments in a grid based on configured spacing."""
         # create tensor based on number of environments
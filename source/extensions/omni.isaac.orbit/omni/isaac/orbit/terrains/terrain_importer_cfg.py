@@ -14,6 +14,7 @@ from omni.isaac.orbit.utils import configclass
 from .terrain_importer import TerrainImporter
 
 if TYPE_CHECKING:
+    from .terrain_curriculum_cfg import TerrainCurriculumCfg
     from .terrain_generator_cfg import TerrainGeneratorCfg
 
 
@@ -49,6 +50,9 @@ class TerrainImporterCfg:
     """The terrain generator configuration.
 
     Only used if ``terrain_type`` is set to "generator".
+
+    If the configuration is an instance of :class:`~omni.isaac.orbit.terrains.TiledTerrainGeneratorCfg`, the
+    sub-terrains are imported as separate prims when they are first used by the environments.
     """
 
     usd_path: str | None = None
@@ -95,5 +99,15 @@ class TerrainImporterCfg:
       This parameter is used only when sub-terrain origins are defined.
     """
 
+    curriculum: TerrainCurriculumCfg | None = None
+    """The terrain curriculum configuration. Defaults to None.
+
+    If specified, the terrain levels and types of the environments can be sampled from the curriculum with
+    :meth:`~omni.isaac.orbit.terrains.TerrainImporter.resample_env_origins`.
+
+    Note:
+      This parameter is used only when sub-terrain origins are defined.
+    """
+
     debug_vis: bool = False
     """Whether to enable visualization of terrain origins for the terrain. Defaults to False."""
@@ -0,0 +1,203 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import atexit
+import numpy as np
+import os
+import shutil
+import time
+
+from .terrain_cache import TerrainCache
+
+
+class TerrainSharedMemory:
+    """Handoff of the arrays of generated terrains between the processes of a machine.
+
+    In multi-GPU training, one process is launched per GPU and each of them would generate the same terrain.
+    Instead, the process with the local rank 0 (the publisher) generates the terrain and publishes its arrays
+    with :meth:`publish`. The other processes wait for the arrays with :meth:`attach` and map them into their
+    memory without copying them.
+
+    The arrays of an entry are stored as raw ``.npy`` files in a directory named after its key. The entries are
+    written and renamed in the same way as the entries of the :class:`TerrainCache` class, so that the processes
+    never attach to partially published entries. By default, the directory is located in ``/dev/shm``, which
+    is the memory-backed file system of POSIX shared memory on Linux. Thus, the arrays never touch the disk and
+    the memory pages of the arrays are shared by all the processes that attach to them.
+
+    If the entries are persistent, they are not removed when the processes exit, so that they can be attached
+    to by later runs. Otherwise, the entries are scoped to the launch of the processes with a run identifier
+    (see :meth:`get_run_id`), so that the processes never attach to an entry left by another run, and the
+    entries published by a process are removed when it exits or calls :meth:`close`. Since the entries occupy
+    memory, the least recently used entries are removed after publishing an entry until the entries fit within
+    the maximum size, in the same way as by :meth:`TerrainCache.evict`. The processes that are attached to a
+    removed entry keep their arrays. The entries can also be removed with :meth:`unlink`.
+    """
+
+    def __init__(
+        self,
+        shared_dir: str,
+        rank: int | None = None,
+        timeout: float = 600.0,
+        max_size_mb: float | None = None,
+        persistent: bool = True,
+        run_id: str | None = None,
+    ):
+        """Initialize the terrain shared memory.
+
+        Args:
+            shared_dir: The directory where the entries are published.
+            rank: The local rank of the process. Defaults to None, in which case it is read from the
+                ``LOCAL_RANK`` environment variable (set by ``torchrun``) and is 0 if the variable is not set.
+            timeout: The maximum time (in seconds) to wait for an entry to be published. Defaults to 600.0.
+            max_size_mb: The maximum size of the published entries (in MB). Defaults to None, in which case the
+                size of the entries is not limited.
+            persistent: Whether the published entries are kept after the process exits. Defaults to True.
+            run_id: The identifier of the run that scopes the entries if they are not persistent. It must be the
+                same for all the processes of a run and differ between runs. Defaults to None, in which case it is
+                resolved with :meth:`get_run_id`.
+        """
+        self.shared_dir = shared_dir
+        self.rank = rank if rank is not None else int(os.environ.get("LOCAL_RANK", 0))
+        self.timeout = timeout
+        self.persistent = persistent
+        self.run_id = run_id if run_id is not None else self.get_run_id()
+        # the entries are written in the same format as the terrain cache
+        self._store = TerrainCache(shared_dir, max_size_mb)
+        # the keys of the entries published by this process
+        self._published_keys: list[str] = list()
+        # remove the entries published by this process when it exits
+        if not self.persistent:
+            atexit.register(self.close)
+
+    """
+    Properties.
+    """
+
+    @property
+    def is_publisher(self) -> bool:
+        """Whether the process publishes the entries, i.e. its local rank is 0."""
+        return self.rank == 0
+
+    """
+    Operations.
+    """
+
+    @staticmethod
+    def get_run_id() -> str:
+        """Resolves the identifier of the run of the current process.
+
+        The processes of a run are launched by the same parent process, such as the agent of ``torchrun``.
+        Thus, the identifier is made of the process id of the parent and of the restart count of ``torchrun``
+        (from the ``TORCHELASTIC_RESTART_COUNT`` environment variable), which changes when the processes are
+        restarted after a failure.
+
+        Returns:
+            The identifier of the run.
+        """
+        return f"{os.getppid()}-{os.environ.get('TORCHELASTIC_RESTART_COUNT', 0)}"
+
+    def get_path(self, key: str) -> str:
+        """Gets the path of the directory of an entry.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The path of the directory of the entry. It contains the run identifier if the entries are not persistent.
+        """
+        return os.path.join(self.shared_dir, self._get_entry_name(key))
+
+    def contains(self, key: str) -> bool:
+        """Checks whether an entry is published.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            True if the entry is published.
+        """
+        return self._store.contains(self._get_entry_name(key))
+
+    def publish(self, key: str, data: dict[str, np.ndarray]):
+        """Publishes the arrays of an entry.
+
+        If the entry is already published, it is not overwritten. The least recently used entries, except for
+        the published one, are removed until the entries fit within the maximum size.
+
+        Args:
+            key: The key of the entry.
+            data: A dictionary with the names and the arrays to publish. The names must be valid file names.
+        """
+        name = self._get_entry_name(key)
+        self._store.save(name, data)
+        if not self.persistent and key not in self._published_keys:
+            self._published_keys.append(key)
+        self._store.evict(keep=name)
+
+    def attach(self, key: str, wait: bool = True) -> dict[str, np.ndarray] | None:
+        """Attaches to the arrays of an entry.
+
+        The arrays are memory-mapped in copy-on-write mode. Their memory is shared with the other processes as
+        long as they are not modified.
+
+        Args:
+            key: The key of the entry.
+            wait: Whether to wait for the entry to be published. Defaults to True.
+
+        Returns:
+            A dictionary with the names and the arrays of the entry. None if the entry is not published and
+            :obj:`wait` is False.
+
+        Raises:
+            TimeoutError: If the entry is not published within the timeout.
+        """
+        name = self._get_entry_name(key)
+        start_time = time.perf_counter()
+        while not self._store.contains(name):
+            if not wait:
+                return None
+            if time.perf_counter() - start_time > self.timeout:
+                raise TimeoutError(
+                    f"The entry '{key}' was not published in '{self.shared_dir}' within {self.timeout} seconds."
+                )
+            time.sleep(0.05)
+        return self._store.load(name)
+
+    def unlink(self, key: str):
+        """Removes an entry.
+
+        The processes that are attached to the entry keep their arrays. This is a no-op if the entry is not
+        published.
+
+        Args:
+            key: The key of the entry.
+        """
+        shutil.rmtree(self.get_path(key), ignore_errors=True)
+
+    def close(self):
+        """Removes the entries published by this process if they are not persistent.
+
+        This is called automatically when the process exits.
+        """
+        for key in self._published_keys:
+            self.unlink(key)
+        self._published_keys.clear()
+
+    """
+    Internal helpers.
+    """
+
+    def _get_entry_name(self, key: str) -> str:
+        """Resolves the name of the directory of an entry.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The key if the entries are persistent. Otherwise, the key followed by the run identifier.
+        """
+        return key if self.persistent else f"{key}-run-{self.run_id}"
@@ -0,0 +1,316 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import numpy as np
+import torch
+import trimesh
+from collections import OrderedDict
+from collections.abc import Sequence
+
+import carb
+import warp as wp
+
+from omni.isaac.orbit.utils.warp import convert_to_warp_mesh
+
+from .terrain_cache import TerrainCache
+from .terrain_generator import TerrainGenerator
+from .terrain_generator_cfg import SubTerrainBaseCfg, TiledTerrainGeneratorCfg
+from .utils import create_height_map
+
+
+class TiledTerrainGenerator(TerrainGenerator):
+    """Terrain generator that generates the sub-terrains (tiles) on demand.
+
+    Unlike the :class:`TerrainGenerator` class, this class does not generate all the sub-terrains at once and
+    does not combine them into a single mesh. Instead, the configuration and the difficulty of each tile are
+    decided at initialization, and the mesh of a tile is only generated when it is queried. This keeps the memory
+    and the startup time low for large grids of sub-terrains, of which only a few are used at a time.
+
+    The meshes of the most recently used tiles are kept in memory, up to :obj:`cfg.max_num_tiles`. The origins
+    and the flat patches of a tile are computed when its mesh is generated for the first time and are kept for
+    all the tiles. If the mesh of a released tile is queried again, it is generated again with the same seed.
+
+    The tiles are the same as the sub-terrains of the :class:`TerrainGenerator` class for the same configuration,
+    and are placed in the same (centered) terrain frame. The flat patches are sampled separately and thus differ.
+    The color scheme is applied to each tile separately.
+
+    Since the tiles are not combined, the :attr:`terrain_mesh` and :attr:`terrain_meshes` attributes are not
+    available, and the height map of :meth:`get_height_map` only covers the tiles in memory. The
+    :attr:`terrain_origins` and :attr:`flat_patches` attributes are only valid for the tiles that have been
+    generated (see :attr:`is_generated`).
+
+    All the operations of this class run on the CPU, except for the warp meshes of the tiles and the flat
+    patches, which are created on the specified device.
+    """
+
+    cfg: TiledTerrainGeneratorCfg
+    """The configuration of the tiled terrain generator."""
+    border_mesh: trimesh.Trimesh | None
+    """The mesh of the border around the tiles. None if the border width is zero."""
+    is_generated: np.ndarray
+    """Whether each tile has been generated at least once. Shape is (num_rows, num_cols).
+
+    The origins and the flat patches of a tile are only valid if it has been generated.
+    """
+
+    def __init__(self, cfg: TiledTerrainGeneratorCfg, device: str = "cpu"):
+        """Initialize the tiled terrain generator.
+
+        Args:
+            cfg: Configuration for the tiled terrain generator.
+            device: The device to use for the warp meshes and the flat patches tensor.
+        """
+        # check inputs
+        if len(cfg.sub_terrains) == 0:
+            raise ValueError("No sub-terrains specified! Please add at least one sub-terrain.")
+        if cfg.use_shared_memory:
+            raise ValueError("The tiled terrain generator does not support sharing the terrain between processes.")
+        # store inputs
+        self.cfg = cfg
+        self.device = device
+        # -- valid patches
+        self.flat_patches = {}
+        # -- the flat patches to sample: (name, row, col, patch configuration, bounds of the sub-terrain)
+        self._flat_patch_queries = list()
+        # set common values to all sub-terrains config
+        self._configure_sub_terrains()
+
+        # set the seed for reproducibility
+        if self.cfg.seed is not None:
+            torch.manual_seed(self.cfg.seed)
+            np.random.seed(self.cfg.seed)
+        # create buffers for the tiles
+        self.terrain_meshes = list()
+        self.terrain_origins = np.zeros((self.cfg.num_rows, self.cfg.num_cols, 3))
+        self.is_generated = np.zeros((self.cfg.num_rows, self.cfg.num_cols), dtype=bool)
+        # create the cache of the sub-terrains
+        self._cache = TerrainCache(self.cfg.cache_dir, self.cfg.cache_max_size_mb)
+
+        # decide the configuration and difficulty of the tiles
+        # note: the random numbers are sampled in the same order as in the terrain generator
+        if self.cfg.curriculum:
+            sub_terrains = self._get_curriculum_sub_terrains()
+        else:
+            sub_terrains = self._get_random_sub_terrains()
+        self._sub_terrains: dict[tuple[int, int], tuple[int, int, float, SubTerrainBaseCfg]] = {
+            (row, col): (row, col, difficulty, sub_cfg) for row, col, difficulty, sub_cfg in sub_terrains
+        }
+        # resolve the seed from which the seeds of the tiles are derived
+        self._base_seed = self.cfg.seed if self.cfg.seed is not None else np.random.randint(0, 2**31 - 1)
+
+        # offset of the terrain frame such that the tiles are centered
+        self._terrain_offset = np.zeros(3)
+        self._terrain_offset[:2] = (
+            -self.cfg.size[0] * self.cfg.num_rows * 0.5,
+            -self.cfg.size[1] * self.cfg.num_cols * 0.5,
+        )
+        # meshes of the tiles in memory from the least to the most recently used
+        self._tile_meshes: OrderedDict[tuple[int, int], trimesh.Trimesh] = OrderedDict()
+        self._tile_warp_meshes: dict[tuple[int, int], wp.Mesh] = dict()
+        self._border_warp_mesh: wp.Mesh | None = None
+
+        # create the border around the tiles
+        if self.cfg.border_width > 0.0:
+            self._add_terrain_border()
+            self.border_mesh = self.terrain_meshes.pop()
+            self.border_mesh.apply_translation(self._terrain_offset)
+        else:
+            self.border_mesh = None
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_tiles_in_memory(self) -> int:
+        """The number of tile meshes in memory."""
+        return len(self._tile_meshes)
+
+    """
+    Operations.
+    """
+
+    def generate_tiles(self, rows: Sequence[int] | np.ndarray, cols: Sequence[int] | np.ndarray):
+        """Generate the meshes of the tiles that are not in memory.
+
+        The tiles are marked as the most recently used ones. If the number of tiles in memory exceeds
+        :obj:`cfg.max_num_tiles`, the meshes of the least recently used tiles are released.
+
+        Args:
+            rows: The row indices of the tiles.
+            cols: The column indices of the tiles.
+        """
+        # find the unique tiles
+        tiles = np.stack([np.asarray(rows, dtype=np.int64).reshape(-1), np.asarray(cols, dtype=np.int64).reshape(-1)])
+        tiles = [(int(row), int(col)) for row, col in np.unique(tiles, axis=1).T]
+        # mark the tiles in memory as the most recently used ones
+        missing_tiles = list()
+        for tile in tiles:
+            if tile in self._tile_meshes:
+                self._tile_meshes.move_to_end(tile)
+            else:
+                missing_tiles.append(tile)
+        if len(missing_tiles) == 0:
+            return
+        carb.log_info(f"Generating {len(missing_tiles)} tiles of the terrain.")
+
+        # generate the meshes of the tiles
+        self.terrain_meshes = list()
+        self._generate_sub_terrains([self._sub_terrains[tile] for tile in missing_tiles], self._base_seed)
+        # sample the flat patches of the tiles generated for the first time
+        # note: the flat patches of the tiles generated again are kept
+        self._flat_patch_queries = [query for query in self._flat_patch_queries if not self.is_generated[query[1:3]]]
+        existing_names = set(self.flat_patches.keys())
+        if len(self._flat_patch_queries) > 0:
+            self._sample_flat_patches(trimesh.util.concatenate(self.terrain_meshes))
+
+        # move the tiles to the terrain frame and store them
+        is_new = np.zeros_like(self.is_generated)
+        for tile, mesh in zip(missing_tiles, self.terrain_meshes):
+            mesh.apply_translation(self._terrain_offset)
+            self._tile_meshes[tile] = self._color_mesh(mesh)
+            self.terrain_origins[tile] += self._terrain_offset
+            is_new[tile] = not self.is_generated[tile]
+        self.terrain_meshes = list()
+        self.is_generated |= is_new
+        # offset the flat patches of the new tiles by their origins
+        # note: the flat patches of a new type are offset for all the generated tiles
+        terrain_origins = torch.tensor(self.terrain_origins, dtype=torch.float, device=self.device).unsqueeze(2)
+        for name, value in self.flat_patches.items():
+            mask = torch.from_numpy(is_new if name in existing_names else self.is_generated).to(self.device)
+            value[mask] += terrain_origins[mask]
+
+        # release the meshes of the least recently used tiles
+        while len(self._tile_meshes) > self.cfg.max_num_tiles:
+            tile, _ = self._tile_meshes.popitem(last=False)
+            self._tile_warp_meshes.pop(tile, None)
+
+    def get_height_map(self, resolution: float | None = None) -> tuple[torch.Tensor, torch.Tensor]:
+        """Computes a dense height map of the tiles in memory.
+
+        The height map covers the whole terrain, including its border, and is expressed in the terrain frame as
+        for the :class:`TerrainGenerator` class. It is computed from the warp meshes of the tiles in memory and
+        of the border, so that the cells of the other tiles contain :obj:`float('inf')`. The tiles to cover can
+        be generated first with :meth:`generate_tiles`.
+
+        Args:
+            resolution: The distance between two cells of the height map (in m). Defaults to None, in which case
+                the horizontal scale of the height-field sub-terrains (:obj:`cfg.horizontal_scale`) is used.
+
+        Returns:
+            A tuple containing the height map and the (x, y) position of its first cell. The shape of the height
+            map is (num_x, num_y) and the shape of the origin is (2,).
+
+        Raises:
+            RuntimeError: If there are no tiles in memory and no border.
+        """
+        # resolve the resolution
+        if resolution is None:
+            resolution = self.cfg.horizontal_scale
+        # collect the warp meshes of the tiles in memory and of the border
+        # note: the order of the tiles in memory is kept since they are all marked as used in the same order
+        wp_meshes = [self.get_tile_warp_mesh(row, col) for row, col in list(self._tile_meshes)]
+        if self.border_mesh is not None:
+            if self._border_warp_mesh is None:
+                self._border_warp_mesh = convert_to_warp_mesh(
+                    self.border_mesh.vertices, self.border_mesh.faces, device=self.device
+                )
+            wp_meshes.append(self._border_warp_mesh)
+        if len(wp_meshes) == 0:
+            raise RuntimeError("No tiles in memory to compute the height map of. Please generate the tiles first.")
+        # compute the height map over the whole terrain
+        x_range = (self._terrain_offset[0] - self.cfg.border_width, -self._terrain_offset[0] + self.cfg.border_width)
+        y_range = (self._terrain_offset[1] - self.cfg.border_width, -self._terrain_offset[1] + self.cfg.border_width)
+        return create_height_map(wp_meshes, resolution, x_range, y_range)
+
+    def get_tile_mesh(self, row: int, col: int) -> trimesh.Trimesh:
+        """Get the mesh of a tile in the terrain frame.
+
+        The tile is generated if it is not in memory.
+
+        Args:
+            row: The row index of the tile.
+            col: The column index of the tile.
+
+        Returns:
+            The mesh of the tile.
+        """
+        self.generate_tiles([row], [col])
+        return self._tile_meshes[(row, col)]
+
+    def get_tile_warp_mesh(self, row: int, col: int) -> wp.Mesh:
+        """Get the warp mesh of a tile in the terrain frame for ray-casting.
+
+        The tile is generated if it is not in memory. The warp mesh is released along with the tile mesh.
+
+        Args:
+            row: The row index of the tile.
+            col: The column index of the tile.
+
+        Returns:
+            The warp mesh of the tile.
+        """
+        mesh = self.get_tile_mesh(row, col)
+        if (row, col) not in self._tile_warp_meshes:
+            self._tile_warp_meshes[(row, col)] = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
+        return self._tile_warp_meshes[(row, col)]
+
+    def get_tile_origins(self, rows: Sequence[int] | np.ndarray, cols: Sequence[int] | np.ndarray) -> np.ndarray:
+        """Get the origins of the tiles in the terrain frame.
+
+        The tiles that were never generated are generated first.
+
+        Args:
+            rows: The row indices of the tiles.
+            cols: The column indices of the tiles.
+
+        Returns:
+            The origins of the tiles. Shape is (num_tiles, 3).
+        """
+        rows, cols = self._generate_missing_tiles(rows, cols)
+        return self.terrain_origins[rows, cols]
+
+    def get_tile_flat_patches(
+        self, rows: Sequence[int] | np.ndarray, cols: Sequence[int] | np.ndarray
+    ) -> dict[str, torch.Tensor]:
+        """Get the flat patches of the tiles in the terrain frame.
+
+        The tiles that were never generated are generated first.
+
+        Args:
+            rows: The row indices of the tiles.
+            cols: The column indices of the tiles.
+
+        Returns:
+            A dictionary with the flat patches of the tiles for each type of flat patches. The shape of the
+            tensors is (num_tiles, num_patches, 3).
+        """
+        rows, cols = self._generate_missing_tiles(rows, cols)
+        rows, cols = torch.from_numpy(rows).to(self.device), torch.from_numpy(cols).to(self.device)
+        return {name: value[rows, cols] for name, value in self.flat_patches.items()}
+
+    """
+    Internal helpers.
+    """
+
+    def _generate_missing_tiles(
+        self, rows: Sequence[int] | np.ndarray, cols: Sequence[int] | np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Generate the tiles that were never generated.
+
+        Args:
+            rows: The row indices of the tiles.
+            cols: The column indices of the tiles.
+
+        Returns:
+            The row and column indices of the tiles as arrays.
+        """
+        rows, cols = np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64)
+        is_missing = ~self.is_generated[rows, cols]
+        if np.any(is_missing):
+            self.generate_tiles(rows[is_missing], cols[is_missing])
+        return rows, cols
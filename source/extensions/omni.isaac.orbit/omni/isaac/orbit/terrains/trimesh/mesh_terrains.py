@@ -14,7 +14,17 @@ import trimesh
 from typing import TYPE_CHECKING
 
 from .utils import *  # noqa: F401, F403
-from .utils import make_border, make_plane
+from .utils import (
+    make_border,
+    make_box,
+    make_boxes,
+    make_cone,
+    make_cones,
+    make_cylinder,
+    make_cylinders,
+    make_plane,
+    sample_random_orientation,
+)
 
 if TYPE_CHECKING:
     from . import mesh_terrains_cfg
@@ -290,7 +300,9 @@ def random_grid_terrain(
     num_boxes_y = int(cfg.size[1] / cfg.grid_width)
     # constant parameters
     terrain_height = 1.0
-    device = torch.device("cuda") if torch.cuda.is_available() else torch.device("cpu")
+    # note: the grid is small, so it is generated on the CPU. This also allows generating the terrain in
+    #   forked worker processes of the terrain generator, where CUDA cannot be used.
+    device = torch.device("cpu")
 
     # generate the border
     border_width = cfg.size[0] - min(num_boxes_x, num_boxes_y) * cfg.grid_width
@@ -732,6 +744,10 @@ def repeated_objects_terrain(
     The object parameters are specified in the configuration as curriculum parameters. The difficulty
     is used to linearly interpolate between the minimum and maximum values of the parameters.
 
+    For the object types ``"cylinder"``, ``"box"`` and ``"cone"``, the meshes of all the objects are created at
+    once from template meshes (see :func:`make_boxes`, :func:`make_cylinders` and :func:`make_cones`). The result
+    is the same as creating the objects one by one with the object functions.
+
     .. image:: ../../_static/terrains/trimesh/repeated_objects_cylinder_terrain.jpg
        :width: 30%
 
@@ -833,12 +849,40 @@ def repeated_objects_terrain(
             break
 
     # generate obstacles (but keep platform clean)
-    for index in range(len(object_centers)):
-        # randomize the height of the object
-        ob_height = height + np.random.uniform(-cfg.max_height_noise, cfg.max_height_noise)
-        if ob_height > 0.0:
-            object_mesh = object_func(center=object_centers[index], height=ob_height, **object_kwargs)
+    if object_func in (make_box, make_cylinder, make_cone):
+        # sample the parameters of the objects in the same order as the object functions
+        object_ids, object_heights, object_euler_zyx, object_sections = list(), list(), list(), list()
+        for index in range(len(object_centers)):
+            # randomize the height of the object
+            ob_height = height + np.random.uniform(-cfg.max_height_noise, cfg.max_height_noise)
+            if ob_height > 0.0:
+                object_ids.append(index)
+                object_heights.append(ob_height)
+                object_euler_zyx.append(
+                    sample_random_orientation(object_kwargs["max_yx_angle"], object_kwargs["degrees"])
+                )
+                if object_func is not make_box:
+                    object_sections.append(np.random.randint(4, 6))
+        # create the meshes of all the objects at once
+        if len(object_ids) > 0:
+            object_centers = object_centers[object_ids]
+            if object_func is make_box:
+                object_mesh = make_boxes(
+                    object_kwargs["length"], object_kwargs["width"], object_heights, object_centers, object_euler_zyx
+                )
+            else:
+                make_objects = make_cylinders if object_func is make_cylinder else make_cones
+                object_mesh = make_objects(
+                    object_kwargs["radius"], object_heights, object_centers, object_euler_zyx, object_sections
+                )
             meshes_list.append(object_mesh)
+    else:
+        for index in range(len(object_centers)):
+            # randomize the height of the object
+            ob_height = height + np.random.uniform(-cfg.max_height_noise, cfg.max_height_noise)
+            if ob_height > 0.0:
+                object_mesh = object_func(center=object_centers[index], height=ob_height, **object_kwargs)
+                meshes_list.append(object_mesh)
 
     # generate a ground plane for the terrain
     ground_plane = make_plane(cfg.size, height=0.0, center_zero=False)
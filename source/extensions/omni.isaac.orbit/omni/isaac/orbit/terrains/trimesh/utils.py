@@ -97,6 +97,60 @@ def make_border(
     return [box_mesh_left, box_mesh_right, box_mesh_top, box_mesh_bottom]
 
 
+def make_flat_border(
+    size: tuple[float, float], inner_size: tuple[float, float], position: tuple[float, float, float]
+) -> trimesh.Trimesh:
+    """Generate the top surface of a rectangular border with a hole in the middle.
+
+    Unlike :meth:`make_border`, this function does not generate boxes but only the top surface of the border
+    as a single mesh. It consists of four quads (eight triangles) between the outer and inner corners of the
+    border. The normals of the triangles point upwards.
+
+    Args:
+        size: The length (along x) and width (along y) of the border (in m).
+        inner_size: The inner length (along x) and width (along y) of the hole (in m).
+        position: The center of the top surface of the border (in m).
+
+    Returns:
+        A trimesh.Trimesh object that represents the top surface of the border.
+    """
+    # corners of the outer and inner rectangles in counter-clockwise order
+    corners = np.array([[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-1.0, 1.0]])
+    vertices = np.zeros((8, 3))
+    vertices[:4, :2] = corners * np.asarray(size) / 2.0
+    vertices[4:, :2] = corners * np.asarray(inner_size) / 2.0
+    vertices += np.asarray(position)
+    # two triangles per side of the border
+    outer = np.arange(4)
+    inner = outer + 4
+    faces = np.concatenate([
+        np.stack([outer, np.roll(outer, -1), np.roll(inner, -1)], axis=1),
+        np.stack([outer, np.roll(inner, -1), inner], axis=1),
+    ])
+    return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+
+
+def sample_random_orientation(max_yx_angle: float = 0, degrees: bool = True) -> np.ndarray:
+    """Sample a random orientation with capped angles along the y and x axis.
+
+    The random numbers are drawn from the global random number generator of numpy.
+
+    Args:
+        max_yx_angle: The maximum angle along the y and x axis. Defaults to 0.
+        degrees: Whether the angle is in degrees. Defaults to True.
+
+    Returns:
+        The Euler angles (in radians) of the orientation in the "zyx" convention. Shape is (3,).
+    """
+    # create a random rotation
+    euler_zyx = tf.Rotation.random().as_euler("zyx")  # returns rotation of shape (3,)
+    # cap the rotation along the y and x axis
+    if degrees:
+        max_yx_angle = max_yx_angle / 180.0
+    euler_zyx[1:] *= max_yx_angle
+    return euler_zyx
+
+
 def make_box(
     length: float,
     width: float,
@@ -122,11 +176,7 @@ def make_box(
     transform = np.eye(4)
     transform[0:3, -1] = np.asarray(center)
     # -- create a random rotation
-    euler_zyx = tf.Rotation.random().as_euler("zyx")  # returns rotation of shape (3,)
-    # -- cap the rotation along the y and x axis
-    if degrees:
-        max_yx_angle = max_yx_angle / 180.0
-    euler_zyx[1:] *= max_yx_angle
+    euler_zyx = sample_random_orientation(max_yx_angle, degrees)
     # -- apply the rotation
     transform[0:3, 0:3] = tf.Rotation.from_euler("zyx", euler_zyx).as_matrix()
     # create the box
@@ -153,11 +203,7 @@ def make_cylinder(
     transform = np.eye(4)
     transform[0:3, -1] = np.asarray(center)
     # -- create a random rotation
-    euler_zyx = tf.Rotation.random().as_euler("zyx")  # returns rotation of shape (3,)
-    # -- cap the rotation along the y and x axis
-    if degrees:
-        max_yx_angle = max_yx_angle / 180.0
-    euler_zyx[1:] *= max_yx_angle
+    euler_zyx = sample_random_orientation(max_yx_angle, degrees)
     # -- apply the rotation
     transform[0:3, 0:3] = tf.Rotation.from_euler("zyx", euler_zyx).as_matrix()
     # create the cylinder
@@ -183,12 +229,141 @@ def make_cone(
     transform = np.eye(4)
     transform[0:3, -1] = np.asarray(center)
     # -- create a random rotation
-    euler_zyx = tf.Rotation.random().as_euler("zyx")  # returns rotation of shape (3,)
-    # -- cap the rotation along the y and x axis
-    if degrees:
-        max_yx_angle = max_yx_angle / 180.0
-    euler_zyx[1:] *= max_yx_angle
+    euler_zyx = sample_random_orientation(max_yx_angle, degrees)
     # -- apply the rotation
     transform[0:3, 0:3] = tf.Rotation.from_euler("zyx", euler_zyx).as_matrix()
     # create the cone
     return trimesh.creation.cone(radius, height, sections=np.random.randint(4, 6), transform=transform)
+
+
+def make_boxes(
+    length: float, width: float, heights: np.ndarray, centers: np.ndarray, euler_zyx: np.ndarray
+) -> trimesh.Trimesh:
+    """Generate a single mesh of multiple boxes.
+
+    This is the vectorized version of :func:`make_box`. The vertices and faces of all the boxes are computed
+    at once from a template box. The mesh is the same as the concatenation of the boxes created with
+    :func:`make_box` with the same orientations.
+
+    Args:
+        length: The length (along x) of the boxes (in m).
+        width: The width (along y) of the boxes (in m).
+        heights: The heights of the boxes (in m). Shape is (N,).
+        centers: The centers of the boxes (in m). Shape is (N, 3).
+        euler_zyx: The orientations of the boxes as Euler angles (in radians) in the "zyx" convention.
+            Shape is (N, 3).
+
+    Returns:
+        A trimesh.Trimesh object for the boxes.
+    """
+    heights = np.asarray(heights, dtype=np.float64)
+    scales = np.stack([np.full_like(heights, length), np.full_like(heights, width), heights], axis=-1)
+    return _make_objects({0: trimesh.creation.box()}, np.zeros(len(heights), dtype=int), scales, centers, euler_zyx)
+
+
+def make_cylinders(
+    radius: float, heights: np.ndarray, centers: np.ndarray, euler_zyx: np.ndarray, sections: np.ndarray
+) -> trimesh.Trimesh:
+    """Generate a single mesh of multiple cylinders.
+
+    This is the vectorized version of :func:`make_cylinder`. The vertices and faces of all the cylinders are
+    computed at once from a template cylinder for each number of sections. The mesh is the same as the
+    concatenation of the cylinders created with :func:`make_cylinder` with the same orientations and sections.
+
+    Args:
+        radius: The radius of the cylinders (in m).
+        heights: The heights of the cylinders (in m). Shape is (N,).
+        centers: The centers of the cylinders (in m). Shape is (N, 3).
+        euler_zyx: The orientations of the cylinders as Euler angles (in radians) in the "zyx" convention.
+            Shape is (N, 3).
+        sections: The number of sections of the cylinders. Shape is (N,).
+
+    Returns:
+        A trimesh.Trimesh object for the cylinders.
+    """
+    heights = np.asarray(heights, dtype=np.float64)
+    scales = np.stack([np.full_like(heights, radius), np.full_like(heights, radius), heights], axis=-1)
+    templates = {n: trimesh.creation.cylinder(1.0, 1.0, sections=n) for n in np.unique(sections)}
+    return _make_objects(templates, np.asarray(sections), scales, centers, euler_zyx)
+
+
+def make_cones(
+    radius: float, heights: np.ndarray, centers: np.ndarray, euler_zyx: np.ndarray, sections: np.ndarray
+) -> trimesh.Trimesh:
+    """Generate a single mesh of multiple cones.
+
+    This is the vectorized version of :func:`make_cone`. The vertices and faces of all the cones are computed
+    at once from a template cone for each number of sections. The mesh is the same as the concatenation of the
+    cones created with :func:`make_cone` with the same orientations and sections.
+
+    Args:
+        radius: The radius of the cones (in m).
+        heights: The heights of the cones (in m). Shape is (N,).
+        centers: The centers of the cones (in m). Shape is (N, 3).
+        euler_zyx: The orientations of the cones as Euler angles (in radians) in the "zyx" convention.
+            Shape is (N, 3).
+        sections: The number of sections of the cones. Shape is (N,).
+
+    Returns:
+        A trimesh.Trimesh object for the cones.
+    """
+    heights = np.asarray(heights, dtype=np.float64)
+    scales = np.stack([np.full_like(heights, radius), np.full_like(heights, radius), heights], axis=-1)
+    templates = {n: trimesh.creation.cone(1.0, 1.0, sections=n) for n in np.unique(sections)}
+    return _make_objects(templates, np.asarray(sections), scales, centers, euler_zyx)
+
+
+"""
+Helper functions.
+"""
+
+
+def _make_objects(
+    templates: dict[int, trimesh.Trimesh],
+    template_ids: np.ndarray,
+    scales: np.ndarray,
+    centers: np.ndarray,
+    euler_zyx: np.ndarray,
+) -> trimesh.Trimesh:
+    """Generate a single mesh of multiple objects from scaled and transformed template meshes.
+
+    The objects are stored in the mesh in the order of the inputs.
+
+    Args:
+        templates: The template meshes of unit size, indexed by their id.
+        template_ids: The id of the template of each object. Shape is (N,).
+        scales: The scale of each object along the x, y and z axes of its template. Shape is (N, 3).
+        centers: The center of each object (in m). Shape is (N, 3).
+        euler_zyx: The orientation of each object as Euler angles (in radians) in the "zyx" convention.
+            Shape is (N, 3).
+
+    Returns:
+        A trimesh.Trimesh object for the objects.
+    """
+    num_objects = len(template_ids)
+    # compute the homogeneous transforms of the objects
+    transforms = np.tile(np.eye(4), (num_objects, 1, 1))
+    transforms[:, 0:3, 0:3] = tf.Rotation.from_euler("zyx", np.reshape(euler_zyx, (-1, 3))).as_matrix()
+    transforms[:, 0:3, -1] = centers
+    # compute the location of the vertices and faces of each object in the mesh
+    num_vertices = np.array([len(templates[i].vertices) for i in template_ids], dtype=np.int64)
+    num_faces = np.array([len(templates[i].faces) for i in template_ids], dtype=np.int64)
+    vertex_offsets = np.cumsum(num_vertices) - num_vertices
+    face_offsets = np.cumsum(num_faces) - num_faces
+    # create the vertices and faces of the objects of each template at once
+    vertices = np.zeros((num_vertices.sum(), 3))
+    faces = np.zeros((num_faces.sum(), 3), dtype=np.int64)
+    for template_id, template in templates.items():
+        ids = np.flatnonzero(template_ids == template_id)
+        # scale the template vertices: (num_template_objects, num_template_vertices, 3)
+        template_vertices = template.vertices * scales[ids, None]
+        # transform the vertices in homogeneous coordinates
+        # note: the batched product matches the transform of the meshes one by one with trimesh
+        template_vertices = np.concatenate([template_vertices, np.ones_like(template_vertices[..., :1])], axis=-1)
+        template_vertices = np.matmul(transforms[ids], template_vertices.transpose(0, 2, 1)).transpose(0, 2, 1)
+        # store the vertices and faces
+        vertex_ids = vertex_offsets[ids, None] + np.arange(len(template.vertices))
+        vertices[vertex_ids.reshape(-1)] = template_vertices[..., :3].reshape(-1, 3)
+        face_ids = face_offsets[ids, None] + np.arange(len(template.faces))
+        faces[face_ids.reshape(-1)] = (template.faces + vertex_offsets[ids, None, None]).reshape(-1, 3)
+    return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
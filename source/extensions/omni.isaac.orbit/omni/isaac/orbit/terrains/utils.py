@@ -12,47 +12,62 @@ import trimesh
 
 import warp as wp
 
-from omni.isaac.orbit.utils.warp import raycast_mesh
+from omni.isaac.orbit.utils.warp import raycast_mesh, raycast_meshes
 
+from .terrain_generator_cfg import FlatPatchSamplingCfg
 
-def color_meshes_by_height(meshes: list[trimesh.Trimesh], **kwargs) -> trimesh.Trimesh:
+
+def color_meshes_by_height(meshes: list[trimesh.Trimesh] | trimesh.Trimesh, **kwargs) -> trimesh.Trimesh:
     """
     Color the vertices of a trimesh object based on the z-coordinate (height) of each vertex,
     using the Turbo colormap. If the z-coordinates are all the same, the vertices will be colored
     with a single color.
 
+    The color map is evaluated once on a table of colors. The heights are quantized to the entries of the
+    table and the colors of the vertices are looked up in it. The vertex colors are stored as ``uint8``.
+
     Args:
-        meshes: A list of trimesh objects.
+        meshes: A list of trimesh objects or a single trimesh object. The list of meshes is combined into
+            a new mesh, while a single mesh is colored in place.
 
     Keyword Args:
         color: A list of 3 integers in the range [0,255] representing the RGB
             color of the mesh. Used when the z-coordinates of all vertices are the same.
         color_map: The name of the color map to be used. Defaults to "turbo".
+        num_colors: The number of colors in the table of the color map. Defaults to 1024.
 
     Returns:
         A trimesh object with the vertices colored based on the z-coordinate (height) of each vertex.
     """
     # Combine all meshes into a single mesh
-    mesh = trimesh.util.concatenate(meshes)
+    if isinstance(meshes, trimesh.Trimesh):
+        mesh = meshes
+    else:
+        mesh = trimesh.util.concatenate(meshes)
     # Get the z-coordinates of each vertex
     heights = mesh.vertices[:, 2]
+    min_height, max_height = np.min(heights), np.max(heights)
     # Check if the z-coordinates are all the same
-    if np.max(heights) == np.min(heights):
+    if max_height == min_height:
         # Obtain a single color: light blue
         color = kwargs.pop("color", [172, 216, 230, 255])
         color = np.asarray(color, dtype=np.uint8)
         # Set the color for all vertices
         mesh.visual.vertex_colors = color
     else:
-        # Normalize the heights to [0,1]
-        heights_normalized = (heights - np.min(heights)) / (np.max(heights) - np.min(heights))
-        # clip lower and upper bounds to have better color mapping
-        heights_normalized = np.clip(heights_normalized, 0.1, 0.9)
-        # Get the color for each vertex based on the height
+        # Create the table of colors of the color map
+        num_colors = kwargs.pop("num_colors", 1024)
         color_map = kwargs.pop("color_map", "turbo")
-        colors = trimesh.visual.color.interpolate(heights_normalized, color_map=color_map)
+        color_table = trimesh.visual.color.interpolate(np.linspace(0.0, 1.0, num_colors), color_map=color_map)
+        # Map the heights to the entries of the table
+        # note: the normalized heights are clipped to [0.1, 0.9] to have better color mapping
+        scale = (num_colors - 1) / (0.8 * (max_height - min_height))
+        indices = heights - (min_height + 0.1 * (max_height - min_height))
+        indices *= scale
+        np.clip(indices, 0, num_colors - 1, out=indices)
+        np.rint(indices, out=indices)
         # Set the vertex colors
-        mesh.visual.vertex_colors = colors
+        mesh.visual.vertex_colors = color_table[indices.astype(np.intp)]
     # Return the mesh
     return mesh
 
@@ -155,6 +170,8 @@ def find_flat_patches(
     3. Reject patches that are outside the z range or have a height difference that is too large.
     4. Keep sampling until all patches are valid.
 
+    The sampling is performed by :func:`find_flat_patches_batched` with a single search space.
+
     Args:
         wp_mesh: The warp mesh to find patches in.
         num_patches: The desired number of patches to find.
@@ -179,65 +196,139 @@ def find_flat_patches(
     device = wp.device_to_torch(wp_mesh.device)
 
     # resolve inputs to consistent type
-    # -- patch radii
-    if isinstance(patch_radius, float):
-        patch_radius = [patch_radius]
-    # -- origin
     if isinstance(origin, np.ndarray):
         origin = torch.from_numpy(origin).to(torch.float).to(device)
     elif isinstance(origin, torch.Tensor):
         origin = origin.to(device)
     else:
         origin = torch.tensor(origin, dtype=torch.float, device=device)
-
-    # create ranges for the x and y coordinates around the origin.
-    # The provided ranges are bounded by the mesh's bounding box.
-    x_range = (
-        max(x_range[0] + origin[0].item(), wp_mesh.points.numpy()[:, 0].min()),
-        min(x_range[1] + origin[0].item(), wp_mesh.points.numpy()[:, 0].max()),
-    )
-    y_range = (
-        max(y_range[0] + origin[1].item(), wp_mesh.points.numpy()[:, 1].min()),
-        min(y_range[1] + origin[1].item(), wp_mesh.points.numpy()[:, 1].max()),
-    )
-    z_range = (
-        z_range[0] + origin[2].item(),
-        z_range[1] + origin[2].item(),
+    # create the patch configuration
+    patch_cfg = FlatPatchSamplingCfg(
+        num_patches=num_patches,
+        patch_radius=patch_radius,
+        x_range=x_range,
+        y_range=y_range,
+        z_range=z_range,
+        max_height_diff=max_height_diff,
     )
+    # sample the patches
+    return find_flat_patches_batched(wp_mesh, [patch_cfg], origin.unsqueeze(0))[0]
+
+
+def find_flat_patches_batched(
+    wp_mesh: wp.Mesh,
+    patch_cfgs: list[FlatPatchSamplingCfg],
+    origins: np.ndarray | torch.Tensor,
+    bounds: np.ndarray | torch.Tensor | None = None,
+    oversample_factor: int = 4,
+    max_iterations: int = 10000,
+) -> list[torch.Tensor]:
+    """Finds flat patches for multiple search spaces in the input mesh at once.
+
+    This function is the batched version of :func:`find_flat_patches`. Each search space is defined by a patch
+    configuration, an origin in the mesh frame and optionally the 2D bounds of the region to search in. This
+    allows sampling the patches of all the sub-terrains of a terrain, which are combined into a single mesh.
+
+    The function performs rejection sampling for all the search spaces at the same time:
+
+    1. Sample candidate locations for the remaining patches of each search space. The number of candidates is
+       the number of remaining patches times the :obj:`oversample_factor`.
+    2. Query the height of a ring of points around all the candidates with a single ray-casting call.
+    3. Reject the candidates whose points are outside the bounds or the z range, or have a height difference
+       that is too large.
+    4. Assign the valid candidates to the remaining patches and keep sampling until all patches are valid.
 
-    # create a circle of points around (0, 0) to query validity of the patches
+    Args:
+        wp_mesh: The warp mesh to find patches in.
+        patch_cfgs: The configuration of the patches for each search space.
+        origins: The origins defining the center of the search spaces. This is specified in the mesh frame.
+            Shape is (num_spaces, 3).
+        bounds: The minimum and maximum (x, y) coordinates of the regions to search in. The patches are
+            only valid if their points lie within these regions. Shape is (num_spaces, 2, 2). Defaults to None,
+            in which case the bounding box of the mesh is used for all the search spaces.
+        oversample_factor: The number of candidates sampled per remaining patch at each iteration. Defaults to 4.
+        max_iterations: The maximum number of sampling iterations. Defaults to 10000.
+
+    Returns:
+        A list with the flat patches of each search space. Each patch tensor has a shape of (num_patches, 3).
+        The patches are defined in the mesh frame relative to the origin of the search space.
+
+    Raises:
+        RuntimeError: If the function fails to find valid patches. This can happen if the input parameters
+            are not suitable for finding valid patches and maximum number of iterations is reached.
+    """
+    # set device to warp mesh device
+    device = wp.device_to_torch(wp_mesh.device)
+    num_spaces = len(patch_cfgs)
+
+    # resolve inputs to consistent type
+    # -- origins
+    origins = torch.as_tensor(origins, dtype=torch.float, device=device).view(num_spaces, 3)
+    # -- bounds
+    if bounds is None:
+        points = wp.to_torch(wp_mesh.points)
+        mesh_bounds = torch.stack([points[:, :2].min(dim=0)[0], points[:, :2].max(dim=0)[0]])
+        bounds = mesh_bounds.unsqueeze(0).repeat(num_spaces, 1, 1)
+    else:
+        bounds = torch.as_tensor(bounds, dtype=torch.float, device=device).view(num_spaces, 2, 2)
+    # -- patch radii
+    # note: the radii of each search space are padded by repeating the last one. This does not change the
+    #   validity of the patches since the repeated points have the same height.
+    patch_radii = [
+        [cfg.patch_radius] if isinstance(cfg.patch_radius, float) else cfg.patch_radius for cfg in patch_cfgs
+    ]
+    max_num_radii = max(len(radii) for radii in patch_radii)
+    patch_radii = [list(radii) + [radii[-1]] * (max_num_radii - len(radii)) for radii in patch_radii]
+    patch_radii = torch.tensor(patch_radii, dtype=torch.float, device=device)
+
+    # create the ranges for the x and y coordinates around the origins
+    # The provided ranges are bounded by the search bounds.
+    ranges = torch.tensor([[cfg.x_range, cfg.y_range] for cfg in patch_cfgs], dtype=torch.float, device=device)
+    sample_min = torch.maximum(ranges[..., 0] + origins[:, :2], bounds[:, 0])
+    sample_max = torch.minimum(ranges[..., 1] + origins[:, :2], bounds[:, 1])
+    z_range = torch.tensor([cfg.z_range for cfg in patch_cfgs], dtype=torch.float, device=device)
+    z_range += origins[:, 2:]
+    max_height_diff = torch.tensor([cfg.max_height_diff for cfg in patch_cfgs], dtype=torch.float, device=device)
+
+    # create circles of points around (0, 0) to query validity of the patches
     # the ring of points is uniformly distributed around the circle
     angle = torch.linspace(0, 2 * np.pi, 10, device=device)
-    query_x = []
-    query_y = []
-    for radius in patch_radius:
-        query_x.append(radius * torch.cos(angle))
-        query_y.append(radius * torch.sin(angle))
-    query_x = torch.cat(query_x).unsqueeze(1)  # dim: (num_radii * 10, 1)
-    query_y = torch.cat(query_y).unsqueeze(1)  # dim: (num_radii * 10, 1)
-    # dim: (num_radii * 10, 3)
-    query_points = torch.cat([query_x, query_y, torch.zeros_like(query_x)], dim=-1)
+    # dim: (num_spaces, num_radii * 10, 2)
+    query_offsets = patch_radii.unsqueeze(-1).unsqueeze(-1) * torch.stack([torch.cos(angle), torch.sin(angle)], dim=-1)
+    query_offsets = query_offsets.view(num_spaces, -1, 2)
 
     # create buffers
-    # -- a buffer to store indices of points that are not valid
-    points_ids = torch.arange(num_patches, device=device)
+    # -- the number of patches of each search space
+    num_patches = torch.tensor([cfg.num_patches for cfg in patch_cfgs], device=device)
+    max_num_patches = int(num_patches.max())
+    # -- a buffer to store which patches are not valid yet
+    # note: the search spaces with fewer patches are padded with patches that are always valid
+    is_pending = torch.arange(max_num_patches, device=device) < num_patches.unsqueeze(1)
     # -- a buffer to store the flat patches locations
-    flat_patches = torch.zeros(num_patches, 3, device=device)
+    flat_patches = torch.zeros(num_spaces, max_num_patches, 3, device=device)
 
     # sample points and raycast to find the height.
-    # 1. Reject points that are outside the z_range or have a height difference that is too large.
+    # 1. Reject points that are outside the bounds or the z_range or have a height difference that is too large.
     # 2. Keep sampling until all points are valid.
     iter_count = 0
-    while len(points_ids) > 0 and iter_count < 10000:
-        # sample points in the 2D region around the origin
-        pos_x = torch.empty(len(points_ids), device=device).uniform_(*x_range)
-        pos_y = torch.empty(len(points_ids), device=device).uniform_(*y_range)
-        flat_patches[points_ids, :2] = torch.stack([pos_x, pos_y], dim=-1)
-
-        # define the query points to check validity of the patch
-        # dim: (num_patches, num_radii * 10, 3)
-        points = flat_patches[points_ids].unsqueeze(1) + query_points
-        points[..., 2] = 100.0
+    space_ids = torch.arange(num_spaces, device=device)
+    while iter_count < max_iterations:
+        # search spaces with remaining patches
+        space_ids = space_ids[is_pending[space_ids].any(dim=1)]
+        if len(space_ids) == 0:
+            break
+        num_pending = is_pending[space_ids].sum(dim=1)
+        num_candidates = oversample_factor * int(num_pending.max())
+
+        # sample candidates in the 2D region around the origins
+        # dim: (num_active_spaces, num_candidates, 2)
+        candidates = torch.rand(len(space_ids), num_candidates, 2, device=device)
+        candidates = sample_min[space_ids].unsqueeze(1) + candidates * (sample_max - sample_min)[space_ids].unsqueeze(1)
+
+        # define the query points to check validity of the patches
+        # dim: (num_active_spaces, num_candidates, num_radii * 10, 3)
+        points = candidates.unsqueeze(2) + query_offsets[space_ids].unsqueeze(1)
+        points = torch.cat([points, torch.full_like(points[..., :1], 100.0)], dim=-1)
         # ray-cast direction is downwards
         dirs = torch.zeros_like(points)
         dirs[..., 2] = -1.0
@@ -245,30 +336,147 @@ def find_flat_patches(
         # ray-cast to find the height of the patches
         ray_hits = raycast_mesh(points.view(-1, 3), dirs.view(-1, 3), wp_mesh)[0]
         heights = ray_hits.view(points.shape)[..., 2]
-        # set the height of the patches
-        # note: for invalid patches, they would be overwritten in the next iteration
-        #   so it's safe to set the height to the last value
-        flat_patches[points_ids, 2] = heights[..., -1]
 
         # check validity
+        # -- points are within the bounds
+        space_bounds = bounds[space_ids].view(-1, 1, 1, 2, 2)
+        is_valid = torch.all(
+            (points[..., :2] >= space_bounds[..., 0, :]) & (points[..., :2] <= space_bounds[..., 1, :]), dim=-1
+        )
+        is_valid = torch.all(is_valid, dim=-1)
         # -- height is within the z range
-        not_valid = torch.any(torch.logical_or(heights < z_range[0], heights > z_range[1]), dim=1)
+        space_z_range = z_range[space_ids].view(-1, 1, 1, 2)
+        is_valid &= torch.all((heights >= space_z_range[..., 0]) & (heights <= space_z_range[..., 1]), dim=-1)
         # -- height difference is within the max height difference
-        not_valid = torch.logical_or(not_valid, (heights.max(dim=1)[0] - heights.min(dim=1)[0]) > max_height_diff)
-
-        # remove invalid patches indices
-        points_ids = points_ids[not_valid]
+        is_valid &= (heights.max(dim=-1)[0] - heights.min(dim=-1)[0]) <= max_height_diff[space_ids].unsqueeze(1)
+
+        # assign the valid candidates to the remaining patches in order
+        # note: stable sorting moves the remaining patches and the valid candidates to the front
+        pending_order = torch.argsort((~is_pending[space_ids]).int(), dim=1, stable=True)
+        valid_order = torch.argsort((~is_valid).int(), dim=1, stable=True)
+        num_assigned = torch.minimum(num_pending, is_valid.sum(dim=1))
+        max_num_assigned = min(max_num_patches, num_candidates)
+        assign_mask = torch.arange(max_num_assigned, device=device) < num_assigned.unsqueeze(1)
+        local_ids = torch.arange(len(space_ids), device=device).unsqueeze(1).expand(-1, max_num_assigned)[assign_mask]
+        patch_ids = pending_order[:, :max_num_assigned][assign_mask]
+        candidate_ids = valid_order[:, :max_num_assigned][assign_mask]
+        # set the location of the patches
+        # note: the height of the patch is the height of the last point of the ring
+        flat_patches[space_ids[local_ids], patch_ids, :2] = candidates[local_ids, candidate_ids]
+        flat_patches[space_ids[local_ids], patch_ids, 2] = heights[local_ids, candidate_ids, -1]
+        is_pending[space_ids[local_ids], patch_ids] = False
         # increment count
         iter_count += 1
 
     # check all patches are valid
-    if len(points_ids) > 0:
+    if torch.any(is_pending):
         raise RuntimeError(
             "Failed to find valid patches! Please check the input parameters."
             f"\n\tMaximum number of iterations reached: {iter_count}"
-            f"\n\tNumber of invalid patches: {len(points_ids)}"
-            f"\n\tMaximum height difference: {max_height_diff}"
+            f"\n\tNumber of invalid patches: {int(is_pending.sum())}"
+            f"\n\tNumber of search spaces with invalid patches: {int(is_pending.any(dim=1).sum())}"
         )
 
-    # return the flat patches (in the mesh frame)
-    return flat_patches - origin
+    # return the flat patches (in the mesh frame relative to the origins)
+    flat_patches -= origins.unsqueeze(1)
+    return [flat_patches[i, :n] for i, n in enumerate(num_patches.tolist())]
+
+
+def create_height_map(
+    wp_meshes: list[wp.Mesh],
+    resolution: float,
+    x_range: tuple[float, float] | None = None,
+    y_range: tuple[float, float] | None = None,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Creates a dense height map of the input meshes.
+
+    The height map is a regular 2D grid of heights, whose first and second dimensions are along the x and y axes
+    respectively. The height of the cell (i, j) is the height of the highest surface of the meshes at the position
+    ``origin + (i, j) * resolution``. It is computed by ray-casting downwards from above the meshes on all the
+    cells in a single call. The cells where the rays do not hit any mesh contain :obj:`float('inf')`.
+
+    The height map can be queried with :func:`sample_height_map`.
+
+    Args:
+        wp_meshes: The warp meshes to compute the height map of. All the meshes must be on the same device.
+        resolution: The distance between two cells of the height map (in m).
+        x_range: The range of x coordinates covered by the height map. Defaults to None, in which case the range
+            of x coordinates of the vertices of the meshes is used.
+        y_range: The range of y coordinates covered by the height map. Defaults to None, in which case the range
+            of y coordinates of the vertices of the meshes is used.
+
+    Returns:
+        A tuple containing the height map and the (x, y) position of its first cell. The shape of the height map
+        is (num_x, num_y) and the shape of the origin is (2,). Both tensors are on the device of the meshes.
+    """
+    # set device to warp mesh device
+    device = wp.device_to_torch(wp_meshes[0].device)
+    # compute the bounds of the meshes
+    points = torch.cat([wp.to_torch(wp_mesh.points) for wp_mesh in wp_meshes])
+    if x_range is None:
+        x_range = (points[:, 0].min().item(), points[:, 0].max().item())
+    if y_range is None:
+        y_range = (points[:, 1].min().item(), points[:, 1].max().item())
+    # create the positions of the cells
+    # note: a small tolerance is added to include the upper bound despite rounding errors
+    num_x = int(np.floor((x_range[1] - x_range[0]) / resolution + 1e-6)) + 1
+    num_y = int(np.floor((y_range[1] - y_range[0]) / resolution + 1e-6)) + 1
+    x = x_range[0] + resolution * torch.arange(num_x, dtype=torch.float, device=device)
+    y = y_range[0] + resolution * torch.arange(num_y, dtype=torch.float, device=device)
+    grid_x, grid_y = torch.meshgrid(x, y, indexing="ij")
+
+    # ray-cast downwards from above the meshes
+    ray_starts = torch.stack([grid_x, grid_y, torch.full_like(grid_x, points[:, 2].max().item() + 1.0)], dim=-1)
+    ray_directions = torch.zeros_like(ray_starts)
+    ray_directions[..., 2] = -1.0
+    ray_hits = raycast_meshes(ray_starts.view(-1, 3), ray_directions.view(-1, 3), wp_meshes)[0]
+    # extract the heights
+    height_map = ray_hits[:, 2].view(num_x, num_y).contiguous()
+    origin = torch.tensor([x_range[0], y_range[0]], dtype=torch.float, device=device)
+    return height_map, origin
+
+
+def sample_height_map(
+    height_map: torch.Tensor, origin: torch.Tensor, resolution: float, positions: torch.Tensor
+) -> torch.Tensor:
+    """Samples a height map at the input positions with bilinear interpolation.
+
+    The heights of the four cells around all the positions are read with a single gather operation. Since
+    the height map stores the heights at the vertices of height-field terrains, the sampled heights match
+    the surface of these terrains when their horizontal scale is a multiple of the resolution.
+
+    Args:
+        height_map: The height map created with :func:`create_height_map`. Shape is (num_x, num_y).
+        origin: The (x, y) position of the first cell of the height map. Shape is (2,).
+        resolution: The distance between two cells of the height map (in m).
+        positions: The (x, y) positions to sample the heights at. Shape is (..., 2).
+
+    Returns:
+        The heights at the positions. Shape is (...). The heights of the positions outside the height map
+        or next to cells without height are :obj:`float('inf')`.
+    """
+    num_x, num_y = height_map.shape
+    # compute the continuous indices of the positions
+    coords = (positions - origin) / resolution
+    # find the lower cell of each position
+    # note: the lower cell is clamped such that the positions on the upper edges use the last two cells
+    lower_x = coords[..., 0].floor().clamp(0, max(num_x - 2, 0)).long()
+    lower_y = coords[..., 1].floor().clamp(0, max(num_y - 2, 0)).long()
+    frac_x = coords[..., 0] - lower_x
+    frac_y = coords[..., 1] - lower_y
+    # gather the heights of the four cells around the positions
+    # note: for height maps of a single row or column, the neighbor is clamped to the same cell
+    step_x = num_y if num_x > 1 else 0
+    step_y = 1 if num_y > 1 else 0
+    lower_ids = lower_x * num_y + lower_y
+    cell_ids = torch.stack([lower_ids, lower_ids + step_y, lower_ids + step_x, lower_ids + step_x + step_y], dim=-1)
+    corners = height_map.view(-1)[cell_ids]
+    # interpolate the heights
+    heights_x0 = corners[..., 0] + frac_y * (corners[..., 1] - corners[..., 0])
+    heights_x1 = corners[..., 2] + frac_y * (corners[..., 3] - corners[..., 2])
+    heights = heights_x0 + frac_x * (heights_x1 - heights_x0)
+    # mark the positions outside the height map or next to cells without height
+    is_inside = (coords[..., 0] >= 0) & (coords[..., 0] <= num_x - 1) & (coords[..., 1] >= 0)
+    is_inside &= coords[..., 1] <= num_y - 1
+    is_valid = is_inside & torch.isfinite(heights)
+    return torch.where(is_valid, heights, torch.full_like(heights, float("inf")))
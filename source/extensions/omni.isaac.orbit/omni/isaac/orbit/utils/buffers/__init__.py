@@ -0,0 +1,8 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Sub-module containing different buffers for storing batched tensor data."""
+
+from .circular_buffer import CircularBuffer
@@ -0,0 +1,216 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+
+
+class CircularBuffer:
+    """Circular buffer for storing a history of batched tensor data.
+
+    The buffer stores the data in a tensor of shape (batch_size, max_length, ...) that is allocated on the first
+    call to :meth:`append`. All the batches share a single write pointer that marks the slot of the most recent
+    entry. Appending data only writes into this slot, so that the history never has to be shifted or copied.
+
+    The history is only re-ordered when it is read. The :attr:`buffer` property returns the full history ordered
+    from the oldest to the newest entry, while indexing the buffer with a tensor of lags (see :meth:`__getitem__`)
+    returns a single entry per batch with one gather operation.
+
+    When a batch is reset, its history is filled with the next appended data. This ensures that the history
+    does not contain stale data from the previous episode.
+
+    Usage:
+
+    .. code-block:: python
+
+        import torch
+        from omni.isaac.orbit.utils.buffers import CircularBuffer
+
+        # create a buffer for 4 batches with a history of 3 entries
+        buffer = CircularBuffer(max_len=3, batch_size=4, device="cpu")
+        # add data to the buffer
+        for i in range(5):
+            buffer.append(torch.full((4, 2), float(i)))
+
+        # read the ordered history: shape (4, 3, 2) with values 2, 3, 4
+        history = buffer.buffer
+        # read the entry from two steps ago for the first batch and the latest one for the others
+        delayed_data = buffer[torch.tensor([2, 0, 0, 0])]
+
+    """
+
+    def __init__(self, max_len: int, batch_size: int, device: str):
+        """Initialize the circular buffer.
+
+        Args:
+            max_len: The maximum number of entries stored for each batch.
+            batch_size: The number of batches.
+            device: The device on which to store the buffer.
+
+        Raises:
+            ValueError: If the maximum length is less than one.
+        """
+        # check the inputs
+        if max_len < 1:
+            raise ValueError(f"The maximum length of the circular buffer must be at least one. Received: {max_len}.")
+        # store the inputs
+        self._max_len = max_len
+        self._batch_size = batch_size
+        self._device = device
+        # indices of all the batches
+        self._ALL_INDICES = torch.arange(batch_size, device=device)
+        # indices of the ordered history for each position of the write pointer
+        # note: row 'p' contains the indices of the oldest to the newest entry when the pointer is at 'p'
+        arange = torch.arange(max_len, device=device)
+        self._ordered_indices = (arange.unsqueeze(0) + arange.unsqueeze(1) + 1) % max_len
+        # the current write pointer (-1 means that nothing has been written yet)
+        self._pointer: int = -1
+        # number of appends since the last reset for each batch
+        self._num_pushes = torch.zeros(batch_size, dtype=torch.long, device=device)
+        # indices of the batches whose history is filled on the next append
+        self._fill_ids: torch.Tensor | None = self._ALL_INDICES
+        # the data buffer (allocated on the first append)
+        self._buffer: torch.Tensor | None = None
+
+    def __str__(self) -> str:
+        """Returns: A string representation of the circular buffer."""
+        return f"CircularBuffer(max_len={self._max_len}, batch_size={self._batch_size}, device={self._device})"
+
+    """
+    Properties.
+    """
+
+    @property
+    def batch_size(self) -> int:
+        """The number of batches."""
+        return self._batch_size
+
+    @property
+    def device(self) -> str:
+        """The device on which the buffer is stored."""
+        return self._device
+
+    @property
+    def max_length(self) -> int:
+        """The maximum number of entries stored for each batch."""
+        return self._max_len
+
+    @property
+    def current_length(self) -> torch.Tensor:
+        """The number of valid entries for each batch. Shape is (batch_size,).
+
+        This is the number of appends since the last reset, clipped to the maximum length.
+        """
+        return torch.clamp(self._num_pushes, max=self._max_len)
+
+    @property
+    def buffer(self) -> torch.Tensor:
+        """The history ordered from the oldest to the newest entry. Shape is (batch_size, max_length, ...).
+
+        Note:
+            The returned tensor is a copy of the internal storage. It is gathered with a single indexing
+            operation from the circular storage.
+
+        Raises:
+            RuntimeError: If no data has been appended to the buffer yet.
+        """
+        self._check_is_initialized()
+        return self._buffer[:, self._ordered_indices[self._pointer]]
+
+    """
+    Operations.
+    """
+
+    def reset(self, batch_ids: Sequence[int] | None = None):
+        """Reset the history of the specified batches.
+
+        The history is not cleared immediately. Instead, the history of the batches is filled with the data
+        from the next call to :meth:`append`.
+
+        Args:
+            batch_ids: The batch indices to reset. Defaults to None, in which case all the batches are reset.
+        """
+        # resolve the batch indices
+        if batch_ids is None:
+            batch_ids = self._ALL_INDICES
+        elif not isinstance(batch_ids, torch.Tensor):
+            batch_ids = torch.tensor(batch_ids, dtype=torch.long, device=self._device)
+        # reset the number of pushes
+        self._num_pushes[batch_ids] = 0
+        # mark the batches to be filled on the next append
+        if self._fill_ids is None:
+            self._fill_ids = batch_ids
+        else:
+            self._fill_ids = torch.cat([self._fill_ids, batch_ids])
+
+    def append(self, data: torch.Tensor):
+        """Append the data to the history of all the batches.
+
+        Args:
+            data: The data to append. Shape is (batch_size, ...).
+
+        Raises:
+            ValueError: If the first dimension of the data does not match the batch size.
+        """
+        # check the input
+        if data.shape[0] != self._batch_size:
+            raise ValueError(
+                f"The first dimension of the data must match the batch size: {self._batch_size}."
+                f" Received shape: {data.shape}."
+            )
+        # allocate the storage if it is the first append
+        if self._buffer is None:
+            buffer_shape = (self._batch_size, self._max_len, *data.shape[1:])
+            self._buffer = torch.empty(buffer_shape, dtype=data.dtype, device=self._device)
+        # move the pointer and write the data into the slot
+        self._pointer = (self._pointer + 1) % self._max_len
+        self._buffer[:, self._pointer] = data
+        # fill the history of the batches that were reset
+        if self._fill_ids is not None:
+            self._buffer[self._fill_ids] = data[self._fill_ids].unsqueeze(1)
+            self._fill_ids = None
+        # update the number of pushes
+        self._num_pushes += 1
+
+    def __getitem__(self, key: torch.Tensor) -> torch.Tensor:
+        """Read a delayed entry for each batch.
+
+        The entries are gathered from the circular storage with a single indexing operation. Lags that are
+        larger than the stored history are clipped to the oldest entry.
+
+        Args:
+            key: The lag for each batch, where zero refers to the most recent entry. Shape is (batch_size,).
+
+        Returns:
+            The delayed entry for each batch. Shape is (batch_size, ...).
+
+        Raises:
+            ValueError: If the shape of the key does not match the batch size.
+            RuntimeError: If no data has been appended to the buffer yet.
+        """
+        # check the input
+        if key.shape != (self._batch_size,):
+            raise ValueError(
+                f"The key must be a tensor of shape ({self._batch_size},) with the lags. Received: {key.shape}."
+            )
+        self._check_is_initialized()
+        # compute the slot of the delayed entry for each batch
+        index = torch.remainder(self._pointer - torch.clamp(key, min=0, max=self._max_len - 1), self._max_len)
+        return self._buffer[self._ALL_INDICES, index]
+
+    """
+    Helper functions.
+    """
+
+    def _check_is_initialized(self):
+        """Check that data has been appended to the buffer.
+
+        Raises:
+            RuntimeError: If no data has been appended to the buffer yet.
+        """
+        if self._buffer is None:
+            raise RuntimeError("The circular buffer is empty. Please call 'append' before reading from it.")
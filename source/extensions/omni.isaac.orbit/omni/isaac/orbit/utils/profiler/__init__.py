@@ -0,0 +1,14 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Sub-module containing a profiler for measuring the time spent in the phases of a computation.
+
+The profiler records the durations of named phases into rolling windows and reports their mean and
+percentiles. The statistics can be printed, logged or saved to a JSON file, and the recorded phases
+can be exported in the Chrome trace format.
+"""
+
+from .profiler import Profiler
+from .profiler_cfg import ProfilerCfg
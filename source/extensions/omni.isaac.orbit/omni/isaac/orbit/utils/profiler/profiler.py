@@ -0,0 +1,362 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import contextlib
+import json
+import numpy as np
+import os
+import time
+import torch
+from collections import deque
+from collections.abc import Callable
+from prettytable import PrettyTable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .profiler_cfg import ProfilerCfg
+
+_NULL_SCOPE = contextlib.nullcontext()
+"""The scope returned by a disabled profiler. It is shared to avoid creating an object on each call."""
+
+
+class Profiler:
+    """Profiler for measuring the time spent in the named phases of a computation.
+
+    A phase is timed by entering the context manager returned by :meth:`scope`. The durations of the phases
+    are kept in rolling windows of size :attr:`ProfilerCfg.window_size`, from which the mean and percentiles
+    are computed on request. Functions, such as the terms of the managers, can be timed on each call by
+    wrapping them with :meth:`wrap`. If :attr:`ProfilerCfg.record_memory` is True, the number of bytes
+    allocated in each phase is recorded as well.
+
+    If the profiler is disabled, :meth:`scope` returns a shared no-op context manager. This keeps the
+    overhead of the instrumented code close to zero.
+
+    Usage:
+
+    .. code-block:: python
+
+        from omni.isaac.orbit.utils.profiler import Profiler, ProfilerCfg
+
+        profiler = Profiler(ProfilerCfg(enabled=True), device="cuda:0")
+        for _ in range(100):
+            with profiler.scope("step"):
+                with profiler.scope("step/physics"):
+                    ...
+        # print the statistics
+        print(profiler)
+        # get the statistics as a dictionary
+        stats = profiler.summary()
+
+    """
+
+    def __init__(self, cfg: ProfilerCfg, device: str = "cpu"):
+        """Initialize the profiler.
+
+        Args:
+            cfg: The configuration of the profiler.
+            device: The device on which the profiled computations run. Defaults to "cpu".
+        """
+        # store the inputs
+        self.cfg = cfg
+        self._device = device
+        # whether to time with cuda events
+        is_cuda = "cuda" in device and torch.cuda.is_available()
+        self._use_cuda_events = cfg.cuda_timing and is_cuda
+        # whether to read the allocated memory from the cuda caching allocator
+        self._use_cuda_memory = cfg.record_memory and is_cuda
+        # recorded durations (in ms), number of calls, total duration (in ms) and allocated bytes for each phase
+        self._durations: dict[str, deque[float]] = dict()
+        self._num_calls: dict[str, int] = dict()
+        self._total_durations: dict[str, float] = dict()
+        self._total_bytes: dict[str, int] = dict()
+        # cuda events that are not synchronized yet
+        self._pending_events: list[tuple[str, torch.cuda.Event, torch.cuda.Event]] = list()
+        # events for the chrome trace
+        self._trace_events: list[dict[str, Any]] = list()
+        self._record_trace = cfg.trace_path is not None
+        self._origin_time = time.perf_counter()
+
+    def __str__(self) -> str:
+        """Returns: A string representation of the statistics of the profiler."""
+        table = PrettyTable()
+        table.title = "Profiler Statistics (in ms)"
+        table.field_names = ["Phase", "Calls", "Mean"] + [f"P{p:g}" for p in self.cfg.percentiles]
+        table.align["Phase"] = "l"
+        for name, stats in self.summary().items():
+            row = [name, stats["count"], f"{stats['mean']:.4f}"]
+            row += [f"{stats[f'p{p:g}']:.4f}" for p in self.cfg.percentiles]
+            table.add_row(row)
+        return table.get_string()
+
+    """
+    Properties.
+    """
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the profiler records the timings."""
+        return self.cfg.enabled
+
+    @property
+    def phase_names(self) -> list[str]:
+        """The names of the recorded phases in the order in which they were first recorded."""
+        self._resolve_pending_events()
+        return list(self._durations.keys())
+
+    """
+    Operations.
+    """
+
+    def scope(self, name: str) -> contextlib.AbstractContextManager:
+        """Returns a context manager that times the enclosed code as the phase with the given name.
+
+        Args:
+            name: The name of the phase. Nested phases are typically named with a "/" separated path.
+
+        Returns:
+            The context manager for the phase. If the profiler is disabled, this is a no-op.
+        """
+        if not self.cfg.enabled:
+            return _NULL_SCOPE
+        return _ProfilerScope(self, name)
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """Wraps a callable so that each of its calls is timed as the phase with the given name.
+
+        The attributes of the callable (for instance, the :meth:`reset` method of a class-based term) remain
+        accessible through the wrapper.
+
+        Args:
+            name: The name of the phase.
+            func: The callable to wrap.
+
+        Returns:
+            The wrapped callable. If the profiler is disabled, the callable is returned as is.
+        """
+        if not self.cfg.enabled:
+            return func
+        return _ProfiledCallable(self, name, func)
+
+    def reset(self):
+        """Clears all the recorded timings."""
+        self._durations.clear()
+        self._num_calls.clear()
+        self._total_durations.clear()
+        self._total_bytes.clear()
+        self._pending_events.clear()
+        self._trace_events.clear()
+        self._origin_time = time.perf_counter()
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Returns the statistics of the recorded phases.
+
+        The statistics of each phase contain the total number of calls (``"count"``), the total duration of
+        all the calls (``"total"``), and the mean (``"mean"``) and percentiles (``"p<percentile>"``, for instance
+        ``"p50"``) of the durations in the rolling window. All the durations are in milliseconds. If
+        :attr:`ProfilerCfg.record_memory` is True, the statistics also contain the mean number of bytes
+        allocated per call (``"mean_bytes"``).
+
+        Note:
+            If the profiler uses CUDA events, this function synchronizes with the recorded events.
+
+        Returns:
+            A dictionary with the phase names as keys and their statistics as values.
+        """
+        self._resolve_pending_events()
+        stats = dict()
+        for name, durations in self._durations.items():
+            durations = np.fromiter(durations, dtype=np.float64, count=len(durations))
+            percentiles = np.percentile(durations, self.cfg.percentiles)
+            stats[name] = {
+                "count": self._num_calls[name],
+                "total": self._total_durations[name],
+                "mean": float(durations.mean()),
+            }
+            for p, value in zip(self.cfg.percentiles, percentiles):
+                stats[name][f"p{p:g}"] = float(value)
+            if self.cfg.record_memory:
+                stats[name]["mean_bytes"] = self._total_bytes[name] / self._num_calls[name]
+        return stats
+
+    def get_log_info(self, prefix: str = "Profiler") -> dict[str, float]:
+        """Returns the statistics of the recorded phases as a flat dictionary for logging.
+
+        The number of calls and the total durations are not included.
+
+        Args:
+            prefix: The prefix of the keys. Defaults to "Profiler".
+
+        Returns:
+            A dictionary with keys of the form ``"<prefix>/<phase>/<statistic>"`` and the durations in ms.
+        """
+        info = dict()
+        for name, stats in self.summary().items():
+            for key, value in stats.items():
+                if key not in ("count", "total"):
+                    info[f"{prefix}/{name}/{key}"] = value
+        return info
+
+    def save(self):
+        """Saves the statistics and the trace to the files specified in the configuration (if any)."""
+        if self.cfg.json_path is not None:
+            self.export_json(self.cfg.json_path)
+        if self.cfg.trace_path is not None:
+            self.export_chrome_trace(self.cfg.trace_path)
+
+    def export_json(self, path: str):
+        """Saves the statistics of the recorded phases (see :meth:`summary`) to a JSON file.
+
+        Args:
+            path: The path of the file.
+        """
+        self._make_parent_dirs(path)
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def export_chrome_trace(self, path: str):
+        """Saves the recorded scopes to a file in the Chrome trace format.
+
+        Args:
+            path: The path of the file.
+        """
+        self._make_parent_dirs(path)
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self._trace_events, "displayTimeUnit": "ms"}, f)
+
+    """
+    Internal helpers.
+    """
+
+    def _start(self) -> tuple[float, Any, int]:
+        """Starts the timing of a phase.
+
+        Returns:
+            A tuple containing the wall-clock start time, the start CUDA event (or None) and the number of
+            bytes allocated by the CUDA caching allocator so far (or 0).
+        """
+        start_event = None
+        if self._use_cuda_events:
+            start_event = torch.cuda.Event(enable_timing=True)
+            start_event.record()
+        start_bytes = self._read_cuda_allocated_bytes() if self._use_cuda_memory else 0
+        return time.perf_counter(), start_event, start_bytes
+
+    def _stop(self, name: str, start_time: float, start_event: Any, start_bytes: int, output: Any = None):
+        """Stops the timing of a phase and records its duration.
+
+        If the memory is recorded, the allocated bytes are read from the statistics of the CUDA caching
+        allocator and include the temporary tensors. On other devices, only the size of the output tensor
+        (if any) is counted.
+
+        Args:
+            name: The name of the phase.
+            start_time: The wall-clock start time returned by :meth:`_start`.
+            start_event: The start CUDA event returned by :meth:`_start`.
+            start_bytes: The allocated bytes returned by :meth:`_start`.
+            output: The output of the phase, if it is a call of a wrapped callable. Defaults to None.
+        """
+        stop_time = time.perf_counter()
+        # record the allocated memory
+        if self.cfg.record_memory:
+            if self._use_cuda_memory:
+                num_bytes = self._read_cuda_allocated_bytes() - start_bytes
+            elif isinstance(output, torch.Tensor):
+                num_bytes = output.element_size() * output.nelement()
+            else:
+                num_bytes = 0
+            self._total_bytes[name] = self._total_bytes.get(name, 0) + num_bytes
+        # record the duration
+        if start_event is not None:
+            stop_event = torch.cuda.Event(enable_timing=True)
+            stop_event.record()
+            self._pending_events.append((name, start_event, stop_event))
+            # bound the number of pending events
+            if len(self._pending_events) > 10 * self.cfg.window_size:
+                self._resolve_pending_events()
+        else:
+            self._add_duration(name, (stop_time - start_time) * 1e3)
+        # record the trace event
+        if self._record_trace and len(self._trace_events) < self.cfg.max_trace_events:
+            self._trace_events.append({
+                "name": name,
+                "ph": "X",
+                "ts": (start_time - self._origin_time) * 1e6,
+                "dur": (stop_time - start_time) * 1e6,
+                "pid": os.getpid(),
+                "tid": 0,
+            })
+
+    def _add_duration(self, name: str, duration: float):
+        """Adds a duration (in ms) to the rolling window of a phase."""
+        if name not in self._durations:
+            self._durations[name] = deque(maxlen=self.cfg.window_size)
+            self._num_calls[name] = 0
+            self._total_durations[name] = 0.0
+        self._durations[name].append(duration)
+        self._num_calls[name] += 1
+        self._total_durations[name] += duration
+
+    def _resolve_pending_events(self):
+        """Synchronizes with the pending CUDA events and records their durations."""
+        for name, start_event, stop_event in self._pending_events:
+            stop_event.synchronize()
+            self._add_duration(name, start_event.elapsed_time(stop_event))
+        self._pending_events.clear()
+
+    def _read_cuda_allocated_bytes(self) -> int:
+        """Returns the number of bytes allocated by the CUDA caching allocator since its creation."""
+        return torch.cuda.memory_stats(self._device).get("allocated_bytes.all.allocated", 0)
+
+    @staticmethod
+    def _make_parent_dirs(path: str):
+        """Creates the parent directories of a file path if they do not exist."""
+        dir_name = os.path.dirname(os.path.abspath(path))
+        os.makedirs(dir_name, exist_ok=True)
+
+
+class _ProfilerScope:
+    """Context manager that times the enclosed code for a :class:`Profiler`."""
+
+    __slots__ = ("_profiler", "_name", "_start_time", "_start_event", "_start_bytes")
+
+    def __init__(self, profiler: Profiler, name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        self._start_time, self._start_event, self._start_bytes = self._profiler._start()
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self._profiler._stop(self._name, self._start_time, self._start_event, self._start_bytes)
+
+
+class _ProfiledCallable:
+    """Wrapper that times each call of a callable for a :class:`Profiler`.
+
+    The attribute lookups that are not resolved by the wrapper are forwarded to the wrapped callable.
+    """
+
+    def __init__(self, profiler: Profiler, name: str, func: Callable):
+        self._profiler = profiler
+        self._name = name
+        self.func = func
+        # used by inspect to resolve the signature of the wrapped callable
+        self.__wrapped__ = func
+
+    def __getattr__(self, name: str) -> Any:
+        # note: only called if the attribute is not found on the wrapper
+        # the check avoids an infinite recursion when the wrapper is copied before it is initialized
+        if name == "func":
+            raise AttributeError(name)
+        return getattr(self.func, name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        start_time, start_event, start_bytes = self._profiler._start()
+        output = self.func(*args, **kwargs)
+        self._profiler._stop(self._name, start_time, start_event, start_bytes, output)
+        return output
@@ -0,0 +1,71 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+from omni.isaac.orbit.utils import configclass
+
+
+@configclass
+class ProfilerCfg:
+    """Configuration for the :class:`Profiler` class."""
+
+    enabled: bool = False
+    """Whether to record the timings. Defaults to False.
+
+    If False, the profiling scopes are no-ops and the terms of the managers are not wrapped.
+    """
+
+    cuda_timing: bool = False
+    """Whether to measure the durations with CUDA events instead of the wall-clock time. Defaults to False.
+
+    The wall-clock time only measures the time to launch the kernels on the GPU. CUDA events measure the time
+    spent on the GPU stream between the start and end of a scope. The events are only synchronized when the
+    statistics are read. This flag is ignored if the device is not a CUDA device.
+    """
+
+    time_terms: bool = True
+    """Whether to time each term call inside the managers. Defaults to True.
+
+    The recorded costs of the terms are available through the
+    :attr:`~omni.isaac.orbit.managers.ManagerBase.term_stats` property of each manager.
+    """
+
+    record_memory: bool = False
+    """Whether to record the number of bytes allocated in each phase. Defaults to False.
+
+    On CUDA devices, the bytes are read from the statistics of the caching allocator and include the temporary
+    tensors. On other devices, only the size of the tensor returned by a wrapped callable is counted.
+    """
+
+    window_size: int = 1000
+    """The number of most recent durations kept for each phase to compute the statistics. Defaults to 1000."""
+
+    percentiles: tuple[float, ...] = (50.0, 90.0, 99.0)
+    """The percentiles (in the range [0, 100]) of the durations to report. Defaults to (50.0, 90.0, 99.0)."""
+
+    log_interval: int = 0
+    """The interval (in environment steps) at which the statistics are written into the logging information of
+    the environment. Defaults to 0, which means the statistics are not logged.
+    """
+
+    json_path: str | None = None
+    """The file path to save the statistics in JSON format when the environment is closed. Defaults to None,
+    in which case the statistics are not saved.
+    """
+
+    trace_path: str | None = None
+    """The file path to save the recorded scopes in the Chrome trace format when the environment is closed.
+    Defaults to None, in which case no trace is recorded.
+
+    The trace can be viewed with ``chrome://tracing`` or `Perfetto <https://ui.perfetto.dev>`_. The events
+    of the trace always use the wall-clock time.
+    """
+
+    max_trace_events: int = 1000000
+    """The maximum number of events stored for the trace. Defaults to 1000000.
+
+    Once the limit is reached, further events are not recorded in the trace. The statistics are still updated.
+    """
@@ -5,4 +5,11 @@
 
 """Sub-module containing operations based on warp."""
 
-from .ops import convert_to_warp_mesh, raycast_mesh
+from .ops import (
+    convert_to_warp_mesh,
+    raycast_camera_meshes,
+    raycast_dynamic_meshes,
+    raycast_mesh,
+    raycast_meshes,
+    update_mesh_points,
+)
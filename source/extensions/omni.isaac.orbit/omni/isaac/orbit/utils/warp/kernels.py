@@ -71,3 +71,296 @@ def raycast_mesh_kernel(
             ray_normal[tid] = n
         if return_face_id == 1:
             ray_face_id[tid] = f
+
+
+@wp.kernel
+def raycast_meshes_kernel(
+    meshes: wp.array(dtype=wp.uint64),
+    ray_starts: wp.array(dtype=wp.vec3),
+    ray_directions: wp.array(dtype=wp.vec3),
+    ray_hits: wp.array(dtype=wp.vec3),
+    ray_distance: wp.array(dtype=wp.float32),
+    ray_normal: wp.array(dtype=wp.vec3),
+    ray_face_id: wp.array(dtype=wp.int32),
+    ray_mesh_id: wp.array(dtype=wp.int32),
+    max_dist: float = 1e6,
+    return_distance: int = False,
+    return_normal: int = False,
+    return_face_id: int = False,
+    return_mesh_id: int = False,
+):
+    """Performs ray-casting against multiple meshes and keeps the closest hit.
+
+    Each thread casts its ray against all the meshes in :obj:`meshes`. The distance of the closest hit found
+    so far is used as the maximum distance for the next meshes, so that the traversal of their bounding volume
+    hierarchy (BVH) stops early for the rays that are already occluded.
+
+    Args:
+        meshes: The ids of the input meshes. Shape is (M,), where M is the number of meshes.
+        ray_starts: The input ray start positions. Shape is (N, 3).
+        ray_directions: The input ray directions. Shape is (N, 3).
+        ray_hits: The output ray hit positions. Shape is (N, 3).
+        ray_distance: The output ray hit distances. Shape is (N,), if `return_distance` is True. Otherwise,
+            this array is not used.
+        ray_normal: The output ray hit normals. Shape is (N, 3), if `return_normal` is True. Otherwise,
+            this array is not used.
+        ray_face_id: The output ray hit face ids. Shape is (N,), if `return_face_id` is True. Otherwise,
+            this array is not used.
+        ray_mesh_id: The output indices of the hit meshes in the :obj:`meshes` array. Shape is (N,), if
+            `return_mesh_id` is True. Otherwise, this array is not used.
+        max_dist: The maximum ray-cast distance. Defaults to 1e6.
+        return_distance: Whether to return the ray hit distances. Defaults to False.
+        return_normal: Whether to return the ray hit normals. Defaults to False`.
+        return_face_id: Whether to return the ray hit face ids. Defaults to False.
+        return_mesh_id: Whether to return the indices of the hit meshes. Defaults to False.
+    """
+    # get the thread id
+    tid = wp.tid()
+
+    t = float(0.0)  # hit distance along ray
+    u = float(0.0)  # hit face barycentric u
+    v = float(0.0)  # hit face barycentric v
+    sign = float(0.0)  # hit face sign
+    n = wp.vec3()  # hit face normal
+    f = int(0)  # hit face index
+
+    # closest hit over all the meshes
+    closest_t = float(max_dist)
+    closest_n = wp.vec3()
+    closest_f = int(-1)
+    closest_mesh = int(-1)
+
+    # ray cast against each mesh and keep the closest hit
+    for i in range(meshes.shape[0]):
+        hit_success = wp.mesh_query_ray(meshes[i], ray_starts[tid], ray_directions[tid], closest_t, t, u, v, sign, n, f)
+        if hit_success and t < closest_t:
+            closest_t = t
+            closest_n = n
+            closest_f = f
+            closest_mesh = i
+    # if the ray hit, store the hit data
+    if closest_mesh >= 0:
+        ray_hits[tid] = ray_starts[tid] + closest_t * ray_directions[tid]
+        if return_distance == 1:
+            ray_distance[tid] = closest_t
+        if return_normal == 1:
+            ray_normal[tid] = closest_n
+        if return_face_id == 1:
+            ray_face_id[tid] = closest_f
+        if return_mesh_id == 1:
+            ray_mesh_id[tid] = closest_mesh
+
+
+@wp.kernel
+def raycast_dynamic_meshes_kernel(
+    meshes: wp.array(dtype=wp.uint64),
+    instance_meshes: wp.array(dtype=wp.uint64),
+    instance_transforms: wp.array2d(dtype=wp.transform),
+    ray_starts: wp.array2d(dtype=wp.vec3),
+    ray_directions: wp.array2d(dtype=wp.vec3),
+    ray_hits: wp.array2d(dtype=wp.vec3),
+    ray_distance: wp.array2d(dtype=wp.float32),
+    ray_normal: wp.array2d(dtype=wp.vec3),
+    ray_face_id: wp.array2d(dtype=wp.int32),
+    ray_mesh_id: wp.array2d(dtype=wp.int32),
+    max_dist: float = 1e6,
+    return_distance: int = False,
+    return_normal: int = False,
+    return_face_id: int = False,
+    return_mesh_id: int = False,
+):
+    """Performs ray-casting against static meshes and moving mesh instances and keeps the closest hit.
+
+    The rays are grouped by environment. The rays of an environment are cast against all the static meshes
+    and against the instances of the moving meshes in this environment. For an instance, the rays are
+    transformed into the local frame of the instance, so that the bounding volume hierarchy (BVH) of its mesh
+    is never rebuilt or refitted when the instance moves.
+
+    The transforms of the instances must be rigid (without scaling), so that the hit distances in the local
+    frame of an instance are the same as in the world frame.
+
+    Args:
+        meshes: The ids of the static meshes. Shape is (M,), where M is the number of static meshes.
+        instance_meshes: The ids of the meshes of the moving instances. Shape is (I,), where I is the number
+            of instances per environment.
+        instance_transforms: The transforms of the instances in the world frame. Shape is (E, I), where E is
+            the number of environments.
+        ray_starts: The input ray start positions. Shape is (E, N, 3), where N is the number of rays per
+            environment.
+        ray_directions: The input ray directions. Shape is (E, N, 3).
+        ray_hits: The output ray hit positions. Shape is (E, N, 3).
+        ray_distance: The output ray hit distances. Shape is (E, N), if `return_distance` is True. Otherwise,
+            this array is not used.
+        ray_normal: The output ray hit normals in the world frame. Shape is (E, N, 3), if `return_normal` is True.
+            Otherwise, this array is not used.
+        ray_face_id: The output ray hit face ids. Shape is (E, N), if `return_face_id` is True. Otherwise,
+            this array is not used.
+        ray_mesh_id: The output indices of the hit meshes. The static meshes are indexed first, followed by
+            the instances. Shape is (E, N), if `return_mesh_id` is True. Otherwise, this array is not used.
+        max_dist: The maximum ray-cast distance. Defaults to 1e6.
+        return_distance: Whether to return the ray hit distances. Defaults to False.
+        return_normal: Whether to return the ray hit normals. Defaults to False`.
+        return_face_id: Whether to return the ray hit face ids. Defaults to False.
+        return_mesh_id: Whether to return the indices of the hit meshes. Defaults to False.
+    """
+    # get the thread id
+    env_id, ray_id = wp.tid()
+
+    t = float(0.0)  # hit distance along ray
+    u = float(0.0)  # hit face barycentric u
+    v = float(0.0)  # hit face barycentric v
+    sign = float(0.0)  # hit face sign
+    n = wp.vec3()  # hit face normal
+    f = int(0)  # hit face index
+
+    # closest hit over all the meshes
+    closest_t = float(max_dist)
+    closest_n = wp.vec3()
+    closest_f = int(-1)
+    closest_mesh = int(-1)
+
+    ray_start = ray_starts[env_id, ray_id]
+    ray_direction = ray_directions[env_id, ray_id]
+    # ray cast against each static mesh
+    num_meshes = meshes.shape[0]
+    for i in range(num_meshes):
+        hit_success = wp.mesh_query_ray(meshes[i], ray_start, ray_direction, closest_t, t, u, v, sign, n, f)
+        if hit_success and t < closest_t:
+            closest_t = t
+            closest_n = n
+            closest_f = f
+            closest_mesh = i
+    # ray cast against each instance in the local frame of the instance
+    for i in range(instance_meshes.shape[0]):
+        transform = instance_transforms[env_id, i]
+        inv_transform = wp.transform_inverse(transform)
+        local_start = wp.transform_point(inv_transform, ray_start)
+        local_direction = wp.transform_vector(inv_transform, ray_direction)
+        hit_success = wp.mesh_query_ray(
+            instance_meshes[i], local_start, local_direction, closest_t, t, u, v, sign, n, f
+        )
+        if hit_success and t < closest_t:
+            closest_t = t
+            closest_n = wp.transform_vector(transform, n)
+            closest_f = f
+            closest_mesh = num_meshes + i
+    # if the ray hit, store the hit data
+    if closest_mesh >= 0:
+        ray_hits[env_id, ray_id] = ray_start + closest_t * ray_direction
+        if return_distance == 1:
+            ray_distance[env_id, ray_id] = closest_t
+        if return_normal == 1:
+            ray_normal[env_id, ray_id] = closest_n
+        if return_face_id == 1:
+            ray_face_id[env_id, ray_id] = closest_f
+        if return_mesh_id == 1:
+            ray_mesh_id[env_id, ray_id] = closest_mesh
+
+
+@wp.kernel
+def raycast_camera_kernel(
+    meshes: wp.array(dtype=wp.uint64),
+    instance_meshes: wp.array(dtype=wp.uint64),
+    instance_transforms: wp.array2d(dtype=wp.transform),
+    env_ids: wp.array(dtype=wp.int32),
+    camera_transforms: wp.array(dtype=wp.transform),
+    ray_starts: wp.array2d(dtype=wp.vec3),
+    ray_directions: wp.array2d(dtype=wp.vec3),
+    ray_hits: wp.array2d(dtype=wp.vec3),
+    ray_distance: wp.array2d(dtype=wp.float32),
+    ray_depth: wp.array2d(dtype=wp.float32),
+    ray_normal: wp.array2d(dtype=wp.vec3),
+    max_dist: float = 1e6,
+    return_distance: int = False,
+    return_depth: int = False,
+    return_normal: int = False,
+):
+    """Performs ray-casting of cameras against static meshes and moving mesh instances.
+
+    The rays are defined in the frame of the cameras and are transformed into the world frame by each thread
+    with the pose of its camera, so that the rays in the world frame are never stored. The outputs are written
+    in-place into the rows of the updated cameras. Unlike the other ray-casting kernels, the outputs of the rays
+    that miss all the meshes are set to infinity, so that the output arrays can be reused across launches.
+
+    Args:
+        meshes: The ids of the static meshes. Shape is (M,), where M is the number of static meshes.
+        instance_meshes: The ids of the meshes of the moving instances. Shape is (I,), where I is the number
+            of instances per environment.
+        instance_transforms: The transforms of the instances in the world frame. Shape is (E, I), where E is
+            the number of updated cameras.
+        env_ids: The indices of the updated cameras. Shape is (E,).
+        camera_transforms: The transforms of the updated cameras in the world frame. Shape is (E,).
+        ray_starts: The ray start positions in the frame of the cameras. Shape is (C, N, 3), where C is the
+            number of cameras and N is the number of rays per camera.
+        ray_directions: The ray directions in the frame of the cameras. Shape is (C, N, 3).
+        ray_hits: The output ray hit positions in the world frame. Shape is (C, N, 3).
+        ray_distance: The output ray hit distances. Shape is (C, N), if `return_distance` is True. Otherwise,
+            this array is not used.
+        ray_depth: The output ray hit depths, i.e. the distances of the hits along the x-axis of the camera
+            frame. Shape is (C, N), if `return_depth` is True. Otherwise, this array is not used.
+        ray_normal: The output ray hit normals in the world frame. Shape is (C, N, 3), if `return_normal` is True.
+            Otherwise, this array is not used.
+        max_dist: The maximum ray-cast distance. Defaults to 1e6.
+        return_distance: Whether to return the ray hit distances. Defaults to False.
+        return_depth: Whether to return the ray hit depths. Defaults to False.
+        return_normal: Whether to return the ray hit normals. Defaults to False`.
+    """
+    # get the thread id
+    index, ray_id = wp.tid()
+    env_id = env_ids[index]
+
+    t = float(0.0)  # hit distance along ray
+    u = float(0.0)  # hit face barycentric u
+    v = float(0.0)  # hit face barycentric v
+    sign = float(0.0)  # hit face sign
+    n = wp.vec3()  # hit face normal
+    f = int(0)  # hit face index
+
+    # closest hit over all the meshes
+    closest_t = float(max_dist)
+    closest_n = wp.vec3()
+    closest_mesh = int(-1)
+
+    # transform the ray into the world frame
+    camera_transform = camera_transforms[index]
+    local_direction = ray_directions[env_id, ray_id]
+    ray_start = wp.transform_point(camera_transform, ray_starts[env_id, ray_id])
+    ray_direction = wp.transform_vector(camera_transform, local_direction)
+    # ray cast against each static mesh
+    num_meshes = meshes.shape[0]
+    for i in range(num_meshes):
+        hit_success = wp.mesh_query_ray(meshes[i], ray_start, ray_direction, closest_t, t, u, v, sign, n, f)
+        if hit_success and t < closest_t:
+            closest_t = t
+            closest_n = n
+            closest_mesh = i
+    # ray cast against each instance in the local frame of the instance
+    for i in range(instance_meshes.shape[0]):
+        transform = instance_transforms[index, i]
+        inv_transform = wp.transform_inverse(transform)
+        local_start = wp.transform_point(inv_transform, ray_start)
+        instance_direction = wp.transform_vector(inv_transform, ray_direction)
+        hit_success = wp.mesh_query_ray(
+            instance_meshes[i], local_start, instance_direction, closest_t, t, u, v, sign, n, f
+        )
+        if hit_success and t < closest_t:
+            closest_t = t
+            closest_n = wp.transform_vector(transform, n)
+            closest_mesh = num_meshes + i
+    # store the hit data or reset the outputs of the missed rays
+    if closest_mesh >= 0:
+        ray_hits[env_id, ray_id] = ray_start + closest_t * ray_direction
+        if return_distance == 1:
+            ray_distance[env_id, ray_id] = closest_t
+        if return_depth == 1:
+            ray_depth[env_id, ray_id] = closest_t * local_direction[0]
+        if return_normal == 1:
+            ray_normal[env_id, ray_id] = closest_n
+    else:
+        ray_hits[env_id, ray_id] = wp.vec3(wp.inf, wp.inf, wp.inf)
+        if return_distance == 1:
+            ray_distance[env_id, ray_id] = wp.inf
+        if return_depth == 1:
+            ray_depth[env_id, ray_id] = wp.inf
+        if return_normal == 1:
+            ray_normal[env_id, ray_id] = wp.vec3(wp.inf, wp.inf, wp.inf)
@@ -8,8 +8,10 @@
 # needed to import for allowing type-hinting: torch.Tensor | None
 from __future__ import annotations
 
+import math
 import numpy as np
 import torch
+from collections.abc import Sequence
 
 import warp as wp
 
@@ -24,12 +26,25 @@ def raycast_mesh(
     return_distance: bool = False,
     return_normal: bool = False,
     return_face_id: bool = False,
+    ray_hits: torch.Tensor | None = None,
+    ray_distance: torch.Tensor | None = None,
+    ray_normal: torch.Tensor | None = None,
+    ray_face_id: torch.Tensor | None = None,
+    stream: wp.Stream | None = None,
 ) -> tuple[torch.Tensor, torch.Tensor | None, torch.Tensor | None, torch.Tensor | None]:
     """Performs ray-casting against a mesh.
 
     Note that the `ray_starts` and `ray_directions`, and `ray_hits` should have compatible shapes
     and data types to ensure proper execution. Additionally, they all must be in the same frame.
 
+    For repeated calls, the outputs can be written into preallocated buffers instead of allocating new tensors
+    on each call. The buffers must be contiguous tensors on the device of the mesh and are returned as they are.
+    The inputs are only copied if they are not contiguous or not on the device of the mesh.
+
+    The kernel is launched on the given warp stream or, by default, on the warp stream of the current torch
+    stream. In the latter case, the outputs can be used by the following torch operations without synchronizing
+    the device. For another stream, the caller has to synchronize the stream before using the outputs.
+
     Args:
         ray_starts: The starting position of the rays. Shape (N, 3).
         ray_directions: The ray directions for each ray. Shape (N, 3).
@@ -38,6 +53,16 @@ def raycast_mesh(
         return_distance: Whether to return the distance of the ray until it hits the mesh. Defaults to False.
         return_normal: Whether to return the normal of the mesh face the ray hits. Defaults to False.
         return_face_id: Whether to return the face id of the mesh face the ray hits. Defaults to False.
+        ray_hits: The output buffer for the ray hit positions. Shape (N, 3). Defaults to None, in which case
+            a new tensor is allocated.
+        ray_distance: The output buffer for the ray hit distances. Shape (N,). Only used if :attr:`return_distance`
+            is True. Defaults to None, in which case a new tensor is allocated.
+        ray_normal: The output buffer for the ray hit normals. Shape (N, 3). Only used if :attr:`return_normal`
+            is True. Defaults to None, in which case a new tensor is allocated.
+        ray_face_id: The output buffer for the ray hit face ids of type :obj:`torch.int32`. Shape (N,). Only used
+            if :attr:`return_face_id` is True. Defaults to None, in which case a new tensor is allocated.
+        stream: The warp stream to launch the kernel on. Defaults to None, in which case the warp stream of the
+            current torch stream is used.
 
     Returns:
         The ray hit position. Shape (N, 3).
@@ -51,44 +76,31 @@ def raycast_mesh(
         The ray hit face id. Shape (N,).
             Will only return if :attr:`return_face_id` is True else returns None.
             The returned tensor contains :obj:`int(-1)` for missed hits.
+
+    Raises:
+        ValueError: If an output buffer does not match the rays or is not a contiguous tensor on the device
+            of the mesh.
     """
     # extract device and shape information
     shape = ray_starts.shape
     device = ray_starts.device
     # device of the mesh
-    torch_device = wp.device_to_torch(mesh.device)
+    torch_device = torch.device(wp.device_to_torch(mesh.device))
     # reshape the tensors
-    ray_starts = ray_starts.to(torch_device).view(-1, 3).contiguous()
-    ray_directions = ray_directions.to(torch_device).view(-1, 3).contiguous()
+    # note: these are no-ops if the tensors are already contiguous and on the device of the mesh
+    ray_starts = ray_starts.to(torch_device).contiguous().view(-1, 3)
+    ray_directions = ray_directions.to(torch_device).contiguous().view(-1, 3)
     num_rays = ray_starts.shape[0]
-    # create output tensor for the ray hits
-    ray_hits = torch.full((num_rays, 3), float("inf"), device=torch_device).contiguous()
-
-    # map the memory to warp arrays
-    ray_starts_wp = wp.from_torch(ray_starts, dtype=wp.vec3)
-    ray_directions_wp = wp.from_torch(ray_directions, dtype=wp.vec3)
-    ray_hits_wp = wp.from_torch(ray_hits, dtype=wp.vec3)
-
+    # prepare the output tensors
+    # note: the buffers are reset in-place since the kernel only writes the hits
+    ray_hits_out = _prepare_output_buffer("ray_hits", ray_hits, shape, float("inf"), torch_device)
+    ray_distance_out, ray_normal_out, ray_face_id_out = None, None, None
     if return_distance:
-        ray_distance = torch.full((num_rays,), float("inf"), device=torch_device).contiguous()
-        ray_distance_wp = wp.from_torch(ray_distance, dtype=wp.float32)
-    else:
-        ray_distance = None
-        ray_distance_wp = wp.empty((1,), dtype=wp.float32, device=torch_device)
-
+        ray_distance_out = _prepare_output_buffer("ray_distance", ray_distance, shape[:-1], float("inf"), torch_device)
     if return_normal:
-        ray_normal = torch.full((num_rays, 3), float("inf"), device=torch_device).contiguous()
-        ray_normal_wp = wp.from_torch(ray_normal, dtype=wp.vec3)
-    else:
-        ray_normal = None
-        ray_normal_wp = wp.empty((1,), dtype=wp.vec3, device=torch_device)
-
+        ray_normal_out = _prepare_output_buffer("ray_normal", ray_normal, shape, float("inf"), torch_device)
     if return_face_id:
-        ray_face_id = torch.ones((num_rays,), dtype=torch.int32, device=torch_device).contiguous() * (-1)
-        ray_face_id_wp = wp.from_torch(ray_face_id, dtype=wp.int32)
-    else:
-        ray_face_id = None
-        ray_face_id_wp = wp.empty((1,), dtype=wp.int32, device=torch_device)
+        ray_face_id_out = _prepare_output_buffer("ray_face_id", ray_face_id, shape[:-1], -1, torch_device, torch.int32)
 
     # launch the warp kernel
     wp.launch(
@@ -96,30 +108,477 @@ def raycast_mesh(
         dim=num_rays,
         inputs=[
             mesh.id,
-            ray_starts_wp,
-            ray_directions_wp,
-            ray_hits_wp,
-            ray_distance_wp,
-            ray_normal_wp,
-            ray_face_id_wp,
+            wp.from_torch(ray_starts, dtype=wp.vec3),
+            wp.from_torch(ray_directions, dtype=wp.vec3),
+            _map_output_buffer(ray_hits_out, wp.vec3, (num_rays,), mesh.device),
+            _map_output_buffer(ray_distance_out, wp.float32, (num_rays,), mesh.device),
+            _map_output_buffer(ray_normal_out, wp.vec3, (num_rays,), mesh.device),
+            _map_output_buffer(ray_face_id_out, wp.int32, (num_rays,), mesh.device),
             float(max_dist),
             int(return_distance),
             int(return_normal),
             int(return_face_id),
         ],
         device=mesh.device,
+        stream=stream if stream is not None else _get_torch_stream(torch_device),
     )
-    # NOTE: Synchronize is not needed anymore, but we keep it for now. Check with @dhoeller.
-    wp.synchronize()
 
+    # return the buffers as they are and the allocated tensors on the device of the rays
+    return (
+        _resolve_output(ray_hits_out, ray_hits, device),
+        _resolve_output(ray_distance_out, ray_distance, device),
+        _resolve_output(ray_normal_out, ray_normal, device),
+        _resolve_output(ray_face_id_out, ray_face_id, device),
+    )
+
+
+def raycast_meshes(
+    ray_starts: torch.Tensor,
+    ray_directions: torch.Tensor,
+    meshes: Sequence[wp.Mesh] | wp.array,
+    max_dist: float = 1e6,
+    return_distance: bool = False,
+    return_normal: bool = False,
+    return_face_id: bool = False,
+    return_mesh_id: bool = False,
+    ray_hits: torch.Tensor | None = None,
+    ray_distance: torch.Tensor | None = None,
+    ray_normal: torch.Tensor | None = None,
+    ray_face_id: torch.Tensor | None = None,
+    ray_mesh_id: torch.Tensor | None = None,
+    stream: wp.Stream | None = None,
+) -> tuple[torch.Tensor, torch.Tensor | None, torch.Tensor | None, torch.Tensor | None, torch.Tensor | None]:
+    """Performs ray-casting against multiple meshes and returns the closest hit of each ray.
+
+    All the meshes are ray-casted in a single kernel launch. Compared to calling :meth:`raycast_mesh` for
+    each mesh, this avoids launching one kernel per mesh and merging the results afterwards.
+
+    The meshes can be passed either as a sequence of warp meshes or as a warp array of their ids (with
+    data type :obj:`wp.uint64`). For repeated calls with the same meshes, the latter avoids creating the
+    array of mesh ids on each call. All the meshes must be on the same device.
+
+    Note that the `ray_starts` and `ray_directions`, and `ray_hits` should have compatible shapes
+    and data types to ensure proper execution. Additionally, they all must be in the same frame.
+
+    The output buffers and the stream are handled in the same way as in :meth:`raycast_mesh`.
+
+    Args:
+        ray_starts: The starting position of the rays. Shape (N, 3).
+        ray_directions: The ray directions for each ray. Shape (N, 3).
+        meshes: The warp meshes (or the array of their ids) to ray-cast against.
+        max_dist: The maximum distance to ray-cast. Defaults to 1e6.
+        return_distance: Whether to return the distance of the ray until it hits the mesh. Defaults to False.
+        return_normal: Whether to return the normal of the mesh face the ray hits. Defaults to False.
+        return_face_id: Whether to return the face id of the mesh face the ray hits. Defaults to False.
+        return_mesh_id: Whether to return the index (in :attr:`meshes`) of the mesh the ray hits.
+            Defaults to False.
+        ray_hits: The output buffer for the ray hit positions. Shape (N, 3). Defaults to None, in which case
+            a new tensor is allocated.
+        ray_distance: The output buffer for the ray hit distances. Shape (N,). Only used if :attr:`return_distance`
+            is True. Defaults to None, in which case a new tensor is allocated.
+        ray_normal: The output buffer for the ray hit normals. Shape (N, 3). Only used if :attr:`return_normal`
+            is True. Defaults to None, in which case a new tensor is allocated.
+        ray_face_id: The output buffer for the ray hit face ids of type :obj:`torch.int32`. Shape (N,). Only used
+            if :attr:`return_face_id` is True. Defaults to None, in which case a new tensor is allocated.
+        ray_mesh_id: The output buffer for the ray hit mesh ids of type :obj:`torch.int32`. Shape (N,). Only used
+            if :attr:`return_mesh_id` is True. Defaults to None, in which case a new tensor is allocated.
+        stream: The warp stream to launch the kernel on. Defaults to None, in which case the warp stream of the
+            current torch stream is used.
+
+    Returns:
+        The ray hit position. Shape (N, 3).
+            The returned tensor contains :obj:`float('inf')` for missed hits.
+        The ray hit distance. Shape (N,).
+            Will only return if :attr:`return_distance` is True, else returns None.
+            The returned tensor contains :obj:`float('inf')` for missed hits.
+        The ray hit normal. Shape (N, 3).
+            Will only return if :attr:`return_normal` is True else returns None.
+            The returned tensor contains :obj:`float('inf')` for missed hits.
+        The ray hit face id. Shape (N,).
+            Will only return if :attr:`return_face_id` is True else returns None.
+            The returned tensor contains :obj:`int(-1)` for missed hits.
+        The ray hit mesh id. Shape (N,).
+            Will only return if :attr:`return_mesh_id` is True else returns None.
+            The returned tensor contains :obj:`int(-1)` for missed hits.
+
+    Raises:
+        ValueError: If an output buffer does not match the rays or is not a contiguous tensor on the device
+            of the meshes.
+    """
+    # resolve the ids of the meshes
+    # note: the meshes are kept referenced by the input argument until the kernel is done
+    mesh_ids = _resolve_mesh_ids(meshes)
+    # extract device and shape information
+    shape = ray_starts.shape
+    device = ray_starts.device
+    # device of the meshes
+    torch_device = torch.device(wp.device_to_torch(mesh_ids.device))
+    # reshape the tensors
+    # note: these are no-ops if the tensors are already contiguous and on the device of the meshes
+    ray_starts = ray_starts.to(torch_device).contiguous().view(-1, 3)
+    ray_directions = ray_directions.to(torch_device).contiguous().view(-1, 3)
+    num_rays = ray_starts.shape[0]
+    # prepare the output tensors
+    # note: the buffers are reset in-place since the kernel only writes the hits
+    ray_hits_out = _prepare_output_buffer("ray_hits", ray_hits, shape, float("inf"), torch_device)
+    ray_distance_out, ray_normal_out, ray_face_id_out, ray_mesh_id_out = None, None, None, None
     if return_distance:
-        ray_distance = ray_distance.to(device).view(shape[0], shape[1])
+        ray_distance_out = _prepare_output_buffer("ray_distance", ray_distance, shape[:-1], float("inf"), torch_device)
     if return_normal:
-        ray_normal = ray_normal.to(device).view(shape)
+        ray_normal_out = _prepare_output_buffer("ray_normal", ray_normal, shape, float("inf"), torch_device)
     if return_face_id:
-        ray_face_id = ray_face_id.to(device).view(shape[0], shape[1])
+        ray_face_id_out = _prepare_output_buffer("ray_face_id", ray_face_id, shape[:-1], -1, torch_device, torch.int32)
+    if return_mesh_id:
+        ray_mesh_id_out = _prepare_output_buffer("ray_mesh_id", ray_mesh_id, shape[:-1], -1, torch_device, torch.int32)
+
+    # launch the warp kernel
+    wp.launch(
+        kernel=kernels.raycast_meshes_kernel,
+        dim=num_rays,
+        inputs=[
+            mesh_ids,
+            wp.from_torch(ray_starts, dtype=wp.vec3),
+            wp.from_torch(ray_directions, dtype=wp.vec3),
+            _map_output_buffer(ray_hits_out, wp.vec3, (num_rays,), mesh_ids.device),
+            _map_output_buffer(ray_distance_out, wp.float32, (num_rays,), mesh_ids.device),
+            _map_output_buffer(ray_normal_out, wp.vec3, (num_rays,), mesh_ids.device),
+            _map_output_buffer(ray_face_id_out, wp.int32, (num_rays,), mesh_ids.device),
+            _map_output_buffer(ray_mesh_id_out, wp.int32, (num_rays,), mesh_ids.device),
+            float(max_dist),
+            int(return_distance),
+            int(return_normal),
+            int(return_face_id),
+            int(return_mesh_id),
+        ],
+        device=mesh_ids.device,
+        stream=stream if stream is not None else _get_torch_stream(torch_device),
+    )
+
+    # return the buffers as they are and the allocated tensors on the device of the rays
+    return (
+        _resolve_output(ray_hits_out, ray_hits, device),
+        _resolve_output(ray_distance_out, ray_distance, device),
+        _resolve_output(ray_normal_out, ray_normal, device),
+        _resolve_output(ray_face_id_out, ray_face_id, device),
+        _resolve_output(ray_mesh_id_out, ray_mesh_id, device),
+    )
+
+
+def raycast_dynamic_meshes(
+    ray_starts: torch.Tensor,
+    ray_directions: torch.Tensor,
+    meshes: Sequence[wp.Mesh] | wp.array,
+    instance_meshes: Sequence[wp.Mesh] | wp.array,
+    instance_poses: torch.Tensor,
+    max_dist: float = 1e6,
+    return_distance: bool = False,
+    return_normal: bool = False,
+    return_face_id: bool = False,
+    return_mesh_id: bool = False,
+    ray_hits: torch.Tensor | None = None,
+    ray_distance: torch.Tensor | None = None,
+    ray_normal: torch.Tensor | None = None,
+    ray_face_id: torch.Tensor | None = None,
+    ray_mesh_id: torch.Tensor | None = None,
+    stream: wp.Stream | None = None,
+) -> tuple[torch.Tensor, torch.Tensor | None, torch.Tensor | None, torch.Tensor | None, torch.Tensor | None]:
+    """Performs ray-casting against static meshes and moving mesh instances and returns the closest hit of each ray.
+
+    The rays are grouped by environment. The rays of an environment are cast against all the static meshes and
+    against the instances of the moving meshes in this environment. Each instance is a mesh with a pose per
+    environment. Instead of moving the vertices of the mesh, the rays are transformed into the local frame of the
+    instance. This means that the bounding volume hierarchy (BVH) of the mesh is built once and is neither rebuilt
+    nor refitted when the instances move. All the meshes are ray-casted in a single kernel launch.
+
+    The meshes can be passed either as a sequence of warp meshes or as a warp array of their ids (with
+    data type :obj:`wp.uint64`). All the meshes must be on the same device.
 
-    return ray_hits.to(device).view(shape), ray_distance, ray_normal, ray_face_id
+    The output buffers and the stream are handled in the same way as in :meth:`raycast_mesh`.
+
+    Note:
+        The poses of the instances are rigid transforms. Scaling of the instances is not supported.
+
+    Args:
+        ray_starts: The starting position of the rays. Shape (E, N, 3), where E is the number of environments
+            and N is the number of rays per environment.
+        ray_directions: The ray directions for each ray. Shape (E, N, 3).
+        meshes: The static warp meshes (or the array of their ids) to ray-cast against. This can be empty.
+        instance_meshes: The warp meshes (or the array of their ids) of the moving instances. Shape (I,), where
+            I is the number of instances per environment.
+        instance_poses: The poses of the instances in the same frame as the rays. The pose is the position and
+            the quaternion orientation in (w, x, y, z). Shape (E, I, 7).
+        max_dist: The maximum distance to ray-cast. Defaults to 1e6.
+        return_distance: Whether to return the distance of the ray until it hits the mesh. Defaults to False.
+        return_normal: Whether to return the normal of the mesh face the ray hits. Defaults to False.
+        return_face_id: Whether to return the face id of the mesh face the ray hits. Defaults to False.
+        return_mesh_id: Whether to return the index of the mesh the ray hits. The static meshes are indexed
+            first (in the order of :attr:`meshes`), followed by the instances (in the order of
+            :attr:`instance_meshes`). Defaults to False.
+        ray_hits: The output buffer for the ray hit positions. Shape (E, N, 3). Defaults to None, in which case
+            a new tensor is allocated.
+        ray_distance: The output buffer for the ray hit distances. Shape (E, N). Only used if
+            :attr:`return_distance` is True. Defaults to None, in which case a new tensor is allocated.
+        ray_normal: The output buffer for the ray hit normals. Shape (E, N, 3). Only used if :attr:`return_normal`
+            is True. Defaults to None, in which case a new tensor is allocated.
+        ray_face_id: The output buffer for the ray hit face ids of type :obj:`torch.int32`. Shape (E, N). Only
+            used if :attr:`return_face_id` is True. Defaults to None, in which case a new tensor is allocated.
+        ray_mesh_id: The output buffer for the ray hit mesh ids of type :obj:`torch.int32`. Shape (E, N). Only
+            used if :attr:`return_mesh_id` is True. Defaults to None, in which case a new tensor is allocated.
+        stream: The warp stream to launch the kernel on. Defaults to None, in which case the warp stream of the
+            current torch stream is used.
+
+    Returns:
+        The ray hit position. Shape (E, N, 3).
+            The returned tensor contains :obj:`float('inf')` for missed hits.
+        The ray hit distance. Shape (E, N).
+            Will only return if :attr:`return_distance` is True, else returns None.
+            The returned tensor contains :obj:`float('inf')` for missed hits.
+        The ray hit normal in the frame of the rays. Shape (E, N, 3).
+            Will only return if :attr:`return_normal` is True else returns None.
+            The returned tensor contains :obj:`float('inf')` for missed hits.
+        The ray hit face id. Shape (E, N).
+            Will only return if :attr:`return_face_id` is True else returns None.
+            The returned tensor contains :obj:`int(-1)` for missed hits.
+        The ray hit mesh id. Shape (E, N).
+            Will only return if :attr:`return_mesh_id` is True else returns None.
+            The returned tensor contains :obj:`int(-1)` for missed hits.
+
+    Raises:
+        ValueError: If the shape of the instance poses does not match the rays and the instance meshes.
+        ValueError: If an output buffer does not match the rays or is not a contiguous tensor on the device
+            of the meshes.
+    """
+    # resolve the ids of the meshes
+    # note: the meshes are kept referenced by the input arguments until the kernel is done
+    instance_mesh_ids = _resolve_mesh_ids(instance_meshes)
+    mesh_ids = _resolve_mesh_ids(meshes, device=instance_mesh_ids.device)
+    # extract device and shape information
+    num_envs, num_rays = ray_starts.shape[:2]
+    device = ray_starts.device
+    # device of the meshes
+    torch_device = torch.device(wp.device_to_torch(instance_mesh_ids.device))
+    # check the poses of the instances
+    if instance_poses.shape != (num_envs, instance_mesh_ids.shape[0], 7):
+        raise ValueError(
+            f"Invalid shape of the instance poses: {tuple(instance_poses.shape)}. Expected:"
+            f" {(num_envs, instance_mesh_ids.shape[0], 7)}."
+        )
+    # reshape the tensors
+    # note: these are no-ops if the tensors are already contiguous and on the device of the meshes
+    ray_starts = ray_starts.to(torch_device).contiguous().view(num_envs, num_rays, 3)
+    ray_directions = ray_directions.to(torch_device).contiguous().view(num_envs, num_rays, 3)
+    # convert the poses to warp transforms: (position, quaternion in (x, y, z, w))
+    instance_transforms = _convert_poses_to_transforms(instance_poses.to(torch_device))
+    # prepare the output tensors
+    # note: the buffers are reset in-place since the kernel only writes the hits
+    shape = (num_envs, num_rays)
+    ray_hits_out = _prepare_output_buffer("ray_hits", ray_hits, (*shape, 3), float("inf"), torch_device)
+    ray_distance_out, ray_normal_out, ray_face_id_out, ray_mesh_id_out = None, None, None, None
+    if return_distance:
+        ray_distance_out = _prepare_output_buffer("ray_distance", ray_distance, shape, float("inf"), torch_device)
+    if return_normal:
+        ray_normal_out = _prepare_output_buffer("ray_normal", ray_normal, (*shape, 3), float("inf"), torch_device)
+    if return_face_id:
+        ray_face_id_out = _prepare_output_buffer("ray_face_id", ray_face_id, shape, -1, torch_device, torch.int32)
+    if return_mesh_id:
+        ray_mesh_id_out = _prepare_output_buffer("ray_mesh_id", ray_mesh_id, shape, -1, torch_device, torch.int32)
+
+    # launch the warp kernel
+    wp.launch(
+        kernel=kernels.raycast_dynamic_meshes_kernel,
+        dim=shape,
+        inputs=[
+            mesh_ids,
+            instance_mesh_ids,
+            wp.from_torch(instance_transforms, dtype=wp.transform),
+            wp.from_torch(ray_starts, dtype=wp.vec3),
+            wp.from_torch(ray_directions, dtype=wp.vec3),
+            _map_output_buffer(ray_hits_out, wp.vec3, shape, instance_mesh_ids.device),
+            _map_output_buffer(ray_distance_out, wp.float32, shape, instance_mesh_ids.device),
+            _map_output_buffer(ray_normal_out, wp.vec3, shape, instance_mesh_ids.device),
+            _map_output_buffer(ray_face_id_out, wp.int32, shape, instance_mesh_ids.device),
+            _map_output_buffer(ray_mesh_id_out, wp.int32, shape, instance_mesh_ids.device),
+            float(max_dist),
+            int(return_distance),
+            int(return_normal),
+            int(return_face_id),
+            int(return_mesh_id),
+        ],
+        device=instance_mesh_ids.device,
+        stream=stream if stream is not None else _get_torch_stream(torch_device),
+    )
+
+    # return the buffers as they are and the allocated tensors on the device of the rays
+    return (
+        _resolve_output(ray_hits_out, ray_hits, device),
+        _resolve_output(ray_distance_out, ray_distance, device),
+        _resolve_output(ray_normal_out, ray_normal, device),
+        _resolve_output(ray_face_id_out, ray_face_id, device),
+        _resolve_output(ray_mesh_id_out, ray_mesh_id, device),
+    )
+
+
+def raycast_camera_meshes(
+    ray_starts: torch.Tensor,
+    ray_directions: torch.Tensor,
+    camera_poses: torch.Tensor,
+    meshes: Sequence[wp.Mesh] | wp.array,
+    ray_hits: torch.Tensor,
+    ray_distance: torch.Tensor | None = None,
+    ray_depth: torch.Tensor | None = None,
+    ray_normal: torch.Tensor | None = None,
+    env_ids: Sequence[int] | torch.Tensor | None = None,
+    instance_meshes: Sequence[wp.Mesh] | wp.array | None = None,
+    instance_poses: torch.Tensor | None = None,
+    max_dist: float = 1e6,
+    stream: wp.Stream | None = None,
+):
+    """Performs ray-casting of cameras against static meshes and moving mesh instances into output buffers.
+
+    Unlike :meth:`raycast_meshes`, the rays are given in the frame of the cameras and are shared by all the
+    updates of the cameras. They are transformed into the world frame inside the kernel with the poses of the
+    cameras, so that the rays in the world frame are never created. The outputs are written in-place into the
+    given buffers, which are typically the image buffers of the cameras, at the rows of the updated cameras.
+    The outputs of the rays that miss all the meshes are set to :obj:`float('inf')`.
+
+    The output buffers and the stream are handled in the same way as in :meth:`raycast_mesh`.
+
+    The meshes can be passed either as a sequence of warp meshes or as a warp array of their ids (with
+    data type :obj:`wp.uint64`). All the meshes and the output buffers must be on the same device.
+
+    Args:
+        ray_starts: The starting positions of the rays in the frame of the cameras. Shape (C, N, 3), where C
+            is the number of cameras and N is the number of rays per camera.
+        ray_directions: The directions of the rays in the frame of the cameras. Shape (C, N, 3).
+        camera_poses: The poses of the updated cameras in the world frame. The pose is the position and the
+            quaternion orientation in (w, x, y, z). Shape (E, 7), where E is the number of updated cameras.
+        meshes: The static warp meshes (or the array of their ids) to ray-cast against. This can be empty.
+        ray_hits: The output buffer for the ray hit positions in the world frame. Shape (C, N, 3).
+        ray_distance: The output buffer for the ray hit distances. Shape (C, ...) with N elements per camera,
+            e.g. the image shape. Defaults to None, in which case the distances are not computed.
+        ray_depth: The output buffer for the ray hit depths, i.e. the distances of the hits along the x-axis
+            of the camera frame. Shape (C, ...) with N elements per camera. Defaults to None, in which case
+            the depths are not computed.
+        ray_normal: The output buffer for the ray hit normals in the world frame. Shape (C, ..., 3) with N
+            elements per camera. Defaults to None, in which case the normals are not computed.
+        env_ids: The indices of the updated cameras. Defaults to None, which means all the cameras.
+        instance_meshes: The warp meshes (or the array of their ids) of the moving instances. Shape (I,),
+            where I is the number of instances per camera. Defaults to None, which means no moving instances.
+        instance_poses: The poses of the instances of the updated cameras in the world frame. The pose is the
+            position and the quaternion orientation in (w, x, y, z). Shape (E, I, 7). Defaults to None.
+        max_dist: The maximum distance to ray-cast. Defaults to 1e6.
+        stream: The warp stream to launch the kernel on. Defaults to None, in which case the warp stream of the
+            current torch stream is used.
+
+    Raises:
+        ValueError: If the shape of the camera or the instance poses does not match the updated cameras.
+        ValueError: If an output buffer is not a contiguous float tensor on the device of the meshes.
+    """
+    # resolve the ids of the meshes
+    # note: the meshes are kept referenced by the input arguments until the kernel is done
+    if instance_meshes is not None and len(instance_meshes) > 0:
+        instance_mesh_ids = _resolve_mesh_ids(instance_meshes)
+        mesh_ids = _resolve_mesh_ids(meshes, device=instance_mesh_ids.device)
+    else:
+        mesh_ids = _resolve_mesh_ids(meshes)
+        instance_mesh_ids = _resolve_mesh_ids([], device=mesh_ids.device)
+    # extract shape information
+    num_cameras, num_rays = ray_starts.shape[:2]
+    # device of the meshes
+    torch_device = torch.device(wp.device_to_torch(mesh_ids.device))
+    # resolve the updated cameras
+    if env_ids is None:
+        env_ids = torch.arange(num_cameras, dtype=torch.int32, device=torch_device)
+    else:
+        env_ids = torch.as_tensor(env_ids, device=torch_device).to(torch.int32)
+    num_envs = env_ids.shape[0]
+    # check the poses
+    if camera_poses.shape != (num_envs, 7):
+        raise ValueError(f"Invalid shape of the camera poses: {tuple(camera_poses.shape)}. Expected: {(num_envs, 7)}.")
+    if instance_mesh_ids.shape[0] > 0 and (
+        instance_poses is None or instance_poses.shape != (num_envs, instance_mesh_ids.shape[0], 7)
+    ):
+        raise ValueError(
+            f"Invalid shape of the instance poses: {None if instance_poses is None else tuple(instance_poses.shape)}."
+            f" Expected: {(num_envs, instance_mesh_ids.shape[0], 7)}."
+        )
+    # check the output buffers
+    for name, buffer, shape in [
+        ("ray_hits", ray_hits, (num_cameras, num_rays, 3)),
+        ("ray_distance", ray_distance, (num_cameras, num_rays)),
+        ("ray_depth", ray_depth, (num_cameras, num_rays)),
+        ("ray_normal", ray_normal, (num_cameras, num_rays, 3)),
+    ]:
+        if buffer is not None:
+            _check_output_buffer(name, buffer, shape, torch_device)
+
+    # map the inputs to warp arrays
+    # note: the conversions are no-ops if the inputs are already on the device of the meshes
+    ray_starts_wp = wp.from_torch(ray_starts.to(torch_device).contiguous(), dtype=wp.vec3)
+    ray_directions_wp = wp.from_torch(ray_directions.to(torch_device).contiguous(), dtype=wp.vec3)
+    camera_transforms_wp = wp.from_torch(
+        _convert_poses_to_transforms(camera_poses.to(torch_device)), dtype=wp.transform
+    )
+    if instance_mesh_ids.shape[0] > 0:
+        instance_transforms = _convert_poses_to_transforms(instance_poses.to(torch_device))
+        instance_transforms_wp = wp.from_torch(instance_transforms, dtype=wp.transform)
+    else:
+        instance_transforms_wp = wp.empty((1, 1), dtype=wp.transform, device=mesh_ids.device)
+    # launch the warp kernel
+    wp.launch(
+        kernel=kernels.raycast_camera_kernel,
+        dim=(num_envs, num_rays),
+        inputs=[
+            mesh_ids,
+            instance_mesh_ids,
+            instance_transforms_wp,
+            wp.from_torch(env_ids.contiguous(), dtype=wp.int32),
+            camera_transforms_wp,
+            ray_starts_wp,
+            ray_directions_wp,
+            _map_output_buffer(ray_hits, wp.vec3, (num_cameras, num_rays), mesh_ids.device),
+            _map_output_buffer(ray_distance, wp.float32, (num_cameras, num_rays), mesh_ids.device),
+            _map_output_buffer(ray_depth, wp.float32, (num_cameras, num_rays), mesh_ids.device),
+            _map_output_buffer(ray_normal, wp.vec3, (num_cameras, num_rays), mesh_ids.device),
+            float(max_dist),
+            int(ray_distance is not None),
+            int(ray_depth is not None),
+            int(ray_normal is not None),
+        ],
+        device=mesh_ids.device,
+        stream=stream if stream is not None else _get_torch_stream(torch_device),
+    )
+
+
+def update_mesh_points(mesh: wp.Mesh, points: torch.Tensor):
+    """Updates the vertices of a warp mesh in-place and refits its bounding volume hierarchy (BVH).
+
+    Refitting only updates the bounds of the existing BVH nodes, which is much cheaper than building
+    a new mesh. This is meant for deforming meshes, where the topology of the mesh does not change. For
+    meshes that only move rigidly, ray-casting against an instance with :meth:`raycast_dynamic_meshes`
+    avoids updating the mesh altogether.
+
+    Note:
+        The quality of the BVH degrades if the vertices move far from their initial positions. In that
+        case, a new mesh should be created with :meth:`convert_to_warp_mesh`.
+
+    Args:
+        mesh: The warp mesh to update.
+        points: The new vertices of the mesh. Shape is (N, 3), where N is the number of vertices of the mesh.
+
+    Raises:
+        ValueError: If the number of vertices does not match the mesh.
+    """
+    # check the number of vertices
+    if points.shape != (mesh.points.shape[0], 3):
+        raise ValueError(
+            f"Invalid shape of the mesh vertices: {tuple(points.shape)}. Expected: {(mesh.points.shape[0], 3)}."
+        )
+    # copy the vertices into the existing buffer of the mesh
+    points = points.to(device=wp.device_to_torch(mesh.device), dtype=torch.float32).contiguous()
+    wp.copy(mesh.points, wp.from_torch(points, dtype=wp.vec3))
+    # update the bounds of the BVH
+    mesh.refit()
 
 
 def convert_to_warp_mesh(points: np.ndarray, indices: np.ndarray, device: str) -> wp.Mesh:
@@ -138,3 +597,148 @@ def convert_to_warp_mesh(points: np.ndarray, indices: np.ndarray, device: str) -
         points=wp.array(points.astype(np.float32), dtype=wp.vec3, device=device),
         indices=wp.array(indices.astype(np.int32).flatten(), dtype=wp.int32, device=device),
     )
+
+
+"""
+Helper functions.
+"""
+
+_PLACEHOLDER_ARRAYS: dict[tuple[type, int, str], wp.array] = {}
+"""The placeholder arrays for the outputs that are not written by the kernels.
+
+The keys are the data type, the number of dimensions and the device of the arrays.
+"""
+
+
+def _resolve_mesh_ids(meshes: Sequence[wp.Mesh] | wp.array, device: str | None = None) -> wp.array:
+    """Returns the warp array of the ids of the meshes.
+
+    Args:
+        meshes: The warp meshes or the array of their ids (with data type :obj:`wp.uint64`).
+        device: The device of the array if the sequence of meshes is empty. Defaults to None, in which case
+            the device of the first mesh is used.
+
+    Returns:
+        The array of the ids of the meshes.
+    """
+    if isinstance(meshes, wp.array):
+        return meshes
+    if len(meshes) > 0:
+        device = meshes[0].device
+    return wp.array([mesh.id for mesh in meshes], dtype=wp.uint64, device=device)
+
+
+def _convert_poses_to_transforms(poses: torch.Tensor) -> torch.Tensor:
+    """Converts poses to the layout of warp transforms.
+
+    Args:
+        poses: The poses as the position and the quaternion orientation in (w, x, y, z). Shape is (..., 7).
+
+    Returns:
+        The poses as the position and the quaternion orientation in (x, y, z, w). Shape is (..., 7).
+    """
+    return torch.cat([poses[..., :3], poses[..., [4, 5, 6, 3]]], dim=-1).contiguous()
+
+
+def _check_output_buffer(
+    name: str, buffer: torch.Tensor, shape: tuple[int, ...], device: torch.device, dtype: torch.dtype = torch.float32
+):
+    """Checks that an output buffer can be written in-place by a warp kernel.
+
+    Args:
+        name: The name of the buffer for the error message.
+        buffer: The output buffer.
+        shape: The expected shape of the buffer. The buffer can have any shape with the same first dimension
+            and the same number of elements.
+        device: The expected device of the buffer.
+        dtype: The expected data type of the buffer. Defaults to :obj:`torch.float32`.
+
+    Raises:
+        ValueError: If the buffer is not a contiguous tensor of the expected shape and type on the device.
+    """
+    if buffer.dtype != dtype or buffer.device != device or not buffer.is_contiguous():
+        raise ValueError(
+            f"Invalid output buffer '{name}': expected a contiguous tensor of type {dtype} on device"
+            f" '{device}', but got a tensor of type {buffer.dtype} on device '{buffer.device}'."
+        )
+    if buffer.shape[0] != shape[0] or buffer.numel() != math.prod(shape):
+        raise ValueError(f"Invalid shape of the output buffer '{name}': {tuple(buffer.shape)}. Expected: {shape}.")
+
+
+def _prepare_output_buffer(
+    name: str,
+    buffer: torch.Tensor | None,
+    shape: tuple[int, ...],
+    fill_value: float,
+    device: torch.device,
+    dtype: torch.dtype = torch.float32,
+) -> torch.Tensor:
+    """Returns an output tensor filled with the value of the missed hits.
+
+    Args:
+        name: The name of the buffer for the error message.
+        buffer: The output buffer to fill in-place. If None, a new tensor is allocated.
+        shape: The shape of the output tensor.
+        fill_value: The value of the missed hits.
+        device: The device of the output tensor.
+        dtype: The data type of the output tensor. Defaults to :obj:`torch.float32`.
+
+    Returns:
+        The output tensor.
+
+    Raises:
+        ValueError: If the buffer is not a contiguous tensor of the expected shape and type on the device.
+    """
+    if buffer is None:
+        return torch.full(shape, fill_value, dtype=dtype, device=device)
+    _check_output_buffer(name, buffer, tuple(shape), device, dtype)
+    return buffer.fill_(fill_value)
+
+
+def _map_output_buffer(buffer: torch.Tensor | None, dtype: type, shape: tuple[int, ...], device: wp.context.Device):
+    """Maps the memory of an output tensor to a warp array.
+
+    Args:
+        buffer: The output tensor. If None, a placeholder array is returned since the kernel does not write it.
+            The placeholder arrays are cached, so that they are not allocated on each call.
+        dtype: The warp data type of the array.
+        shape: The shape of the array.
+        device: The warp device of the placeholder array.
+
+    Returns:
+        The warp array.
+    """
+    if buffer is None:
+        key = (dtype, len(shape), str(device))
+        if key not in _PLACEHOLDER_ARRAYS:
+            _PLACEHOLDER_ARRAYS[key] = wp.empty((1,) * len(shape), dtype=dtype, device=device)
+        return _PLACEHOLDER_ARRAYS[key]
+    if dtype == wp.vec3:
+        return wp.from_torch(buffer.view(*shape, 3), dtype=dtype)
+    return wp.from_torch(buffer.view(*shape), dtype=dtype)
+
+
+def _resolve_output(
+    output: torch.Tensor | None, buffer: torch.Tensor | None, device: torch.device
+) -> torch.Tensor | None:
+    """Returns the output buffer as it is or moves the allocated output tensor to the device of the rays."""
+    if output is None or buffer is not None:
+        return output
+    return output.to(device)
+
+
+def _get_torch_stream(device: torch.device) -> wp.Stream | None:
+    """Returns the warp stream of the current torch stream on a device.
+
+    Launching a kernel on this stream orders it with the torch operations on the device, so that the device
+    does not need to be synchronized before the outputs of the kernel are used by torch.
+
+    Args:
+        device: The torch device.
+
+    Returns:
+        The warp stream, or None if the device is not a CUDA device.
+    """
+    if device.type != "cuda":
+        return None
+    return wp.stream_from_torch(torch.cuda.current_stream(device))
@@ -0,0 +1,224 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+This script benchmarks the reward, termination and observation managers in eager and compiled modes.
+
+The benchmark uses a stub environment with terms that mimic the locomotion terms (small element-wise
+operations and reductions on the asset data). Thus, it measures the overhead of launching the term
+computations and not of the simulation.
+
+.. code-block:: bash
+
+    # Usage
+    ./orbit.sh -p source/extensions/omni.isaac.orbit/test/managers/check_manager_compile_perf.py --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from omni.isaac.orbit.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark for the compiled managers.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of environments.")
+parser.add_argument("--num_steps", type=int, default=500, help="Number of calls to the managers.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run the benchmark on.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+from collections import namedtuple
+
+from omni.isaac.orbit.managers import (
+    ObservationGroupCfg,
+    ObservationManager,
+    ObservationTermCfg,
+    RewardManager,
+    RewardTermCfg,
+    TerminationManager,
+    TerminationTermCfg,
+)
+from omni.isaac.orbit.utils import configclass
+from omni.isaac.orbit.utils.timer import Timer
+
+
+class StubData:
+    """Data buffers of the stub environment."""
+
+    def __init__(self, num_envs: int, device: str):
+        self.root_lin_vel_b = torch.rand(num_envs, 3, device=device)
+        self.root_ang_vel_b = torch.rand(num_envs, 3, device=device)
+        self.projected_gravity_b = torch.rand(num_envs, 3, device=device)
+        self.joint_pos = torch.rand(num_envs, 12, device=device)
+        self.joint_vel = torch.rand(num_envs, 12, device=device)
+        self.applied_torque = torch.rand(num_envs, 12, device=device)
+        self.command = torch.rand(num_envs, 3, device=device)
+        self.action = torch.rand(num_envs, 12, device=device)
+        self.prev_action = torch.rand(num_envs, 12, device=device)
+
+
+"""
+Stub terms.
+"""
+
+
+def track_lin_vel_xy_exp(env, std: float) -> torch.Tensor:
+    error = torch.sum(torch.square(env.data.command[:, :2] - env.data.root_lin_vel_b[:, :2]), dim=1)
+    return torch.exp(-error / std**2)
+
+
+def track_ang_vel_z_exp(env, std: float) -> torch.Tensor:
+    error = torch.square(env.data.command[:, 2] - env.data.root_ang_vel_b[:, 2])
+    return torch.exp(-error / std**2)
+
+
+def lin_vel_z_l2(env) -> torch.Tensor:
+    return torch.square(env.data.root_lin_vel_b[:, 2])
+
+
+def ang_vel_xy_l2(env) -> torch.Tensor:
+    return torch.sum(torch.square(env.data.root_ang_vel_b[:, :2]), dim=1)
+
+
+def joint_torques_l2(env) -> torch.Tensor:
+    return torch.sum(torch.square(env.data.applied_torque), dim=1)
+
+
+def joint_acc_l2(env) -> torch.Tensor:
+    return torch.sum(torch.square(env.data.joint_vel * 50.0), dim=1)
+
+
+def action_rate_l2(env) -> torch.Tensor:
+    return torch.sum(torch.square(env.data.action - env.data.prev_action), dim=1)
+
+
+def flat_orientation_l2(env) -> torch.Tensor:
+    return torch.sum(torch.square(env.data.projected_gravity_b[:, :2]), dim=1)
+
+
+def bad_orientation(env, limit_angle: float) -> torch.Tensor:
+    return torch.acos(-env.data.projected_gravity_b[:, 2]).abs() > limit_angle
+
+
+def joint_pos_out_of_limit(env) -> torch.Tensor:
+    return torch.any(torch.abs(env.data.joint_pos) > 0.99, dim=1)
+
+
+def base_lin_vel(env) -> torch.Tensor:
+    return env.data.root_lin_vel_b
+
+
+def base_ang_vel(env) -> torch.Tensor:
+    return env.data.root_ang_vel_b
+
+
+def joint_pos_rel(env) -> torch.Tensor:
+    return env.data.joint_pos - 0.5
+
+
+def joint_vel_rel(env) -> torch.Tensor:
+    return env.data.joint_vel - 0.1
+
+
+"""
+Benchmark.
+"""
+
+
+@configclass
+class PolicyCfg(ObservationGroupCfg):
+    """Observation group with the stub terms."""
+
+    base_lin_vel = ObservationTermCfg(func=base_lin_vel, clip=(-1.0, 1.0), scale=2.0)
+    base_ang_vel = ObservationTermCfg(func=base_ang_vel, clip=(-1.0, 1.0), scale=0.25)
+    joint_pos = ObservationTermCfg(func=joint_pos_rel)
+    joint_vel = ObservationTermCfg(func=joint_vel_rel, scale=0.05)
+
+
+def create_managers(env) -> dict:
+    """Creates the managers with the stub terms."""
+    reward_cfg = {
+        "track_lin_vel_xy_exp": RewardTermCfg(func=track_lin_vel_xy_exp, weight=1.0, params={"std": 0.5}),
+        "track_ang_vel_z_exp": RewardTermCfg(func=track_ang_vel_z_exp, weight=0.5, params={"std": 0.5}),
+        "lin_vel_z_l2": RewardTermCfg(func=lin_vel_z_l2, weight=-2.0),
+        "ang_vel_xy_l2": RewardTermCfg(func=ang_vel_xy_l2, weight=-0.05),
+        "dof_torques_l2": RewardTermCfg(func=joint_torques_l2, weight=-1.0e-5),
+        "dof_acc_l2": RewardTermCfg(func=joint_acc_l2, weight=-2.5e-7),
+        "action_rate_l2": RewardTermCfg(func=action_rate_l2, weight=-0.01),
+        "flat_orientation_l2": RewardTermCfg(func=flat_orientation_l2, weight=-1.0),
+    }
+    termination_cfg = {
+        "bad_orientation": TerminationTermCfg(func=bad_orientation, params={"limit_angle": 1.0}),
+        "joint_pos_out_of_limit": TerminationTermCfg(func=joint_pos_out_of_limit),
+    }
+    observation_cfg = {"policy": PolicyCfg()}
+    return {
+        "reward": RewardManager(reward_cfg, env),
+        "termination": TerminationManager(termination_cfg, env),
+        "observation": ObservationManager(observation_cfg, env),
+    }
+
+
+def step_managers(managers: dict, dt: float):
+    """Calls the per-step computations of the managers."""
+    managers["termination"].compute()
+    managers["reward"].compute(dt=dt)
+    managers["observation"].compute()
+
+
+def main():
+    """Runs the benchmark."""
+    # create stub environment
+    env = namedtuple("RLTaskEnv", ["num_envs", "device", "data", "max_episode_length_s"])(
+        args_cli.num_envs, args_cli.device, StubData(args_cli.num_envs, args_cli.device), 20.0
+    )
+    # iterate over the modes
+    results = dict()
+    for mode in ["eager", "compiled"]:
+        managers = create_managers(env)
+        if mode == "compiled":
+            for manager in managers.values():
+                manager.compile_terms()
+        # warm-up (includes the compilation)
+        with Timer() as timer:
+            for _ in range(5):
+                step_managers(managers, dt=0.02)
+        print(f"[INFO]: Warm-up time ({mode}): {timer.total_run_time:.2f} s")
+        # benchmark
+        with Timer() as timer:
+            for _ in range(args_cli.num_steps):
+                step_managers(managers, dt=0.02)
+            if "cuda" in args_cli.device:
+                torch.cuda.synchronize()
+        results[mode] = timer.total_run_time / args_cli.num_steps
+        # print the compilation report
+        if mode == "compiled":
+            for name, manager in managers.items():
+                print(f"[INFO]: Compilation report of the {name} manager:")
+                for term_name, status in manager.compile_report.items():
+                    print(f"\t{term_name:<30}: {status}")
+    # print results
+    print(f"[INFO]: Managers step with {args_cli.num_envs} environments.")
+    for mode, step_time in results.items():
+        print(f"\t{mode:<10}: {step_time * 1e6:10.2f} us / step")
+    print(f"\tspeed-up  : {results['eager'] / results['compiled']:10.2f}x")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,112 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+This script benchmarks the observation manager with and without preallocated group buffers.
+
+The benchmark uses a stub environment that only provides the number of environments, the device and
+some data buffers. Thus, it measures the overhead of the manager itself and not of the simulation.
+
+.. code-block:: bash
+
+    # Usage
+    ./orbit.sh -p source/extensions/omni.isaac.orbit/test/managers/check_observation_manager_perf.py --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from omni.isaac.orbit.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark for the observation manager.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of environments.")
+parser.add_argument("--num_terms", type=int, default=16, help="Number of terms in the observation group.")
+parser.add_argument("--num_steps", type=int, default=1000, help="Number of calls to the manager.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run the benchmark on.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+from collections import namedtuple
+
+from omni.isaac.orbit.managers import ObservationGroupCfg, ObservationManager, ObservationTermCfg
+from omni.isaac.orbit.utils.timer import Timer
+
+
+class StubData:
+    """Data buffers of the stub environment."""
+
+    def __init__(self, num_envs: int, num_terms: int, device: str):
+        self.buffers = [torch.rand(num_envs, 12, device=device) for _ in range(num_terms)]
+
+
+def stub_data_term(env, index: int) -> torch.Tensor:
+    """Returns a reference to the data buffer (the manager has to copy it)."""
+    return env.data.buffers[index]
+
+
+def stub_fresh_term(env, index: int) -> torch.Tensor:
+    """Returns a freshly allocated tensor (the manager does not need to copy it)."""
+    return env.data.buffers[index] * 0.5
+
+
+def create_group_cfg(num_terms: int, preallocate_buffer: bool) -> ObservationGroupCfg:
+    """Creates an observation group with alternating data and fresh terms."""
+    group_cfg = ObservationGroupCfg(preallocate_buffer=preallocate_buffer)
+    for index in range(num_terms):
+        if index % 2 == 0:
+            term_cfg = ObservationTermCfg(func=stub_data_term, params={"index": index}, clip=(-1.0, 1.0), scale=2.0)
+        else:
+            term_cfg = ObservationTermCfg(
+                func=stub_fresh_term, params={"index": index}, scale=0.5, clone_output=preallocate_buffer
+            )
+        setattr(group_cfg, f"term_{index}", term_cfg)
+    return group_cfg
+
+
+def main():
+    """Runs the benchmark."""
+    # create stub environment
+    env = namedtuple("BaseEnv", ["num_envs", "device", "data"])(
+        args_cli.num_envs, args_cli.device, StubData(args_cli.num_envs, args_cli.num_terms, args_cli.device)
+    )
+    # iterate over the modes
+    results = dict()
+    for name, preallocate_buffer in [("concatenate", False), ("preallocated", True)]:
+        cfg = {"policy": create_group_cfg(args_cli.num_terms, preallocate_buffer)}
+        obs_man = ObservationManager(cfg, env)
+        # warm-up
+        for _ in range(10):
+            obs_man.compute()
+        # benchmark
+        with Timer() as timer:
+            for _ in range(args_cli.num_steps):
+                obs_man.compute()
+            if "cuda" in args_cli.device:
+                torch.cuda.synchronize()
+        results[name] = timer.total_run_time / args_cli.num_steps
+    # print results
+    print(f"[INFO]: Observation manager with {args_cli.num_terms} terms and {args_cli.num_envs} environments.")
+    for name, step_time in results.items():
+        print(f"\t{name:<15}: {step_time * 1e6:10.2f} us / step")
+    print(f"\tspeed-up       : {results['concatenate'] / results['preallocated']:10.2f}x")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
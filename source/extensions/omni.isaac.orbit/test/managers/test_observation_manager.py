@@ -258,6 +258,154 @@ class TestObservationManager(unittest.TestCase):
         torch.testing.assert_close(obs_policy[:, 5:8], obs_critic[:, 0:3])
         torch.testing.assert_close(obs_policy[:, 8:11], obs_critic[:, 3:6])
 
+    def test_compute_preallocated_buffer(self):
+        """Test the observation computation with a preallocated group buffer."""
+
+        @configclass
+        class MyObservationManagerCfg:
+            """Test config class for observation manager."""
+
+            @configclass
+            class PolicyCfg(ObservationGroupCfg):
+                """Test config class for policy observation group."""
+
+                term_1 = ObservationTermCfg(func=grilled_chicken, scale=10, clone_output=False)
+                term_2 = ObservationTermCfg(func=grilled_chicken_with_curry, scale=0.0, params={"hot": False})
+                term_3 = ObservationTermCfg(func=pos_w_data, scale=2.0, clip=(0.0, 1.5))
+                term_4 = ObservationTermCfg(func=lin_vel_w_data, scale=1.5)
+
+            policy: ObservationGroupCfg = PolicyCfg()
+            policy_fused: ObservationGroupCfg = PolicyCfg(preallocate_buffer=True)
+
+        # create observation manager
+        cfg = MyObservationManagerCfg()
+        self.obs_man = ObservationManager(cfg, self.env)
+        self.assertEqual(self.obs_man.group_obs_dim["policy"], self.obs_man.group_obs_dim["policy_fused"])
+        # compute observation using manager
+        observations = self.obs_man.compute()
+        # check that both paths give the same result
+        self.assertEqual((self.env.num_envs, 11), observations["policy_fused"].shape)
+        torch.testing.assert_close(observations["policy"], observations["policy_fused"])
+        # check that the asset data was not modified by the in-place operations
+        torch.testing.assert_close(observations["policy"][:, 8:11], self.env.data.lin_vel_w * 1.5)
+        # check that the same buffer is returned on every call
+        buffer_ptr = observations["policy_fused"].data_ptr()
+        self.env.data.pos_w[:] = 0.1
+        observations = self.obs_man.compute()
+        self.assertEqual(buffer_ptr, observations["policy_fused"].data_ptr())
+        torch.testing.assert_close(observations["policy_fused"][:, 5:8], torch.full_like(self.env.data.pos_w, 0.2))
+
+    def test_compute_with_history(self):
+        """Test the observation computation with history of the terms."""
+
+        @configclass
+        class MyObservationManagerCfg:
+            """Test config class for observation manager."""
+
+            @configclass
+            class PolicyCfg(ObservationGroupCfg):
+                """Test config class for policy observation group."""
+
+                term_1 = ObservationTermCfg(func=grilled_chicken, history_length=3)
+                term_2 = ObservationTermCfg(
+                    func=complex_function_class, scale=2.0, params={"interval": 0.5}, history_length=4
+                )
+
+            @configclass
+            class CriticCfg(ObservationGroupCfg):
+                """Test config class for critic observation group."""
+
+                term_1 = ObservationTermCfg(func=lin_vel_w_data, history_length=2, flatten_history_dim=False)
+
+            policy: ObservationGroupCfg = PolicyCfg()
+            policy_fused: ObservationGroupCfg = PolicyCfg(preallocate_buffer=True)
+            critic: ObservationGroupCfg = CriticCfg(concatenate_terms=False)
+
+        # create observation manager
+        cfg = MyObservationManagerCfg()
+        self.obs_man = ObservationManager(cfg, self.env)
+        # check the dimensions
+        self.assertEqual(self.obs_man.group_obs_term_dim["policy"], [(12,), (4,)])
+        self.assertEqual(self.obs_man.group_obs_dim["policy"], (16,))
+        self.assertEqual(self.obs_man.group_obs_term_dim["critic"], [(2, 3)])
+        # compute observation using manager
+        observations = self.obs_man.compute()
+        self.assertEqual((self.env.num_envs, 16), observations["policy"].shape)
+        self.assertEqual((self.env.num_envs, 2, 3), observations["critic"]["term_1"].shape)
+        # check the history is filled with the first observation
+        torch.testing.assert_close(observations["policy"][:, :12], torch.ones(self.num_envs, 12))
+        torch.testing.assert_close(observations["policy"][:, 12:], torch.full((self.num_envs, 4), 1.0))
+        torch.testing.assert_close(observations["critic"]["term_1"][:, 0], self.env.data.lin_vel_w)
+        # check the history is ordered from the oldest to the newest entry
+        for _ in range(2):
+            observations = self.obs_man.compute()
+        torch.testing.assert_close(observations["policy"][0, 12:], torch.tensor([1.0, 1.0, 2.0, 3.0]))
+        torch.testing.assert_close(observations["policy"], observations["policy_fused"])
+
+        # check reset only affects the specified environments
+        self.obs_man.reset(env_ids=[1])
+        observations = self.obs_man.compute()
+        torch.testing.assert_close(observations["policy"][0, 12:], torch.tensor([1.0, 2.0, 3.0, 4.0]))
+        torch.testing.assert_close(observations["policy"][1, 12:], torch.full((4,), 1.0))
+        torch.testing.assert_close(observations["policy"], observations["policy_fused"])
+
+    def test_compute_with_delay(self):
+        """Test the observation computation with delayed terms."""
+
+        @configclass
+        class MyObservationManagerCfg:
+            """Test config class for observation manager."""
+
+            @configclass
+            class PolicyCfg(ObservationGroupCfg):
+                """Test config class for policy observation group."""
+
+                term_1 = ObservationTermCfg(func=grilled_chicken)
+                term_2 = ObservationTermCfg(func=complex_function_class, params={"interval": 1.0}, delay_range=(0, 3))
+
+            policy: ObservationGroupCfg = PolicyCfg()
+
+        # create observation manager
+        cfg = MyObservationManagerCfg()
+        self.obs_man = ObservationManager(cfg, self.env)
+        # set the delays manually
+        delays = torch.tensor([0, 1, 2, 3] * (self.num_envs // 4), device=self.device)
+        self.obs_man._group_obs_term_delay["policy"]["term_2"][:] = delays
+        # compute observation using manager
+        for _ in range(5):
+            observations = self.obs_man.compute()
+        # check the observation
+        # note: the term returns the number of calls since the last reset
+        self.assertEqual((self.env.num_envs, 5), observations["policy"].shape)
+        torch.testing.assert_close(observations["policy"][:, -1], 5.0 - delays)
+        # check that reset resamples the delays and clears the delay buffers
+        self.obs_man.reset(env_ids=[0, 1, 2, 3])
+        new_delays = self.obs_man._group_obs_term_delay["policy"]["term_2"]
+        self.assertTrue(torch.all((new_delays >= 0) & (new_delays <= 3)))
+        torch.testing.assert_close(new_delays[4:], delays[4:])
+        observations = self.obs_man.compute()
+        torch.testing.assert_close(observations["policy"][0:4, -1], torch.ones(4, device=self.device))
+        torch.testing.assert_close(observations["policy"][4:, -1], 6.0 - delays[4:])
+
+    def test_invalid_delay_config(self):
+        """Test the invalid delay range of a term."""
+
+        @configclass
+        class MyObservationManagerCfg:
+            """Test config class for observation manager."""
+
+            @configclass
+            class PolicyCfg(ObservationGroupCfg):
+                """Test config class for policy observation group."""
+
+                term_1 = ObservationTermCfg(func=grilled_chicken, delay_range=(2, 1))
+
+            policy: ObservationGroupCfg = PolicyCfg()
+
+        # check the invalid config
+        with self.assertRaises(ValueError):
+            self.obs_man = ObservationManager(MyObservationManagerCfg(), self.env)
+
     def test_invalid_observation_config(self):
         """Test the invalid observation config."""
 
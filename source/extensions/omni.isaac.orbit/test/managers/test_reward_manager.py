@@ -12,11 +12,13 @@ simulation_app = AppLauncher(headless=True).app
 
 """Rest everything follows."""
 
+import torch
 import unittest
 from collections import namedtuple
 
 from omni.isaac.orbit.managers import RewardManager, RewardTermCfg
 from omni.isaac.orbit.utils import configclass
+from omni.isaac.orbit.utils.profiler import Profiler, ProfilerCfg
 
 
 def grilled_chicken(env):
@@ -35,11 +37,26 @@ def grilled_chicken_with_yoghurt(env, hot: bool, bland: float):
     return 0
 
 
+def grilled_chicken_per_env(env, bbq: float):
+    return bbq * torch.arange(env.num_envs, dtype=torch.float, device=env.device)
+
+
+def grilled_chicken_with_error(env):
+    raise ValueError("The chicken is burnt.")
+
+
+def grilled_chicken_with_branch(env):
+    value = torch.ones(env.num_envs, device=env.device)
+    if value.sum().item() > 0:
+        return value
+    return -value
+
+
 class TestRewardManager(unittest.TestCase):
     """Test cases for various situations with reward manager."""
 
     def setUp(self) -> None:
-        self.env = namedtuple("RLTaskEnv", ["num_envs", "dt", "device"])(20, 0.1, "cpu")
+        self.env = namedtuple("RLTaskEnv", ["num_envs", "dt", "device", "max_episode_length_s"])(20, 0.1, "cpu", 2.0)
 
     def test_str(self):
         """Test the string representation of the reward manager."""
@@ -123,6 +140,175 @@ class TestRewardManager(unittest.TestCase):
         self.assertEqual(float(rewards[0]), expected_reward)
         self.assertEqual(tuple(rewards.shape), (self.env.num_envs,))
 
+    def test_compute_weighted_terms(self):
+        """Test the computation of reward and episodic sums with multiple weighted terms."""
+        cfg = {
+            "term_1": RewardTermCfg(func=grilled_chicken, weight=10),
+            "term_2": RewardTermCfg(func=grilled_chicken_per_env, weight=-2.0, params={"bbq": 0.5}),
+            "term_3": RewardTermCfg(func=grilled_chicken_with_curry, weight=0.0, params={"hot": False}),
+        }
+        self.rew_man = RewardManager(cfg, self.env)
+        # compute expected reward
+        env_ids = torch.arange(self.env.num_envs, dtype=torch.float)
+        expected_reward = (10 * 1.0 - 2.0 * 0.5 * env_ids) * self.env.dt
+        # compute reward using manager
+        for _ in range(3):
+            rewards = self.rew_man.compute(dt=self.env.dt)
+        torch.testing.assert_close(rewards, expected_reward)
+        # check the term values
+        self.assertEqual(tuple(self.rew_man.term_values.shape), (self.env.num_envs, 3))
+        torch.testing.assert_close(self.rew_man.term_values[:, 1], 0.5 * env_ids)
+        # check the episodic sums
+        torch.testing.assert_close(self.rew_man.episode_sums[:, 0], torch.full((self.env.num_envs,), 3.0))
+        # check the logged information and the reset of the episodic sums
+        extras = self.rew_man.reset(env_ids=[0, 1])
+        self.assertAlmostEqual(float(extras["Episode Reward/term_1"]), 3.0 / self.env.max_episode_length_s, places=5)
+        self.assertAlmostEqual(float(extras["Episode Reward/term_2"]), -0.15 / self.env.max_episode_length_s, places=5)
+        self.assertEqual(float(extras["Episode Reward/term_3"]), 0.0)
+        torch.testing.assert_close(self.rew_man.episode_sums[0:2], torch.zeros(2, 3))
+        self.assertEqual(float(self.rew_man.episode_sums[2, 0]), 3.0)
+
+    def test_set_term_weight(self):
+        """Test the update of the reward when the weight of a term is changed."""
+        cfg = {
+            "term_1": RewardTermCfg(func=grilled_chicken, weight=10),
+            "term_2": RewardTermCfg(func=grilled_chicken_per_env, weight=1.0, params={"bbq": 1.0}),
+        }
+        self.rew_man = RewardManager(cfg, self.env)
+        self.rew_man.compute(dt=self.env.dt)
+        # change the weight of the terms
+        term_cfg = self.rew_man.get_term_cfg("term_1")
+        term_cfg.weight = 2.0
+        self.rew_man.set_term_cfg("term_1", term_cfg)
+        term_cfg = self.rew_man.get_term_cfg("term_2")
+        term_cfg.weight = 0.0
+        self.rew_man.set_term_cfg("term_2", term_cfg)
+        # check the reward
+        rewards = self.rew_man.compute(dt=self.env.dt)
+        torch.testing.assert_close(rewards, torch.full((self.env.num_envs,), 2.0 * self.env.dt))
+
+    def test_modify_term_weight_in_place(self):
+        """Test the update of the reward when the weight of a term is modified without setting its configuration."""
+        cfg = {
+            "term_1": RewardTermCfg(func=grilled_chicken, weight=10),
+            "term_2": RewardTermCfg(func=grilled_chicken_per_env, weight=0.0, params={"bbq": 1.0}),
+        }
+        self.rew_man = RewardManager(cfg, self.env)
+        rewards = self.rew_man.compute(dt=self.env.dt)
+        torch.testing.assert_close(rewards, torch.full((self.env.num_envs,), 10.0 * self.env.dt))
+        # modify the weights in place, as done by the curriculum terms
+        self.rew_man.get_term_cfg("term_1").weight = 0.0
+        self.rew_man.get_term_cfg("term_2").weight = 3.0
+        rewards = self.rew_man.compute(dt=self.env.dt)
+        expected_rewards = 3.0 * torch.arange(self.env.num_envs, dtype=torch.float) * self.env.dt
+        torch.testing.assert_close(rewards, expected_rewards.to(rewards.device))
+        # the values of the skipped terms are cleared
+        torch.testing.assert_close(self.rew_man.term_values[:, 0], torch.zeros(self.env.num_envs))
+
+    def test_compile_terms(self):
+        """Test the compilation of the reward terms."""
+        cfg = {
+            "term_1": RewardTermCfg(func=grilled_chicken_per_env, weight=2.0, params={"bbq": 0.5}),
+            "term_2": RewardTermCfg(func=grilled_chicken_with_branch, weight=1.0),
+        }
+        self.rew_man = RewardManager(cfg, self.env)
+        expected_rewards = self.rew_man.compute(dt=self.env.dt).clone()
+        # compile the terms
+        self.rew_man.compile_terms()
+        self.assertEqual(self.rew_man.compile_report, {"term_1": "pending", "term_2": "pending"})
+        # check the reward is the same
+        rewards = self.rew_man.compute(dt=self.env.dt)
+        torch.testing.assert_close(rewards, expected_rewards)
+        # check the report
+        # note: the second term has a data-dependent branch so it cannot be traced into a single graph
+        report = self.rew_man.compile_report
+        self.assertEqual(report["term_1"], "compiled")
+        self.assertTrue(report["term_2"].startswith("eager"))
+
+    def test_profile_terms(self):
+        """Test timing the calls of the reward terms with a profiler."""
+        cfg = {
+            "term_1": RewardTermCfg(func=grilled_chicken_per_env, weight=2.0, params={"bbq": 0.5}),
+            "term_2": RewardTermCfg(func=grilled_chicken, weight=1.0),
+        }
+        self.rew_man = RewardManager(cfg, self.env)
+        expected_rewards = self.rew_man.compute(dt=self.env.dt).clone()
+        # time the terms
+        profiler = Profiler(ProfilerCfg(enabled=True))
+        self.rew_man.profile_terms(profiler, prefix="reward_manager")
+        # check the reward is the same
+        for _ in range(3):
+            rewards = self.rew_man.compute(dt=self.env.dt)
+        torch.testing.assert_close(rewards, expected_rewards)
+        # check the recorded timings
+        stats = profiler.summary()
+        self.assertEqual(list(stats.keys()), ["reward_manager/term_1", "reward_manager/term_2"])
+        self.assertEqual(stats["reward_manager/term_1"]["count"], 3)
+
+    def test_term_stats(self):
+        """Test recording the costs of the reward terms with a profiler."""
+        cfg = {
+            "term_1": RewardTermCfg(func=grilled_chicken_per_env, weight=2.0, params={"bbq": 0.5}),
+            "term_2": RewardTermCfg(func=grilled_chicken, weight=1.0),
+        }
+        self.rew_man = RewardManager(cfg, self.env)
+        self.assertEqual(self.rew_man.term_stats, {})
+        expected_rewards = self.rew_man.compute(dt=self.env.dt).clone()
+        # record the costs of the terms
+        profiler = Profiler(ProfilerCfg(enabled=True, record_memory=True))
+        self.rew_man.profile_terms(profiler, prefix="reward_manager")
+        for _ in range(4):
+            rewards = self.rew_man.compute(dt=self.env.dt)
+        torch.testing.assert_close(rewards, expected_rewards)
+        # check the recorded costs
+        term_stats = self.rew_man.term_stats
+        self.assertEqual(list(term_stats.keys()), ["term_1", "term_2"])
+        self.assertEqual(term_stats["term_1"]["calls"], 4)
+        self.assertGreater(term_stats["term_1"]["total_time"], 0.0)
+        self.assertEqual(term_stats["term_1"]["mean_bytes"], self.env.num_envs * 4)
+        # check that the costs are printed
+        self.assertIn("Mean time (ms)", str(self.rew_man))
+        # check the reset of the costs
+        profiler.reset()
+        self.assertEqual(self.rew_man.term_stats["term_1"]["calls"], 0)
+
+    def test_compile_and_profile_terms(self):
+        """Test that the terms are compiled and timed independently of the order of the calls."""
+        cfg = {
+            "term_1": RewardTermCfg(func=grilled_chicken_per_env, weight=2.0, params={"bbq": 0.5}),
+        }
+        for compile_first in [True, False]:
+            with self.subTest(compile_first=compile_first):
+                self.rew_man = RewardManager(cfg, self.env)
+                profiler = Profiler(ProfilerCfg(enabled=True))
+                if compile_first:
+                    self.rew_man.compile_terms()
+                    self.rew_man.profile_terms(profiler, prefix="reward_manager")
+                else:
+                    self.rew_man.profile_terms(profiler, prefix="reward_manager")
+                    self.rew_man.compile_terms()
+                # wrapping again does not stack the wrappers
+                self.rew_man.profile_terms(profiler, prefix="reward_manager")
+                self.rew_man.compute(dt=self.env.dt)
+                # the timing wraps the compiled term, which wraps the function
+                term_func = self.rew_man.get_term_cfg("term_1").func
+                self.assertEqual(type(term_func.func).__name__, "_CompiledCallable")
+                self.assertIs(term_func.func.func, grilled_chicken_per_env)
+                self.assertEqual(self.rew_man.compile_report, {"term_1": "compiled"})
+                self.assertEqual(self.rew_man.term_stats["term_1"]["calls"], 1)
+
+    def test_compile_terms_runtime_error(self):
+        """Test that the errors of the terms are raised and do not switch the terms to eager mode."""
+        cfg = {
+            "term_1": RewardTermCfg(func=grilled_chicken_with_error, weight=1.0),
+        }
+        self.rew_man = RewardManager(cfg, self.env)
+        self.rew_man.compile_terms()
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                self.rew_man.compute(dt=self.env.dt)
+        self.assertEqual(self.rew_man.compile_report, {"term_1": "pending"})
+
     def test_active_terms(self):
         """Test the correct reading of active terms."""
         cfg = {
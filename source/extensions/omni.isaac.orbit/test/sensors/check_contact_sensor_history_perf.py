@@ -0,0 +1,115 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+This script benchmarks the update of the contact force history in the contact sensor.
+
+It compares the previous update, which shifts the whole history at every update, with the circular
+buffer used by :class:`omni.isaac.orbit.sensors.ContactSensor`, which writes a single entry per update and
+orders the history only when the data is read. The benchmark runs the tensor operations of both updates
+without the physics engine.
+
+.. code-block:: bash
+
+    # Usage
+    ./orbit.sh -p source/extensions/omni.isaac.orbit/test/sensors/check_contact_sensor_history_perf.py --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from omni.isaac.orbit.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark for the contact force history.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of environments.")
+parser.add_argument("--num_bodies", type=int, default=17, help="Number of bodies in each sensor.")
+parser.add_argument("--decimation", type=int, default=4, help="Number of updates per read of the data.")
+parser.add_argument("--num_steps", type=int, default=100, help="Number of reads of the data.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run the benchmark on.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+
+from omni.isaac.orbit.utils.timer import Timer
+
+
+def shift_update(history: torch.Tensor, forces: torch.Tensor, env_ids: slice):
+    """Previous update: shifts the whole history and writes the forces at the first index."""
+    history[env_ids, 1:] = history[env_ids, :-1].clone()
+    history[env_ids, 0] = forces[env_ids]
+
+
+def ring_update(buffer: torch.Tensor, head: torch.Tensor, start_ids: torch.Tensor, forces: torch.Tensor):
+    """Circular buffer update: writes the forces at the next position of the buffer."""
+    head.add_(1).remainder_(buffer.shape[1])
+    buffer.view(-1, *buffer.shape[2:]).index_copy_(0, start_ids + head, forces)
+
+
+def ring_read(
+    buffer: torch.Tensor, head: torch.Tensor, start_ids: torch.Tensor, offsets: torch.Tensor, out: torch.Tensor
+):
+    """Circular buffer read: gathers the history from the most recent to the oldest entry."""
+    indices = torch.remainder(head.unsqueeze(1) - offsets, buffer.shape[1])
+    indices = (indices + start_ids.unsqueeze(1)).view(-1)
+    row_size = buffer[0, 0].numel()
+    torch.index_select(buffer.view(-1, row_size), dim=0, index=indices, out=out.view(-1, row_size))
+
+
+def main():
+    """Runs the benchmark."""
+    num_envs, num_bodies, device = args_cli.num_envs, args_cli.num_bodies, args_cli.device
+    forces = torch.rand(num_envs, num_bodies, 3, device=device)
+
+    print(f"[INFO]: Contact force history with {num_envs} sensors and {num_bodies} bodies.")
+    print(f"\t{'history':<10}{'shift (us/update)':>20}{'ring (us/update)':>20}{'ring read (us)':>20}")
+    for history_length in [1, 3, 10, 30]:
+        # previous update
+        history = torch.zeros(num_envs, history_length, num_bodies, 3, device=device)
+        with Timer() as timer:
+            for _ in range(args_cli.num_steps * args_cli.decimation):
+                shift_update(history, forces, slice(None))
+            if "cuda" in device:
+                torch.cuda.synchronize()
+        shift_time = timer.total_run_time / (args_cli.num_steps * args_cli.decimation)
+        # circular buffer update
+        buffer = torch.zeros_like(history)
+        ordered_history = torch.zeros_like(history)
+        head = torch.zeros(num_envs, dtype=torch.long, device=device)
+        offsets = torch.arange(history_length, device=device)
+        start_ids = torch.arange(num_envs, device=device) * history_length
+        with Timer() as timer:
+            for _ in range(args_cli.num_steps * args_cli.decimation):
+                ring_update(buffer, head, start_ids, forces)
+            if "cuda" in device:
+                torch.cuda.synchronize()
+        ring_time = timer.total_run_time / (args_cli.num_steps * args_cli.decimation)
+        # circular buffer read
+        with Timer() as timer:
+            for _ in range(args_cli.num_steps):
+                ring_read(buffer, head, start_ids, offsets, ordered_history)
+            if "cuda" in device:
+                torch.cuda.synchronize()
+        read_time = timer.total_run_time / args_cli.num_steps
+        # print results
+        print(f"\t{history_length:<10}{shift_time * 1e6:>20.2f}{ring_time * 1e6:>20.2f}{read_time * 1e6:>20.2f}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,96 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+This script benchmarks the height scans of a rough terrain.
+
+It compares ray-casting the terrain mesh, as done by :class:`omni.isaac.orbit.sensors.RayCaster`, to the
+bilinear lookup in the height map of the terrain, as done by :class:`omni.isaac.orbit.sensors.HeightFieldScanner`.
+The rays follow the grid pattern of the height scanner of the locomotion environments (187 rays per sensor).
+
+.. code-block:: bash
+
+    # Usage
+    ./orbit.sh -p source/extensions/omni.isaac.orbit/test/sensors/check_height_scan_perf.py --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from omni.isaac.orbit.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark for the height scans.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of height scanners.")
+parser.add_argument("--num_steps", type=int, default=100, help="Number of scans to time.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run the benchmark on.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+
+import warp as wp
+
+from omni.isaac.orbit.sensors.ray_caster import patterns
+from omni.isaac.orbit.terrains.config.rough import ROUGH_TERRAINS_CFG
+from omni.isaac.orbit.terrains.terrain_generator import TerrainGenerator
+from omni.isaac.orbit.terrains.utils import sample_height_map
+from omni.isaac.orbit.utils.timer import Timer
+from omni.isaac.orbit.utils.warp import convert_to_warp_mesh, raycast_mesh
+
+
+def main():
+    """Runs the benchmark."""
+    wp.init()
+    device = args_cli.device
+    # generate the terrain
+    terrain_generator = TerrainGenerator(ROUGH_TERRAINS_CFG.replace(seed=0, use_cache=False), device=device)
+    mesh = terrain_generator.terrain_mesh
+    wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=device)
+    with Timer() as timer:
+        height_map, origin = terrain_generator.get_height_map()
+    print(f"[INFO]: Created a height map of shape {tuple(height_map.shape)} in {timer.total_run_time:.3f} s.")
+
+    # create the rays of the height scanners at random positions on the terrain
+    pattern_cfg = patterns.GridPatternCfg(resolution=0.1, size=(1.6, 1.0))
+    ray_starts, ray_directions = pattern_cfg.func(pattern_cfg, device)
+    # note: the positions are sampled away from the outer edges of the border
+    lower = torch.tensor([*(mesh.bounds[0, :2] + 0.1 * mesh.extents[:2]), 20.0], dtype=torch.float, device=device)
+    span = torch.tensor([*(0.8 * mesh.extents[:2]), 0.0], dtype=torch.float, device=device)
+    positions = lower + torch.rand(args_cli.num_envs, 1, 3, device=device) * span
+    ray_starts_w = (ray_starts + positions).view(-1, 3)
+    ray_directions_w = ray_directions.repeat(args_cli.num_envs, 1)
+    print(f"[INFO]: Scanning {args_cli.num_envs} x {len(ray_starts)} rays on {device}.")
+
+    # ray-cast the terrain mesh
+    with Timer() as timer:
+        for _ in range(args_cli.num_steps):
+            ray_hits = raycast_mesh(ray_starts_w, ray_directions_w, wp_mesh)[0]
+    print(f"\tray-casting: {1e3 * timer.total_run_time / args_cli.num_steps:8.3f} ms per scan")
+    # look up the height map
+    with Timer() as timer:
+        for _ in range(args_cli.num_steps):
+            heights = sample_height_map(height_map, origin, ROUGH_TERRAINS_CFG.horizontal_scale, ray_starts_w[:, :2])
+    print(f"\tlookup:      {1e3 * timer.total_run_time / args_cli.num_steps:8.3f} ms per scan")
+    # compare the heights
+    error = (heights - ray_hits[:, 2]).abs()
+    print(f"\tmean / max height error: {error.mean():.4f} / {error.max():.4f} m")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
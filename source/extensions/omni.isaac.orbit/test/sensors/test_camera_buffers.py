@@ -0,0 +1,190 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+# ignore private usage of variables warning
+# pyright: reportPrivateUsage=none
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.orbit.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import numpy as np
+import torch
+import unittest
+from typing import Any
+
+from omni.isaac.orbit.sensors.camera import Camera, CameraCfg, CameraData
+
+
+class FakeAnnotator:
+    """Stand-in for a replicator annotator that returns a given output."""
+
+    def __init__(self, output: Any):
+        self.output = output
+        self.num_calls = 0
+
+    def get_data(self) -> Any:
+        self.num_calls += 1
+        return self.output
+
+    def detach(self, render_product_paths: list[str]):
+        pass
+
+
+class FakeAttribute:
+    """Stand-in for a USD attribute with a constant value."""
+
+    def __init__(self, value: float):
+        self.value = value
+
+    def Get(self) -> float:
+        return self.value
+
+
+class FakeCameraPrim:
+    """Stand-in for a USD camera prim."""
+
+    def __init__(self, focal_length: float, horizontal_aperture: float):
+        self.focal_length = focal_length
+        self.horizontal_aperture = horizontal_aperture
+        self.num_reads = 0
+
+    def GetFocalLengthAttr(self) -> FakeAttribute:
+        self.num_reads += 1
+        return FakeAttribute(self.focal_length)
+
+    def GetHorizontalApertureAttr(self) -> FakeAttribute:
+        return FakeAttribute(self.horizontal_aperture)
+
+
+class FakeView:
+    """Stand-in for the prim view of the cameras."""
+
+    def __init__(self, count: int):
+        self.count = count
+
+    def get_world_poses(self, env_ids: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        positions = torch.zeros(len(env_ids), 3)
+        orientations = torch.zeros(len(env_ids), 4)
+        orientations[:, 0] = 1.0
+        return positions, orientations
+
+
+class TestCameraBuffers(unittest.TestCase):
+    """Test the batched readback of the annotators into the camera buffers with fake annotators."""
+
+    def setUp(self):
+        self.num_cameras = 6
+        self.height, self.width = 12, 16
+        # create the state of the camera
+        self.camera = Camera.__new__(Camera)
+        self.camera._initialize_handle = None
+        self.camera._invalidate_initialize_handle = None
+        self.camera._debug_vis_handle = None
+        self.camera.cfg = CameraCfg(
+            prim_path="/World/Camera",
+            spawn=None,
+            height=self.height,
+            width=self.width,
+            data_types=["rgb", "distance_to_image_plane", "semantic_segmentation"],
+        )
+        self.camera._device = "cpu"
+        self.camera._view = FakeView(self.num_cameras)
+        self.camera._ALL_INDICES = torch.arange(self.num_cameras)
+        self.camera._frame = torch.zeros(self.num_cameras, dtype=torch.long)
+        self.camera._data = CameraData()
+        self.camera._sensor_prims = [FakeCameraPrim(24.0, 20.0 + index) for index in range(self.num_cameras)]
+        self.camera._render_product_paths = [f"/Render/Camera_{index}" for index in range(self.num_cameras)]
+        self.camera._rep_registry = {name: list() for name in self.camera.cfg.data_types}
+        self._set_annotator_outputs(np.random.default_rng(0))
+        self.camera._create_buffers()
+
+    def test_update_buffers(self):
+        """Test that the outputs of the annotators are written into the buffers of the cameras."""
+        # allocate the buffers
+        self.camera._update_buffers_impl(self.camera._ALL_INDICES)
+        self._check_outputs(self.camera._ALL_INDICES)
+        buffers = {name: self.camera._data.output[name] for name in self.camera.cfg.data_types}
+        # update a subset of the cameras with new outputs
+        rng = np.random.default_rng(1)
+        expected_outputs = {name: value.clone() for name, value in buffers.items()}
+        self._set_annotator_outputs(rng)
+        env_ids = torch.tensor([1, 4])
+        self.camera._update_buffers_impl(env_ids)
+        self._check_outputs(env_ids)
+        # check that the other cameras are unchanged and that the buffers are reused
+        other_ids = torch.tensor([0, 2, 3, 5])
+        for name, buffer in buffers.items():
+            self.assertIs(self.camera._data.output[name], buffer)
+            torch.testing.assert_close(buffer[other_ids], expected_outputs[name][other_ids])
+        # update all the cameras
+        self._set_annotator_outputs(rng)
+        self.camera._update_buffers_impl(self.camera._ALL_INDICES)
+        self._check_outputs(self.camera._ALL_INDICES)
+        for name, buffer in buffers.items():
+            self.assertIs(self.camera._data.output[name], buffer)
+        # check the frame count
+        torch.testing.assert_close(self.camera.frame, torch.tensor([2, 3, 2, 2, 3, 2]))
+
+    def test_cached_intrinsic_matrices(self):
+        """Test that the intrinsic matrices are only read from the cameras when they are set."""
+        # check the intrinsic matrices
+        for index, sensor_prim in enumerate(self.camera._sensor_prims):
+            focal_px = self.width * sensor_prim.focal_length / sensor_prim.horizontal_aperture
+            expected_matrix = torch.tensor(
+                [[focal_px, 0.0, self.width * 0.5], [0.0, focal_px, self.height * 0.5], [0.0, 0.0, 1.0]]
+            )
+            torch.testing.assert_close(self.camera._data.intrinsic_matrices[index], expected_matrix)
+        # the updates do not read the cameras
+        num_reads = [sensor_prim.num_reads for sensor_prim in self.camera._sensor_prims]
+        self.camera._update_buffers_impl(self.camera._ALL_INDICES)
+        self.camera._update_buffers_impl(self.camera._ALL_INDICES)
+        self.assertEqual([sensor_prim.num_reads for sensor_prim in self.camera._sensor_prims], num_reads)
+
+    """
+    Helper functions.
+    """
+
+    def _set_annotator_outputs(self, rng: np.random.Generator):
+        """Set new outputs of the annotators."""
+        self.outputs = {
+            "rgb": rng.integers(0, 256, size=(self.num_cameras, self.height, self.width, 4), dtype=np.uint8),
+            "distance_to_image_plane": rng.random((self.num_cameras, self.height, self.width), dtype=np.float32),
+            "semantic_segmentation": rng.integers(0, 2**31, size=(self.num_cameras, self.height, self.width)),
+        }
+        self.outputs["semantic_segmentation"] = self.outputs["semantic_segmentation"].astype(np.uint32)
+        for name, outputs in self.outputs.items():
+            annotators = list()
+            for index, output in enumerate(outputs):
+                if name == "semantic_segmentation":
+                    output = {"data": output, "info": {"idToLabels": {str(index): {"class": "object"}}}}
+                annotators.append(FakeAnnotator(output))
+            self.camera._rep_registry[name] = annotators
+
+    def _check_outputs(self, env_ids: torch.Tensor):
+        """Check that the buffers of the cameras contain the outputs of the annotators."""
+        output = self.camera._data.output
+        torch.testing.assert_close(output["rgb"][env_ids], torch.from_numpy(self.outputs["rgb"][env_ids]))
+        torch.testing.assert_close(
+            output["distance_to_image_plane"][env_ids],
+            torch.from_numpy(self.outputs["distance_to_image_plane"][env_ids]),
+        )
+        # the colorized segmentation is returned as a 4 channel image
+        segmentation = self.outputs["semantic_segmentation"][env_ids].view(np.uint8)
+        segmentation = segmentation.reshape(len(env_ids), self.height, self.width, 4)
+        torch.testing.assert_close(output["semantic_segmentation"][env_ids], torch.from_numpy(segmentation))
+        for index in env_ids.tolist():
+            self.assertEqual(
+                self.camera._data.info[index]["semantic_segmentation"]["idToLabels"], {str(index): {"class": "object"}}
+            )
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,162 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+# ignore private usage of variables warning
+# pyright: reportPrivateUsage=none
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.orbit.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import numpy as np
+import torch
+import unittest
+
+from omni.isaac.orbit.sensors.camera.utils import (
+    _get_pixel_rays,
+    create_pointcloud_from_depth,
+    create_pointcloud_from_rgbd,
+    create_pointclouds_from_depth,
+    create_pointclouds_from_rgbd,
+    voxel_downsample_pointclouds,
+)
+from omni.isaac.orbit.utils.math import random_orientation
+
+
+class TestCameraUtils(unittest.TestCase):
+    """Test the batched creation of pointclouds from the images of multiple cameras."""
+
+    def setUp(self):
+        torch.manual_seed(0)
+        self.num_cameras = 5
+        self.height, self.width = 24, 32
+        # intrinsic matrices of the cameras
+        focal_px = torch.rand(self.num_cameras) * 20.0 + 20.0
+        self.intrinsic_matrices = torch.zeros(self.num_cameras, 3, 3)
+        self.intrinsic_matrices[:, 0, 0] = focal_px
+        self.intrinsic_matrices[:, 1, 1] = focal_px
+        self.intrinsic_matrices[:, 0, 2] = self.width * 0.5
+        self.intrinsic_matrices[:, 1, 2] = self.height * 0.5
+        self.intrinsic_matrices[:, 2, 2] = 1.0
+        # depth images with invalid pixels
+        self.depth = torch.rand(self.num_cameras, self.height, self.width) * 5.0 + 0.1
+        self.depth[torch.rand_like(self.depth) < 0.2] = float("inf")
+        self.depth[torch.rand_like(self.depth) < 0.1] = float("nan")
+        self.depth[0] = float("inf")
+        self.rgb = torch.randint(0, 256, (self.num_cameras, self.height, self.width, 3), dtype=torch.uint8)
+        # poses of the cameras
+        self.positions = torch.rand(self.num_cameras, 3) * 10.0
+        self.orientations = random_orientation(self.num_cameras, device="cpu")
+
+    def test_pointclouds_from_depth(self):
+        """Test that the batched pointclouds match the pointclouds of each camera."""
+        points, mask = create_pointclouds_from_depth(
+            self.intrinsic_matrices, self.depth, self.positions, self.orientations
+        )
+        packed_points, offsets = create_pointclouds_from_depth(
+            self.intrinsic_matrices, self.depth, self.positions, self.orientations, output_format="packed"
+        )
+        self.assertEqual(points.shape, (self.num_cameras, self.height * self.width, 3))
+        self.assertEqual(offsets.shape, (self.num_cameras + 1,))
+        self.assertTrue(torch.all(points[~mask] == 0.0))
+        for index in range(self.num_cameras):
+            expected_points = create_pointcloud_from_depth(
+                self.intrinsic_matrices[index],
+                self.depth[index],
+                position=self.positions[index],
+                orientation=self.orientations[index],
+            )
+            torch.testing.assert_close(points[index][mask[index]], expected_points)
+            torch.testing.assert_close(packed_points[offsets[index] : offsets[index + 1]], expected_points)
+        # the first camera has no valid points
+        self.assertEqual(int(offsets[1]), 0)
+
+    def test_pointclouds_from_rgbd(self):
+        """Test that the batched colored pointclouds match the colored pointclouds of each camera."""
+        points, colors, offsets = create_pointclouds_from_rgbd(
+            self.intrinsic_matrices,
+            self.depth,
+            self.rgb,
+            normalize_rgb=True,
+            positions=self.positions,
+            orientations=self.orientations,
+            num_channels=4,
+            output_format="packed",
+        )
+        for index in range(self.num_cameras):
+            expected_points, expected_colors = create_pointcloud_from_rgbd(
+                self.intrinsic_matrices[index],
+                self.depth[index],
+                self.rgb[index],
+                normalize_rgb=True,
+                position=self.positions[index],
+                orientation=self.orientations[index],
+                num_channels=4,
+            )
+            torch.testing.assert_close(points[offsets[index] : offsets[index + 1]], expected_points)
+            torch.testing.assert_close(colors[offsets[index] : offsets[index + 1]], expected_colors)
+        # the colors of the invalid points are zero in the padded format
+        _, colors, mask = create_pointclouds_from_rgbd(self.intrinsic_matrices, self.depth, (255.0, 0.0, 0.0))
+        self.assertTrue(torch.all(colors[~mask] == 0.0))
+        torch.testing.assert_close(colors[mask], torch.tensor([[255.0, 0.0, 0.0]]).expand(int(mask.sum()), 3))
+
+    def test_pixel_rays_cache(self):
+        """Test that the rays through the pixels are only recomputed when the intrinsic matrices change."""
+        rays = _get_pixel_rays(self.intrinsic_matrices, self.height, self.width)
+        self.assertIs(_get_pixel_rays(self.intrinsic_matrices.clone(), self.height, self.width), rays)
+        # modify the intrinsic matrices in place
+        self.intrinsic_matrices[0, 0, 0] += 1.0
+        new_rays = _get_pixel_rays(self.intrinsic_matrices, self.height, self.width)
+        self.assertIsNot(new_rays, rays)
+        torch.testing.assert_close(new_rays[1:], rays[1:])
+        # change the image size
+        self.assertEqual(_get_pixel_rays(self.intrinsic_matrices, self.width, self.height).shape, rays.shape)
+        self.assertIsNot(_get_pixel_rays(self.intrinsic_matrices, self.width, self.height), new_rays)
+
+    def test_voxel_downsample(self):
+        """Test that the downsampled pointclouds contain the mean points of the voxels."""
+        voxel_size = 0.5
+        points, colors, mask = create_pointclouds_from_rgbd(
+            self.intrinsic_matrices, self.depth, self.rgb, positions=self.positions, orientations=self.orientations
+        )
+        downsampled_points, downsampled_colors, downsampled_mask = voxel_downsample_pointclouds(
+            points, mask, voxel_size, colors
+        )
+        self.assertEqual(downsampled_points.shape[:2], downsampled_mask.shape)
+        self.assertEqual(downsampled_mask.shape[1], int(downsampled_mask.sum(dim=1).max()))
+        for index in range(self.num_cameras):
+            # compute the mean points and colors of the voxels of the pointcloud
+            valid_points = points[index][mask[index]].numpy()
+            valid_colors = colors[index][mask[index]].numpy()
+            voxels, voxel_ids = np.unique(np.floor(valid_points / voxel_size), axis=0, return_inverse=True)
+            voxel_ids = voxel_ids.reshape(-1)
+            self.assertEqual(int(downsampled_mask[index].sum()), len(voxels))
+            if len(voxels) == 0:
+                continue
+            expected_points = np.stack([valid_points[voxel_ids == i].mean(axis=0) for i in range(len(voxels))])
+            expected_colors = np.stack([valid_colors[voxel_ids == i].mean(axis=0) for i in range(len(voxels))])
+            # compare the voxels in the same order
+            np.testing.assert_allclose(downsampled_points[index][downsampled_mask[index]], expected_points, atol=1e-5)
+            np.testing.assert_allclose(downsampled_colors[index][downsampled_mask[index]], expected_colors, atol=1e-3)
+        # the downsampling is applied when creating the pointclouds
+        packed_points, offsets = create_pointclouds_from_depth(
+            self.intrinsic_matrices,
+            self.depth,
+            self.positions,
+            self.orientations,
+            voxel_size=voxel_size,
+            output_format="packed",
+        )
+        torch.testing.assert_close(packed_points, downsampled_points[downsampled_mask])
+        torch.testing.assert_close(offsets[1:], torch.cumsum(downsampled_mask.sum(dim=1), dim=0))
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -388,6 +388,8 @@ class TestContactSensor(unittest.TestCase):
         # check current contact mode
         self.assertEqual(sensor.compute_first_contact(dt=dt).item(), in_contact)
         self.assertEqual(sensor.compute_first_air(dt=dt).item(), in_air)
+        # check the history of the contact forces (the most recent entry is the current force)
+        torch.testing.assert_close(sensor.data.net_forces_w_history[:, 0], sensor.data.net_forces_w)
 
     def _perform_sim_step(self) -> None:
         """Updates sensors and steps the contact sensor test scene."""
@@ -0,0 +1,124 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+# ignore private usage of variables warning
+# pyright: reportPrivateUsage=none
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.orbit.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import torch
+import unittest
+
+import omni.isaac.core.utils.prims as prim_utils
+import omni.isaac.core.utils.stage as stage_utils
+
+import omni.isaac.orbit.sim as sim_utils
+import omni.isaac.orbit.terrains as terrain_gen
+from omni.isaac.orbit.sensors.ray_caster import (
+    HeightFieldScanner,
+    HeightFieldScannerCfg,
+    RayCaster,
+    RayCasterCfg,
+    patterns,
+)
+from omni.isaac.orbit.terrains import TerrainGenerator, TerrainGeneratorCfg
+from omni.isaac.orbit.terrains.utils import create_prim_from_mesh
+
+
+class TestHeightFieldScanner(unittest.TestCase):
+    """Test the height-field scanner against the ray-caster."""
+
+    def setUp(self):
+        """Create a blank new stage with a rough terrain for each test."""
+        self.num_sensors = 8
+        self.ray_caster_cfg = RayCasterCfg(
+            prim_path="/World/envs/env_.*/Sensor",
+            mesh_prim_paths=["/World/ground"],
+            offset=RayCasterCfg.OffsetCfg(pos=(0.0, 0.0, 20.0)),
+            pattern_cfg=patterns.GridPatternCfg(resolution=0.1, size=(1.6, 1.0)),
+            attach_yaw_only=True,
+        )
+        self.scanner_cfg = HeightFieldScannerCfg(
+            prim_path=self.ray_caster_cfg.prim_path,
+            mesh_prim_paths=self.ray_caster_cfg.mesh_prim_paths,
+            offset=HeightFieldScannerCfg.OffsetCfg(pos=(0.0, 0.0, 20.0)),
+            pattern_cfg=self.ray_caster_cfg.pattern_cfg,
+            resolution=0.1,
+        )
+        # Create a new stage
+        stage_utils.create_new_stage()
+        # Load kit helper
+        self.sim = sim_utils.SimulationContext(sim_utils.SimulationCfg(dt=0.01))
+        # Rough terrain without vertical walls
+        # note: the surface of the height-field terrain is linear along the lines of the height map
+        terrain_cfg = TerrainGeneratorCfg(
+            seed=0,
+            size=(8.0, 8.0),
+            border_width=2.0,
+            num_rows=2,
+            num_cols=2,
+            slope_threshold=None,
+            sub_terrains={
+                "random_rough": terrain_gen.HfRandomUniformTerrainCfg(
+                    proportion=1.0, noise_range=(0.02, 0.10), noise_step=0.02, border_width=0.25
+                ),
+            },
+        )
+        create_prim_from_mesh("/World/ground", TerrainGenerator(terrain_cfg).terrain_mesh)
+        # Sensor frames on the lines of the height map
+        for i in range(self.num_sensors):
+            translation = (0.1 * (11 * i - 40), 0.1 * (7 * i - 30), 0.0)
+            prim_utils.create_prim(f"/World/envs/env_{i}/Sensor", "Xform", translation=translation)
+        # load stage
+        stage_utils.update_stage()
+
+    def tearDown(self):
+        """Stops simulator after each test."""
+        # stop simulation
+        self.sim.stop()
+        # clear the stage
+        self.sim.clear_all_callbacks()
+        self.sim.clear_instance()
+        # clear the meshes shared by the ray-cast sensors
+        RayCaster.meshes.clear()
+
+    """
+    Tests
+    """
+
+    def test_height_scan(self):
+        """Test that the height-field scanner outputs the same data as the ray-caster."""
+        ray_caster = RayCaster(cfg=self.ray_caster_cfg)
+        scanner = HeightFieldScanner(cfg=self.scanner_cfg)
+        # Play sim
+        self.sim.reset()
+        self.assertTrue(scanner._is_initialized)
+        # Update the sensors
+        self.sim.step()
+        ray_caster.update(dt=self.sim.get_physics_dt(), force_recompute=True)
+        scanner.update(dt=self.sim.get_physics_dt(), force_recompute=True)
+        # Check the data
+        self.assertEqual(scanner.data.ray_hits_w.shape, (self.num_sensors, scanner.num_rays, 3))
+        torch.testing.assert_close(scanner.data.pos_w, ray_caster.data.pos_w)
+        torch.testing.assert_close(scanner.data.ray_hits_w, ray_caster.data.ray_hits_w, atol=1e-4, rtol=1e-4)
+        torch.testing.assert_close(scanner.data.ray_mesh_ids, ray_caster.data.ray_mesh_ids)
+
+    def test_invalid_cfg(self):
+        """Test that the unsupported configurations raise an error."""
+        with self.assertRaises(ValueError):
+            HeightFieldScanner(cfg=self.scanner_cfg.replace(attach_yaw_only=False))
+        with self.assertRaises(ValueError):
+            HeightFieldScanner(cfg=self.scanner_cfg.replace(dynamic_mesh_prim_paths=["/World/envs/env_.*/Sensor"]))
+
+
+if __name__ == "__main__":
+    run_tests()
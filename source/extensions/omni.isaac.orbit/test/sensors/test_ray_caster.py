@@ -0,0 +1,142 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+# ignore private usage of variables warning
+# pyright: reportPrivateUsage=none
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.orbit.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import torch
+import trimesh
+import unittest
+
+import omni.isaac.core.utils.prims as prim_utils
+import omni.isaac.core.utils.stage as stage_utils
+
+import omni.isaac.orbit.sim as sim_utils
+from omni.isaac.orbit.sensors.ray_caster import RayCaster, RayCasterCfg, patterns
+from omni.isaac.orbit.terrains.trimesh.utils import make_plane
+from omni.isaac.orbit.terrains.utils import create_prim_from_mesh
+from omni.isaac.orbit.utils.warp import convert_to_warp_mesh
+
+
+class TestRayCaster(unittest.TestCase):
+    """Test the ray-caster with the registered meshes."""
+
+    def setUp(self):
+        """Create a blank new stage with a flat ground for each test."""
+        self.num_sensors = 4
+        self.ray_caster_cfg = RayCasterCfg(
+            prim_path="/World/envs/env_.*/Sensor",
+            mesh_prim_paths=["/World/ground"],
+            offset=RayCasterCfg.OffsetCfg(pos=(0.0, 0.0, 20.0)),
+            pattern_cfg=patterns.GridPatternCfg(resolution=0.1, size=(1.0, 1.0)),
+            attach_yaw_only=True,
+        )
+        # Create a new stage
+        stage_utils.create_new_stage()
+        # Load kit helper
+        self.sim = sim_utils.SimulationContext(sim_utils.SimulationCfg(dt=0.01))
+        # Flat ground
+        create_prim_from_mesh("/World/ground", make_plane(size=(20.0, 20.0), height=0.0, center_zero=True))
+        # Sensor frames along the x-axis
+        for i in range(self.num_sensors):
+            prim_utils.create_prim(f"/World/envs/env_{i}/Sensor", "Xform", translation=(2.0 * i, 0.0, 0.0))
+        # load stage
+        stage_utils.update_stage()
+
+    def tearDown(self):
+        """Stops simulator after each test."""
+        # stop simulation
+        self.sim.stop()
+        # clear the stage
+        self.sim.clear_all_callbacks()
+        self.sim.clear_instance()
+        # clear the meshes shared by the ray-cast sensors
+        RayCaster.unregister_meshes(list(RayCaster.meshes.keys()))
+
+    """
+    Tests
+    """
+
+    def test_register_meshes(self):
+        """Test that the ray-caster refreshes its meshes when meshes are registered and unregistered."""
+        ray_caster = RayCaster(cfg=self.ray_caster_cfg)
+        # Play sim
+        self.sim.reset()
+        self.assertTrue(ray_caster._is_initialized)
+        # Update the sensor
+        self.sim.step()
+        ray_caster.update(dt=self.sim.get_physics_dt(), force_recompute=True)
+        # Check that the rays hit the ground
+        torch.testing.assert_close(
+            ray_caster.data.ray_hits_w[..., 2], torch.zeros_like(ray_caster.data.ray_hits_w[..., 2])
+        )
+        self.assertTrue(torch.all(ray_caster.data.ray_mesh_ids == 0))
+
+        # Register a box below the first sensor
+        box = trimesh.creation.box(extents=(2.0, 2.0, 2.0))
+        RayCaster.register_meshes(
+            {"/World/ground/box": convert_to_warp_mesh(box.vertices, box.faces, device=ray_caster.device)}
+        )
+        # Update the sensor
+        self.sim.step()
+        ray_caster.update(dt=self.sim.get_physics_dt(), force_recompute=True)
+        # Check that the rays of the first sensor hit the box
+        self.assertEqual(ray_caster._static_mesh_prim_paths, ["/World/ground", "/World/ground/box"])
+        torch.testing.assert_close(
+            ray_caster.data.ray_hits_w[0, :, 2], torch.ones_like(ray_caster.data.ray_hits_w[0, :, 2])
+        )
+        self.assertTrue(torch.all(ray_caster.data.ray_mesh_ids[0] == 1))
+        torch.testing.assert_close(
+            ray_caster.data.ray_hits_w[1:, :, 2], torch.zeros_like(ray_caster.data.ray_hits_w[1:, :, 2])
+        )
+        self.assertTrue(torch.all(ray_caster.data.ray_mesh_ids[1:] == 0))
+
+        # Unregister the box
+        RayCaster.unregister_meshes(["/World/ground/box"])
+        # Update the sensor
+        self.sim.step()
+        ray_caster.update(dt=self.sim.get_physics_dt(), force_recompute=True)
+        # Check that the rays hit the ground again
+        self.assertEqual(ray_caster._static_mesh_prim_paths, ["/World/ground"])
+        torch.testing.assert_close(
+            ray_caster.data.ray_hits_w[..., 2], torch.zeros_like(ray_caster.data.ray_hits_w[..., 2])
+        )
+        self.assertTrue(torch.all(ray_caster.data.ray_mesh_ids == 0))
+
+    def test_registered_meshes_only(self):
+        """Test that the ray-caster uses the registered meshes below a mesh prim path without a prim."""
+        plane = make_plane(size=(20.0, 20.0), height=0.5, center_zero=True)
+        RayCaster.register_meshes(
+            {"/World/tiles/tile_0_0": convert_to_warp_mesh(plane.vertices, plane.faces, device=self.sim.device)}
+        )
+        ray_caster = RayCaster(cfg=self.ray_caster_cfg.replace(mesh_prim_paths=["/World/tiles"]))
+        # Play sim
+        self.sim.reset()
+        self.assertTrue(ray_caster._is_initialized)
+        # Update the sensor
+        self.sim.step()
+        ray_caster.update(dt=self.sim.get_physics_dt(), force_recompute=True)
+        # Check that the rays hit the registered mesh
+        self.assertEqual(ray_caster._static_mesh_prim_paths, ["/World/tiles/tile_0_0"])
+        torch.testing.assert_close(
+            ray_caster.data.ray_hits_w[..., 2], torch.full_like(ray_caster.data.ray_hits_w[..., 2], 0.5)
+        )
+        # Check that the sensor raises an error if no meshes are left
+        RayCaster.unregister_meshes(["/World/tiles/tile_0_0"])
+        with self.assertRaises(RuntimeError):
+            ray_caster.refresh_meshes()
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -20,6 +20,7 @@ import copy
 import numpy as np
 import os
 import torch
+import trimesh
 import unittest
 
 import omni.isaac.core.utils.prims as prim_utils
@@ -29,12 +30,13 @@ from pxr import Gf
 
 import omni.isaac.orbit.sim as sim_utils
 from omni.isaac.orbit.sensors.camera import Camera, CameraCfg
-from omni.isaac.orbit.sensors.ray_caster import RayCasterCamera, RayCasterCameraCfg, patterns
+from omni.isaac.orbit.sensors.ray_caster import RayCaster, RayCasterCamera, RayCasterCameraCfg, patterns
 from omni.isaac.orbit.sim import PinholeCameraCfg
 from omni.isaac.orbit.terrains.trimesh.utils import make_plane
 from omni.isaac.orbit.terrains.utils import create_prim_from_mesh
 from omni.isaac.orbit.utils import convert_dict_to_backend
 from omni.isaac.orbit.utils.timer import Timer
+from omni.isaac.orbit.utils.warp import convert_to_warp_mesh
 
 # sample camera poses
 POSITION = [2.5, 2.5, 2.5]
@@ -276,6 +278,50 @@ class TestWarpCamera(unittest.TestCase):
         torch.testing.assert_close(camera.data.pos_w, eyes)
         torch.testing.assert_close(camera.data.quat_w_ros, quat_ros_gt)
 
+    def test_register_meshes(self):
+        """Test that the camera refreshes its meshes when meshes are registered and unregistered."""
+        camera = RayCasterCamera(self.camera_cfg)
+        # play sim
+        self.sim.reset()
+        # look at the origin
+        eyes = torch.tensor([POSITION], dtype=torch.float32, device=camera.device)
+        targets = torch.tensor([[0.0, 0.0, 0.0]], dtype=torch.float32, device=camera.device)
+        camera.set_world_poses_from_view(eyes, targets)
+        # the center of the image is at the origin of the ground
+        row, col = self.camera_cfg.pattern_cfg.height // 2, self.camera_cfg.pattern_cfg.width // 2
+        distance = torch.linalg.norm(eyes).item()
+
+        # update the camera
+        self.sim.step()
+        camera.update(self.dt)
+        self.assertAlmostEqual(camera.data.output["distance_to_image_plane"][0, row, col].item(), distance, places=2)
+
+        # register a box that covers the ground with its top at a height of 1
+        box = trimesh.creation.box(extents=(20.0, 20.0, 2.0))
+        RayCaster.register_meshes(
+            {"/World/defaultGroundPlane/box": convert_to_warp_mesh(box.vertices, box.faces, device=camera.device)}
+        )
+        try:
+            # update the camera
+            self.sim.step()
+            camera.update(self.dt)
+            # the center ray hits the top of the box
+            self.assertAlmostEqual(
+                camera.data.output["distance_to_image_plane"][0, row, col].item(),
+                distance * (POSITION[2] - 1.0) / POSITION[2],
+                places=2,
+            )
+        finally:
+            # unregister the box
+            RayCaster.unregister_meshes(["/World/defaultGroundPlane/box"])
+
+        # update the camera
+        self.sim.step()
+        camera.update(self.dt)
+        # the center ray hits the ground again
+        self.assertEqual(camera._static_mesh_prim_paths, ["/World/defaultGroundPlane"])
+        self.assertAlmostEqual(camera.data.output["distance_to_image_plane"][0, row, col].item(), distance, places=2)
+
     def test_intrinsic_matrix(self):
         """Checks that the camera's set and retrieve methods work for intrinsic matrix."""
         camera_cfg = copy.deepcopy(self.camera_cfg)
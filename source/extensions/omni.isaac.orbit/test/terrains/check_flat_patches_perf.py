@@ -0,0 +1,102 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+This script benchmarks the sampling of flat patches on the sub-terrains of a terrain.
+
+It compares sampling the patches of each sub-terrain separately, with one warp mesh per sub-terrain, to
+sampling the patches of all the sub-terrains at once on the combined terrain mesh, as done by
+:class:`omni.isaac.orbit.terrains.TerrainGenerator`.
+
+.. code-block:: bash
+
+    # Usage
+    ./orbit.sh -p source/extensions/omni.isaac.orbit/test/terrains/check_flat_patches_perf.py --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from omni.isaac.orbit.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark for the sampling of flat patches.")
+parser.add_argument("--num_rows", type=int, default=10, help="Number of rows of sub-terrains.")
+parser.add_argument("--num_cols", type=int, default=20, help="Number of columns of sub-terrains.")
+parser.add_argument("--num_patches", type=int, default=10, help="Number of patches per sub-terrain.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run the benchmark on.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import numpy as np
+import trimesh
+
+import warp as wp
+
+from omni.isaac.orbit.terrains import FlatPatchSamplingCfg
+from omni.isaac.orbit.terrains.config.rough import ROUGH_TERRAINS_CFG
+from omni.isaac.orbit.terrains.terrain_generator import TerrainGenerator
+from omni.isaac.orbit.terrains.utils import find_flat_patches, find_flat_patches_batched
+from omni.isaac.orbit.utils.timer import Timer
+from omni.isaac.orbit.utils.warp import convert_to_warp_mesh
+
+
+def main():
+    """Runs the benchmark."""
+    wp.init()
+    # generate the sub-terrains without flat patches
+    cfg = ROUGH_TERRAINS_CFG.replace(
+        seed=0, num_rows=args_cli.num_rows, num_cols=args_cli.num_cols, use_cache=False, color_scheme="none"
+    )
+    terrain_generator = TerrainGenerator(cfg)
+    # the sub-terrain meshes are in the frame of the terrain before it is centered
+    # note: the last mesh is the border of the terrain
+    sub_terrain_meshes = terrain_generator.terrain_meshes[:-1]
+    origins = np.stack([mesh.bounds.mean(axis=0) for mesh in sub_terrain_meshes])
+    patch_cfg = FlatPatchSamplingCfg(
+        num_patches=args_cli.num_patches, patch_radius=[0.1, 0.3, 0.5], max_height_diff=0.1, x_range=(-3.0, 3.0)
+    )
+    print(f"[INFO]: Sampling {args_cli.num_patches} flat patches on {len(sub_terrain_meshes)} sub-terrains.")
+
+    # sample the patches of each sub-terrain separately
+    with Timer() as timer:
+        for mesh, origin in zip(sub_terrain_meshes, origins):
+            wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=args_cli.device)
+            find_flat_patches(
+                wp_mesh,
+                num_patches=patch_cfg.num_patches,
+                patch_radius=patch_cfg.patch_radius,
+                origin=origin,
+                x_range=patch_cfg.x_range,
+                y_range=patch_cfg.y_range,
+                z_range=patch_cfg.z_range,
+                max_height_diff=patch_cfg.max_height_diff,
+            )
+    print(f"\tper sub-terrain: {timer.total_run_time:8.3f} s")
+
+    # sample the patches of all the sub-terrains at once
+    with Timer() as timer:
+        terrain_mesh = trimesh.util.concatenate(sub_terrain_meshes)
+        wp_mesh = convert_to_warp_mesh(terrain_mesh.vertices, terrain_mesh.faces, device=args_cli.device)
+        bounds = np.stack([mesh.bounds[:, :2] for mesh in sub_terrain_meshes])
+        find_flat_patches_batched(wp_mesh, [patch_cfg] * len(sub_terrain_meshes), origins, bounds)
+    print(f"\tbatched:         {timer.total_run_time:8.3f} s")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -0,0 +1,84 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+This script benchmarks the generation of the rough terrains with different numbers of worker processes.
+
+It also checks that the generated terrain is the same for all the numbers of workers.
+
+.. code-block:: bash
+
+    # Usage
+    ./orbit.sh -p source/extensions/omni.isaac.orbit/test/terrains/check_terrain_generator_perf.py --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from omni.isaac.orbit.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark for the parallel terrain generation.")
+parser.add_argument("--num_rows", type=int, default=20, help="Number of rows of sub-terrains.")
+parser.add_argument("--num_cols", type=int, default=20, help="Number of columns of sub-terrains.")
+parser.add_argument(
+    "--num_workers", type=int, nargs="+", default=[0, 2, 4, 8], help="Numbers of worker processes to benchmark."
+)
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import numpy as np
+
+from omni.isaac.orbit.terrains.config.rough import ROUGH_TERRAINS_CFG
+from omni.isaac.orbit.terrains.terrain_generator import TerrainGenerator
+from omni.isaac.orbit.utils.timer import Timer
+
+
+def main():
+    """Runs the benchmark."""
+    print(f"[INFO]: Generating rough terrains with {args_cli.num_rows} x {args_cli.num_cols} sub-terrains.")
+    for curriculum in [False, True]:
+        reference_mesh = None
+        for num_workers in args_cli.num_workers:
+            # configure the terrain generator
+            cfg = ROUGH_TERRAINS_CFG.replace(
+                seed=0,
+                curriculum=curriculum,
+                num_rows=args_cli.num_rows,
+                num_cols=args_cli.num_cols,
+                num_workers=num_workers,
+                use_cache=False,
+            )
+            # generate the terrain
+            with Timer() as timer:
+                terrain_generator = TerrainGenerator(cfg)
+            # check that the terrain matches the one generated in the main process
+            mesh = terrain_generator.terrain_mesh
+            if reference_mesh is None:
+                reference_mesh = mesh
+            is_identical = np.array_equal(mesh.vertices, reference_mesh.vertices) and np.array_equal(
+                mesh.faces, reference_mesh.faces
+            )
+            print(
+                f"\tcurriculum: {str(curriculum):<6}  workers: {num_workers:<3}  time: {timer.total_run_time:8.3f} s"
+                f"  identical: {is_identical}"
+            )
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
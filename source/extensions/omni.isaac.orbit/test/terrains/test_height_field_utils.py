@@ -0,0 +1,121 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.orbit.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import numpy as np
+import torch
+import trimesh
+import unittest
+
+import warp as wp
+
+from omni.isaac.orbit.terrains.height_field.utils import convert_height_field_to_mesh
+from omni.isaac.orbit.utils.warp import convert_to_warp_mesh, raycast_mesh
+
+
+def create_triangles_reference(num_rows: int, num_cols: int) -> np.ndarray:
+    """Creates the triangles of the height-field mesh row by row (previous implementation)."""
+    triangles = -np.ones((2 * (num_rows - 1) * (num_cols - 1), 3), dtype=np.uint32)
+    for i in range(num_rows - 1):
+        ind0 = np.arange(0, num_cols - 1) + i * num_cols
+        ind1 = ind0 + 1
+        ind2 = ind0 + num_cols
+        ind3 = ind2 + 1
+        start = 2 * i * (num_cols - 1)
+        stop = start + 2 * (num_cols - 1)
+        triangles[start:stop:2, 0] = ind0
+        triangles[start:stop:2, 1] = ind3
+        triangles[start:stop:2, 2] = ind1
+        triangles[start + 1 : stop : 2, 0] = ind0
+        triangles[start + 1 : stop : 2, 1] = ind2
+        triangles[start + 1 : stop : 2, 2] = ind3
+    return triangles
+
+
+def get_boundary_length(mesh: trimesh.Trimesh) -> float:
+    """Returns the total length of the edges that belong to a single triangle."""
+    edges, counts = np.unique(mesh.edges_sorted, axis=0, return_counts=True)
+    boundary = edges[counts == 1]
+    return np.linalg.norm(mesh.vertices[boundary[:, 0]] - mesh.vertices[boundary[:, 1]], axis=1).sum()
+
+
+class TestHeightFieldUtils(unittest.TestCase):
+    """Test the conversion of height fields to meshes."""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        # random height field
+        random_hf = rng.integers(0, 20, size=(41, 31), dtype=np.int16)
+        # stairs with a rough patch
+        x, y = np.meshgrid(np.arange(60), np.arange(50), indexing="ij")
+        stairs_hf = (np.minimum(np.minimum(x, 59 - x), np.minimum(y, 49 - y)) // 5 * 30).astype(np.int16)
+        stairs_hf[5:15, 30:45] += rng.integers(0, 5, size=(10, 15), dtype=np.int16)
+        self.height_fields = {"random": random_hf, "stairs": stairs_hf}
+
+    def test_convert_height_field_to_mesh(self):
+        """Test that the triangles match the previous implementation."""
+        for name, height_field in self.height_fields.items():
+            for slope_threshold in [None, 0.75]:
+                with self.subTest(height_field=name, slope_threshold=slope_threshold):
+                    vertices, triangles = convert_height_field_to_mesh(height_field, 0.1, 0.005, slope_threshold)
+                    # check the vertices
+                    self.assertEqual(vertices.shape, (height_field.size, 3))
+                    np.testing.assert_allclose(vertices[:, 2], height_field.reshape(-1) * 0.005)
+                    # check the triangles
+                    expected_triangles = create_triangles_reference(*height_field.shape)
+                    self.assertEqual(triangles.dtype, expected_triangles.dtype)
+                    np.testing.assert_array_equal(triangles, expected_triangles)
+
+    def test_simplify_flat_regions(self):
+        """Test that the simplified mesh has fewer triangles and describes the same surface."""
+        wp.init()
+        for name, height_field in self.height_fields.items():
+            for slope_threshold in [None, 0.75]:
+                with self.subTest(height_field=name, slope_threshold=slope_threshold):
+                    mesh = trimesh.Trimesh(
+                        *convert_height_field_to_mesh(height_field, 0.1, 0.005, slope_threshold), process=False
+                    )
+                    simplified_mesh = trimesh.Trimesh(
+                        *convert_height_field_to_mesh(height_field, 0.1, 0.005, slope_threshold, simplify=True),
+                        process=False,
+                    )
+                    # check the number of triangles
+                    if name == "stairs":
+                        self.assertLess(len(simplified_mesh.faces), len(mesh.faces))
+                    else:
+                        self.assertLessEqual(len(simplified_mesh.faces), len(mesh.faces))
+                    # check that all vertices are used
+                    self.assertEqual(len(np.unique(simplified_mesh.faces)), len(simplified_mesh.vertices))
+                    # check the area and the orientation of the surface
+                    self.assertAlmostEqual(simplified_mesh.area, mesh.area, places=6)
+                    np.testing.assert_allclose(
+                        simplified_mesh.area_faces @ simplified_mesh.face_normals,
+                        mesh.area_faces @ mesh.face_normals,
+                        atol=1e-6,
+                    )
+                    # check that there are no T-junctions: only the outer edges belong to a single triangle
+                    self.assertAlmostEqual(get_boundary_length(simplified_mesh), get_boundary_length(mesh), places=6)
+                    # check the heights of the surface
+                    ray_starts = torch.rand(1000, 3) * torch.tensor([*mesh.extents[:2], 0.0], dtype=torch.float)
+                    ray_starts[:, 2] = 10.0
+                    ray_directions = torch.zeros_like(ray_starts)
+                    ray_directions[:, 2] = -1.0
+                    heights = [
+                        raycast_mesh(ray_starts, ray_directions, convert_to_warp_mesh(m.vertices, m.faces, "cpu"))[0]
+                        for m in [mesh, simplified_mesh]
+                    ]
+                    torch.testing.assert_close(heights[1], heights[0], atol=1e-5, rtol=1e-5)
+
+
+if __name__ == "__main__":
+    run_tests()
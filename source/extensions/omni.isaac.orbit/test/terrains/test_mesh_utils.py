@@ -0,0 +1,97 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.orbit.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import numpy as np
+import trimesh
+import unittest
+
+from omni.isaac.orbit.terrains.trimesh.utils import (
+    make_border,
+    make_box,
+    make_boxes,
+    make_cone,
+    make_cones,
+    make_cylinder,
+    make_cylinders,
+    make_flat_border,
+    sample_random_orientation,
+)
+
+
+class TestMeshUtils(unittest.TestCase):
+    """Test the vectorized creation of object meshes."""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.num_objects = 50
+        self.centers = rng.uniform(0.0, 8.0, size=(self.num_objects, 3))
+        self.heights = rng.uniform(0.05, 0.5, size=self.num_objects)
+
+    def test_make_boxes(self):
+        """Test that the boxes created at once match the boxes created one by one."""
+        # create the boxes one by one
+        np.random.seed(0)
+        meshes = [
+            make_box(0.3, 0.2, height, center, max_yx_angle=20.0) for height, center in zip(self.heights, self.centers)
+        ]
+        expected_mesh = trimesh.util.concatenate(meshes)
+        # create the boxes at once with the same random numbers
+        np.random.seed(0)
+        euler_zyx = [sample_random_orientation(20.0) for _ in range(self.num_objects)]
+        mesh = make_boxes(0.3, 0.2, self.heights, self.centers, euler_zyx)
+        # check the meshes are identical
+        np.testing.assert_array_equal(mesh.vertices, expected_mesh.vertices)
+        np.testing.assert_array_equal(mesh.faces, expected_mesh.faces)
+
+    def test_make_cylinders_and_cones(self):
+        """Test that the cylinders and cones created at once match the ones created one by one."""
+        for make_object, make_objects in [(make_cylinder, make_cylinders), (make_cone, make_cones)]:
+            with self.subTest(object_type=make_object.__name__):
+                # create the objects one by one
+                np.random.seed(0)
+                meshes = [
+                    make_object(0.2, height, center, max_yx_angle=0.5, degrees=False)
+                    for height, center in zip(self.heights, self.centers)
+                ]
+                expected_mesh = trimesh.util.concatenate(meshes)
+                # create the objects at once with the same random numbers
+                np.random.seed(0)
+                euler_zyx, sections = list(), list()
+                for _ in range(self.num_objects):
+                    euler_zyx.append(sample_random_orientation(0.5, degrees=False))
+                    sections.append(np.random.randint(4, 6))
+                # check that both numbers of sections are tested
+                self.assertEqual(set(sections), {4, 5})
+                mesh = make_objects(0.2, self.heights, self.centers, euler_zyx, sections)
+                # check the meshes are identical
+                np.testing.assert_array_equal(mesh.vertices, expected_mesh.vertices)
+                np.testing.assert_array_equal(mesh.faces, expected_mesh.faces)
+
+    def test_make_flat_border(self):
+        """Test that the flat border matches the top faces of the border boxes."""
+        size, inner_size, position = (10.0, 6.0), (7.0, 4.0), (1.0, 2.0, 0.5)
+        mesh = make_flat_border(size, inner_size, position)
+        # select the top faces of the border boxes
+        expected_mesh = trimesh.util.concatenate(make_border(size, inner_size, 1.0, (*position[:2], 0.0)))
+        expected_mesh.update_faces(np.all(expected_mesh.triangles[:, :, 2] > 0.0, axis=1))
+        # check the number of triangles, the area and the normals
+        self.assertEqual(len(mesh.faces), len(expected_mesh.faces))
+        self.assertAlmostEqual(mesh.area, expected_mesh.area)
+        np.testing.assert_allclose(mesh.face_normals, np.tile([0.0, 0.0, 1.0], (len(mesh.faces), 1)), atol=1e-12)
+        np.testing.assert_allclose(mesh.vertices[:, 2], position[2])
+        np.testing.assert_allclose(mesh.bounds[:, :2], expected_mesh.bounds[:, :2])
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,139 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+# ignore private usage of variables warning
+# pyright: reportPrivateUsage=none
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.orbit.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import torch
+import unittest
+
+from omni.isaac.orbit.terrains import TerrainCurriculum, TerrainCurriculumCfg, TerrainImporter, TerrainImporterCfg
+
+
+class TestTerrainCurriculum(unittest.TestCase):
+    """Test the statistics and the sampling of the terrain curriculum."""
+
+    def setUp(self):
+        torch.manual_seed(0)
+        self.num_levels = 5
+        self.num_types = 3
+        self.cfg = TerrainCurriculumCfg()
+
+    def test_update(self):
+        """Test that the statistics of the tiles match the updates of the episodes one by one."""
+        curriculum = TerrainCurriculum(self.cfg, self.num_levels, self.num_types)
+        levels = torch.tensor([0, 0, 0, 2, 4])
+        types = torch.tensor([1, 1, 1, 0, 2])
+        success = torch.tensor([True, True, True, False, True])
+        curriculum.update(levels, types, success)
+        # check the visits
+        expected_counts = torch.zeros(self.num_levels, self.num_types, dtype=torch.long)
+        expected_counts[0, 1] = 3
+        expected_counts[2, 0] = 1
+        expected_counts[4, 2] = 1
+        torch.testing.assert_close(curriculum.visit_counts, expected_counts)
+        torch.testing.assert_close(curriculum.last_visits, (expected_counts > 0).long())
+        self.assertEqual(curriculum.num_updates, 1)
+        # check the success rates
+        expected_rates = torch.full((self.num_levels, self.num_types), self.cfg.initial_success_rate)
+        for level, type, value in zip(levels.tolist(), types.tolist(), success.float().tolist()):
+            expected_rates[level, type] += (1.0 - self.cfg.success_rate_decay) * (value - expected_rates[level, type])
+        torch.testing.assert_close(curriculum.success_rates, expected_rates)
+
+    def test_sampling_probs(self):
+        """Test that the sampling distribution favors the tiles with intermediate success rates."""
+        for keep_terrain_type in [True, False]:
+            with self.subTest(keep_terrain_type=keep_terrain_type):
+                cfg = self.cfg.replace(keep_terrain_type=keep_terrain_type, staleness_coeff=0.0)
+                curriculum = TerrainCurriculum(cfg, self.num_levels, self.num_types)
+                # initially, the tiles are favored from the lowest level
+                probs = curriculum.get_sampling_probs()
+                if keep_terrain_type:
+                    torch.testing.assert_close(probs.sum(dim=0), torch.ones(self.num_types))
+                    self.assertTrue(torch.all(probs[:-1] > probs[1:]))
+                else:
+                    torch.testing.assert_close(probs.sum(), torch.tensor(1.0))
+                    self.assertTrue(torch.all(probs.view(-1)[:-1] > probs.view(-1)[1:]))
+                # the tiles with intermediate success rates are favored
+                curriculum.success_rates[:] = 1.0
+                curriculum.success_rates[3, :] = 0.6
+                probs = curriculum.get_sampling_probs()
+                if keep_terrain_type:
+                    torch.testing.assert_close(probs.argmax(dim=0), torch.full((self.num_types,), 3))
+                else:
+                    self.assertEqual(int(probs.argmax()) // self.num_types, 3)
+
+    def test_staleness(self):
+        """Test that only the stale tiles are sampled with the staleness distribution."""
+        cfg = self.cfg.replace(staleness_coeff=1.0)
+        curriculum = TerrainCurriculum(cfg, self.num_levels, self.num_types)
+        # visit all the tiles but the last level
+        levels, types = torch.meshgrid(torch.arange(self.num_levels - 1), torch.arange(self.num_types), indexing="ij")
+        curriculum.update(levels.flatten(), types.flatten(), torch.ones(levels.numel()))
+        # sample the tiles
+        types = torch.arange(1000) % self.num_types
+        sampled_levels, sampled_types = curriculum.sample(types)
+        self.assertTrue(torch.all(sampled_levels == self.num_levels - 1))
+        torch.testing.assert_close(sampled_types, types)
+
+    def test_sample(self):
+        """Test the sampled tiles with and without keeping the terrain types."""
+        for keep_terrain_type in [True, False]:
+            with self.subTest(keep_terrain_type=keep_terrain_type):
+                cfg = self.cfg.replace(keep_terrain_type=keep_terrain_type)
+                curriculum = TerrainCurriculum(cfg, self.num_levels, self.num_types)
+                types = torch.arange(10000) % self.num_types
+                levels, sampled_types = curriculum.sample(types)
+                self.assertEqual(levels.shape, types.shape)
+                self.assertTrue(torch.all((levels >= 0) & (levels < self.num_levels)))
+                self.assertTrue(torch.all((sampled_types >= 0) & (sampled_types < self.num_types)))
+                if keep_terrain_type:
+                    torch.testing.assert_close(sampled_types, types)
+                else:
+                    self.assertEqual(len(torch.unique(sampled_types)), self.num_types)
+                # check the frequencies of the tiles
+                counts = torch.zeros(self.num_levels, self.num_types).index_put_(
+                    (levels, sampled_types), torch.ones(len(levels)), accumulate=True
+                )
+                probs = curriculum.get_sampling_probs()
+                expected_counts = probs * (len(types) / self.num_types if keep_terrain_type else len(types))
+                torch.testing.assert_close(counts, expected_counts, atol=0.1 * len(types) / self.num_types, rtol=0.1)
+
+    def test_importer(self):
+        """Test the resampling of the environment origins with the state of the importer set directly."""
+        num_envs = 32
+        # create the state of the importer
+        importer = TerrainImporter.__new__(TerrainImporter)
+        importer.cfg = TerrainImporterCfg(prim_path="/World/ground", num_envs=num_envs, curriculum=self.cfg)
+        importer.device = "cpu"
+        importer._tiled_terrain_generator = None
+        importer.terrain_origins = torch.rand(self.num_levels, self.num_types, 3)
+        importer.env_origins = torch.zeros(num_envs, 3)
+        importer.curriculum = TerrainCurriculum(self.cfg, self.num_levels, self.num_types)
+        importer.terrain_levels = torch.zeros(num_envs, dtype=torch.long)
+        importer.terrain_types = torch.arange(num_envs) % self.num_types
+        # resample the origins of half of the environments
+        env_ids = torch.arange(0, num_envs, 2)
+        importer.resample_env_origins(env_ids, torch.ones(len(env_ids), dtype=torch.bool))
+        # check the statistics
+        self.assertEqual(int(importer.curriculum.visit_counts.sum()), len(env_ids))
+        self.assertTrue(torch.all(importer.curriculum.success_rates[0] > self.cfg.initial_success_rate))
+        # check the origins
+        expected_origins = importer.terrain_origins[importer.terrain_levels, importer.terrain_types]
+        torch.testing.assert_close(importer.env_origins[env_ids], expected_origins[env_ids])
+        torch.testing.assert_close(importer.env_origins[1::2], torch.zeros(num_envs // 2, 3))
+
+
+if __name__ == "__main__":
+    run_tests()
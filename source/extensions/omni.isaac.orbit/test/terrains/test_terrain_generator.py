@@ -0,0 +1,605 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.orbit.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import multiprocessing
+import numpy as np
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+import torch
+import trimesh
+import unittest
+
+import warp as wp
+
+import omni.isaac.orbit.terrains as terrain_gen
+from omni.isaac.orbit.terrains import (
+    FlatPatchSamplingCfg,
+    TerrainCache,
+    TerrainGenerator,
+    TerrainGeneratorCfg,
+    TerrainSharedMemory,
+    TiledTerrainGenerator,
+    TiledTerrainGeneratorCfg,
+)
+from omni.isaac.orbit.terrains.utils import color_meshes_by_height, sample_height_map
+from omni.isaac.orbit.utils.warp import convert_to_warp_mesh, raycast_mesh
+
+
+def generate_shared_terrain(cfg: TerrainGeneratorCfg):
+    """Generates and publishes the terrain as the process with local rank 0."""
+    os.environ["LOCAL_RANK"] = "0"
+    TerrainGenerator(cfg)
+
+
+def generate_shared_terrain_vertices(cfg: TerrainGeneratorCfg, rank: int, delay: float, queue: multiprocessing.Queue):
+    """Generates or attaches to the shared terrain after a delay and sends the sum of its vertices."""
+    time.sleep(delay)
+    os.environ["LOCAL_RANK"] = str(rank)
+    queue.put((rank, TerrainGenerator(cfg).terrain_mesh.vertices.sum()))
+
+
+def get_run_id(queue: multiprocessing.Queue):
+    """Sends the run identifier of the process."""
+    queue.put(TerrainSharedMemory.get_run_id())
+
+
+def publish_arrays(shared_dir: str, key: str, data: dict[str, np.ndarray], delay: float):
+    """Publishes the arrays after a delay."""
+    time.sleep(delay)
+    TerrainSharedMemory(shared_dir, rank=0).publish(key, data)
+
+
+class LockedTerrainGenerator(TerrainGenerator):
+    """Terrain generator that holds a lock and thus cannot be pickled."""
+
+    def _configure_sub_terrains(self):
+        self._lock = threading.Lock()
+        super()._configure_sub_terrains()
+
+
+class TestTerrainGenerator(unittest.TestCase):
+    """Test the generation of the terrains."""
+
+    def setUp(self):
+        self.cfg = TerrainGeneratorCfg(
+            seed=0,
+            size=(8.0, 8.0),
+            border_width=2.0,
+            num_rows=3,
+            num_cols=4,
+            sub_terrains={
+                "boxes": terrain_gen.MeshRandomGridTerrainCfg(
+                    proportion=0.5,
+                    grid_width=0.45,
+                    grid_height_range=(0.05, 0.2),
+                    platform_width=2.0,
+                    flat_patch_sampling={
+                        "target": FlatPatchSamplingCfg(num_patches=5, patch_radius=[0.2, 0.4], max_height_diff=0.01)
+                    },
+                ),
+                "random_rough": terrain_gen.HfRandomUniformTerrainCfg(
+                    proportion=0.5,
+                    noise_range=(0.02, 0.10),
+                    noise_step=0.02,
+                    border_width=0.25,
+                    flat_patch_sampling={
+                        "root_spawn": FlatPatchSamplingCfg(num_patches=8, patch_radius=0.5, max_height_diff=0.2)
+                    },
+                ),
+            },
+        )
+
+    def test_parallel_generation(self):
+        """Test that the generated terrain does not depend on the number of worker processes."""
+        for curriculum in [False, True]:
+            with self.subTest(curriculum=curriculum):
+                # generate the terrain in the main process
+                self.cfg.curriculum = curriculum
+                self.cfg.num_workers = 0
+                expected = TerrainGenerator(self.cfg)
+                # generate the terrain in worker processes
+                self.cfg.num_workers = 2
+                terrain = TerrainGenerator(self.cfg)
+                # check the terrain
+                np.testing.assert_array_equal(terrain.terrain_mesh.vertices, expected.terrain_mesh.vertices)
+                np.testing.assert_array_equal(terrain.terrain_mesh.faces, expected.terrain_mesh.faces)
+                np.testing.assert_array_equal(terrain.terrain_origins, expected.terrain_origins)
+                torch.testing.assert_close(terrain.flat_patches["root_spawn"], expected.flat_patches["root_spawn"])
+
+    def test_parallel_generation_without_generator(self):
+        """Test that the worker processes do not receive the terrain generator.
+
+        The terrain generator holds a lock, which cannot be pickled. The workers are forked and only receive the
+        arguments of the sub-terrains, so that the generation succeeds and matches the serial generation.
+        """
+        with self.assertRaises(TypeError):
+            pickle.dumps(LockedTerrainGenerator(self.cfg))
+        # generate the terrain in worker processes
+        self.cfg.num_workers = 2
+        terrain = LockedTerrainGenerator(self.cfg)
+        # check the terrain
+        self.cfg.num_workers = 0
+        self._check_terrains_equal(terrain, TerrainGenerator(self.cfg))
+
+    def test_flat_patches(self):
+        """Test that the flat patches sampled at once on the terrain lie on flat regions of their sub-terrain."""
+        wp.init()
+        terrain = TerrainGenerator(self.cfg)
+        wp_mesh = convert_to_warp_mesh(terrain.terrain_mesh.vertices, terrain.terrain_mesh.faces, device="cpu")
+        # offsets of the points around the patches
+        angle = torch.linspace(0, 2 * np.pi, 10)
+        ring = torch.stack([torch.cos(angle), torch.sin(angle), torch.zeros_like(angle)], dim=-1)
+        for name, num_patches, radius, max_height_diff in [("root_spawn", 8, 0.5, 0.2), ("target", 5, 0.4, 0.01)]:
+            with self.subTest(name=name):
+                patches = terrain.flat_patches[name]
+                self.assertEqual(patches.shape, (self.cfg.num_rows, self.cfg.num_cols, num_patches, 3))
+                # check the sub-terrains with patches of this type
+                # note: the patches of the other sub-terrains are at their origins
+                offsets = patches - torch.tensor(terrain.terrain_origins, dtype=torch.float).unsqueeze(2)
+                has_patches = torch.any(offsets != 0, dim=-1).all(dim=-1)
+                self.assertTrue(has_patches.any())
+                patches = patches[has_patches]
+                # check that the patches lie within their sub-terrain
+                # note: the sub-terrain origins are at the center of the sub-terrains
+                offsets = offsets[has_patches][..., :2].abs()
+                self.assertTrue(torch.all(offsets <= torch.tensor(self.cfg.size) * 0.5 - radius))
+                # check the height difference of the points around the patches
+                points = patches.view(-1, 1, 3) + radius * ring
+                points[..., 2] = 10.0
+                directions = torch.zeros_like(points)
+                directions[..., 2] = -1.0
+                heights = raycast_mesh(points.view(-1, 3), directions.view(-1, 3), wp_mesh)[0][:, 2]
+                heights = heights.view(points.shape[:-1])
+                self.assertTrue(torch.all(heights.max(dim=-1)[0] - heights.min(dim=-1)[0] <= max_height_diff + 1e-5))
+                torch.testing.assert_close(patches.view(-1, 3)[:, 2], heights[:, -1], atol=1e-4, rtol=1e-4)
+
+    def test_color_by_height(self):
+        """Test that the colors looked up by height match the interpolated color map."""
+        terrain = TerrainGenerator(self.cfg)
+        mesh = terrain.terrain_mesh
+        # interpolate the color map for each vertex
+        heights = mesh.vertices[:, 2]
+        heights = np.clip((heights - heights.min()) / (heights.max() - heights.min()), 0.1, 0.9)
+        expected_colors = trimesh.visual.color.interpolate(heights, color_map="viridis")
+        # color the mesh in place
+        colored_mesh = color_meshes_by_height(mesh, color_map="viridis")
+        self.assertIs(colored_mesh, mesh)
+        colors = colored_mesh.visual.vertex_colors
+        self.assertEqual(colors.dtype, np.uint8)
+        self.assertLessEqual(np.abs(colors.astype(int) - expected_colors.astype(int)).max(), 1)
+
+    def test_height_map(self):
+        """Test that the heights sampled from the height map match the heights obtained by ray-casting."""
+        wp.init()
+        # use height-field sub-terrains without vertical walls, whose surface is linear along the lines of the
+        # height map
+        self.cfg.sub_terrains = {"random_rough": self.cfg.sub_terrains["random_rough"].replace(proportion=1.0)}
+        self.cfg.slope_threshold = None
+        terrain = TerrainGenerator(self.cfg)
+        height_map, origin = terrain.get_height_map()
+        # check the extent of the height map
+        bounds = terrain.terrain_mesh.bounds
+        torch.testing.assert_close(origin, torch.tensor(bounds[0, :2], dtype=torch.float))
+        expected_shape = np.round((bounds[1, :2] - bounds[0, :2]) / self.cfg.horizontal_scale).astype(int) + 1
+        self.assertEqual(height_map.shape, tuple(expected_shape))
+        self.assertTrue(torch.all(torch.isfinite(height_map)))
+        # sample points on the lines of the height map
+        num_points = 2000
+        points = origin + torch.rand(num_points, 2) * (torch.tensor(height_map.shape) - 1) * self.cfg.horizontal_scale
+        on_x_lines = torch.arange(num_points) % 2 == 0
+        points[on_x_lines, 0] = (points[on_x_lines, 0] - origin[0]).div(0.1).round() * 0.1 + origin[0]
+        points[~on_x_lines, 1] = (points[~on_x_lines, 1] - origin[1]).div(0.1).round() * 0.1 + origin[1]
+        heights = sample_height_map(height_map, origin, self.cfg.horizontal_scale, points)
+        # ray-cast the terrain mesh at the same points
+        wp_mesh = convert_to_warp_mesh(terrain.terrain_mesh.vertices, terrain.terrain_mesh.faces, device="cpu")
+        ray_starts = torch.cat([points, torch.full((num_points, 1), 10.0)], dim=-1)
+        ray_directions = torch.zeros_like(ray_starts)
+        ray_directions[:, 2] = -1.0
+        expected_heights = raycast_mesh(ray_starts, ray_directions, wp_mesh)[0][:, 2]
+        torch.testing.assert_close(heights, expected_heights, atol=1e-4, rtol=1e-4)
+        # check that the points outside the height map are missed
+        outside_points = torch.stack([origin - 0.05, origin + torch.tensor(height_map.shape) * 0.1])
+        self.assertTrue(torch.all(torch.isinf(sample_height_map(height_map, origin, 0.1, outside_points))))
+
+    def test_sub_terrain_seeds(self):
+        """Test that the seeds of the sub-terrains are reproducible and different for each sub-terrain."""
+        seeds = [
+            TerrainGenerator._get_sub_terrain_seed(0, row, col)
+            for row in range(self.cfg.num_rows)
+            for col in range(self.cfg.num_cols)
+        ]
+        self.assertEqual(len(set(seeds)), len(seeds))
+        self.assertEqual(seeds[0], TerrainGenerator._get_sub_terrain_seed(0, 0, 0))
+        self.assertNotEqual(seeds[0], TerrainGenerator._get_sub_terrain_seed(1, 0, 0))
+
+    def test_cache(self):
+        """Test that the terrains loaded from the cache are identical to the generated terrains."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.cfg.use_cache = True
+            self.cfg.cache_dir = cache_dir
+            self.cfg.color_scheme = "random"
+            # generate the terrain and fill the cache
+            expected = TerrainGenerator(self.cfg)
+            # check the entries of the cache
+            entries = os.listdir(cache_dir)
+            terrain_entries = [name for name in entries if name.startswith("terrain_")]
+            self.assertEqual(len(terrain_entries), 1)
+            self.assertEqual(len(entries), 1 + self.cfg.num_rows * self.cfg.num_cols)
+            # load the complete terrain from the cache
+            # note: the number of workers does not change the cached terrain
+            self.cfg.num_workers = 2
+            terrain = TerrainGenerator(self.cfg)
+            self.assertEqual(len(terrain.terrain_meshes), 0)
+            self._check_terrains_equal(terrain, expected)
+            np.testing.assert_array_equal(
+                terrain.terrain_mesh.visual.vertex_colors, expected.terrain_mesh.visual.vertex_colors
+            )
+            # load the sub-terrains from the cache
+            shutil.rmtree(os.path.join(cache_dir, terrain_entries[0]))
+            terrain = TerrainGenerator(self.cfg)
+            self.assertGreater(len(terrain.terrain_meshes), 0)
+            self._check_terrains_equal(terrain, expected)
+
+    def test_cache_without_seed(self):
+        """Test that the complete terrain is not cached if no seed is specified."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.cfg.seed = None
+            self.cfg.use_cache = True
+            self.cfg.cache_dir = cache_dir
+            # generate the terrain twice
+            expected = TerrainGenerator(self.cfg)
+            terrain = TerrainGenerator(self.cfg)
+            # check that only the sub-terrains are cached
+            self.assertFalse(any(name.startswith("terrain_") for name in os.listdir(cache_dir)))
+            self.assertGreater(len(terrain.terrain_meshes), 0)
+            # check that the terrains are sampled again
+            self.assertFalse(np.array_equal(terrain.terrain_origins, expected.terrain_origins))
+
+    def test_shared_memory(self):
+        """Test that the processes with a non-zero local rank attach to the terrain published by rank 0."""
+        expected = TerrainGenerator(self.cfg)
+        terrain_key = f"terrain_{expected._get_terrain_hash()}"
+        with tempfile.TemporaryDirectory() as shared_dir:
+            self.cfg.use_shared_memory = True
+            self.cfg.shared_memory_dir = shared_dir
+            self.cfg.shared_memory_timeout = 60.0
+            # generate the terrain in another process with the local rank 0
+            process = multiprocessing.get_context("fork").Process(target=generate_shared_terrain, args=(self.cfg,))
+            process.start()
+            # attach to the terrain as the process with the local rank 1
+            local_rank = os.environ.get("LOCAL_RANK")
+            os.environ["LOCAL_RANK"] = "1"
+            try:
+                terrain = TerrainGenerator(self.cfg)
+            finally:
+                if local_rank is None:
+                    os.environ.pop("LOCAL_RANK")
+                else:
+                    os.environ["LOCAL_RANK"] = local_rank
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+            # check the terrain
+            self.assertEqual(len(terrain.terrain_meshes), 0)
+            self.assertEqual(len(os.listdir(shared_dir)), 1)
+            self._check_terrains_equal(terrain, expected)
+            # the process with the local rank 0 attaches to the terrain published by a previous run
+            terrain = TerrainGenerator(self.cfg)
+            self.assertEqual(len(terrain.terrain_meshes), 0)
+            self._check_terrains_equal(terrain, expected)
+            # the process with the local rank 0 generates the terrain again if the reuse is disabled
+            self.cfg.shared_memory_reuse = False
+            terrain = TerrainGenerator(self.cfg)
+            self.assertGreater(len(terrain.terrain_meshes), 0)
+            self._check_terrains_equal(terrain, expected)
+            # the terrain is published for the run and removed when the process exits
+            # note: the terrain published by the previous run is kept for the runs that reuse it
+            self.assertEqual(len(os.listdir(shared_dir)), 2)
+            self.assertTrue(os.path.isdir(terrain._shared_memory.get_path(terrain_key)))
+            terrain._shared_memory.close()
+            self.assertEqual(len(os.listdir(shared_dir)), 1)
+            self.assertFalse(os.path.isdir(terrain._shared_memory.get_path(terrain_key)))
+
+    def test_shared_memory_stale_terrain(self):
+        """Test that the processes of a run never attach to the stale terrains of previous runs."""
+        self.cfg.shared_memory_reuse = False
+        expected = TerrainGenerator(self.cfg)
+        stale_data = expected._get_terrain_data()
+        stale_data["vertices"] = stale_data["vertices"] + 1.0
+        terrain_key = f"terrain_{expected._get_terrain_hash()}"
+        with tempfile.TemporaryDirectory() as shared_dir:
+            self.cfg.use_shared_memory = True
+            self.cfg.shared_memory_dir = shared_dir
+            self.cfg.shared_memory_timeout = 60.0
+            # stale terrains left by a previous run that reused the terrain and by a previous run that crashed
+            TerrainSharedMemory(shared_dir, rank=0).publish(terrain_key, stale_data)
+            TerrainSharedMemory(shared_dir, rank=0, persistent=False, run_id="previous").publish(
+                terrain_key, stale_data
+            )
+            # launch the processes of a run: the other rank starts before the rank 0
+            context = multiprocessing.get_context("fork")
+            queue = context.Queue()
+            processes = [
+                context.Process(target=generate_shared_terrain_vertices, args=(self.cfg, rank, delay, queue))
+                for rank, delay in [(1, 0.0), (0, 0.5)]
+            ]
+            for process in processes:
+                process.start()
+            results = dict(queue.get(timeout=120.0) for _ in processes)
+            for process in processes:
+                process.join()
+                self.assertEqual(process.exitcode, 0)
+            # check that both processes use the terrain of the run
+            self.assertAlmostEqual(results[0], expected.terrain_mesh.vertices.sum())
+            self.assertAlmostEqual(results[1], expected.terrain_mesh.vertices.sum())
+
+    """
+    Helper functions.
+    """
+
+    def _check_terrains_equal(self, terrain: TerrainGenerator, expected: TerrainGenerator):
+        """Check that the meshes, origins and flat patches of two terrains are equal."""
+        np.testing.assert_array_equal(terrain.terrain_mesh.vertices, expected.terrain_mesh.vertices)
+        np.testing.assert_array_equal(terrain.terrain_mesh.faces, expected.terrain_mesh.faces)
+        np.testing.assert_array_equal(terrain.terrain_origins, expected.terrain_origins)
+        self.assertEqual(terrain.flat_patches.keys(), expected.flat_patches.keys())
+        for name in expected.flat_patches:
+            torch.testing.assert_close(terrain.flat_patches[name], expected.flat_patches[name])
+
+
+class TestTiledTerrainGenerator(unittest.TestCase):
+    """Test the generation of the terrains on demand."""
+
+    def setUp(self):
+        self.cfg = TiledTerrainGeneratorCfg(
+            seed=0,
+            size=(8.0, 8.0),
+            border_width=2.0,
+            num_rows=4,
+            num_cols=5,
+            max_num_tiles=3,
+            sub_terrains={
+                "pyramid": terrain_gen.MeshPyramidStairsTerrainCfg(
+                    proportion=0.5, step_height_range=(0.05, 0.2), step_width=0.3, platform_width=2.0
+                ),
+                "random_rough": terrain_gen.HfRandomUniformTerrainCfg(
+                    proportion=0.5,
+                    noise_range=(0.02, 0.10),
+                    noise_step=0.02,
+                    border_width=0.25,
+                    flat_patch_sampling={
+                        "root_spawn": FlatPatchSamplingCfg(num_patches=8, patch_radius=0.5, max_height_diff=0.2)
+                    },
+                ),
+            },
+        )
+
+    def test_tiles(self):
+        """Test that the tiles match the sub-terrains of the terrain generator."""
+        for curriculum in [False, True]:
+            with self.subTest(curriculum=curriculum):
+                self.cfg.curriculum = curriculum
+                # generate all the sub-terrains at once
+                expected = TerrainGenerator(self.cfg)
+                expected_meshes = {
+                    tuple(np.floor(mesh.bounds.mean(axis=0)[:2] / self.cfg.size).astype(int)): mesh
+                    for mesh in expected.terrain_meshes[:-1]
+                }
+                # generate a few tiles on demand
+                terrain = TiledTerrainGenerator(self.cfg)
+                self.assertFalse(terrain.is_generated.any())
+                rows, cols = np.array([0, 3, 1, 1]), np.array([0, 4, 2, 2])
+                origins = terrain.get_tile_origins(rows, cols)
+                self.assertEqual(terrain.is_generated.sum(), 3)
+                np.testing.assert_allclose(origins, expected.terrain_origins[rows, cols])
+                # check the meshes in the terrain frame
+                offset = np.array([self.cfg.size[0] * self.cfg.num_rows, self.cfg.size[1] * self.cfg.num_cols, 0]) / 2
+                for row, col in zip(rows, cols):
+                    mesh = terrain.get_tile_mesh(row, col)
+                    np.testing.assert_allclose(mesh.vertices + offset, expected_meshes[(row, col)].vertices)
+                    np.testing.assert_array_equal(mesh.faces, expected_meshes[(row, col)].faces)
+                # check the border
+                np.testing.assert_allclose(terrain.border_mesh.vertices + offset, expected.terrain_meshes[-1].vertices)
+
+    def test_lru(self):
+        """Test that the least recently used tiles are released and generated again when queried."""
+        terrain = TiledTerrainGenerator(self.cfg)
+        first_mesh = terrain.get_tile_mesh(0, 0).copy()
+        origins = terrain.get_tile_origins([0, 0, 1, 2], [0, 1, 1, 2])
+        flat_patches = terrain.get_tile_flat_patches([0, 0, 1, 2], [0, 1, 1, 2])
+        self.assertEqual(terrain.num_tiles_in_memory, self.cfg.max_num_tiles)
+        self.assertEqual(terrain.is_generated.sum(), 4)
+        # generate the first tile again
+        mesh = terrain.get_tile_mesh(0, 0)
+        self.assertEqual(terrain.num_tiles_in_memory, self.cfg.max_num_tiles)
+        np.testing.assert_array_equal(mesh.vertices, first_mesh.vertices)
+        np.testing.assert_array_equal(mesh.faces, first_mesh.faces)
+        # check that the origins and the flat patches are kept
+        np.testing.assert_array_equal(terrain.get_tile_origins([0, 0, 1, 2], [0, 1, 1, 2]), origins)
+        new_flat_patches = terrain.get_tile_flat_patches([0, 0, 1, 2], [0, 1, 1, 2])
+        torch.testing.assert_close(new_flat_patches["root_spawn"], flat_patches["root_spawn"])
+        # check that the flat patches lie within their tile
+        offsets = flat_patches["root_spawn"] - torch.tensor(origins, dtype=torch.float).unsqueeze(1)
+        has_patches = torch.any(offsets != 0, dim=-1).all(dim=-1)
+        self.assertTrue(has_patches.any())
+        self.assertTrue(torch.all(offsets[has_patches][..., :2].abs() <= self.cfg.size[0] * 0.5))
+        # check the warp mesh of the tile
+        wp.init()
+        wp_mesh = terrain.get_tile_warp_mesh(0, 0)
+        self.assertEqual(wp_mesh.points.shape[0], len(mesh.vertices))
+
+    def test_height_map(self):
+        """Test that the height map of the tiles in memory matches the height map of the terrain generator."""
+        wp.init()
+        self.cfg.max_num_tiles = self.cfg.num_rows * self.cfg.num_cols
+        expected_height_map, expected_origin = TerrainGenerator(self.cfg).get_height_map()
+        # generate a single tile
+        terrain = TiledTerrainGenerator(self.cfg)
+        terrain.generate_tiles([1], [2])
+        height_map, origin = terrain.get_height_map()
+        torch.testing.assert_close(origin, expected_origin)
+        self.assertEqual(height_map.shape, expected_height_map.shape)
+        # check that only the tile and the border are covered
+        tile_size = int(round(self.cfg.size[0] / self.cfg.horizontal_scale))
+        border_size = int(round(self.cfg.border_width / self.cfg.horizontal_scale))
+        tile = (
+            slice(border_size + tile_size + 1, border_size + 2 * tile_size),
+            slice(border_size + 2 * tile_size + 1, border_size + 3 * tile_size),
+        )
+        torch.testing.assert_close(height_map[tile], expected_height_map[tile])
+        torch.testing.assert_close(height_map[:border_size], expected_height_map[:border_size])
+        self.assertTrue(torch.all(torch.isinf(height_map[border_size + 1 : border_size + tile_size, border_size + 1])))
+        # generate all the tiles
+        terrain.generate_tiles(*np.indices((self.cfg.num_rows, self.cfg.num_cols)))
+        height_map, _ = terrain.get_height_map()
+        torch.testing.assert_close(height_map, expected_height_map)
+
+
+class TestTerrainCache(unittest.TestCase):
+    """Test the binary cache of the terrains."""
+
+    def test_save_load(self):
+        """Test saving and loading the entries of the cache."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = TerrainCache(cache_dir)
+            data = {"vertices": np.random.rand(10, 3), "faces": np.arange(30, dtype=np.int64).reshape(10, 3)}
+            # save the entry
+            self.assertFalse(cache.contains("entry"))
+            self.assertIsNone(cache.load("entry"))
+            cache.save("entry", data)
+            self.assertTrue(cache.contains("entry"))
+            # load the entry
+            loaded_data = cache.load("entry")
+            self.assertEqual(loaded_data.keys(), data.keys())
+            for name, value in data.items():
+                np.testing.assert_array_equal(loaded_data[name], value)
+            # modifying the loaded arrays does not change the cache
+            loaded_data["vertices"][:] = 0.0
+            np.testing.assert_array_equal(cache.load("entry")["vertices"], data["vertices"])
+
+    def test_evict(self):
+        """Test removing the least recently used entries."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = TerrainCache(cache_dir, max_size_mb=2.5)
+            # save entries of 1 MB each
+            for index in range(4):
+                cache.save(f"entry_{index}", {"data": np.zeros(1024**2, dtype=np.uint8)})
+                # ensure distinct modification times
+                os.utime(os.path.join(cache_dir, f"entry_{index}"), (index, index))
+            # use the first entry
+            time.sleep(0.01)
+            cache.load("entry_0")
+            # remove the least recently used entries
+            cache.evict()
+            self.assertEqual(sorted(os.listdir(cache_dir)), ["entry_0", "entry_3"])
+            self.assertLessEqual(cache.size, 2.5 * 1024**2)
+
+
+class TestTerrainSharedMemory(unittest.TestCase):
+    """Test the handoff of the terrains between processes."""
+
+    def test_publish_attach(self):
+        """Test attaching to the arrays published by another process."""
+        with tempfile.TemporaryDirectory() as shared_dir:
+            shared_memory = TerrainSharedMemory(shared_dir, rank=1, timeout=60.0)
+            self.assertFalse(shared_memory.is_publisher)
+            data = {"vertices": np.random.rand(10, 3), "faces": np.arange(30, dtype=np.int64).reshape(10, 3)}
+            # publish the arrays in another process after a delay
+            process = multiprocessing.get_context("fork").Process(
+                target=publish_arrays, args=(shared_dir, "entry", data, 0.5)
+            )
+            process.start()
+            self.assertIsNone(shared_memory.attach("entry", wait=False))
+            # wait for the arrays
+            attached_data = shared_memory.attach("entry")
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+            self.assertTrue(shared_memory.contains("entry"))
+            # check that the arrays are mapped and not copied
+            self.assertEqual(attached_data.keys(), data.keys())
+            for name, value in data.items():
+                self.assertIsInstance(attached_data[name], np.memmap)
+                np.testing.assert_array_equal(attached_data[name], value)
+            # remove the entry
+            shared_memory.unlink("entry")
+            self.assertFalse(shared_memory.contains("entry"))
+            np.testing.assert_array_equal(attached_data["vertices"], data["vertices"])
+
+    def test_evict(self):
+        """Test that the least recently used entries are removed after publishing an entry."""
+        with tempfile.TemporaryDirectory() as shared_dir:
+            shared_memory = TerrainSharedMemory(shared_dir, rank=0, max_size_mb=2.5)
+            # publish entries of 1 MB each
+            for index in range(4):
+                shared_memory.publish(f"entry_{index}", {"data": np.zeros(1024**2, dtype=np.uint8)})
+                # note: the modification times must differ to sort the entries
+                time.sleep(0.01)
+            self.assertEqual(sorted(os.listdir(shared_dir)), ["entry_2", "entry_3"])
+            # the published entry is kept even if it exceeds the maximum size
+            shared_memory.publish("entry_4", {"data": np.zeros(3 * 1024**2, dtype=np.uint8)})
+            self.assertEqual(os.listdir(shared_dir), ["entry_4"])
+
+    def test_close(self):
+        """Test that the entries are removed on close if they are not persistent."""
+        with tempfile.TemporaryDirectory() as shared_dir:
+            data = {"data": np.zeros(10)}
+            # persistent entries are kept
+            shared_memory = TerrainSharedMemory(shared_dir, rank=0)
+            shared_memory.publish("persistent", data)
+            shared_memory.close()
+            self.assertTrue(shared_memory.contains("persistent"))
+            # other entries are removed
+            shared_memory = TerrainSharedMemory(shared_dir, rank=0, persistent=False)
+            shared_memory.publish("entry", data)
+            attached_data = shared_memory.attach("entry")
+            shared_memory.close()
+            self.assertFalse(shared_memory.contains("entry"))
+            self.assertEqual(os.listdir(shared_dir), ["persistent"])
+            np.testing.assert_array_equal(attached_data["data"], data["data"])
+
+    def test_run_id(self):
+        """Test that the entries that are not persistent are scoped to the processes of a run."""
+        # the processes launched by the same parent share the run identifier
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        processes = [context.Process(target=get_run_id, args=(queue,)) for _ in range(2)]
+        for process in processes:
+            process.start()
+        run_ids = [queue.get(timeout=60.0) for _ in processes]
+        for process in processes:
+            process.join()
+        self.assertEqual(run_ids[0], run_ids[1])
+        self.assertNotEqual(run_ids[0], TerrainSharedMemory.get_run_id())
+        # the entries of other runs are not attached to
+        with tempfile.TemporaryDirectory() as shared_dir:
+            data = {"data": np.zeros(10)}
+            TerrainSharedMemory(shared_dir, rank=0, persistent=False, run_id="previous").publish("entry", data)
+            shared_memory = TerrainSharedMemory(shared_dir, rank=1, persistent=False, run_id="current")
+            self.assertIsNone(shared_memory.attach("entry", wait=False))
+            TerrainSharedMemory(shared_dir, rank=0, persistent=False, run_id="current").publish("entry", data)
+            self.assertIsNotNone(shared_memory.attach("entry", wait=False))
+
+    def test_timeout(self):
+        """Test that attaching to an entry that is never published raises an error."""
+        with tempfile.TemporaryDirectory() as shared_dir:
+            shared_memory = TerrainSharedMemory(shared_dir, rank=1, timeout=0.2)
+            with self.assertRaises(TimeoutError):
+                shared_memory.attach("entry")
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -24,6 +24,7 @@ from omni.isaac.core.objects import DynamicSphere
 from omni.isaac.core.prims import GeometryPrim, RigidPrim, RigidPrimView
 
 import omni.isaac.orbit.terrains as terrain_gen
+from omni.isaac.orbit.sensors.ray_caster import RayCaster
 from omni.isaac.orbit.sim import SimulationContext, build_simulation_context
 from omni.isaac.orbit.terrains import TerrainImporter, TerrainImporterCfg
 from omni.isaac.orbit.terrains.config.rough import ROUGH_TERRAINS_CFG
@@ -94,6 +95,47 @@ class TestTerrainImporter(unittest.TestCase):
                 self.assertAlmostEqual(actualSize[0], expectedSizeX)
                 self.assertAlmostEqual(actualSize[1], expectedSizeY)
 
+    def test_tiled_terrain(self) -> None:
+        """Tests that the used tiles are imported, registered for the ray-casters and released afterwards."""
+        for device in ("cuda:0", "cpu"):
+            with build_simulation_context(device=device, auto_add_lighting=True) as _:
+                # Handler for terrains importing
+                terrain_importer_cfg = terrain_gen.TerrainImporterCfg(
+                    prim_path="/World/ground",
+                    max_init_terrain_level=0,
+                    terrain_type="generator",
+                    terrain_generator=terrain_gen.TiledTerrainGeneratorCfg(
+                        seed=0,
+                        size=(8.0, 8.0),
+                        border_width=2.0,
+                        num_rows=4,
+                        num_cols=1,
+                        max_num_tiles=2,
+                        sub_terrains={"flat": terrain_gen.MeshPlaneTerrainCfg(proportion=1.0)},
+                    ),
+                    num_envs=1,
+                )
+                terrain_importer = TerrainImporter(terrain_importer_cfg)
+                # check that the border and the used tile are imported and registered
+                self.assertEqual(set(terrain_importer.meshes.keys()), {"border", "tile_0_0"})
+                self.assertIn("/World/ground/border", RayCaster.meshes)
+                self.assertIn("/World/ground/tile_0_0", RayCaster.meshes)
+
+                # move the environment through the levels
+                env_ids = torch.tensor([0], device=terrain_importer.device)
+                move_up = torch.tensor([True], device=terrain_importer.device)
+                for level in range(1, 4):
+                    terrain_importer.update_env_origins(env_ids, move_up, ~move_up)
+                    # check that only the most recently used tiles are kept
+                    tile_keys = {f"tile_{row}_0" for row in (level - 1, level)}
+                    self.assertEqual(set(terrain_importer.meshes.keys()), {"border"} | tile_keys)
+                    for row in range(4):
+                        prim_path = f"/World/ground/tile_{row}_0"
+                        self.assertEqual(prim_utils.is_prim_path_valid(prim_path), f"tile_{row}_0" in tile_keys)
+                        self.assertEqual(prim_path in RayCaster.meshes, f"tile_{row}_0" in tile_keys)
+                # clear the meshes shared by the ray-cast sensors
+                RayCaster.unregister_meshes(list(RayCaster.meshes.keys()))
+
     def test_plane(self) -> None:
         """Generates a plane and tests that the resulting mesh has the correct size."""
         for device in ("cuda:0", "cpu"):
@@ -0,0 +1,89 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.orbit.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import torch
+import unittest
+
+from omni.isaac.orbit.utils.buffers import CircularBuffer
+
+
+class TestCircularBuffer(unittest.TestCase):
+    """Test fixture for checking the circular buffer."""
+
+    def setUp(self):
+        self.max_len = 5
+        self.batch_size = 3
+        self.device = "cpu"
+        self.buffer = CircularBuffer(self.max_len, self.batch_size, self.device)
+
+    def test_initialization(self):
+        """Test the buffer properties before appending data."""
+        self.assertEqual(self.buffer.max_length, self.max_len)
+        self.assertEqual(self.buffer.batch_size, self.batch_size)
+        self.assertEqual(self.buffer.current_length.tolist(), [0] * self.batch_size)
+        # reading an empty buffer is not allowed
+        with self.assertRaises(RuntimeError):
+            self.buffer.buffer
+        # invalid maximum length
+        with self.assertRaises(ValueError):
+            CircularBuffer(0, self.batch_size, self.device)
+
+    def test_append_and_order(self):
+        """Test that the history is ordered from the oldest to the newest entry."""
+        for i in range(7):
+            self.buffer.append(torch.full((self.batch_size, 2), float(i), device=self.device))
+        # check the history
+        expected = torch.arange(2, 7, dtype=torch.float, device=self.device)
+        expected = expected.view(1, -1, 1).expand(self.batch_size, -1, 2)
+        torch.testing.assert_close(self.buffer.buffer, expected)
+        self.assertEqual(self.buffer.current_length.tolist(), [self.max_len] * self.batch_size)
+        # invalid batch size
+        with self.assertRaises(ValueError):
+            self.buffer.append(torch.zeros(self.batch_size + 1, 2, device=self.device))
+
+    def test_first_append_fills_history(self):
+        """Test that the history is filled with the first appended data."""
+        data = torch.rand(self.batch_size, 4, device=self.device)
+        self.buffer.append(data)
+        torch.testing.assert_close(self.buffer.buffer, data.unsqueeze(1).expand(-1, self.max_len, -1))
+
+    def test_reset(self):
+        """Test that resetting only affects the specified batches."""
+        for i in range(3):
+            self.buffer.append(torch.full((self.batch_size, 1), float(i), device=self.device))
+        self.buffer.reset(batch_ids=[1])
+        self.assertEqual(self.buffer.current_length.tolist(), [3, 0, 3])
+        # append new data
+        self.buffer.append(torch.full((self.batch_size, 1), 10.0, device=self.device))
+        history = self.buffer.buffer.squeeze(-1)
+        torch.testing.assert_close(history[0], torch.tensor([0.0, 0.0, 1.0, 2.0, 10.0], device=self.device))
+        torch.testing.assert_close(history[1], torch.full((self.max_len,), 10.0, device=self.device))
+        torch.testing.assert_close(history[2], history[0])
+
+    def test_delayed_read(self):
+        """Test reading a delayed entry for each batch."""
+        for i in range(8):
+            self.buffer.append(torch.full((self.batch_size, 2), float(i), device=self.device))
+        # read with different lags
+        lags = torch.tensor([0, 3, 10], device=self.device)
+        delayed_data = self.buffer[lags]
+        # note: the lag of the last batch is clipped to the oldest entry
+        torch.testing.assert_close(delayed_data[:, 0], torch.tensor([7.0, 4.0, 3.0], device=self.device))
+        # invalid key shape
+        with self.assertRaises(ValueError):
+            self.buffer[torch.zeros(self.batch_size + 1, dtype=torch.long, device=self.device)]
+
+
+if __name__ == "__main__":
+    run_tests()
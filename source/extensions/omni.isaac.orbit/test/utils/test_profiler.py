@@ -0,0 +1,134 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+# NOTE: While we don't actually use the simulation app in this test, we still need to launch it
+#       because warp is only available in the context of a running simulation
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.orbit.app import AppLauncher, run_tests
+
+# launch omniverse app
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import json
+import os
+import tempfile
+import time
+import torch
+import unittest
+
+from omni.isaac.orbit.utils.profiler import Profiler, ProfilerCfg
+
+
+class StatefulTerm:
+    """A callable with state to check the attribute forwarding of the wrapper."""
+
+    def __init__(self):
+        self.num_resets = 0
+
+    def reset(self):
+        self.num_resets += 1
+
+    def __call__(self, value: float) -> float:
+        return 2 * value
+
+
+class TestProfiler(unittest.TestCase):
+    """Test fixture for the Profiler class."""
+
+    def test_disabled_profiler(self):
+        """Test that a disabled profiler does not record anything and does not wrap callables."""
+        profiler = Profiler(ProfilerCfg(enabled=False))
+        # the scopes are no-ops
+        with profiler.scope("phase"):
+            pass
+        self.assertEqual(profiler.phase_names, [])
+        self.assertEqual(profiler.summary(), {})
+        # callables are not wrapped
+        term = StatefulTerm()
+        self.assertIs(profiler.wrap("term", term), term)
+
+    def test_scopes(self):
+        """Test the statistics of nested scopes."""
+        profiler = Profiler(ProfilerCfg(enabled=True, window_size=5, percentiles=(50.0, 100.0)))
+        for _ in range(8):
+            with profiler.scope("outer"):
+                with profiler.scope("outer/inner"):
+                    time.sleep(0.01)
+        # check the statistics
+        stats = profiler.summary()
+        self.assertEqual(list(stats.keys()), ["outer/inner", "outer"])
+        for name in ["outer", "outer/inner"]:
+            self.assertEqual(stats[name]["count"], 8)
+            self.assertGreaterEqual(stats[name]["mean"], 10.0)
+            self.assertGreaterEqual(stats[name]["p100"], stats[name]["p50"])
+        # the outer scope contains the inner scope
+        self.assertGreaterEqual(stats["outer"]["mean"], stats["outer/inner"]["mean"])
+        # check the logging information
+        log_info = profiler.get_log_info()
+        self.assertEqual(len(log_info), 2 * 3)
+        self.assertEqual(log_info["Profiler/outer/p50"], stats["outer"]["p50"])
+        # check the reset
+        profiler.reset()
+        self.assertEqual(profiler.summary(), {})
+
+    def test_wrap(self):
+        """Test timing the calls of a wrapped callable."""
+        profiler = Profiler(ProfilerCfg(enabled=True))
+        term = profiler.wrap("manager/term", StatefulTerm())
+        # check the outputs and the forwarding of the attributes
+        for i in range(3):
+            self.assertEqual(term(float(i)), 2.0 * i)
+        term.reset()
+        self.assertEqual(term.num_resets, 1)
+        # check that the calls are recorded
+        self.assertEqual(profiler.summary()["manager/term"]["count"], 3)
+
+    def test_record_memory(self):
+        """Test recording the total durations and the allocated memory of the calls."""
+        profiler = Profiler(ProfilerCfg(enabled=True, record_memory=True))
+        term = profiler.wrap("manager/term", lambda num_envs: torch.zeros(num_envs, 3))
+        for _ in range(4):
+            term(10)
+        # check the statistics
+        stats = profiler.summary()["manager/term"]
+        self.assertEqual(stats["count"], 4)
+        self.assertAlmostEqual(stats["total"], 4 * stats["mean"])
+        self.assertEqual(stats["mean_bytes"], 10 * 3 * 4)
+        # the totals are not logged
+        self.assertNotIn("Profiler/manager/term/total", profiler.get_log_info())
+        self.assertIn("Profiler/manager/term/mean_bytes", profiler.get_log_info())
+
+    def test_export(self):
+        """Test saving the statistics and the trace to files."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cfg = ProfilerCfg(
+                enabled=True,
+                json_path=os.path.join(tmp_dir, "stats.json"),
+                trace_path=os.path.join(tmp_dir, "trace", "trace.json"),
+                max_trace_events=3,
+            )
+            profiler = Profiler(cfg)
+            for _ in range(5):
+                with profiler.scope("phase"):
+                    pass
+            profiler.save()
+            # check the statistics
+            with open(cfg.json_path) as f:
+                stats = json.load(f)
+            self.assertEqual(stats["phase"]["count"], 5)
+            # check the trace
+            with open(cfg.trace_path) as f:
+                trace = json.load(f)
+            self.assertEqual(len(trace["traceEvents"]), 3)
+            self.assertEqual(trace["traceEvents"][0]["name"], "phase")
+            self.assertEqual(trace["traceEvents"][0]["ph"], "X")
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,385 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+# NOTE: While we don't actually use the simulation app in this test, we still need to launch it
+#       because warp is only available in the context of a running simulation
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.orbit.app import AppLauncher, run_tests
+
+# launch omniverse app
+app_launcher = AppLauncher(headless=True)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+import trimesh
+import unittest
+
+import warp as wp
+
+from omni.isaac.orbit.terrains.trimesh.utils import make_plane
+from omni.isaac.orbit.utils.math import quat_apply, quat_from_euler_xyz
+from omni.isaac.orbit.utils.warp import (
+    convert_to_warp_mesh,
+    raycast_camera_meshes,
+    raycast_dynamic_meshes,
+    raycast_mesh,
+    raycast_meshes,
+    update_mesh_points,
+)
+
+
+class TestWarpRaycast(unittest.TestCase):
+    """Test fixture for the ray-casting operations based on warp."""
+
+    def setUp(self):
+        wp.init()
+        self.device = "cpu"
+        # ground plane and two boxes standing on it
+        ground = make_plane(size=(10.0, 10.0), height=0.0, center_zero=True)
+        box_1 = trimesh.creation.box((1.0, 1.0, 1.0), trimesh.transformations.translation_matrix((1.0, 0.0, 0.5)))
+        box_2 = trimesh.creation.box((1.0, 1.0, 2.0), trimesh.transformations.translation_matrix((-1.0, 0.0, 1.0)))
+        self.meshes = [
+            convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device) for mesh in [ground, box_1, box_2]
+        ]
+        # grid of rays pointing downwards with one ray outside the ground plane
+        x, y = torch.meshgrid(torch.linspace(-2.0, 2.0, 9), torch.linspace(-1.0, 1.0, 5), indexing="ij")
+        ray_starts = torch.stack([x.flatten(), y.flatten(), torch.full_like(x.flatten(), 5.0)], dim=-1)
+        ray_starts = torch.cat([ray_starts, torch.tensor([[20.0, 0.0, 5.0]])])
+        # shape: (num_sensors, num_rays, 3)
+        self.ray_starts = ray_starts.unsqueeze(0).repeat(2, 1, 1)
+        self.ray_directions = torch.zeros_like(self.ray_starts)
+        self.ray_directions[..., 2] = -1.0
+
+    def test_raycast_meshes(self):
+        """Test that the closest hit over multiple meshes matches ray-casting each mesh separately."""
+        # ray-cast against each mesh separately
+        single_hits = [
+            raycast_mesh(
+                self.ray_starts,
+                self.ray_directions,
+                mesh,
+                return_distance=True,
+                return_normal=True,
+                return_face_id=True,
+            )
+            for mesh in self.meshes
+        ]
+        distances = torch.stack([hits[1] for hits in single_hits])
+        expected_distance, expected_mesh_id = torch.min(distances, dim=0)
+        expected_mesh_id[torch.isinf(expected_distance)] = -1
+        # ray-cast against all the meshes at once
+        for meshes in [self.meshes, wp.array([mesh.id for mesh in self.meshes], dtype=wp.uint64)]:
+            ray_hits, ray_distance, ray_normal, ray_face_id, ray_mesh_id = raycast_meshes(
+                self.ray_starts,
+                self.ray_directions,
+                meshes,
+                return_distance=True,
+                return_normal=True,
+                return_face_id=True,
+                return_mesh_id=True,
+            )
+            # check the shapes
+            self.assertEqual(ray_hits.shape, self.ray_starts.shape)
+            self.assertEqual(ray_distance.shape, self.ray_starts.shape[:-1])
+            # check the closest hits
+            torch.testing.assert_close(ray_distance, expected_distance)
+            torch.testing.assert_close(ray_mesh_id.long(), expected_mesh_id)
+            for mesh_id, hits in enumerate(single_hits):
+                mask = expected_mesh_id == mesh_id
+                torch.testing.assert_close(ray_hits[mask], hits[0][mask])
+                torch.testing.assert_close(ray_normal[mask], hits[2][mask])
+                torch.testing.assert_close(ray_face_id[mask], hits[3][mask])
+            # check the missed hit
+            self.assertTrue(torch.isinf(ray_hits[:, -1]).all())
+            self.assertTrue((ray_face_id[:, -1] == -1).all())
+        # check that all the meshes are hit by some rays
+        self.assertEqual(set(ray_mesh_id.unique().tolist()), {-1, 0, 1, 2})
+
+    def test_raycast_output_buffers(self):
+        """Test that ray-casting into preallocated output buffers matches ray-casting into new tensors."""
+        num_envs, num_rays = self.ray_starts.shape[:2]
+        # ray-cast into new tensors
+        expected_mesh = raycast_mesh(
+            self.ray_starts,
+            self.ray_directions,
+            self.meshes[0],
+            return_distance=True,
+            return_normal=True,
+            return_face_id=True,
+        )
+        expected_meshes = raycast_meshes(
+            self.ray_starts,
+            self.ray_directions,
+            self.meshes,
+            return_distance=True,
+            return_normal=True,
+            return_face_id=True,
+            return_mesh_id=True,
+        )
+        # output buffers with stale values
+        buffers = {
+            "ray_hits": torch.zeros(num_envs, num_rays, 3),
+            "ray_distance": torch.zeros(num_envs, num_rays),
+            "ray_normal": torch.zeros(num_envs, num_rays, 3),
+            "ray_face_id": torch.zeros(num_envs, num_rays, dtype=torch.int32),
+        }
+        # ray-cast into the buffers twice to check that they are reset
+        for _ in range(2):
+            outputs = raycast_mesh(
+                self.ray_starts,
+                self.ray_directions,
+                self.meshes[0],
+                return_distance=True,
+                return_normal=True,
+                return_face_id=True,
+                **buffers,
+            )
+            for output, buffer, expected in zip(outputs, buffers.values(), expected_mesh):
+                self.assertIs(output, buffer)
+                torch.testing.assert_close(output, expected)
+        buffers["ray_mesh_id"] = torch.zeros(num_envs, num_rays, dtype=torch.int32)
+        outputs = raycast_meshes(
+            self.ray_starts,
+            self.ray_directions,
+            self.meshes,
+            return_distance=True,
+            return_normal=True,
+            return_face_id=True,
+            return_mesh_id=True,
+            **buffers,
+        )
+        for output, buffer, expected in zip(outputs, buffers.values(), expected_meshes):
+            self.assertIs(output, buffer)
+            torch.testing.assert_close(output, expected)
+        # the buffers of the outputs that are not returned are not used
+        ray_hits, ray_distance, _, _ = raycast_mesh(
+            self.ray_starts[0], self.ray_directions[0], self.meshes[0], ray_distance=buffers["ray_distance"]
+        )
+        self.assertIsNone(ray_distance)
+        torch.testing.assert_close(ray_hits, expected_mesh[0][0])
+        # check the output buffers
+        with self.assertRaises(ValueError):
+            raycast_mesh(self.ray_starts, self.ray_directions, self.meshes[0], ray_hits=buffers["ray_hits"][:1])
+        with self.assertRaises(ValueError):
+            raycast_mesh(
+                self.ray_starts,
+                self.ray_directions,
+                self.meshes[0],
+                return_face_id=True,
+                ray_face_id=buffers["ray_distance"],
+            )
+
+    def test_raycast_meshes_max_distance(self):
+        """Test that the hits beyond the maximum distance are ignored."""
+        ray_hits, ray_distance, _, _, ray_mesh_id = raycast_meshes(
+            self.ray_starts, self.ray_directions, self.meshes, max_dist=3.5, return_distance=True, return_mesh_id=True
+        )
+        # only the top of the box with a height of 2.0 is closer than the maximum distance
+        hit_mask = ray_mesh_id >= 0
+        self.assertTrue(hit_mask.any())
+        self.assertTrue((ray_mesh_id[hit_mask] == 2).all())
+        self.assertTrue((ray_distance[hit_mask] <= 3.5).all())
+        self.assertTrue(torch.isinf(ray_hits[~hit_mask]).all())
+
+    def test_raycast_dynamic_meshes(self):
+        """Test that ray-casting against moving instances matches ray-casting against the moved meshes."""
+        num_envs = self.ray_starts.shape[0]
+        box = trimesh.creation.box((1.0, 1.0, 1.0))
+        # poses of the box instances: one per environment
+        instance_pos = torch.tensor([[0.5, 0.0, 1.0], [-1.0, 0.5, 2.5]])
+        instance_quat = quat_from_euler_xyz(
+            torch.tensor([0.0, 0.4]), torch.tensor([0.3, 0.0]), torch.tensor([0.2, 0.7])
+        )
+        instance_poses = torch.cat([instance_pos, instance_quat], dim=-1).unsqueeze(1)
+        instance_meshes = [convert_to_warp_mesh(box.vertices, box.faces, device=self.device)]
+        # ray-cast against the static meshes and the moving box
+        outputs = raycast_dynamic_meshes(
+            self.ray_starts,
+            self.ray_directions,
+            self.meshes,
+            instance_meshes,
+            instance_poses,
+            return_distance=True,
+            return_normal=True,
+            return_face_id=True,
+            return_mesh_id=True,
+        )
+        ray_hits, ray_distance, ray_normal, ray_face_id, ray_mesh_id = outputs
+        # check that the moving box is hit in all environments
+        for env_id in range(num_envs):
+            self.assertTrue((ray_mesh_id[env_id] == len(self.meshes)).any())
+        # compare with the static ray-casting against the box moved into each environment
+        for env_id in range(num_envs):
+            vertices = quat_apply(
+                instance_quat[env_id].expand(len(box.vertices), 4), torch.tensor(box.vertices, dtype=torch.float)
+            )
+            vertices += instance_pos[env_id]
+            moved_box = convert_to_warp_mesh(vertices.numpy(), box.faces, device=self.device)
+            expected = raycast_meshes(
+                self.ray_starts[env_id],
+                self.ray_directions[env_id],
+                self.meshes + [moved_box],
+                return_distance=True,
+                return_normal=True,
+                return_face_id=True,
+                return_mesh_id=True,
+            )
+            torch.testing.assert_close(ray_hits[env_id], expected[0], atol=1e-4, rtol=1e-4)
+            torch.testing.assert_close(ray_distance[env_id], expected[1], atol=1e-4, rtol=1e-4)
+            torch.testing.assert_close(ray_normal[env_id], expected[2], atol=1e-4, rtol=1e-4)
+            torch.testing.assert_close(ray_face_id[env_id], expected[3])
+            torch.testing.assert_close(ray_mesh_id[env_id], expected[4])
+        # ray-cast into output buffers with stale values twice to check that they are reset
+        num_rays = self.ray_starts.shape[1]
+        buffers = {
+            "ray_hits": torch.zeros(num_envs, num_rays, 3),
+            "ray_distance": torch.zeros(num_envs, num_rays),
+            "ray_normal": torch.zeros(num_envs, num_rays, 3),
+            "ray_face_id": torch.zeros(num_envs, num_rays, dtype=torch.int32),
+            "ray_mesh_id": torch.zeros(num_envs, num_rays, dtype=torch.int32),
+        }
+        for _ in range(2):
+            buffer_outputs = raycast_dynamic_meshes(
+                self.ray_starts,
+                self.ray_directions,
+                self.meshes,
+                instance_meshes,
+                instance_poses,
+                return_distance=True,
+                return_normal=True,
+                return_face_id=True,
+                return_mesh_id=True,
+                **buffers,
+            )
+            for output, buffer, expected in zip(buffer_outputs, buffers.values(), outputs):
+                self.assertIs(output, buffer)
+                torch.testing.assert_close(output, expected)
+        # check the shape of the poses
+        with self.assertRaises(ValueError):
+            raycast_dynamic_meshes(self.ray_starts, self.ray_directions, [], self.meshes, instance_poses)
+        # check the output buffers
+        with self.assertRaises(ValueError):
+            raycast_dynamic_meshes(
+                self.ray_starts,
+                self.ray_directions,
+                self.meshes,
+                instance_meshes,
+                instance_poses,
+                ray_hits=buffers["ray_hits"][:1],
+            )
+
+    def test_raycast_camera_meshes(self):
+        """Test that ray-casting from the camera frame matches ray-casting the rays in the world frame."""
+        num_cameras, height, width = 3, 4, 5
+        num_rays = height * width
+        box = trimesh.creation.box((1.0, 1.0, 1.0))
+        box_mesh = convert_to_warp_mesh(box.vertices, box.faces, device=self.device)
+        # rays in the camera frame with the x-axis pointing forward
+        y, z = torch.meshgrid(torch.linspace(-0.8, 0.8, width), torch.linspace(-0.6, 0.6, height), indexing="xy")
+        ray_directions = torch.stack([torch.ones_like(y), y, z], dim=-1).view(1, num_rays, 3)
+        ray_directions = ray_directions / ray_directions.norm(dim=-1, keepdim=True)
+        ray_directions = ray_directions.repeat(num_cameras, 1, 1)
+        ray_starts = torch.zeros_like(ray_directions)
+        ray_starts[..., 1] = 0.01
+        # cameras looking downwards from above the meshes and one camera looking at the horizon
+        camera_pos = torch.tensor([[1.0, 0.0, 3.0], [-1.5, 0.3, 4.0], [0.0, 0.0, 1.0]])
+        camera_quat = quat_from_euler_xyz(
+            torch.tensor([0.0, 0.1, 0.0]), torch.tensor([1.3, 1.5, 0.0]), torch.tensor([0.0, 0.4, 0.0])
+        )
+        camera_poses = torch.cat([camera_pos, camera_quat], dim=-1)
+        instance_poses = torch.tensor([[0.0, 1.0, 0.5, 1.0, 0.0, 0.0, 0.0]]).repeat(num_cameras, 1, 1)
+        # output buffers with the shape of the images
+        ray_hits = torch.zeros(num_cameras, num_rays, 3)
+        ray_distance = torch.zeros(num_cameras, height, width)
+        ray_depth = torch.zeros(num_cameras, height, width)
+        ray_normal = torch.zeros(num_cameras, height, width, 3)
+        # update a subset of the cameras
+        env_ids = torch.tensor([0, 2])
+        raycast_camera_meshes(
+            ray_starts,
+            ray_directions,
+            camera_poses[env_ids],
+            self.meshes,
+            ray_hits=ray_hits,
+            ray_distance=ray_distance,
+            ray_depth=ray_depth,
+            ray_normal=ray_normal,
+            env_ids=env_ids,
+            instance_meshes=[box_mesh],
+            instance_poses=instance_poses[env_ids],
+        )
+        # compare with ray-casting the rays transformed into the world frame
+        quat = camera_quat[env_ids].unsqueeze(1).expand(-1, num_rays, -1)
+        ray_starts_w = quat_apply(quat, ray_starts[env_ids]) + camera_pos[env_ids].unsqueeze(1)
+        ray_directions_w = quat_apply(quat, ray_directions[env_ids])
+        expected_hits, expected_distance, expected_normal, _, _ = raycast_dynamic_meshes(
+            ray_starts_w,
+            ray_directions_w,
+            self.meshes,
+            [box_mesh],
+            instance_poses[env_ids],
+            return_distance=True,
+            return_normal=True,
+        )
+        torch.testing.assert_close(ray_hits[env_ids], expected_hits, atol=1e-4, rtol=1e-4)
+        torch.testing.assert_close(ray_distance[env_ids].view(2, -1), expected_distance, atol=1e-4, rtol=1e-4)
+        torch.testing.assert_close(ray_normal[env_ids].view(2, -1, 3), expected_normal, atol=1e-4, rtol=1e-4)
+        # the depth is the distance along the x-axis of the camera frame
+        expected_depth = expected_distance * ray_directions[env_ids, :, 0]
+        torch.testing.assert_close(ray_depth[env_ids].view(2, -1), expected_depth, atol=1e-4, rtol=1e-4)
+        # check that the camera looking at the horizon misses some meshes and that the other camera is not updated
+        self.assertTrue(torch.isinf(ray_depth[2]).any())
+        self.assertTrue(torch.isfinite(ray_depth[0]).all())
+        self.assertTrue((ray_hits[1] == 0.0).all() and (ray_depth[1] == 0.0).all())
+        # the missed rays are reset when the buffers are reused
+        ray_hits_1 = ray_hits.clone()
+        ray_hits.zero_()
+        raycast_camera_meshes(
+            ray_starts,
+            ray_directions,
+            camera_poses,
+            self.meshes,
+            ray_hits=ray_hits,
+            instance_meshes=[box_mesh],
+            instance_poses=instance_poses,
+        )
+        torch.testing.assert_close(ray_hits[env_ids], ray_hits_1[env_ids])
+        self.assertTrue(torch.isinf(ray_hits[2]).all(dim=-1).any())
+        # check the output buffers
+        with self.assertRaises(ValueError):
+            raycast_camera_meshes(
+                ray_starts, ray_directions, camera_poses, self.meshes, ray_hits=ray_hits.view(-1, 3)[:num_rays]
+            )
+        with self.assertRaises(ValueError):
+            raycast_camera_meshes(ray_starts, ray_directions, camera_poses, self.meshes, ray_hits=ray_hits.double())
+        with self.assertRaises(ValueError):
+            raycast_camera_meshes(ray_starts, ray_directions, camera_poses[:1], self.meshes, ray_hits=ray_hits)
+
+    def test_update_mesh_points(self):
+        """Test that the ray-casting sees the vertices of a mesh updated in-place."""
+        mesh = self.meshes[1]
+        mesh_id = mesh.id
+        distance = raycast_mesh(self.ray_starts, self.ray_directions, mesh, return_distance=True)[1]
+        # move the box upwards
+        points = wp.to_torch(mesh.points).clone()
+        points[:, 2] += 1.0
+        update_mesh_points(mesh, points)
+        # check that the mesh is updated in-place
+        self.assertEqual(mesh.id, mesh_id)
+        new_distance = raycast_mesh(self.ray_starts, self.ray_directions, mesh, return_distance=True)[1]
+        hit_mask = ~torch.isinf(distance)
+        self.assertTrue(hit_mask.any())
+        torch.testing.assert_close(new_distance[hit_mask], distance[hit_mask] - 1.0)
+        torch.testing.assert_close(torch.isinf(new_distance), ~hit_mask)
+        # check the number of vertices
+        with self.assertRaises(ValueError):
+            update_mesh_points(mesh, points[1:])
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -53,3 +53,33 @@ def terrain_levels_vel(
     terrain.update_env_origins(env_ids, move_up, move_down)
     # return the mean terrain level
     return torch.mean(terrain.terrain_levels.float())
+
+
+def terrain_levels_prioritized(
+    env: RLTaskEnv, env_ids: Sequence[int], asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")
+) -> torch.Tensor:
+    """Curriculum that samples the terrains from the success of the robots on each terrain.
+
+    An episode is successful when the robot walked far enough, i.e. more than half of the size of a sub-terrain.
+    The successes are recorded by the terrain curriculum for the sub-terrains of the episodes. The sub-terrains
+    of the next episodes are then sampled from the statistics of all the sub-terrains.
+
+    .. note::
+        It is only possible to use this term with the terrain type ``generator`` and a terrain curriculum
+        configured in :attr:`omni.isaac.orbit.terrains.TerrainImporterCfg.curriculum`. For further information,
+        check the :class:`omni.isaac.orbit.terrains.TerrainCurriculum` class.
+
+    Returns:
+        The mean terrain level for the given environment ids.
+    """
+    # extract the used quantities (to enable type-hinting)
+    asset: Articulation = env.scene[asset_cfg.name]
+    terrain: TerrainImporter = env.scene.terrain
+    # compute the distance the robot walked
+    distance = torch.norm(asset.data.root_pos_w[env_ids, :2] - env.scene.env_origins[env_ids, :2], dim=1)
+    # robots that walked far enough solved their terrain
+    success = distance > terrain.cfg.terrain_generator.size[0] / 2
+    # sample the terrains of the next episodes
+    terrain.resample_env_origins(env_ids, success)
+    # return the mean terrain level
+    return torch.mean(terrain.terrain_levels.float())
@@ -79,6 +79,31 @@ random data in a dataset.
    # close collector
    collector_interface.close()
 
+Image observations, such as the images of cameras, can be stored in chunked and compressed datasets
+by passing an :class:`ImageEncodingCfg` configuration to the collector. The depth images can also be
+quantized to unsigned 16-bit integers (millimeters by default). The demonstrations are then encoded
+in background threads and written by a single writer thread. The stored datasets are read back as torch tensors with the
+:class:`RobomimicDataReader`, which decompresses the requested frames and converts the quantized depth
+images back to meters.
+
+.. code-block:: python
+
+   from omni.isaac.orbit_tasks.utils.data_collector import (
+       ImageEncodingCfg,
+       RobomimicDataCollector,
+       RobomimicDataReader,
+   )
+
+   # create data-collector that compresses the camera images
+   image_cfg = ImageEncodingCfg(image_keys=["obs/rgb"], depth_keys=["obs/depth"], compression="lzf")
+   collector_interface = RobomimicDataCollector(task_name, log_dir, filename, num_demos, image_cfg=image_cfg)
+
+   # read the depth images of the first demonstration
+   with RobomimicDataReader(os.path.join(log_dir, filename)) as reader:
+      depth = reader.read(0, "obs/depth")
+
 """
 
+from .image_encoding import ImageEncodingCfg, dequantize_depth, quantize_depth
 from .robomimic_data_collector import RobomimicDataCollector
+from .robomimic_data_reader import RobomimicDataReader
@@ -0,0 +1,286 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Encoding of the image observations stored by the data collector."""
+
+# needed to import for allowing type-hinting: np.ndarray | torch.Tensor
+from __future__ import annotations
+
+import h5py
+import numpy as np
+import torch
+import zlib
+from dataclasses import dataclass
+from typing import Literal
+
+from omni.isaac.orbit.utils import configclass
+
+try:
+    import lzf
+except ModuleNotFoundError:
+    lzf = None
+
+DEPTH_SCALE_ATTR = "depth_scale"
+"""The name of the attribute of the quantized depth datasets that stores their scale."""
+
+
+@configclass
+class ImageEncodingCfg:
+    """Configuration for encoding the image observations stored by the data collector.
+
+    The image datasets are chunked along the time axis and compressed with a filter of HDF5, so that
+    the frames of a demonstration can be read without decompressing the whole dataset. The depth images
+    can additionally be quantized to unsigned 16-bit integers before being compressed.
+
+    The chunks are compressed by the data collector itself and written into the file as they are, so that
+    the compression runs in parallel on several threads and outside of the global lock of h5py. The files
+    are read with the filters of HDF5.
+    """
+
+    image_keys: list[str] = []
+    """The keys of the image observations, such as ``"obs/rgb"``. Defaults to an empty list.
+
+    The keys are the same as the ones passed to :meth:`RobomimicDataCollector.add`.
+    """
+
+    depth_keys: list[str] = []
+    """The keys of the depth images to quantize, such as ``"obs/depth"``. Defaults to an empty list.
+
+    These images are also encoded as image observations, i.e. they do not need to be part of :attr:`image_keys`.
+    """
+
+    depth_scale: float = 1000.0
+    """The number of quantization steps per meter of the depth images. Defaults to 1000.0 (millimeters).
+
+    With the default scale, the maximum depth that can be stored is 65.535 meters.
+    """
+
+    compression: Literal["gzip", "lzf"] | None = "gzip"
+    """The compression filter of HDF5 for the image datasets. Defaults to "gzip".
+
+    The ``"lzf"`` filter is faster but compresses less than ``"gzip"``. If None, the image datasets are
+    chunked but not compressed.
+
+    Note:
+        The ``"lzf"`` chunks are compressed by the data collector only if the `python-lzf`_ package is
+        installed. Otherwise, they are compressed by HDF5 in the thread that writes the file.
+
+    .. _python-lzf: https://pypi.org/project/python-lzf/
+    """
+
+    compression_opts: int | None = 4
+    """The level of the ``"gzip"`` compression between 0 and 9. Defaults to 4.
+
+    This is only used with the ``"gzip"`` compression.
+    """
+
+    shuffle: bool = True
+    """Whether to apply the byte shuffle filter of HDF5 before the compression. Defaults to True.
+
+    The filter groups the bytes of the pixels by significance, which improves the compression of the
+    quantized depth images.
+    """
+
+    frames_per_chunk: int = 1
+    """The number of frames of an image dataset per chunk. Defaults to 1."""
+
+    num_workers: int = 1
+    """The number of threads that encode the demonstrations. Defaults to 1.
+
+    The encoded demonstrations are written into the file by a separate thread. If 0, the demonstrations are
+    encoded and written by the thread that calls :meth:`RobomimicDataCollector.flush`, i.e. typically the
+    simulation thread.
+    """
+
+
+@dataclass
+class EncodedImages:
+    """The images of a demonstration encoded into the chunks of a dataset."""
+
+    shape: tuple[int, ...]
+    """The shape of the dataset. The first dimension is the number of frames."""
+
+    dtype: np.dtype
+    """The data type of the dataset."""
+
+    chunk_shape: tuple[int, ...]
+    """The shape of the chunks of the dataset."""
+
+    cfg: ImageEncodingCfg
+    """The configuration of the encoding."""
+
+    chunks: list[tuple[bytes, int]] | None = None
+    """The encoded chunks and their filter masks, in the order of the frames. Defaults to None.
+
+    The filter mask flags the filters of HDF5 that were not applied to the chunk. If None, the images in
+    :attr:`data` are compressed by HDF5 when the dataset is written.
+    """
+
+    data: np.ndarray | None = None
+    """The images that are compressed by HDF5. Defaults to None."""
+
+    depth_scale: float | None = None
+    """The scale of the quantized depth images. Defaults to None, in which case the images are not quantized."""
+
+
+"""
+Depth quantization.
+"""
+
+
+def quantize_depth(depth: np.ndarray, scale: float = 1000.0) -> np.ndarray:
+    """Quantizes depth images to unsigned 16-bit integers.
+
+    The depths beyond the maximum depth that can be stored are clipped to it. The invalid depths, i.e. the
+    depths that are not finite or not positive, are stored as 0.
+
+    Args:
+        depth: The depth images (in meters).
+        scale: The number of quantization steps per meter. Defaults to 1000.0 (millimeters).
+
+    Returns:
+        The quantized depth images with the same shape and data type :obj:`np.uint16`.
+    """
+    # scale and round the depths
+    depth = np.asarray(depth, dtype=np.float32) * scale
+    quantized = np.rint(np.clip(np.nan_to_num(depth, nan=0.0, posinf=0.0, neginf=0.0), 0.0, 65535.0))
+    return quantized.astype(np.uint16)
+
+
+def dequantize_depth(depth: torch.Tensor, scale: float = 1000.0) -> torch.Tensor:
+    """Converts quantized depth images back to depths in meters.
+
+    The invalid depths, which are stored as 0, are set to infinity.
+
+    Args:
+        depth: The quantized depth images with an integer data type.
+        scale: The number of quantization steps per meter. Defaults to 1000.0 (millimeters).
+
+    Returns:
+        The depth images (in meters) with data type :obj:`torch.float32`.
+    """
+    depth = depth.to(torch.float32)
+    return torch.where(depth > 0, depth / scale, torch.inf)
+
+
+"""
+Dataset writing.
+"""
+
+
+def encode_images(data: np.ndarray, cfg: ImageEncodingCfg, is_depth: bool = False) -> EncodedImages:
+    """Encodes images into the chunks of a dataset.
+
+    The chunks are shuffled and compressed in the same way as the filters of HDF5, so that they can be
+    written into a dataset as they are with :func:`write_image_dataset`. This function does not call HDF5
+    and can run in parallel on several threads.
+
+    Args:
+        data: The images of the demonstration. Shape is (T, ...), where T is the number of frames.
+        cfg: The configuration of the encoding.
+        is_depth: Whether the images are depth images to quantize. Defaults to False.
+
+    Returns:
+        The encoded images.
+    """
+    if is_depth:
+        data = quantize_depth(data, cfg.depth_scale)
+    data = np.ascontiguousarray(data)
+    # note: h5py does not accept chunks larger than the dataset
+    chunk_shape = (max(1, min(cfg.frames_per_chunk, len(data))), *data.shape[1:])
+    images = EncodedImages(
+        shape=data.shape,
+        dtype=data.dtype,
+        chunk_shape=chunk_shape,
+        cfg=cfg,
+        depth_scale=cfg.depth_scale if is_depth else None,
+    )
+    # let HDF5 compress the images if the compression is not available
+    if cfg.compression == "lzf" and lzf is None:
+        images.data = data
+        return images
+    # resolve the index of the compression in the filter pipeline of HDF5
+    shuffle = cfg.shuffle and cfg.compression is not None
+    compression_mask = 1 << int(shuffle)
+    # encode the chunks
+    images.chunks = list()
+    for start in range(0, len(data), chunk_shape[0]):
+        chunk = data[start : start + chunk_shape[0]]
+        # note: the chunks at the end of the dataset are stored with the full chunk size
+        if len(chunk) < chunk_shape[0]:
+            chunk = np.concatenate([chunk, np.zeros((chunk_shape[0] - len(chunk), *chunk_shape[1:]), data.dtype)])
+        # group the bytes of the pixels by significance
+        if shuffle:
+            buffer = chunk.view(np.uint8).reshape(-1, data.dtype.itemsize).T.tobytes()
+        else:
+            buffer = chunk.tobytes()
+        # compress the chunk
+        if cfg.compression == "gzip":
+            level = cfg.compression_opts if cfg.compression_opts is not None else 4
+            images.chunks.append((zlib.compress(buffer, level), 0))
+        elif cfg.compression == "lzf":
+            # note: the chunks that do not shrink are stored without the compression
+            compressed = lzf.compress(buffer)
+            if compressed is None:
+                images.chunks.append((buffer, compression_mask))
+            else:
+                images.chunks.append((compressed, 0))
+        else:
+            images.chunks.append((buffer, 0))
+    return images
+
+
+def write_image_dataset(group: h5py.Group, name: str, images: EncodedImages) -> h5py.Dataset:
+    """Writes encoded images into a chunked and compressed dataset.
+
+    Args:
+        group: The group to create the dataset in.
+        name: The name of the dataset.
+        images: The images encoded with :func:`encode_images`.
+
+    Returns:
+        The created dataset.
+    """
+    cfg = images.cfg
+    dataset = group.create_dataset(
+        name,
+        shape=images.shape,
+        dtype=images.dtype,
+        chunks=images.chunk_shape,
+        compression=cfg.compression,
+        compression_opts=cfg.compression_opts if cfg.compression == "gzip" else None,
+        shuffle=cfg.shuffle and cfg.compression is not None,
+    )
+    if images.chunks is None:
+        dataset[...] = images.data
+    else:
+        # write the encoded chunks without passing them through the filters
+        for index, (chunk, filter_mask) in enumerate(images.chunks):
+            offset = (index * images.chunk_shape[0],) + (0,) * (len(images.shape) - 1)
+            dataset.id.write_direct_chunk(offset, chunk, filter_mask)
+    # store the scale to convert the depths back to meters
+    if images.depth_scale is not None:
+        dataset.attrs[DEPTH_SCALE_ATTR] = images.depth_scale
+    return dataset
+
+
+def create_image_dataset(
+    group: h5py.Group, name: str, data: np.ndarray, cfg: ImageEncodingCfg, is_depth: bool = False
+) -> h5py.Dataset:
+    """Creates a chunked and compressed dataset of images.
+
+    This encodes the images with :func:`encode_images` and writes them with :func:`write_image_dataset`.
+
+    Args:
+        group: The group to create the dataset in.
+        name: The name of the dataset.
+        data: The images of the demonstration. Shape is (T, ...), where T is the number of frames.
+        cfg: The configuration of the encoding.
+        is_depth: Whether the images are depth images to quantize. Defaults to False.
+
+    Returns:
+        The created dataset.
+    """
+    return write_image_dataset(group, name, encode_images(data, cfg, is_depth))
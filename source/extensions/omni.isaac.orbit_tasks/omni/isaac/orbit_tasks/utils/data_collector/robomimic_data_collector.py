@@ -12,11 +12,16 @@ import h5py
 import json
 import numpy as np
 import os
+import queue
+import threading
 import torch
 from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import carb
 
+from .image_encoding import EncodedImages, ImageEncodingCfg, encode_images, write_image_dataset
+
 
 class RobomimicDataCollector:
     """Data collection interface for robomimic.
@@ -35,6 +40,14 @@ class RobomimicDataCollector:
 
     For reference on datasets, please check the robomimic `documentation`.
 
+    Image observations can be encoded with an :class:`ImageEncodingCfg` configuration. Their datasets are
+    chunked and compressed, and the depth images can be quantized to unsigned 16-bit integers. The
+    demonstrations are then encoded by a pool of background threads and written into the file by a single
+    writer thread, which performs all the calls to h5py after the file is created. The :meth:`flush` method
+    only queues the recorded arrays, so that it returns without waiting for the encoding or the writing.
+    The errors of the background threads are raised by the next call to :meth:`flush` or :meth:`close`.
+    The datasets can be read back with :class:`RobomimicDataReader`.
+
     .. _HDF5: https://www.h5py.org/
     .. _structure: https://robomimic.github.io/docs/datasets/overview.html#dataset-structure
     .. _documentation: https://github.com/ARISE-Initiative/robomimic/blob/master/robomimic/config/base_config.py#L167-L173
@@ -48,6 +61,7 @@ class RobomimicDataCollector:
         num_demos: int = 1,
         flush_freq: int = 1,
         env_config: dict | None = None,
+        image_cfg: ImageEncodingCfg | None = None,
     ):
         """Initializes the data collection wrapper.
 
@@ -58,6 +72,8 @@ class RobomimicDataCollector:
             num_demos: Number of demonstrations to record until stopping. Defaults to 1.
             flush_freq: Frequency to dump data to disk. Defaults to 1.
             env_config: The configuration for the environment. Defaults to None.
+            image_cfg: The configuration for encoding the image observations. Defaults to None, in which case
+                all the data is stored without compression by the thread that calls :meth:`flush`.
         """
         # save input arguments
         self._env_name = env_name
@@ -66,6 +82,7 @@ class RobomimicDataCollector:
         self._filename = filename
         self._num_demos = num_demos
         self._flush_freq = flush_freq
+        self._image_cfg = image_cfg
         # print info
         print(self.__str__())
 
@@ -86,6 +103,18 @@ class RobomimicDataCollector:
         # create buffers to store data
         self._dataset = dict()
 
+        # create the threads to encode and write the demonstrations
+        # note: the writer thread writes the encoded demonstrations in the order of the queue
+        self._write_queue: queue.Queue[tuple[str, Future, bool] | None] = queue.Queue()
+        self._write_error: Exception | None = None
+        if image_cfg is not None and image_cfg.num_workers > 0:
+            self._encoder = ThreadPoolExecutor(max_workers=image_cfg.num_workers, thread_name_prefix="DataCollector")
+            self._writer = threading.Thread(target=self._write_loop, name="DataCollectorWriter", daemon=True)
+            self._writer.start()
+        else:
+            self._encoder = None
+            self._writer = None
+
     def __del__(self):
         """Destructor for data collector."""
         if not self._is_stop:
@@ -200,22 +229,10 @@ class RobomimicDataCollector:
             # data corresponding to demo
             env_dataset = self._dataset[f"env_{index}"]
 
-            # create episode group based on demo count
-            h5_episode_group = self._h5_data_group.create_group(f"demo_{self._demo_count}")
-            # store number of steps taken
-            h5_episode_group.attrs["num_samples"] = len(env_dataset["actions"])
-            # store other data from dictionary
-            for key, value in env_dataset.items():
-                if isinstance(value, dict):
-                    # create group
-                    key_group = h5_episode_group.create_group(key)
-                    # add sub-keys values
-                    for sub_key, sub_value in value.items():
-                        key_group.create_dataset(sub_key, data=np.array(sub_value))
-                else:
-                    h5_episode_group.create_dataset(key, data=np.array(value))
-            # increment total step counts
-            self._h5_data_group.attrs["total"] += h5_episode_group.attrs["num_samples"]
+            # write the episode data into a group based on demo count
+            # note: the file is flushed at the desired frequency after the data is written
+            flush_file = (self._demo_count + 1) % self._flush_freq == 0
+            self._submit_write(f"demo_{self._demo_count}", env_dataset, flush_file)
 
             # increment total demo counts
             self._demo_count += 1
@@ -224,7 +241,6 @@ class RobomimicDataCollector:
 
             # dump at desired frequency
             if self._demo_count % self._flush_freq == 0:
-                self._h5_file_stream.flush()
                 print(f">>> Flushing data to disk. Collected demos: {self._demo_count} / {self._num_demos}")
 
             # if demos collected then stop
@@ -238,16 +254,135 @@ class RobomimicDataCollector:
         """Stop recording and save the file at its current state."""
         if not self._is_stop:
             print(f">>> Closing recording of data. Collected demos: {self._demo_count} / {self._num_demos}")
-            # close the file safely
-            if self._h5_file_stream is not None:
-                self._h5_file_stream.close()
             # mark that data collection is stopped
             self._is_stop = True
+            try:
+                # wait for the pending writes
+                if self._writer is not None:
+                    self._write_queue.put(None)
+                    self._writer.join()
+                    self._encoder.shutdown(wait=True)
+                self._raise_write_error()
+            finally:
+                # close the file safely
+                if self._h5_file_stream is not None:
+                    self._h5_file_stream.close()
 
     """
     Helper functions.
     """
 
+    def _submit_write(self, name: str, env_dataset: dict, flush_file: bool):
+        """Writes the data of a demonstration in the background threads if available.
+
+        Args:
+            name: The name of the group of the demonstration.
+            env_dataset: The data of the demonstration.
+            flush_file: Whether to flush the file after writing the demonstration.
+
+        Raises:
+            Exception: If a previous demonstration failed to be encoded or written in a background thread.
+        """
+        if self._writer is None:
+            self._write_episode(name, self._encode_episode(env_dataset), flush_file)
+        else:
+            # raise the errors of the previous writes before submitting a new one
+            self._raise_write_error()
+            self._write_queue.put((name, self._encoder.submit(self._encode_episode, env_dataset), flush_file))
+
+    def _raise_write_error(self):
+        """Raises the error of the writer thread if any."""
+        if self._write_error is not None:
+            raise self._write_error
+
+    def _write_loop(self):
+        """Writes the encoded demonstrations of the queue into the file until it receives None.
+
+        This is the only thread that calls h5py while it runs. After an error, the remaining
+        demonstrations are discarded.
+        """
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                break
+            if self._write_error is not None:
+                continue
+            name, encoded_episode, flush_file = item
+            try:
+                self._write_episode(name, encoded_episode.result(), flush_file)
+            except Exception as e:
+                self._write_error = e
+
+    def _encode_episode(self, env_dataset: dict) -> dict:
+        """Converts the data of a demonstration into arrays and encodes the image observations.
+
+        This does not call h5py, so that several demonstrations can be encoded in parallel.
+
+        Args:
+            env_dataset: The data of the demonstration.
+
+        Returns:
+            The data of the demonstration with the same structure. The image observations are encoded with
+            the image encoding configuration and the other values are arrays.
+        """
+        # resolve the keys of the image observations
+        if self._image_cfg is not None:
+            depth_keys = set(self._image_cfg.depth_keys)
+            image_keys = set(self._image_cfg.image_keys) | depth_keys
+        else:
+            depth_keys, image_keys = set(), set()
+        # encode the data
+        episode = dict()
+        for key, value in env_dataset.items():
+            if isinstance(value, dict):
+                episode[key] = dict()
+                for sub_key, sub_value in value.items():
+                    full_key = f"{key}/{sub_key}"
+                    if full_key in image_keys:
+                        sub_value = encode_images(np.array(sub_value), self._image_cfg, full_key in depth_keys)
+                    else:
+                        sub_value = np.array(sub_value)
+                    episode[key][sub_key] = sub_value
+            elif key in image_keys:
+                episode[key] = encode_images(np.array(value), self._image_cfg, key in depth_keys)
+            else:
+                episode[key] = np.array(value)
+        return episode
+
+    def _write_episode(self, name: str, episode: dict, flush_file: bool):
+        """Writes the encoded data of a demonstration into a new group of the file.
+
+        Args:
+            name: The name of the group of the demonstration.
+            episode: The data of the demonstration encoded with :meth:`_encode_episode`.
+            flush_file: Whether to flush the file after writing the demonstration.
+        """
+        num_samples = len(episode["actions"])
+        # create episode group
+        h5_episode_group = self._h5_data_group.create_group(name)
+        # store number of steps taken
+        h5_episode_group.attrs["num_samples"] = num_samples
+        # store other data from dictionary
+        for key, value in episode.items():
+            if isinstance(value, dict):
+                # create group
+                key_group = h5_episode_group.create_group(key)
+                # add sub-keys values
+                for sub_key, sub_value in value.items():
+                    if isinstance(sub_value, EncodedImages):
+                        write_image_dataset(key_group, sub_key, sub_value)
+                    else:
+                        key_group.create_dataset(sub_key, data=sub_value)
+            elif isinstance(value, EncodedImages):
+                write_image_dataset(h5_episode_group, key, value)
+            else:
+                h5_episode_group.create_dataset(key, data=value)
+        # increment total step counts
+        self._h5_data_group.attrs["total"] += num_samples
+        # dump to disk
+        if flush_file:
+            self._h5_file_stream.flush()
+
     def _create_new_file(self, fname: str):
         """Create a new HDF5 file for writing episode info into.
 
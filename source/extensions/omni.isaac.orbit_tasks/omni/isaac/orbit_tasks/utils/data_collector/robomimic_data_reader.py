@@ -0,0 +1,167 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Interface to read the data stored by the data collector using format from `robomimic`."""
+
+# needed to import for allowing type-hinting: torch.Tensor | dict
+from __future__ import annotations
+
+import h5py
+import numpy as np
+import torch
+from collections.abc import Sequence
+
+from .image_encoding import DEPTH_SCALE_ATTR, dequantize_depth
+
+
+class RobomimicDataReader:
+    """Data reading interface for datasets stored by the :class:`RobomimicDataCollector`.
+
+    The data is read lazily from the `HDF5`_ file and converted to torch tensors. For the chunked and compressed
+    datasets of the image observations, only the chunks of the requested frames are decompressed. The quantized
+    depth images are converted back to depths in meters, where the invalid depths are set to infinity.
+
+    The reader can be used as a context manager to close the file:
+
+    .. code-block:: python
+
+        with RobomimicDataReader("logs/demos/hdf_dataset.hdf5", device="cuda:0") as reader:
+            for demo in reader.demo_names:
+                depth = reader.read(demo, "obs/depth", indices=slice(0, 10))
+
+    .. _HDF5: https://www.h5py.org/
+    """
+
+    def __init__(self, file_path: str, device: str = "cpu"):
+        """Initializes the data reader.
+
+        Args:
+            file_path: The path to the HDF5 file.
+            device: The device of the returned tensors. Defaults to "cpu".
+        """
+        self._file_path = file_path
+        self._device = device
+        # open the file
+        self._h5_file_stream = h5py.File(file_path, "r")
+        self._h5_data_group = self._h5_file_stream["data"]
+
+    def __enter__(self) -> RobomimicDataReader:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        """The number of demonstrations in the dataset."""
+        return len(self._h5_data_group)
+
+    def __str__(self) -> str:
+        """Represents the data reader as a string."""
+        msg = "Dataset reader <class RobomimicDataReader> object"
+        msg += f"\tReading trajectories from file: {self._file_path}\n"
+        msg += f"\tNumber of demos               : {len(self)}\n"
+        msg += f"\tTotal number of samples       : {self.total}\n"
+
+        return msg
+
+    """
+    Properties
+    """
+
+    @property
+    def demo_names(self) -> list[str]:
+        """The names of the demonstrations sorted by their index."""
+        return sorted(self._h5_data_group.keys(), key=lambda name: int(name.split("_")[-1]))
+
+    @property
+    def total(self) -> int:
+        """The total number of samples of all the demonstrations."""
+        return int(self._h5_data_group.attrs["total"])
+
+    @property
+    def env_args(self) -> str:
+        """The environment meta-info stored as a JSON string."""
+        return self._h5_data_group.attrs["env_args"]
+
+    """
+    Operations.
+    """
+
+    def num_samples(self, demo: str | int) -> int:
+        """The number of samples of a demonstration.
+
+        Args:
+            demo: The name or the index of the demonstration.
+
+        Returns:
+            The number of samples.
+        """
+        return int(self._h5_data_group[self._resolve_demo_name(demo)].attrs["num_samples"])
+
+    def read(self, demo: str | int, key: str, indices: slice | Sequence[int] | None = None) -> torch.Tensor:
+        """Reads a dataset of a demonstration.
+
+        Args:
+            demo: The name or the index of the demonstration.
+            key: The key of the dataset, such as ``"actions"`` or ``"obs/rgb"``.
+            indices: The indices of the frames to read. The indices must be increasing. Defaults to None,
+                in which case all the frames are read.
+
+        Returns:
+            The data of the dataset. Shape is (T, ...), where T is the number of read frames.
+        """
+        dataset = self._h5_data_group[self._resolve_demo_name(demo)][key]
+        return self._read_dataset(dataset, indices)
+
+    def read_demo(self, demo: str | int) -> dict[str, torch.Tensor | dict[str, torch.Tensor]]:
+        """Reads all the datasets of a demonstration.
+
+        Args:
+            demo: The name or the index of the demonstration.
+
+        Returns:
+            The data of the demonstration with the same nesting as the keys of the datasets.
+        """
+        data = dict()
+        for key, value in self._h5_data_group[self._resolve_demo_name(demo)].items():
+            if isinstance(value, h5py.Group):
+                data[key] = {sub_key: self._read_dataset(sub_value) for sub_key, sub_value in value.items()}
+            else:
+                data[key] = self._read_dataset(value)
+        return data
+
+    def close(self):
+        """Closes the file."""
+        if self._h5_file_stream is not None:
+            self._h5_file_stream.close()
+            self._h5_file_stream = None
+
+    """
+    Helper functions.
+    """
+
+    def _resolve_demo_name(self, demo: str | int) -> str:
+        """Returns the name of the demonstration from its index."""
+        return demo if isinstance(demo, str) else f"demo_{demo}"
+
+    def _read_dataset(self, dataset: h5py.Dataset, indices: slice | Sequence[int] | None = None) -> torch.Tensor:
+        """Reads the frames of a dataset into a tensor.
+
+        Args:
+            dataset: The dataset.
+            indices: The indices of the frames to read. Defaults to None, in which case all the frames are read.
+
+        Returns:
+            The data of the dataset.
+        """
+        # read the frames
+        # note: HDF5 only decompresses the chunks that contain the frames
+        data = dataset[()] if indices is None else dataset[indices]
+        # convert the quantized depth images back to meters
+        if DEPTH_SCALE_ATTR in dataset.attrs:
+            # note: torch does not support all the operations on unsigned 16-bit integers
+            depth = torch.from_numpy(data.astype(np.int32)).to(self._device)
+            return dequantize_depth(depth, float(dataset.attrs[DEPTH_SCALE_ATTR]))
+        return torch.from_numpy(np.asarray(data)).to(self._device)
@@ -0,0 +1,120 @@
+# Copyright (c) 2022-2024, The ORBIT Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+This script benchmarks the encoding of the image observations stored by the data collector.
+
+It records the same synthetic RGB-D demonstrations with different encodings of
+:class:`omni.isaac.orbit_tasks.utils.data_collector.ImageEncodingCfg` and reports the time spent in
+:meth:`RobomimicDataCollector.flush`, i.e. the time during which the simulation is blocked, the total
+time until the file is closed and the size of the file.
+
+.. code-block:: bash
+
+    # Usage
+    ./orbit.sh -p source/extensions/omni.isaac.orbit_tasks/test/check_data_collector_compression_perf.py --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from omni.isaac.orbit.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark for the encoding of the recorded images.")
+parser.add_argument("--num_envs", type=int, default=16, help="Number of environments.")
+parser.add_argument("--num_steps", type=int, default=50, help="Number of steps per demonstration.")
+parser.add_argument("--height", type=int, default=240, help="Height of the images.")
+parser.add_argument("--width", type=int, default=320, help="Width of the images.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import contextlib
+import io
+import os
+import tempfile
+import torch
+
+from omni.isaac.orbit.utils.timer import Timer
+
+from omni.isaac.orbit_tasks.utils.data_collector import ImageEncodingCfg, RobomimicDataCollector
+
+
+def create_images(num_envs: int, height: int, width: int, step: int) -> tuple[torch.Tensor, torch.Tensor]:
+    """Creates smooth RGB and depth images of a scene that moves with the step."""
+    v, u = torch.meshgrid(torch.linspace(0.0, 1.0, height), torch.linspace(0.0, 1.0, width), indexing="ij")
+    phase = torch.arange(num_envs).view(-1, 1, 1) * 0.1 + step * 0.02
+    # depth of a tilted plane with a box in front of it
+    depth = 2.0 + 3.0 * v + 0.5 * torch.sin(6.0 * u + phase)
+    box = (torch.abs(u - 0.5 - 0.2 * torch.sin(phase)) < 0.15) & (torch.abs(v - 0.6) < 0.2)
+    depth = torch.where(box, torch.full_like(depth, 1.5), depth)
+    # the sky has no depth
+    depth[:, : height // 8] = torch.inf
+    # shading of the scene with sensor noise
+    shading = torch.stack([u.expand_as(depth), v.expand_as(depth), 1.0 / depth.clamp(max=10.0)], dim=-1)
+    rgb = (shading * 200.0 + torch.randint(0, 8, shading.shape)).clamp(0, 255).to(torch.uint8)
+    return rgb, depth
+
+
+def main():
+    """Runs the benchmark."""
+    num_envs, num_steps = args_cli.num_envs, args_cli.num_steps
+    images = [create_images(num_envs, args_cli.height, args_cli.width, step) for step in range(num_steps)]
+    raw_size = sum(rgb.numel() * rgb.element_size() + depth.numel() * depth.element_size() for rgb, depth in images)
+
+    encodings = {
+        "raw": None,
+        "chunked": ImageEncodingCfg(image_keys=["obs/rgb", "obs/depth"], compression=None),
+        "lzf": ImageEncodingCfg(image_keys=["obs/rgb", "obs/depth"], compression="lzf"),
+        "gzip-4": ImageEncodingCfg(image_keys=["obs/rgb", "obs/depth"]),
+        "uint16+lzf": ImageEncodingCfg(image_keys=["obs/rgb"], depth_keys=["obs/depth"], compression="lzf"),
+        "uint16+gzip-1": ImageEncodingCfg(image_keys=["obs/rgb"], depth_keys=["obs/depth"], compression_opts=1),
+        "uint16+gzip-4 sync": ImageEncodingCfg(image_keys=["obs/rgb"], depth_keys=["obs/depth"], num_workers=0),
+        "uint16+gzip-4": ImageEncodingCfg(image_keys=["obs/rgb"], depth_keys=["obs/depth"]),
+        "uint16+gzip-4 x4": ImageEncodingCfg(image_keys=["obs/rgb"], depth_keys=["obs/depth"], num_workers=4),
+    }
+
+    print(f"[INFO]: Recording {num_envs} demos of {num_steps} RGB-D images of {args_cli.height}x{args_cli.width}.")
+    print(f"\t{'encoding':<20}{'flush (ms)':>15}{'total (ms)':>15}{'size (MB)':>15}{'ratio':>10}")
+    for name, image_cfg in encodings.items():
+        with tempfile.TemporaryDirectory() as log_dir:
+            # note: the collector prints a message for every flushed demonstration
+            with contextlib.redirect_stdout(io.StringIO()):
+                # note: one more demo is requested so that the flush does not close the file
+                collector_interface = RobomimicDataCollector(
+                    "Benchmark-v0", log_dir, "demos", num_envs + 1, image_cfg=image_cfg
+                )
+                collector_interface.reset()
+                for step, (rgb, depth) in enumerate(images):
+                    collector_interface.add("obs/rgb", rgb)
+                    collector_interface.add("obs/depth", depth)
+                    collector_interface.add("actions", torch.full((num_envs, 7), float(step)))
+                with Timer() as total_timer:
+                    with Timer() as flush_timer:
+                        collector_interface.flush(range(num_envs))
+                    collector_interface.close()
+            file_size = os.path.getsize(os.path.join(log_dir, "demos.hdf5"))
+        # print results
+        print(
+            f"\t{name:<20}{flush_timer.total_run_time * 1e3:>15.1f}{total_timer.total_run_time * 1e3:>15.1f}"
+            f"{file_size / 1e6:>15.2f}{raw_size / file_size:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -14,11 +14,20 @@ simulation_app = app_launcher.app
 
 """Rest everything follows."""
 
+import h5py
+import numpy as np
 import os
+import tempfile
 import torch
 import unittest
 
-from omni.isaac.orbit_tasks.utils.data_collector import RobomimicDataCollector
+from omni.isaac.orbit_tasks.utils.data_collector import (
+    ImageEncodingCfg,
+    RobomimicDataCollector,
+    RobomimicDataReader,
+    dequantize_depth,
+    quantize_depth,
+)
 
 
 class TestRobomimicDataCollector(unittest.TestCase):
@@ -80,6 +89,92 @@ class TestRobomimicDataCollector(unittest.TestCase):
         collector_interface.close()
         # TODO: Add inspection of the saved dataset as part of the test.
 
+    def test_depth_quantization(self):
+        """Checks the conversion of the depth images to unsigned 16-bit integers and back."""
+        depth = np.array([0.0, 0.0004, 0.0006, 1.2344, 65.535, 100.0, -1.0, np.inf, np.nan], dtype=np.float32)
+        quantized = quantize_depth(depth)
+        self.assertEqual(quantized.dtype, np.uint16)
+        np.testing.assert_array_equal(quantized, [0, 0, 1, 1234, 65535, 65535, 0, 0, 0])
+        # the invalid depths are read back as infinity
+        dequantized = dequantize_depth(torch.from_numpy(quantized.astype(np.int32)))
+        expected = torch.tensor([torch.inf, torch.inf, 0.001, 1.234, 65.535, 65.535, torch.inf, torch.inf, torch.inf])
+        torch.testing.assert_close(dequantized, expected)
+        # check a different scale
+        torch.testing.assert_close(
+            dequantize_depth(torch.from_numpy(quantize_depth(depth[3:4], 100.0)), 100.0), torch.tensor([1.23])
+        )
+
+    def test_image_encoding(self):
+        """Adds random images into the collector and checks that they are read back from the compressed datasets."""
+        num_envs, num_steps = 3, 5
+        height, width = 16, 20
+        generator = torch.Generator().manual_seed(0)
+        # collect the same data with different encodings
+        for image_cfg in [
+            ImageEncodingCfg(image_keys=["obs/rgb"], depth_keys=["obs/depth"], frames_per_chunk=2, num_workers=2),
+            ImageEncodingCfg(image_keys=["obs/rgb"], depth_keys=["obs/depth"], compression="lzf", num_workers=0),
+            ImageEncodingCfg(image_keys=["obs/rgb", "obs/depth"], compression=None),
+            ImageEncodingCfg(image_keys=["obs/rgb", "obs/depth"], frames_per_chunk=3, num_workers=2),
+        ]:
+            with self.subTest(image_cfg=image_cfg), tempfile.TemporaryDirectory() as log_dir:
+                collector_interface = RobomimicDataCollector("My-Task-v0", log_dir, "images", 10, image_cfg=image_cfg)
+                collector_interface.reset()
+                # store images for a few steps
+                rgb = torch.randint(
+                    0, 256, (num_steps, num_envs, height, width, 3), dtype=torch.uint8, generator=generator
+                )
+                depth = torch.rand(num_steps, num_envs, height, width, generator=generator) * 10.0
+                depth[depth > 9.0] = torch.inf
+                for step in range(num_steps):
+                    collector_interface.add("obs/rgb", rgb[step])
+                    collector_interface.add("obs/depth", depth[step])
+                    collector_interface.add("actions", torch.full((num_envs, 2), float(step)))
+                # flush the environments in a different order
+                collector_interface.flush([2, 0, 1])
+                collector_interface.close()
+
+                # check the stored datasets
+                with h5py.File(os.path.join(log_dir, "images.hdf5"), "r") as file:
+                    dataset = file["data/demo_0/obs/depth"]
+                    self.assertEqual(dataset.compression, image_cfg.compression)
+                    self.assertEqual(dataset.chunks, (min(image_cfg.frames_per_chunk, num_steps), height, width))
+                    is_quantized = "obs/depth" in image_cfg.depth_keys
+                    self.assertEqual(dataset.dtype, np.uint16 if is_quantized else np.float32)
+                    self.assertIsNone(file["data/demo_0/actions"].compression)
+                    self.assertEqual(file["data"].attrs["total"], num_envs * num_steps)
+                # read the datasets back
+                with RobomimicDataReader(os.path.join(log_dir, "images.hdf5")) as reader:
+                    self.assertEqual(reader.demo_names, ["demo_0", "demo_1", "demo_2"])
+                    for demo, env_id in enumerate([2, 0, 1]):
+                        self.assertEqual(reader.num_samples(demo), num_steps)
+                        torch.testing.assert_close(reader.read(demo, "obs/rgb"), rgb[:, env_id])
+                        torch.testing.assert_close(
+                            reader.read(demo, "obs/depth"),
+                            depth[:, env_id],
+                            atol=0.0005 if is_quantized else 0.0,
+                            rtol=0.0,
+                        )
+                        # read a subset of the frames
+                        torch.testing.assert_close(reader.read(demo, "obs/rgb", indices=[1, 3]), rgb[[1, 3], env_id])
+                        demo_data = reader.read_demo(demo)
+                        torch.testing.assert_close(
+                            demo_data["actions"][:, 0], torch.arange(num_steps, dtype=torch.float)
+                        )
+                        torch.testing.assert_close(demo_data["obs"]["rgb"], rgb[:, env_id])
+
+    def test_write_error(self):
+        """Checks that the errors of the background threads are raised by the collector."""
+        with tempfile.TemporaryDirectory() as log_dir:
+            image_cfg = ImageEncodingCfg(image_keys=["obs/rgb"], num_workers=2)
+            collector_interface = RobomimicDataCollector("My-Task-v0", log_dir, "images", 10, image_cfg=image_cfg)
+            collector_interface.reset()
+            # the demonstration without actions cannot be written
+            collector_interface.add("obs/rgb", torch.zeros(2, 4, 4, 3, dtype=torch.uint8))
+            collector_interface.flush([0])
+            with self.assertRaises(KeyError):
+                collector_interface.close()
+            self.assertTrue(collector_interface.is_stopped())
+
 
 if __name__ == "__main__":
     run_tests()